@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Measure the per-call overhead of `@traced`.
+
+The script reports microseconds per call of a four-argument function:
+
+- binding: turning call arguments into span inputs, with a fresh
+  `inspect.signature` and `bind_partial` per call (what `@traced` used to do)
+  and with an `ArgumentBinder` built once per function
+- calls: the undecorated function, and the `@traced` function while its
+  spans are recording and while they are sampled out; recording calls are
+  also timed with an `input_processor` and with `hide_input=True`
+
+A sampled-out call still pays for OpenTelemetry's `start_span` (sampling
+decision and span ids) and for making the span current, so it stays well
+above the undecorated call. Absolute numbers vary a lot between machines;
+compare revisions on the same one.
+
+Run it on two revisions of the package to compare `@traced` before and after
+a change; the binding numbers compare both strategies on the current one.
+
+Usage:
+    python scripts/benchmark_traced.py [--calls 20000] [--repeat 5]
+"""
+
+import argparse
+import inspect
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF, ALWAYS_ON  # noqa: E402
+
+from uipath.core.tracing import traced  # noqa: E402
+from uipath.core.tracing._utils import (  # noqa: E402
+    ArgumentBinder,
+    format_args_for_trace,
+)
+
+
+def work(query: str, limit: int = 10, *, tags: Any = None, **options: Any) -> int:
+    """Stands in for a traced tool call."""
+    return limit
+
+
+def drop_tags(inputs: dict[str, Any]) -> dict[str, Any]:
+    """Stands in for an input processor that redacts one argument."""
+    return {name: value for name, value in inputs.items() if name != "tags"}
+
+
+traced_work = traced(name="work")(work)
+processed_work = traced(name="work", input_processor=drop_tags)(work)
+hidden_work = traced(name="work", hide_input=True)(work)
+
+
+def per_call(function: Callable[[], object], calls: int, repeat: int) -> float:
+    """Best microseconds per call of ``function`` over ``repeat`` rounds."""
+    return min(timeit.repeat(function, number=calls, repeat=repeat)) / calls * 1e6
+
+
+def use_provider(provider: TracerProvider) -> None:
+    """Make ``provider`` the global tracer provider, replacing any earlier one."""
+    # The global provider can only be set once through the public API.
+    trace._TRACER_PROVIDER_SET_ONCE._done = False
+    trace.set_tracer_provider(provider)
+
+
+def main() -> None:
+    """Run the benchmark and print the time per call of each case."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000, help="Calls per round")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per case")
+    options = parser.parse_args()
+
+    args = ("weather in Paris",)
+    kwargs: dict[str, Any] = {"limit": 5, "tags": ["demo"], "verbose": True}
+    binder = ArgumentBinder(work)
+    cases: dict[str, Callable[[], object]] = {
+        "binding: signature per call": lambda: format_args_for_trace(
+            inspect.signature(work), *args, **kwargs
+        ),
+        "binding: ArgumentBinder": lambda: binder.bind(args, kwargs),
+        "call: undecorated": lambda: work(*args, **kwargs),
+    }
+    results = {
+        case: per_call(function, options.calls, options.repeat)
+        for case, function in cases.items()
+    }
+
+    for label, sampler, function in (
+        ("recording", ALWAYS_ON, traced_work),
+        ("input_processor", ALWAYS_ON, processed_work),
+        ("hide_input", ALWAYS_ON, hidden_work),
+        ("sampled out", ALWAYS_OFF, traced_work),
+    ):
+        provider = TracerProvider(sampler=sampler)
+        use_provider(provider)
+        results[f"call: @traced, {label}"] = per_call(
+            lambda function=function: function(*args, **kwargs),
+            options.calls,
+            options.repeat,
+        )
+        provider.shutdown()
+
+    for case, microseconds in results.items():
+        print(f"{case:<32} {microseconds:>8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,27 @@
 """UiPath Core Package."""
 
-from uipath.core.tracing.decorators import traced
-from uipath.core.tracing.span_utils import UiPathSpanUtils
-from uipath.core.tracing.trace_manager import UiPathTraceManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from uipath.core.tracing.decorators import traced
+    from uipath.core.tracing.span_utils import UiPathSpanUtils
+    from uipath.core.tracing.trace_manager import UiPathTraceManager
 
 __all__ = [
     "traced",
     "UiPathSpanUtils",
     "UiPathTraceManager",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve the tracing exports on demand.
+
+    Importing a lightweight submodule such as ``uipath.core.triggers`` then
+    does not pull in OpenTelemetry.
+    """
+    if name in __all__:
+        from uipath.core import tracing
+
+        return getattr(tracing, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,17 @@ with OpenTelemetry tracing, including custom processors for UiPath execution tra
 from uipath.core.tracing.decorators import traced
 from uipath.core.tracing.span_utils import UiPathSpanUtils
 from uipath.core.tracing.trace_manager import UiPathTraceManager
-from uipath.core.tracing.types import UiPathTraceSettings
+from uipath.core.tracing.types import (
+    GeneratorOutputCapture,
+    UiPathTraceSampling,
+    UiPathTraceSettings,
+)
 
 __all__ = [
     "traced",
     "UiPathSpanUtils",
     "UiPathTraceManager",
     "UiPathTraceSettings",
+    "UiPathTraceSampling",
+    "GeneratorOutputCapture",
 ]
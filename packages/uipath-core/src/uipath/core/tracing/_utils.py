@@ -1,13 +1,14 @@
 """Helper utilities for the tracing module."""
 
 import inspect
-import json
+from collections import deque
 from collections.abc import Callable
 from typing import Any, Mapping, Optional
 
 from opentelemetry.trace import Span
 
 from uipath.core.serialization import serialize_json
+from uipath.core.tracing.types import GeneratorOutputCapture
 
 
 def get_supported_params(
@@ -77,6 +78,81 @@ def format_args_for_trace(
         return {"args": args, "kwargs": kwargs}
 
 
+class ArgumentBinder:
+    """Precomputed plan for mapping call arguments to traced inputs.
+
+    Built once per decorated function so each call only walks the parameter
+    list; :func:`format_args_for_trace` is used for signatures the plan does
+    not cover (positional-only or ``*args`` parameters) and for calls that do
+    not bind.
+    """
+
+    _SIMPLE_KINDS = (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+        inspect.Parameter.VAR_KEYWORD,
+    )
+
+    def __init__(self, func: Callable[..., Any]):
+        try:
+            self.signature: Optional[inspect.Signature] = inspect.signature(func)
+        except (TypeError, ValueError):
+            self.signature = None
+        parameters = self.signature.parameters.values() if self.signature else ()
+        self._simple = self.signature is not None and all(
+            p.kind in self._SIMPLE_KINDS for p in parameters
+        )
+        self._named = [
+            (p.name, p.default)
+            for p in parameters
+            if p.kind != inspect.Parameter.VAR_KEYWORD
+        ]
+        self._names = frozenset(name for name, _ in self._named)
+        self._positional_count = sum(
+            p.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD for p in parameters
+        )
+        self._has_var_keyword = any(
+            p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters
+        )
+
+    def bind(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Same result as :func:`format_args_for_trace` for this function."""
+        if not self._simple or len(args) > self._positional_count:
+            return self._bind_slow(args, kwargs)
+
+        result: dict[str, Any] = {}
+        consumed = 0
+        for index, (name, default) in enumerate(self._named):
+            if index < len(args):
+                if name in kwargs:
+                    return self._bind_slow(args, kwargs)
+                value = args[index]
+            elif name in kwargs:
+                value = kwargs[name]
+                consumed += 1
+            elif default is inspect.Parameter.empty:
+                continue
+            else:
+                value = default
+            if name not in ("self", "cls"):
+                result[name] = value
+
+        if consumed < len(kwargs):
+            if not self._has_var_keyword:
+                return self._bind_slow(args, kwargs)
+            for name, value in kwargs.items():
+                if name not in self._names:
+                    result[name] = value
+        return result
+
+    def _bind_slow(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        if self.signature is None:
+            return {"args": args, "kwargs": kwargs}
+        return format_args_for_trace(self.signature, *args, **kwargs)
+
+
 def set_span_input_attributes(
     span: Span,
     trace_name: str,
@@ -86,11 +162,13 @@ def set_span_input_attributes(
     span_type: str,
     run_type: Optional[str],
     input_processor: Optional[Callable[..., Any]],
+    binder: Optional[ArgumentBinder] = None,
 ) -> None:
     """Set span attributes for metadata and inputs before function execution.
 
     This should be called BEFORE the wrapped function executes to ensure
     input context is captured even if the function raises an exception.
+    Nothing is serialized for spans that are not recording.
 
     Args:
         span: The OpenTelemetry span to set attributes on
@@ -100,8 +178,14 @@ def set_span_input_attributes(
         kwargs: Keyword arguments passed to the function
         span_type: Span type categorization (set to "TOOL" for OpenInference tool calls)
         run_type: Optional run type categorization
-        input_processor: Optional function to process inputs before recording
+        input_processor: Optional function called with the bound arguments
+            before they are serialized
+        binder: Argument binding plan of ``wrapped_func``, built on the fly
+            when omitted
     """
+    if not span.is_recording():
+        return
+
     is_tool = span_type and span_type.upper() == "TOOL"
     if is_tool:
         span.set_attribute("openinference.span.kind", "TOOL")
@@ -113,14 +197,12 @@ def set_span_input_attributes(
     if run_type is not None:
         span.set_attribute("run_type", run_type)
 
-    inputs = format_args_for_trace_json(
-        inspect.signature(wrapped_func), *args, **kwargs
-    )
+    binder = binder or ArgumentBinder(wrapped_func)
+    inputs = binder.bind(args, kwargs)
     if input_processor:
-        processed_inputs = input_processor(json.loads(inputs))
-        inputs = json.dumps(processed_inputs, default=str)
+        inputs = input_processor(inputs)
     span.set_attribute("input.mime_type", "application/json")
-    span.set_attribute("input.value", inputs)
+    span.set_attribute("input.value", serialize_json(inputs))
 
 
 def set_span_output_attributes(
@@ -137,6 +219,75 @@ def set_span_output_attributes(
         result: The result from the function execution
         output_processor: Optional function to process outputs before recording
     """
+    if not span.is_recording():
+        return
+
     output = output_processor(result) if output_processor else result
     span.set_attribute("output.value", format_object_for_trace_json(output))
     span.set_attribute("output.mime_type", "application/json")
+
+
+def _approximate_size(item: Any) -> int:
+    if isinstance(item, (str, bytes, bytearray)):
+        return len(item)
+    return len(str(item))
+
+
+class GeneratorOutputCollector:
+    """Collects the items yielded by a traced generator per a capture policy."""
+
+    def __init__(self, span: Span, capture: GeneratorOutputCapture):
+        self.span = span
+        self.capture = capture
+        self.item_count = 0
+        self.truncated = False
+        self._head: list[Any] = []
+        self._head_open = True
+        self._tail: deque[tuple[Any, int]] = deque()
+        self._kept_bytes = 0
+        self._folded: Any = None
+
+    def add(self, item: Any) -> None:
+        """Record one yielded item."""
+        capture = self.capture
+        if self.item_count < capture.max_events:
+            self.span.add_event(f"Yielded: {item}")
+        self.item_count += 1
+
+        if capture.aggregate is not None:
+            self._folded = (
+                item if self.item_count == 1 else capture.aggregate(self._folded, item)
+            )
+            return
+
+        size = 0 if capture.max_bytes is None else _approximate_size(item)
+        if self._head_open:
+            if len(self._head) < capture.head_items and self._fits(size):
+                self._head.append(item)
+                self._kept_bytes += size
+                return
+            self._head_open = False
+
+        self._tail.append((item, size))
+        self._kept_bytes += size
+        while self._tail and (
+            len(self._tail) > capture.tail_items or not self._fits(0)
+        ):
+            _, dropped_size = self._tail.popleft()
+            self._kept_bytes -= dropped_size
+            self.truncated = True
+
+    def output(self) -> Any:
+        """The span output: the folded value, or the kept items in order."""
+        if self.capture.aggregate is not None:
+            return self._folded
+        return self._head + [item for item, _ in self._tail]
+
+    def set_summary_attributes(self) -> None:
+        self.span.set_attribute("output.item_count", self.item_count)
+        if self.truncated:
+            self.span.set_attribute("output.truncated", True)
+
+    def _fits(self, size: int) -> bool:
+        max_bytes = self.capture.max_bytes
+        return max_bytes is None or self._kept_bytes + size <= max_bytes
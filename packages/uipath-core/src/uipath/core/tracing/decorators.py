@@ -13,6 +13,8 @@ from opentelemetry.trace import SpanContext, TraceFlags
 from opentelemetry.trace.status import StatusCode
 
 from uipath.core.tracing._utils import (
+    ArgumentBinder,
+    GeneratorOutputCollector,
     get_supported_params,
     set_span_input_attributes,
     set_span_output_attributes,
@@ -22,9 +24,22 @@ from uipath.core.tracing.span_utils import (
     UiPathSpanUtils,
     _span_registry,
 )
+from uipath.core.tracing.types import GeneratorOutputCapture
 
 logger = logging.getLogger(__name__)
 
+_tracer_cache: Optional[tuple[trace.TracerProvider, trace.Tracer]] = None
+
+
+def _get_tracer() -> trace.Tracer:
+    """Tracer of the current provider, reused while the provider is unchanged."""
+    global _tracer_cache
+    provider = trace.get_tracer_provider()
+    cached = _tracer_cache
+    if cached is None or cached[0] is not provider:
+        cached = _tracer_cache = (provider, provider.get_tracer(__name__))
+    return cached[1]
+
 
 def _opentelemetry_traced(
     name: Optional[str] = None,
@@ -33,6 +48,7 @@ def _opentelemetry_traced(
     input_processor: Optional[Callable[..., Any]] = None,
     output_processor: Optional[Callable[..., Any]] = None,
     recording: bool = True,
+    output_capture: Optional[GeneratorOutputCapture] = None,
 ):
     """Default tracer implementation using OpenTelemetry.
 
@@ -48,10 +64,13 @@ def _opentelemetry_traced(
         input_processor: Optional function to process inputs before recording
         output_processor: Optional function to process outputs before recording
         recording: If False, span is not recorded
+        output_capture: How much of a generator's output is kept on the span
     """
+    capture = output_capture or GeneratorOutputCapture()
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         trace_name = name or func.__name__
+        binder = ArgumentBinder(func)
 
         def get_span():
             ctx = UiPathSpanUtils.get_parent_context()
@@ -82,9 +101,7 @@ def _opentelemetry_traced(
                 return span_cm, non_recording
             else:
                 # Normal recording span
-                span_cm = trace.get_tracer(__name__).start_as_current_span(
-                    trace_name, context=ctx
-                )
+                span_cm = _get_tracer().start_as_current_span(trace_name, context=ctx)
                 span = span_cm.__enter__()
                 return span_cm, span
 
@@ -105,6 +122,7 @@ def _opentelemetry_traced(
                     run_type=run_type,
                     span_type=span_type or "function_call_sync",
                     input_processor=input_processor,
+                    binder=binder,
                 )
 
                 # Execute the function
@@ -142,6 +160,7 @@ def _opentelemetry_traced(
                     run_type=run_type,
                     span_type=span_type or "function_call_async",
                     input_processor=input_processor,
+                    binder=binder,
                 )
 
                 # Execute the function
@@ -181,21 +200,28 @@ def _opentelemetry_traced(
                     run_type=run_type,
                     span_type=span_type or "function_call_generator_sync",
                     input_processor=input_processor,
+                    binder=binder,
                 )
 
-                # Execute the generator and collect outputs
-                outputs = []
+                # Execute the generator and collect bounded outputs
+                collector = (
+                    GeneratorOutputCollector(span, capture)
+                    if span.is_recording()
+                    else None
+                )
                 for item in func(*args, **kwargs):
-                    outputs.append(item)
-                    span.add_event(f"Yielded: {item}")
+                    if collector is not None:
+                        collector.add(item)
                     yield item
 
                 # Set output attributes AFTER execution
-                set_span_output_attributes(
-                    span,
-                    result=outputs,
-                    output_processor=output_processor,
-                )
+                if collector is not None:
+                    set_span_output_attributes(
+                        span,
+                        result=collector.output(),
+                        output_processor=output_processor,
+                    )
+                    collector.set_summary_attributes()
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(StatusCode.ERROR, str(e))
@@ -223,21 +249,28 @@ def _opentelemetry_traced(
                     run_type=run_type,
                     span_type=span_type or "function_call_generator_async",
                     input_processor=input_processor,
+                    binder=binder,
                 )
 
-                # Execute the generator and collect outputs
-                outputs = []
+                # Execute the generator and collect bounded outputs
+                collector = (
+                    GeneratorOutputCollector(span, capture)
+                    if span.is_recording()
+                    else None
+                )
                 async for item in func(*args, **kwargs):
-                    outputs.append(item)
-                    span.add_event(f"Yielded: {item}")
+                    if collector is not None:
+                        collector.add(item)
                     yield item
 
                 # Set output attributes AFTER execution
-                set_span_output_attributes(
-                    span,
-                    result=outputs,
-                    output_processor=output_processor,
-                )
+                if collector is not None:
+                    set_span_output_attributes(
+                        span,
+                        result=collector.output(),
+                        output_processor=output_processor,
+                    )
+                    collector.set_summary_attributes()
             except Exception as e:
                 span.record_exception(e)
                 span.set_status(StatusCode.ERROR, str(e))
@@ -272,6 +305,7 @@ def traced(
     hide_input: bool = ...,
     hide_output: bool = ...,
     recording: bool = ...,
+    output_capture: Optional[GeneratorOutputCapture] = ...,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]: ...
 
 
@@ -284,6 +318,7 @@ def traced(
     hide_input: bool = False,
     hide_output: bool = False,
     recording: bool = True,
+    output_capture: Optional[GeneratorOutputCapture] = None,
 ):
     """Decorator that will trace function invocations.
 
@@ -292,12 +327,16 @@ def traced(
         run_type: Optional string to categorize the run type
         span_type: Optional string to categorize the span type
         input_processor: Optional function to process function inputs before recording
-            Should accept a dictionary of inputs and return a processed dictionary
+            Should accept a dictionary of inputs and return a processed dictionary.
+            It receives the call's own argument values, before serialization,
+            so it should return new values rather than modify them in place
         output_processor: Optional function to process function outputs before recording
             Should accept the function output and return a processed value
         hide_input: If True, don't log any input data
         hide_output: If True, don't log any output data
         recording: If False, current span and all child spans are not captured
+        output_capture: For generators, how many yielded items are kept as the
+            span output and events; see :class:`GeneratorOutputCapture`
     """
     # Handle @traced without parentheses: the decorated function
     # is passed as the first positional argument (``name``).
@@ -328,6 +367,7 @@ def traced(
         "input_processor": input_processor,
         "output_processor": output_processor,
         "recording": recording,
+        "output_capture": output_capture,
     }
 
     tracer_impl = _opentelemetry_traced
@@ -1,45 +1,141 @@
 """Custom OpenTelemetry Span Exporter for UiPath Runtime executions."""
 
-from collections import defaultdict
-from typing import Dict, Optional, Sequence
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Optional, Sequence
 
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
 
+DEFAULT_MAX_EXECUTIONS = 1000
+DEFAULT_MAX_SPANS_PER_EXECUTION = 10_000
+
+
+@dataclass
+class ExecutionSpanStoreMetrics:
+    """Counters of what the execution span store has dropped."""
+
+    evicted_executions: int = 0
+    """Executions dropped because the store held ``max_executions``."""
+
+    expired_executions: int = 0
+    """Executions dropped after ``ttl`` seconds without new spans or reads."""
+
+    dropped_spans: int = 0
+    """Oldest spans dropped from executions exceeding their span cap."""
+
+
+class _ExecutionSpans:
+    __slots__ = ("spans", "touched_at")
+
+    def __init__(self, max_spans: int, now: float):
+        self.spans: deque[ReadableSpan] = deque(maxlen=max_spans)
+        self.touched_at = now
+
 
 class UiPathRuntimeExecutionSpanExporter(SpanExporter):
-    """Custom exporter that stores spans grouped by execution ids."""
+    """Custom exporter that stores spans grouped by execution ids.
+
+    The store is bounded: it keeps the ``max_executions`` most recently used
+    executions, at most ``max_spans_per_execution`` spans each (the oldest are
+    dropped first), and optionally forgets executions unused for ``ttl``
+    seconds. What was dropped is counted in :attr:`metrics`.
+    """
 
-    def __init__(self):
-        """Initialize the exporter."""
-        self._spans: Dict[str, list[ReadableSpan]] = defaultdict(list)
+    def __init__(
+        self,
+        max_executions: int = DEFAULT_MAX_EXECUTIONS,
+        max_spans_per_execution: int = DEFAULT_MAX_SPANS_PER_EXECUTION,
+        ttl: Optional[float] = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            max_executions: Number of executions kept, least recently used
+                evicted first.
+            max_spans_per_execution: Number of spans kept per execution.
+            ttl: Seconds after which an execution without new spans or reads
+                is dropped. None keeps executions until evicted or cleared.
+        """
+        if max_executions < 1 or max_spans_per_execution < 1:
+            raise ValueError("max_executions and max_spans_per_execution must be >= 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.max_executions = max_executions
+        self.max_spans_per_execution = max_spans_per_execution
+        self.ttl = ttl
+        self.metrics = ExecutionSpanStoreMetrics()
+        self._spans: OrderedDict[str, _ExecutionSpans] = OrderedDict()
+        self._lock = threading.Lock()
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """Export spans, grouping them by execution id."""
-        for span in spans:
-            if span.attributes is not None:
-                exec_id = span.attributes.get("execution.id")
-                if exec_id is not None and isinstance(exec_id, str):
-                    self._spans[exec_id].append(span)
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            for span in spans:
+                if span.attributes is not None:
+                    exec_id = span.attributes.get("execution.id")
+                    if exec_id is not None and isinstance(exec_id, str):
+                        self._add(exec_id, span, now)
 
         return SpanExportResult.SUCCESS
 
     def get_spans(self, execution_id: str) -> list[ReadableSpan]:
         """Retrieve spans for a given execution id."""
-        return self._spans.get(execution_id, [])
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            entry = self._spans.get(execution_id)
+            if entry is None:
+                return []
+            entry.touched_at = now
+            self._spans.move_to_end(execution_id)
+            return list(entry.spans)
 
     def clear(self, execution_id: Optional[str] = None) -> None:
         """Clear stored spans for one or all executions."""
-        if execution_id:
-            self._spans.pop(execution_id, None)
-        else:
-            self._spans.clear()
+        with self._lock:
+            if execution_id:
+                self._spans.pop(execution_id, None)
+            else:
+                self._spans.clear()
 
     def shutdown(self) -> None:
         """Shutdown the exporter and clear all stored spans."""
         self.clear()
 
+    def _add(self, execution_id: str, span: ReadableSpan, now: float) -> None:
+        entry = self._spans.get(execution_id)
+        if entry is None:
+            entry = self._spans[execution_id] = _ExecutionSpans(
+                self.max_spans_per_execution, now
+            )
+            if len(self._spans) > self.max_executions:
+                self._spans.popitem(last=False)
+                self.metrics.evicted_executions += 1
+        else:
+            entry.touched_at = now
+            self._spans.move_to_end(execution_id)
+        if len(entry.spans) == self.max_spans_per_execution:
+            self.metrics.dropped_spans += 1
+        entry.spans.append(span)
+
+    def _expire(self, now: float) -> None:
+        """Drop executions unused for ``ttl``, oldest first."""
+        if self.ttl is None:
+            return
+        while self._spans:
+            execution_id, entry = next(iter(self._spans.items()))
+            if now - entry.touched_at < self.ttl:
+                return
+            del self._spans[execution_id]
+            self.metrics.expired_executions += 1
+
 
 __all__ = [
+    "ExecutionSpanStoreMetrics",
     "UiPathRuntimeExecutionSpanExporter",
 ]
@@ -11,13 +11,20 @@ from opentelemetry.sdk.trace.export import (
     SpanExporter,
 )
 
+from uipath.core.tracing.sampling import SpanSampler
 from uipath.core.tracing.types import UiPathTraceSettings
 
 
 class UiPathExecutionTraceProcessorMixin:
-    """Mixin that propagates execution.id and optionally filters spans."""
+    """Mixin that propagates execution.id and optionally filters and samples spans."""
 
     _settings: UiPathTraceSettings | None = None
+    _sampler: SpanSampler | None = None
+
+    def _configure(self, settings: UiPathTraceSettings | None) -> None:
+        self._settings = settings
+        if settings is not None and settings.sampling is not None:
+            self._sampler = SpanSampler(settings.sampling)
 
     def on_start(self, span: Span, parent_context: context_api.Context | None = None):
         """Called when a span is started."""
@@ -33,17 +40,41 @@ class UiPathExecutionTraceProcessorMixin:
                 span.set_attribute("execution.id", execution_id)
 
     def on_end(self, span: ReadableSpan):
-        """Called when a span ends. Filters before delegating to parent."""
+        """Called when a span ends. Filters and samples before delegating to parent."""
         span_filter = self._settings.span_filter if self._settings else None
-        if span_filter is None or span_filter(span):
-            parent = cast(SpanProcessor, super())
+        if span_filter is not None and not span_filter(span):
+            return
+        parent = cast(SpanProcessor, super())
+        if self._sampler is None:
             parent.on_end(span)
+            return
+        for sampled in self._sampler.on_end(span):
+            parent.on_end(sampled)
+
+    def force_flush(self, timeout_millis: int | None = None) -> bool:
+        """Release spans held for sampling decisions, then flush."""
+        parent = cast(SpanProcessor, super())
+        self._release_held_spans(parent)
+        if timeout_millis is None:
+            return parent.force_flush()
+        return parent.force_flush(timeout_millis)
+
+    def shutdown(self) -> None:
+        """Release spans held for sampling decisions, then shut down."""
+        parent = cast(SpanProcessor, super())
+        self._release_held_spans(parent)
+        parent.shutdown()
+
+    def _release_held_spans(self, parent: SpanProcessor) -> None:
+        if self._sampler is not None:
+            for sampled in self._sampler.drain():
+                parent.on_end(sampled)
 
 
 class UiPathExecutionBatchTraceProcessor(
     UiPathExecutionTraceProcessorMixin, BatchSpanProcessor
 ):
-    """Batch span processor that propagates execution.id and optionally filters."""
+    """Batch span processor that propagates execution.id, filters and samples."""
 
     def __init__(
         self,
@@ -52,13 +83,13 @@ class UiPathExecutionBatchTraceProcessor(
     ):
         """Initialize the batch trace processor."""
         super().__init__(span_exporter)
-        self._settings = settings
+        self._configure(settings)
 
 
 class UiPathExecutionSimpleTraceProcessor(
     UiPathExecutionTraceProcessorMixin, SimpleSpanProcessor
 ):
-    """Simple span processor that propagates execution.id and optionally filters."""
+    """Simple span processor that propagates execution.id, filters and samples."""
 
     def __init__(
         self,
@@ -67,7 +98,7 @@ class UiPathExecutionSimpleTraceProcessor(
     ):
         """Initialize the simple trace processor."""
         super().__init__(span_exporter)
-        self._settings = settings
+        self._configure(settings)
 
 
 __all__ = [
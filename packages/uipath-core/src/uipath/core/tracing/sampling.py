@@ -0,0 +1,180 @@
+"""Export-side span sampling for UiPath trace processors.
+
+Sampling happens when spans end, per exporter, so one exporter can receive a
+fraction of the traffic while others (such as the execution span store used by
+evaluations) still see every span. Spans are recorded either way; see
+``UiPathTraceManager(head_sampling_ratio=...)`` for sampling before recording.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import StatusCode
+
+from uipath.core.tracing.types import UiPathTraceSampling
+
+_TRACE_ID_MASK = (1 << 64) - 1
+_MAX_REMEMBERED_DECISIONS = 10_000
+
+
+class _PendingTrace:
+    __slots__ = ("spans", "has_error", "started_at")
+
+    def __init__(self, started_at: float):
+        self.spans: list[ReadableSpan] = []
+        self.has_error = False
+        self.started_at = started_at
+
+
+class _TokenBucket:
+    __slots__ = ("rate", "tokens", "updated_at")
+
+    def __init__(self, rate: float, now: float):
+        self.rate = rate
+        self.tokens = max(rate, 1.0)
+        self.updated_at = now
+
+    def take(self, now: float) -> bool:
+        if self.rate <= 0:
+            return False
+        self.tokens = min(
+            max(self.rate, 1.0), self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+def _is_error(span: ReadableSpan) -> bool:
+    return span.status is not None and span.status.status_code == StatusCode.ERROR
+
+
+def _is_local_root(span: ReadableSpan) -> bool:
+    return span.parent is None or span.parent.is_remote
+
+
+def _duration_seconds(span: ReadableSpan) -> float:
+    if span.start_time is None or span.end_time is None:
+        return 0.0
+    return (span.end_time - span.start_time) / 1e9
+
+
+class SpanSampler:
+    """Decides which ended spans reach an exporter, per :class:`UiPathTraceSampling`.
+
+    Traces selected by the head ratio pass straight through. With tail rules,
+    the spans of other traces are held until their local root span ends and
+    then kept only if the trace failed or was slow. Span type rate limits
+    apply to every span that is not an error.
+    """
+
+    def __init__(
+        self,
+        config: UiPathTraceSampling,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the sampler from its rules."""
+        self.config = config
+        self._clock = clock
+        self._ratio_bound = int(config.ratio * (_TRACE_ID_MASK + 1))
+        self._tail = config.keep_errors or config.latency_threshold is not None
+        self._pending: OrderedDict[int, _PendingTrace] = OrderedDict()
+        self._pending_spans = 0
+        self._decisions: OrderedDict[int, bool] = OrderedDict()
+        self._buckets: dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, span: ReadableSpan) -> list[ReadableSpan]:
+        """Spans to export now, possibly including earlier held spans."""
+        trace_id = span.context.trace_id if span.context else 0
+        with self._lock:
+            now = self._clock()
+            released = self._expire_pending(now)
+            if self._head_sampled(trace_id):
+                released.append(span)
+            elif trace_id in self._decisions:
+                if self._decisions[trace_id]:
+                    released.append(span)
+            elif self._tail:
+                released.extend(self._hold(trace_id, span, now))
+            return self._rate_limit(released, now)
+
+    def drain(self) -> list[ReadableSpan]:
+        """Decide every held trace with the spans seen so far."""
+        with self._lock:
+            released: list[ReadableSpan] = []
+            while self._pending:
+                released.extend(self._decide(next(iter(self._pending))))
+            return self._rate_limit(released, self._clock())
+
+    def _head_sampled(self, trace_id: int) -> bool:
+        return (trace_id & _TRACE_ID_MASK) < self._ratio_bound
+
+    def _hold(
+        self, trace_id: int, span: ReadableSpan, now: float
+    ) -> list[ReadableSpan]:
+        pending = self._pending.get(trace_id)
+        if pending is None:
+            pending = self._pending[trace_id] = _PendingTrace(now)
+        pending.spans.append(span)
+        pending.has_error = pending.has_error or _is_error(span)
+        self._pending_spans += 1
+
+        released: list[ReadableSpan] = []
+        if _is_local_root(span):
+            slow = (
+                self.config.latency_threshold is not None
+                and _duration_seconds(span) >= self.config.latency_threshold
+            )
+            released.extend(self._decide(trace_id, force_keep=slow))
+        while self._pending_spans > self.config.max_buffered_spans and self._pending:
+            released.extend(self._decide(next(iter(self._pending))))
+        return released
+
+    def _decide(self, trace_id: int, force_keep: bool = False) -> list[ReadableSpan]:
+        pending = self._pending.pop(trace_id)
+        self._pending_spans -= len(pending.spans)
+        keep = force_keep or (self.config.keep_errors and pending.has_error)
+        self._decisions[trace_id] = keep
+        if len(self._decisions) > _MAX_REMEMBERED_DECISIONS:
+            self._decisions.popitem(last=False)
+        return pending.spans if keep else []
+
+    def _expire_pending(self, now: float) -> list[ReadableSpan]:
+        released: list[ReadableSpan] = []
+        timeout = self.config.trace_timeout
+        while self._pending:
+            trace_id, pending = next(iter(self._pending.items()))
+            if now - pending.started_at < timeout:
+                break
+            released.extend(self._decide(trace_id))
+        return released
+
+    def _rate_limit(self, spans: list[ReadableSpan], now: float) -> list[ReadableSpan]:
+        limits = self.config.span_type_rates
+        if not limits:
+            return spans
+        kept = []
+        for span in spans:
+            span_type = span.attributes.get("span_type") if span.attributes else None
+            if (
+                not isinstance(span_type, str)
+                or span_type not in limits
+                or _is_error(span)
+            ):
+                kept.append(span)
+                continue
+            bucket = self._buckets.get(span_type)
+            if bucket is None:
+                bucket = self._buckets[span_type] = _TokenBucket(limits[span_type], now)
+            if bucket.take(now):
+                kept.append(span)
+        return kept
+
+
+__all__ = ["SpanSampler"]
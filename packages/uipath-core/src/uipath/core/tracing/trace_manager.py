@@ -5,13 +5,23 @@ from __future__ import annotations
 import contextlib
 import logging
 import threading
-from typing import Any, ClassVar, Generator, Optional
+from typing import Any, ClassVar, Generator, Optional, Sequence
 
 from opentelemetry import context as context_api
 from opentelemetry import trace
 from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import SpanExporter
+from opentelemetry.sdk.trace.sampling import (
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+    _get_from_env_or_default,
+)
+from opentelemetry.trace import Link, SpanKind
+from opentelemetry.trace.span import TraceState
 from opentelemetry.util._decorator import _AgnosticContextManager
+from opentelemetry.util.types import Attributes
 
 from uipath.core.tracing.exporters import UiPathRuntimeExecutionSpanExporter
 from uipath.core.tracing.processors import (
@@ -82,6 +92,49 @@ class _DelegatingSpanProcessor(SpanProcessor):
             p.shutdown()
 
 
+class _DelegatingSampler(Sampler):
+    """A sampler that delegates to a rule which can be replaced between jobs.
+
+    Same WORKAROUND as ``_DelegatingSpanProcessor``: the global TracerProvider
+    is set once and its sampler cannot be changed afterwards, so the provider
+    created by ``UiPathTraceManager`` gets this sampler and each job swaps the
+    rule behind it.
+    """
+
+    _instance: ClassVar[_DelegatingSampler | None] = None
+    _init_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self) -> None:
+        self.default: Sampler = _get_from_env_or_default()
+        self.delegate: Sampler = self.default
+
+    @classmethod
+    def get_instance(cls) -> _DelegatingSampler:
+        """Get or create the singleton."""
+        if cls._instance is None:
+            with cls._init_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def should_sample(
+        self,
+        parent_context: context_api.Context | None,
+        trace_id: int,
+        name: str,
+        kind: SpanKind | None = None,
+        attributes: Attributes = None,
+        links: Sequence[Link] | None = None,
+        trace_state: TraceState | None = None,
+    ) -> SamplingResult:
+        return self.delegate.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+
+    def get_description(self) -> str:
+        return self.delegate.get_description()
+
+
 class UiPathTraceManager:
     """Trace manager.
 
@@ -89,15 +142,39 @@ class UiPathTraceManager:
     child processors can be added and removed between jobs without accumulation.
     """
 
-    def __init__(self) -> None:
-        """Initialize a trace manager."""
-        trace.set_tracer_provider(TracerProvider())
+    def __init__(self, head_sampling_ratio: float | None = None) -> None:
+        """Initialize a trace manager.
+
+        Args:
+            head_sampling_ratio: Fraction of traces recorded at all, decided
+                when the root span starts; child spans follow their parent.
+                Spans of the other traces are never recorded, so ``@traced``
+                skips serializing their inputs and outputs, but no exporter
+                sees them either, including the execution span store used by
+                evaluations. Leave unset when evaluating; use
+                ``UiPathTraceSampling`` to export a fraction to one exporter
+                only. Traces are chosen by trace id with the same rule as
+                ``UiPathTraceSampling.ratio``.
+        """
+        if head_sampling_ratio is not None and not 0.0 <= head_sampling_ratio <= 1.0:
+            raise ValueError("head_sampling_ratio must be between 0 and 1")
+        sampler = _DelegatingSampler.get_instance()
+        trace.set_tracer_provider(TracerProvider(sampler=sampler))
         # If a previous provider was already set, reuse it.
         current_provider = trace.get_tracer_provider()
         assert isinstance(current_provider, TracerProvider), (
             "An incompatible Otel TracerProvider was instantiated. Please check runtime configuration."
         )
         self.tracer_provider: TracerProvider = current_provider
+        if head_sampling_ratio is None:
+            sampler.delegate = sampler.default
+        elif current_provider.sampler is not sampler:
+            logger.warning(
+                "Head sampling is ignored: the TracerProvider was not created "
+                "by UiPathTraceManager, so every span is recorded"
+            )
+        else:
+            sampler.delegate = ParentBased(TraceIdRatioBased(head_sampling_ratio))
         self._delegating = _DelegatingSpanProcessor.get_instance(current_provider)
         self.tracer_span_processors: list[SpanProcessor] = []
         self.execution_span_exporter = UiPathRuntimeExecutionSpanExporter()
@@ -1,11 +1,57 @@
 """Tracing types for UiPath SDK."""
 
-from typing import Callable
+from typing import Any, Callable, Optional
 
 from opentelemetry.sdk.trace import ReadableSpan
 from pydantic import BaseModel, Field
 
 
+class UiPathTraceSampling(BaseModel):
+    """Sampling rules applied to the spans sent to one exporter.
+
+    A ``ratio`` of the traces is kept, chosen from the trace id so every
+    process makes the same choice. With ``keep_errors`` or
+    ``latency_threshold``, the remaining traces are held until their root span
+    ends and kept whole if any span failed or the root was slow.
+    ``span_type_rates`` then caps how many spans of a given ``span_type`` are
+    exported per second; spans with an error status are never rate limited.
+
+    These rules run when spans end, so every span is still recorded and its
+    inputs and outputs serialized; they only cut what is exported. To skip
+    recording altogether when no evaluation needs the spans, pass
+    ``head_sampling_ratio`` to ``UiPathTraceManager``.
+    """
+
+    ratio: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="Fraction of traces kept up front."
+    )
+    keep_errors: bool = Field(
+        default=True, description="Keep whole traces containing an error span."
+    )
+    latency_threshold: float | None = Field(
+        default=None,
+        gt=0,
+        description="Keep whole traces whose root span lasted this many seconds.",
+    )
+    span_type_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description="Maximum spans per second exported for each span type.",
+    )
+    max_buffered_spans: int = Field(
+        default=10_000,
+        ge=1,
+        description=(
+            "Held spans above which the oldest traces are decided early, on "
+            "the spans seen so far."
+        ),
+    )
+    trace_timeout: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds after which a held trace is decided without its root.",
+    )
+
+
 class UiPathTraceSettings(BaseModel):
     """Trace settings for UiPath SDK."""
 
@@ -19,3 +65,47 @@ class UiPathTraceSettings(BaseModel):
             "Return True to export, False to skip."
         ),
     )
+    sampling: UiPathTraceSampling | None = Field(
+        default=None,
+        description=(
+            "Optional sampling rules, applied after span_filter. None exports "
+            "every span."
+        ),
+    )
+
+
+class GeneratorOutputCapture(BaseModel):
+    """How much of a traced generator's output is kept on its span.
+
+    By default the first and last 1000 yielded items are recorded as the
+    span output, within a 1 MiB budget, and only the first 128 items get a
+    ``Yielded`` event, so memory per span stays bounded however long the
+    stream is. The span also gets an ``output.item_count`` attribute, and
+    ``output.truncated`` when items were left out of the output.
+    """
+
+    head_items: int = Field(
+        default=1000, ge=0, description="Number of first yielded items to keep."
+    )
+    tail_items: int = Field(
+        default=1000, ge=0, description="Number of last yielded items to keep."
+    )
+    max_bytes: Optional[int] = Field(
+        default=1024 * 1024,
+        ge=0,
+        description=(
+            "Approximate size budget of the kept items, measured on their "
+            "string form. None keeps items regardless of size."
+        ),
+    )
+    max_events: int = Field(
+        default=128, ge=0, description="Number of items recorded as span events."
+    )
+    aggregate: Optional[Callable[[Any, Any], Any]] = Field(
+        default=None,
+        description=(
+            "Reducer folding each item into the previous result, e.g. "
+            "``operator.add`` to join streamed text chunks. When set, the "
+            "span output is the folded value and no items are kept."
+        ),
+    )
@@ -0,0 +1,76 @@
+import pytest
+from opentelemetry.sdk.trace import ReadableSpan
+
+from uipath.core.tracing.exporters import UiPathRuntimeExecutionSpanExporter
+
+
+def make_span(name: str, execution_id: str | None) -> ReadableSpan:
+    attributes = {"execution.id": execution_id} if execution_id else {}
+    return ReadableSpan(name=name, attributes=attributes)
+
+
+def span_names(exporter: UiPathRuntimeExecutionSpanExporter, execution_id: str):
+    return [span.name for span in exporter.get_spans(execution_id)]
+
+
+def test_groups_spans_by_execution_id():
+    exporter = UiPathRuntimeExecutionSpanExporter()
+
+    exporter.export(
+        [make_span("a", "exec-1"), make_span("b", "exec-2"), make_span("c", None)]
+    )
+    exporter.export([make_span("d", "exec-1")])
+
+    assert span_names(exporter, "exec-1") == ["a", "d"]
+    assert span_names(exporter, "exec-2") == ["b"]
+    assert exporter.get_spans("missing") == []
+
+    exporter.clear("exec-1")
+    assert exporter.get_spans("exec-1") == []
+    assert span_names(exporter, "exec-2") == ["b"]
+
+
+def test_evicts_least_recently_used_execution():
+    exporter = UiPathRuntimeExecutionSpanExporter(max_executions=2)
+
+    exporter.export([make_span("a", "exec-1"), make_span("b", "exec-2")])
+    exporter.get_spans("exec-1")
+    exporter.export([make_span("c", "exec-3")])
+
+    assert span_names(exporter, "exec-1") == ["a"]
+    assert exporter.get_spans("exec-2") == []
+    assert span_names(exporter, "exec-3") == ["c"]
+    assert exporter.metrics.evicted_executions == 1
+
+
+def test_caps_spans_per_execution_keeping_newest():
+    exporter = UiPathRuntimeExecutionSpanExporter(max_spans_per_execution=2)
+
+    exporter.export([make_span(name, "exec-1") for name in ["a", "b", "c", "d"]])
+
+    assert span_names(exporter, "exec-1") == ["c", "d"]
+    assert exporter.metrics.dropped_spans == 2
+
+
+def test_expires_executions_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("uipath.core.tracing.exporters.time.monotonic", lambda: now[0])
+    exporter = UiPathRuntimeExecutionSpanExporter(ttl=10)
+
+    exporter.export([make_span("a", "exec-1")])
+    now[0] = 105.0
+    exporter.export([make_span("b", "exec-2")])
+    now[0] = 112.0
+
+    assert exporter.get_spans("exec-1") == []
+    assert span_names(exporter, "exec-2") == ["b"]
+    assert exporter.metrics.expired_executions == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_executions": 0}, {"max_spans_per_execution": 0}, {"ttl": 0}],
+)
+def test_rejects_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        UiPathRuntimeExecutionSpanExporter(**kwargs)
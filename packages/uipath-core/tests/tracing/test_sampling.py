@@ -0,0 +1,170 @@
+"""Tests for export-side span sampling."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.trace import SpanContext, Status, StatusCode
+
+from uipath.core.tracing.sampling import SpanSampler
+from uipath.core.tracing.trace_manager import UiPathTraceManager
+from uipath.core.tracing.types import UiPathTraceSampling, UiPathTraceSettings
+
+
+def exported_names(exporter: MagicMock) -> list[str]:
+    return [span.name for call in exporter.export.call_args_list for span in call[0][0]]
+
+
+@pytest.fixture
+def sampled_exporter():
+    def make(sampling: UiPathTraceSampling):
+        exporter = MagicMock(spec=SpanExporter)
+        exporter.export.return_value = SpanExportResult.SUCCESS
+        trace_manager = UiPathTraceManager()
+        trace_manager.add_span_exporter(
+            exporter, batch=False, settings=UiPathTraceSettings(sampling=sampling)
+        )
+        managers.append(trace_manager)
+        return trace_manager, exporter
+
+    managers: list[UiPathTraceManager] = []
+    yield make
+    for trace_manager in managers:
+        trace_manager.shutdown()
+
+
+class TestTraceSampling:
+    def test_ratio_zero_keeps_only_failed_traces(self, sampled_exporter):
+        trace_manager, exporter = sampled_exporter(UiPathTraceSampling(ratio=0.0))
+        tracer = trace.get_tracer("test")
+
+        with tracer.start_as_current_span("ok-root"):
+            with tracer.start_as_current_span("ok-child"):
+                pass
+        with tracer.start_as_current_span("failed-root"):
+            with tracer.start_as_current_span("failed-child") as child:
+                child.set_status(Status(StatusCode.ERROR, "boom"))
+            with tracer.start_as_current_span("sibling"):
+                pass
+        trace_manager.flush_spans()
+
+        assert exported_names(exporter) == ["failed-child", "sibling", "failed-root"]
+
+    def test_ratio_one_exports_everything(self, sampled_exporter):
+        trace_manager, exporter = sampled_exporter(UiPathTraceSampling(ratio=1.0))
+        tracer = trace.get_tracer("test")
+
+        with tracer.start_as_current_span("root"):
+            with tracer.start_as_current_span("child"):
+                pass
+        trace_manager.flush_spans()
+
+        assert exported_names(exporter) == ["child", "root"]
+
+    def test_keeps_slow_traces(self, sampled_exporter):
+        trace_manager, exporter = sampled_exporter(
+            UiPathTraceSampling(ratio=0.0, keep_errors=False, latency_threshold=5)
+        )
+        tracer = trace.get_tracer("test")
+
+        fast = tracer.start_span("fast", start_time=0)
+        fast.end(end_time=1_000_000_000)
+        slow = tracer.start_span("slow", start_time=0)
+        slow.end(end_time=6_000_000_000)
+        trace_manager.flush_spans()
+
+        assert exported_names(exporter) == ["slow"]
+
+    def test_flush_decides_traces_still_open(self, sampled_exporter):
+        trace_manager, exporter = sampled_exporter(UiPathTraceSampling(ratio=0.0))
+        tracer = trace.get_tracer("test")
+
+        with tracer.start_as_current_span("root"):
+            with tracer.start_as_current_span("failed") as child:
+                child.set_status(Status(StatusCode.ERROR, "boom"))
+            trace_manager.flush_spans()
+            assert exported_names(exporter) == ["failed"]
+
+    def test_execution_store_still_sees_every_span(self, sampled_exporter):
+        trace_manager, exporter = sampled_exporter(UiPathTraceSampling(ratio=0.0))
+
+        with trace_manager.start_execution_span("root", "exec-sampled"):
+            pass
+
+        assert exported_names(exporter) == []
+        assert [s.name for s in trace_manager.get_execution_spans("exec-sampled")] == [
+            "root"
+        ]
+
+
+def make_span(
+    name: str,
+    trace_id: int,
+    span_type: str = "function_call_sync",
+    error: bool = False,
+    parent: SpanContext | None = None,
+) -> ReadableSpan:
+    context = SpanContext(trace_id=trace_id, span_id=1, is_remote=False)
+    status = Status(StatusCode.ERROR) if error else Status(StatusCode.UNSET)
+    return ReadableSpan(
+        name=name,
+        context=context,
+        parent=parent,
+        attributes={"span_type": span_type},
+        status=status,
+        start_time=0,
+        end_time=1,
+    )
+
+
+class TestSpanSampler:
+    def test_head_sampling_is_deterministic_per_trace(self):
+        sampler = SpanSampler(UiPathTraceSampling(ratio=0.5, keep_errors=False))
+
+        kept = [
+            trace_id
+            for trace_id in range(1, 2001)
+            if sampler.on_end(make_span("s", trace_id * 0x9E3779B97F4A7C15))
+        ]
+
+        assert 800 < len(kept) < 1200
+        assert all(
+            sampler.on_end(make_span("s", trace_id * 0x9E3779B97F4A7C15))
+            for trace_id in kept
+        )
+
+    def test_span_type_rate_limit(self):
+        now = [0.0]
+        sampler = SpanSampler(
+            UiPathTraceSampling(span_type_rates={"LLM": 2}), clock=lambda: now[0]
+        )
+
+        released = [sampler.on_end(make_span(f"llm-{i}", 1, "LLM")) for i in range(4)]
+        released.append(sampler.on_end(make_span("tool", 1, "TOOL")))
+        released.append(sampler.on_end(make_span("llm-error", 1, "LLM", error=True)))
+        now[0] = 1.0
+        released.append(sampler.on_end(make_span("llm-later", 1, "LLM")))
+
+        assert [span.name for spans in released for span in spans] == [
+            "llm-0",
+            "llm-1",
+            "tool",
+            "llm-error",
+            "llm-later",
+        ]
+
+    def test_buffer_limit_decides_oldest_trace_early(self):
+        sampler = SpanSampler(UiPathTraceSampling(ratio=0.0, max_buffered_spans=2))
+        parent = SpanContext(trace_id=1, span_id=2, is_remote=False)
+
+        def child(name, trace_id, error=False):
+            return make_span(name, trace_id, error=error, parent=parent)
+
+        assert sampler.on_end(child("a", 1, error=True)) == []
+        assert sampler.on_end(child("b", 2)) == []
+        released = sampler.on_end(child("c", 3))
+
+        assert [span.name for span in released] == ["a"]
+        assert sampler.drain() == []
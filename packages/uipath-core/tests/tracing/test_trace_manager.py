@@ -8,6 +8,7 @@ from opentelemetry.sdk.trace import SpanProcessor
 
 from uipath.core.tracing.trace_manager import (
     UiPathTraceManager,
+    _DelegatingSampler,
     _DelegatingSpanProcessor,
 )
 
@@ -202,3 +203,44 @@ class TestTraceManagerShutdown:
         old_processor.on_start.assert_not_called()
 
         tm2.shutdown()
+
+
+class TestHeadSampling:
+    """Tests for head sampling on the provider created by the trace manager."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_global_provider(self):
+        """Let UiPathTraceManager create the global provider for these tests."""
+        previous = trace._TRACER_PROVIDER
+        trace._TRACER_PROVIDER_SET_ONCE._done = False
+        trace._TRACER_PROVIDER = None
+        _DelegatingSampler._instance = None
+        yield
+        trace._TRACER_PROVIDER = previous
+        _DelegatingSampler._instance = None
+
+    def test_sampled_out_traces_are_not_recorded(self) -> None:
+        tm = UiPathTraceManager(head_sampling_ratio=0.0)
+        tracer = trace.get_tracer("uipath-runtime")
+
+        with tm.start_execution_span("root-span", "test") as root:
+            with tracer.start_as_current_span("child-span") as child:
+                assert not root.is_recording()
+                assert not child.is_recording()
+
+        assert tm.get_execution_spans("test") == []
+        tm.shutdown()
+
+    def test_next_manager_records_every_trace_by_default(self) -> None:
+        UiPathTraceManager(head_sampling_ratio=0.0).shutdown()
+        tm = UiPathTraceManager()
+
+        with tm.start_execution_span("root-span", "test") as root:
+            assert root.is_recording()
+
+        assert [span.name for span in tm.get_execution_spans("test")] == ["root-span"]
+        tm.shutdown()
+
+    def test_rejects_ratio_outside_unit_interval(self) -> None:
+        with pytest.raises(ValueError, match="head_sampling_ratio"):
+            UiPathTraceManager(head_sampling_ratio=1.5)
@@ -1,8 +1,10 @@
 import json
+import operator
 from asyncio import sleep
 from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Any, Sequence
+from unittest.mock import patch
 
 import pytest
 from opentelemetry import trace
@@ -13,7 +15,7 @@ from opentelemetry.sdk.trace.export import (
     SpanExportResult,
 )
 
-from uipath.core.tracing import traced
+from uipath.core.tracing import GeneratorOutputCapture, traced
 
 
 class InMemorySpanExporter(SpanExporter):
@@ -197,6 +199,63 @@ async def test_traced_async_generator_function(setup_tracer):
     assert span.attributes["output.value"] == "[0, 1, 2]"
 
 
+def test_traced_generator_keeps_bounded_output(setup_tracer):
+    exporter, provider = setup_tracer
+
+    @traced(
+        output_capture=GeneratorOutputCapture(head_items=2, tail_items=2, max_events=3)
+    )
+    def long_stream(n):
+        for i in range(n):
+            yield i
+
+    assert sum(long_stream(100_000)) == sum(range(100_000))
+
+    provider.shutdown()
+    span = exporter.get_exported_spans()[0]
+    assert json.loads(span.attributes["output.value"]) == [0, 1, 99_998, 99_999]
+    assert span.attributes["output.item_count"] == 100_000
+    assert span.attributes["output.truncated"] is True
+    assert [event.name for event in span.events] == [
+        "Yielded: 0",
+        "Yielded: 1",
+        "Yielded: 2",
+    ]
+
+
+def test_traced_generator_output_byte_budget(setup_tracer):
+    exporter, provider = setup_tracer
+
+    @traced(output_capture=GeneratorOutputCapture(max_bytes=10))
+    def chunks():
+        yield from ["abcd", "efgh", "ijkl", "mnop"]
+
+    assert list(chunks()) == ["abcd", "efgh", "ijkl", "mnop"]
+
+    provider.shutdown()
+    span = exporter.get_exported_spans()[0]
+    assert json.loads(span.attributes["output.value"]) == ["abcd", "efgh"]
+    assert span.attributes["output.truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_traced_async_generator_aggregates_output(setup_tracer):
+    exporter, provider = setup_tracer
+
+    @traced(output_capture=GeneratorOutputCapture(aggregate=operator.add))
+    async def stream_text():
+        for chunk in ["Hel", "lo", "!"]:
+            yield chunk
+
+    assert [chunk async for chunk in stream_text()] == ["Hel", "lo", "!"]
+
+    provider.shutdown()
+    span = exporter.get_exported_spans()[0]
+    assert json.loads(span.attributes["output.value"]) == "Hello!"
+    assert span.attributes["output.item_count"] == 3
+    assert "output.truncated" not in span.attributes
+
+
 def test_traced_bare_generator_function(setup_tracer):
     """Test @traced without parentheses on a generator function."""
     exporter, provider = setup_tracer
@@ -477,6 +536,31 @@ def test_traced_with_input_processor(setup_tracer):
     assert result["amount"] == 99.99
 
 
+def test_input_processor_receives_the_bound_arguments(setup_tracer):
+    exporter, provider = setup_tracer
+    profile = UserProfile(1, "Ada", "ada@example.com", "admin")
+    seen: list[dict[str, Any]] = []
+
+    def keep_user_name(inputs: dict[str, Any]) -> dict[str, Any]:
+        seen.append(inputs)
+        return {"user": inputs["user"].name, "tags": inputs["tags"]}
+
+    @traced(input_processor=keep_user_name)
+    def greet(user: UserProfile, tags: tuple[str, ...]) -> str:
+        return f"Hello {user.name}"
+
+    greet(profile, ("a", "b"))
+
+    provider.shutdown()
+    spans = exporter.get_exported_spans()
+
+    assert seen == [{"user": profile, "tags": ("a", "b")}]
+    assert json.loads(spans[0].attributes["input.value"]) == {
+        "user": "Ada",
+        "tags": ["a", "b"],
+    }
+
+
 def test_traced_with_output_processor(setup_tracer):
     exporter, provider = setup_tracer
 
@@ -1094,3 +1178,22 @@ def test_suppress_instrumentation_nested_functions(setup_tracer):
     provider.shutdown()
     spans = exporter.get_exported_spans()
     assert len(spans) == 0
+
+
+def test_traced_inspects_signature_once(setup_tracer):
+    exporter, provider = setup_tracer
+
+    @traced()
+    def tool(query, limit=10, **options):
+        return limit
+
+    with patch("uipath.core.tracing._utils.inspect.signature") as signature:
+        for limit in range(3):
+            tool("q", limit=limit, tag="x")
+
+    signature.assert_not_called()
+    provider.shutdown()
+    spans = exporter.get_exported_spans()
+    assert [json.loads(span.attributes["input.value"]) for span in spans] == [
+        {"query": "q", "limit": limit, "tag": "x"} for limit in range(3)
+    ]
@@ -1,7 +1,15 @@
 import inspect
 import json
+from unittest.mock import MagicMock, patch
 
-from uipath.core.tracing._utils import format_args_for_trace, format_args_for_trace_json
+import pytest
+
+from uipath.core.tracing._utils import (
+    ArgumentBinder,
+    format_args_for_trace,
+    format_args_for_trace_json,
+    set_span_input_attributes,
+)
 
 
 class TestSpanUtils:
@@ -88,3 +96,64 @@ class TestSpanUtils:
         assert response_format_data["__class__"] == "OutputFormat"
         assert "__module__" in response_format_data
         assert "schema" in response_format_data
+
+
+class TestArgumentBinder:
+    @pytest.mark.parametrize(
+        "args, kwargs",
+        [
+            ((1, 2), {}),
+            ((1,), {"c": 4, "b": 5}),
+            ((1, 2, 3), {"d": 6, "extra": 7}),
+            ((), {"a": 1, "b": 2, "unknown": 3}),
+            ((1, 2, 3, 4), {}),
+            ((1,), {"a": 2}),
+            ((), {}),
+        ],
+    )
+    def test_bind_matches_format_args_for_trace(self, args, kwargs):
+        def func(a, b, c=3, *, d=None, **options):
+            pass
+
+        expected = format_args_for_trace(inspect.signature(func), *args, **kwargs)
+
+        assert ArgumentBinder(func).bind(args, kwargs) == expected
+
+    def test_bind_skips_self_and_rejects_unknown_kwargs(self):
+        class TestClass:
+            def method(self, x, y=2):
+                pass
+
+        binder = ArgumentBinder(TestClass.method)
+
+        assert binder.bind((TestClass(), 10), {}) == {"x": 10, "y": 2}
+        assert binder.bind((), {"z": 1}) == {"args": (), "kwargs": {"z": 1}}
+
+    def test_bind_falls_back_for_var_positional(self):
+        def func(a, *rest, b=1):
+            pass
+
+        assert ArgumentBinder(func).bind((1, 2, 3), {}) == {
+            "a": 1,
+            "rest": (2, 3),
+            "b": 1,
+        }
+
+    def test_set_span_input_attributes_skips_non_recording_spans(self):
+        span = MagicMock()
+        span.is_recording.return_value = False
+
+        with patch("uipath.core.tracing._utils.serialize_json") as serialize:
+            set_span_input_attributes(
+                span,
+                trace_name="tool",
+                wrapped_func=lambda a: a,
+                args=(1,),
+                kwargs={},
+                span_type="TOOL",
+                run_type=None,
+                input_processor=None,
+            )
+
+        serialize.assert_not_called()
+        span.set_attribute.assert_not_called()
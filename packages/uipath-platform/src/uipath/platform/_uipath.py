@@ -1,44 +1,48 @@
+from __future__ import annotations
+
 from functools import cached_property
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pydantic import ValidationError
 
-from uipath.platform.automation_tracker import AutomationTrackerService
-
-from .action_center import TasksService
-from .agenthub._agenthub_service import AgentHubService
-from .agenthub._remote_a2a_service import RemoteA2aService
-from .automation_ops import AutomationOpsService
-from .chat import ConversationsService, UiPathLlmChatService, UiPathOpenAIService
 from .common import (
     ApiClient,
     UiPathApiConfig,
     UiPathExecutionContext,
 )
 from .common.auth import resolve_config_from_env
-from .connections import ConnectionsService
-from .context_grounding import ContextGroundingService
-from .documents import DocumentsService
-from .entities import EntitiesService
 from .errors import BaseUrlMissingError, SecretMissingError
-from .external_applications import ExternalApplicationService
-from .governance import GovernanceService
-from .guardrails import GuardrailsService
-from .memory import MemoryService
-from .orchestrator import (
-    AssetsService,
-    AttachmentsService,
-    BucketsService,
-    FolderService,
-    JobsService,
-    McpService,
-    OrchestratorSetupService,
-    ProcessesService,
-    QueuesService,
-)
-from .pii_detection import PiiDetectionService
-from .resource_catalog import ResourceCatalogService
-from .semantic_proxy import SemanticProxyService
+
+# Services are imported when first accessed: importing all of them up front
+# would make every `UiPath()` user pay for every service's dependencies.
+if TYPE_CHECKING:
+    from .action_center import TasksService
+    from .agenthub._agenthub_service import AgentHubService
+    from .agenthub._remote_a2a_service import RemoteA2aService
+    from .automation_ops import AutomationOpsService
+    from .automation_tracker import AutomationTrackerService
+    from .chat import ConversationsService, UiPathLlmChatService, UiPathOpenAIService
+    from .connections import ConnectionsService
+    from .context_grounding import ContextGroundingService
+    from .documents import DocumentsService
+    from .entities import EntitiesService
+    from .governance import GovernanceService
+    from .guardrails import GuardrailsService
+    from .memory import MemoryService
+    from .orchestrator import (
+        AssetsService,
+        AttachmentsService,
+        BucketsService,
+        FolderService,
+        JobsService,
+        McpService,
+        OrchestratorSetupService,
+        ProcessesService,
+        QueuesService,
+    )
+    from .pii_detection import PiiDetectionService
+    from .resource_catalog import ResourceCatalogService
+    from .semantic_proxy import SemanticProxyService
 
 
 def _has_valid_client_credentials(
@@ -63,6 +67,8 @@ class UiPath:
         try:
             if _has_valid_client_credentials(client_id, client_secret):
                 assert client_id and client_secret
+                from .external_applications import ExternalApplicationService
+
                 service = ExternalApplicationService(base_url)
                 token_data = service.get_token_data(client_id, client_secret, scope)
                 base_url, secret = service._base_url, token_data.access_token
@@ -87,30 +93,44 @@ class UiPath:
 
     @property
     def assets(self) -> AssetsService:
+        from .orchestrator import AssetsService
+
         return AssetsService(self._config, self._execution_context)
 
     @cached_property
     def attachments(self) -> AttachmentsService:
+        from .orchestrator import AttachmentsService
+
         return AttachmentsService(self._config, self._execution_context)
 
     @property
     def processes(self) -> ProcessesService:
+        from .orchestrator import ProcessesService
+
         return ProcessesService(self._config, self._execution_context, self.attachments)
 
     @property
     def tasks(self) -> TasksService:
+        from .action_center import TasksService
+
         return TasksService(self._config, self._execution_context)
 
     @cached_property
     def buckets(self) -> BucketsService:
+        from .orchestrator import BucketsService
+
         return BucketsService(self._config, self._execution_context)
 
     @cached_property
     def connections(self) -> ConnectionsService:
+        from .connections import ConnectionsService
+
         return ConnectionsService(self._config, self._execution_context, self.folders)
 
     @property
     def context_grounding(self) -> ContextGroundingService:
+        from .context_grounding import ContextGroundingService
+
         return ContextGroundingService(
             self._config,
             self._execution_context,
@@ -120,84 +140,124 @@ class UiPath:
 
     @property
     def memory(self) -> MemoryService:
+        from .memory import MemoryService
+
         return MemoryService(self._config, self._execution_context, self.folders)
 
     @property
     def documents(self) -> DocumentsService:
+        from .documents import DocumentsService
+
         return DocumentsService(self._config, self._execution_context)
 
     @property
     def queues(self) -> QueuesService:
+        from .orchestrator import QueuesService
+
         return QueuesService(self._config, self._execution_context)
 
     @property
     def jobs(self) -> JobsService:
+        from .orchestrator import JobsService
+
         return JobsService(self._config, self._execution_context)
 
     @cached_property
     def folders(self) -> FolderService:
+        from .orchestrator import FolderService
+
         return FolderService(self._config, self._execution_context)
 
     @property
     def llm_openai(self) -> UiPathOpenAIService:
+        from .chat import UiPathOpenAIService
+
         return UiPathOpenAIService(self._config, self._execution_context)
 
     @property
     def llm(self) -> UiPathLlmChatService:
+        from .chat import UiPathLlmChatService
+
         return UiPathLlmChatService(self._config, self._execution_context)
 
     @property
     def entities(self) -> EntitiesService:
+        from .entities import EntitiesService
+
         return EntitiesService(
             self._config, self._execution_context, folders_service=self.folders
         )
 
     @cached_property
     def resource_catalog(self) -> ResourceCatalogService:
+        from .resource_catalog import ResourceCatalogService
+
         return ResourceCatalogService(
             self._config, self._execution_context, self.folders
         )
 
     @property
     def conversational(self) -> ConversationsService:
+        from .chat import ConversationsService
+
         return ConversationsService(self._config, self._execution_context)
 
     @property
     def mcp(self) -> McpService:
+        from .orchestrator import McpService
+
         return McpService(self._config, self._execution_context, self.folders)
 
     @property
     def guardrails(self) -> GuardrailsService:
+        from .guardrails import GuardrailsService
+
         return GuardrailsService(self._config, self._execution_context)
 
     @cached_property
     def governance(self) -> GovernanceService:
+        from .governance import GovernanceService
+
         return GovernanceService(self._config, self._execution_context)
 
     @property
     def agenthub(self) -> AgentHubService:
+        from .agenthub._agenthub_service import AgentHubService
+
         return AgentHubService(self._config, self._execution_context, self.folders)
 
     @property
     def remote_a2a(self) -> RemoteA2aService:
+        from .agenthub._remote_a2a_service import RemoteA2aService
+
         return RemoteA2aService(self._config, self._execution_context, self.folders)
 
     @property
     def orchestrator_setup(self) -> OrchestratorSetupService:
+        from .orchestrator import OrchestratorSetupService
+
         return OrchestratorSetupService(self._config, self._execution_context)
 
     @property
     def automation_ops(self) -> AutomationOpsService:
+        from .automation_ops import AutomationOpsService
+
         return AutomationOpsService(self._config, self._execution_context)
 
     @property
     def pii_detection(self) -> PiiDetectionService:
+        from .pii_detection import PiiDetectionService
+
         return PiiDetectionService(self._config, self._execution_context)
 
     @property
     def semantic_proxy(self) -> SemanticProxyService:
+        from .semantic_proxy import SemanticProxyService
+
         return SemanticProxyService(self._config, self._execution_context)
 
     @property
     def automation_tracker(self) -> AutomationTrackerService:
+        from .automation_tracker import AutomationTrackerService
+
         return AutomationTrackerService(self._config, self._execution_context)
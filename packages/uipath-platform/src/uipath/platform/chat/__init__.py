@@ -6,6 +6,7 @@ This module provides services for chat-related functionality including:
 """
 
 from ._conversations_service import ConversationsService
+from ._embedding_cache import EmbeddingCache
 from ._llm_gateway_service import (
     DEFAULT_REQUESTING_FEATURE,
     DEFAULT_REQUESTING_PRODUCT,
@@ -44,6 +45,7 @@ __all__ = [
     "DEFAULT_REQUESTING_FEATURE",
     "UiPathLlmChatService",
     "UiPathOpenAIService",
+    "EmbeddingCache",
     # LLM Throttling
     "get_llm_semaphore",
     "set_llm_concurrency",
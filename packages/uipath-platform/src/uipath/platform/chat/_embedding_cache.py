@@ -0,0 +1,156 @@
+"""Content-addressed cache of text embeddings.
+
+An embedding only depends on the model and the text, so vectors computed once
+can be reused by every later run that embeds the same text. Entries are keyed
+by model and a hash of the text: recently used vectors stay in an in-memory
+LRU, and with a ``path`` every vector is also kept in a SQLite database that
+several processes can share.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_MAX_MEMORY_ENTRIES = 10_000
+
+# SQLite limits the number of parameters of a single statement.
+_LOOKUP_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    key BLOB NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (model, key)
+) WITHOUT ROWID
+"""
+
+
+def _hash_text(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _pack(vector: list[float]) -> bytes:
+    # Stored as doubles, so a hit returns exactly the floats the API returned.
+    return array("d", vector).tobytes()
+
+
+def _unpack(data: bytes) -> list[float]:
+    vector = array("d")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """Cache of embedding vectors keyed by model and text hash.
+
+    Without a ``path`` the cache only lives in memory. With one, vectors are
+    written to a SQLite database at that path as soon as they are added, so
+    an interrupted run keeps everything it embedded so far. It can be used
+    from several threads.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+    ):
+        """Open a cache, creating the database at ``path`` if needed."""
+        if max_memory_entries < 0:
+            raise ValueError("max_memory_entries must be >= 0")
+        self.path = Path(path) if path is not None else None
+        self.max_memory_entries = max_memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[tuple[str, bytes], list[float]] = OrderedDict()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            assert self.path is not None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Calls may come from different worker threads; _lock serializes them.
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            # WAL lets readers proceed while another process writes.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _remember(self, key: tuple[str, bytes], vector: list[float]) -> None:
+        if self.max_memory_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, texts: list[str]) -> dict[str, list[float]]:
+        """Cached vectors of ``texts`` for ``model``; missing texts are left out."""
+        with self._lock:
+            return self._get_many(model, texts)
+
+    def _get_many(self, model: str, texts: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        on_disk: dict[bytes, str] = {}
+        for text in texts:
+            digest = _hash_text(text)
+            vector = self._memory.get((model, digest))
+            if vector is not None:
+                self._memory.move_to_end((model, digest))
+                found[text] = vector
+            else:
+                on_disk[digest] = text
+
+        if on_disk and self.path is not None:
+            connection = self._connect()
+            digests = list(on_disk)
+            for start in range(0, len(digests), _LOOKUP_CHUNK_SIZE):
+                chunk = digests[start : start + _LOOKUP_CHUNK_SIZE]
+                rows = connection.execute(
+                    "SELECT key, vector FROM embeddings WHERE model = ? "
+                    f"AND key IN ({', '.join('?' * len(chunk))})",
+                    (model, *chunk),
+                )
+                for digest, data in rows:
+                    vector = _unpack(data)
+                    found[on_disk[digest]] = vector
+                    self._remember((model, digest), vector)
+
+        self.hits += len(found)
+        self.misses += len(texts) - len(found)
+        return found
+
+    def set_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        """Store the vector of each text for ``model``."""
+        with self._lock:
+            self._set_many(model, vectors)
+
+    def _set_many(self, model: str, vectors: dict[str, list[float]]) -> None:
+        rows = []
+        for text, vector in vectors.items():
+            digest = _hash_text(text)
+            self._remember((model, digest), list(vector))
+            rows.append((model, digest, _pack(vector)))
+
+        if rows and self.path is not None:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, key, vector) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+
+    def close(self) -> None:
+        """Close the database; the cache reopens it on next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
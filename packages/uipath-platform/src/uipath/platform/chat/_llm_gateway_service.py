@@ -18,6 +18,7 @@ Classes:
 
 from typing import Any, Optional
 
+from anyio import to_thread
 from opentelemetry import trace
 from pydantic import BaseModel
 from uipath.core.tracing import traced
@@ -29,9 +30,13 @@ from ..common._config import UiPathApiConfig
 from ..common._endpoints_manager import EndpointManager
 from ..common._execution_context import UiPathExecutionContext
 from ..common._models import Endpoint
+from ..common._task_group import first_error_task_group
+from ._embedding_cache import EmbeddingCache
 from ._model_capabilities import should_skip_temperature
 from .llm_gateway import (
     ChatCompletion,
+    EmbeddingItem,
+    EmbeddingUsage,
     SpecificToolChoice,
     TextEmbedding,
     ToolChoice,
@@ -103,6 +108,41 @@ class EmbeddingModels(object):
     text_embedding_ada_002 = "text-embedding-ada-002"
 
 
+# Per-request limits of the embedding models, keyed by model name: the number
+# of inputs and the estimated number of tokens across all inputs.
+EMBEDDING_BATCH_LIMITS: dict[str, tuple[int, int]] = {
+    EmbeddingModels.text_embedding_3_large: (2048, 300_000),
+    EmbeddingModels.text_embedding_ada_002: (2048, 300_000),
+}
+# Conservative limits for models not listed above.
+DEFAULT_EMBEDDING_BATCH_LIMITS = (16, 8191)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Upper estimate of the tokens in ``text``, without loading a tokenizer."""
+    # Tokens average about four characters; bytes / 3 errs on the high side.
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def _split_embedding_batches(
+    texts: list[str], max_inputs: int, max_tokens: int
+) -> list[list[str]]:
+    """Split ``texts`` into consecutive batches within the request limits."""
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_tokens = 0
+    for text in texts:
+        tokens = _estimate_tokens(text)
+        if batch and (len(batch) >= max_inputs or batch_tokens + tokens > max_tokens):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 def _cleanup_schema(schema: dict[str, Any]) -> dict[str, Any]:
     """Clean up a JSON schema for use with LLM Gateway.
 
@@ -223,6 +263,16 @@ class UiPathOpenAIService(BaseService):
             )
             ```
         """
+        return await self._request_embeddings(
+            input, embedding_model, openai_api_version
+        )
+
+    async def _request_embeddings(
+        self,
+        input: str | list[str],
+        embedding_model: str,
+        openai_api_version: str,
+    ) -> TextEmbedding:
         endpoint = EndpointManager.get_embeddings_endpoint().format(
             model=embedding_model, api_version=openai_api_version
         )
@@ -239,6 +289,104 @@ class UiPathOpenAIService(BaseService):
 
         return TextEmbedding.model_validate(response.json())
 
+    # Inputs and vectors can run into millions of items, too many for a span.
+    @traced(
+        name="llm_embeddings_batch",
+        run_type="uipath",
+        hide_input=True,
+        hide_output=True,
+    )
+    async def embeddings_batch(
+        self,
+        texts: list[str],
+        embedding_model: str = EmbeddingModels.text_embedding_ada_002,
+        openai_api_version: str = API_VERSION,
+        batch_size: Optional[int] = None,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> TextEmbedding:
+        """Generate embeddings for many texts with as few requests as possible.
+
+        Identical texts are embedded once, and texts found in ``cache`` are not
+        sent at all. The rest are split into batches within the model's
+        request limits (see ``EMBEDDING_BATCH_LIMITS``), which are sent
+        concurrently, up to the limit set with ``set_llm_concurrency``.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            embedding_model (str, optional): The embedding model to use.
+                Defaults to EmbeddingModels.text_embedding_ada_002.
+            openai_api_version (str, optional): The OpenAI API version to use.
+                Defaults to API_VERSION.
+            batch_size (Optional[int]): Maximum number of texts per request,
+                overriding the model's input limit.
+            cache (Optional[EmbeddingCache]): Cache to look vectors up in and
+                to store new vectors in.
+
+        Returns:
+            TextEmbedding: One item per input text, in input order, with
+                ``index`` set to the text's position in ``texts``. The usage
+                only counts the tokens of the requests actually sent.
+
+        Examples:
+            ```python
+            cache = EmbeddingCache(".uipath/embeddings.sqlite3")
+            result = await service.embeddings_batch(chunks, cache=cache)
+            vectors = [item.embedding for item in result.data]
+            ```
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        unique_texts = list(dict.fromkeys(texts))
+        vectors = (
+            await to_thread.run_sync(cache.get_many, embedding_model, unique_texts)
+            if cache is not None
+            else {}
+        )
+        max_inputs, max_tokens = EMBEDDING_BATCH_LIMITS.get(
+            embedding_model, DEFAULT_EMBEDDING_BATCH_LIMITS
+        )
+        if batch_size is not None:
+            max_inputs = batch_size
+        batches = _split_embedding_batches(
+            [text for text in unique_texts if text not in vectors],
+            max_inputs,
+            max_tokens,
+        )
+
+        usages: list[EmbeddingUsage] = []
+
+        async def embed_batch(batch: list[str]) -> None:
+            response = await self._request_embeddings(
+                batch, embedding_model, openai_api_version
+            )
+            batch_vectors = {
+                batch[item.index]: item.embedding for item in response.data
+            }
+            # Cache each batch as it lands, so a failed run keeps its progress.
+            if cache is not None:
+                await to_thread.run_sync(cache.set_many, embedding_model, batch_vectors)
+            vectors.update(batch_vectors)
+            usages.append(response.usage)
+
+        # A failing batch cancels the others instead of leaving them running.
+        async with first_error_task_group() as task_group:
+            for batch in batches:
+                task_group.start_soon(embed_batch, batch)
+
+        return TextEmbedding(
+            data=[
+                EmbeddingItem(embedding=vectors[text], index=index, object="embedding")
+                for index, text in enumerate(texts)
+            ],
+            model=embedding_model,
+            object="list",
+            usage=EmbeddingUsage(
+                prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+                total_tokens=sum(usage.total_tokens for usage in usages),
+            ),
+        )
+
     @traced(name="LLM call", run_type="uipath")
     async def chat_completions(
         self,
@@ -3,6 +3,8 @@
 This module contains common models used across multiple services.
 """
 
+from typing import TYPE_CHECKING
+
 from uipath.core.triggers import UiPathResumeMetadata
 
 from ._api_client import ApiClient
@@ -21,6 +23,13 @@ from ._endpoints_manager import EndpointManager
 from ._execution_context import ExecutionSourceContext, UiPathExecutionContext
 from ._folder_context import FolderContext, header_folder
 from ._http_config import get_ca_bundle_path, get_httpx_client_kwargs
+from ._http_transport import (
+    aclose_shared_transports,
+    configure_http_transport,
+    get_shared_async_transport,
+    get_shared_transport,
+    reset_http_transport,
+)
 from ._models import Endpoint, RequestSpec
 from ._reference_context import (
     ReferenceContext,
@@ -41,35 +50,14 @@ from ._url import UiPathUrl
 from ._user_agent import user_agent_value
 from .auth import TokenData
 from .dynamic_schema import jsonschema_to_pydantic
-from .interrupt_models import (
-    CreateBatchTransform,
-    CreateDeepRag,
-    CreateDeepRagRaw,
-    CreateEphemeralIndex,
-    CreateEphemeralIndexRaw,
-    CreateEscalation,
-    CreateTask,
-    DocumentExtraction,
-    DocumentExtractionValidation,
-    InvokeProcess,
-    InvokeProcessRaw,
-    InvokeSystemAgent,
-    WaitBatchTransform,
-    WaitDeepRag,
-    WaitDeepRagRaw,
-    WaitDocumentExtraction,
-    WaitDocumentExtractionValidation,
-    WaitEphemeralIndex,
-    WaitEphemeralIndexRaw,
-    WaitEscalation,
-    WaitIntegrationEvent,
-    WaitJob,
-    WaitJobRaw,
-    WaitSystemAgent,
-    WaitTask,
-    WaitUntil,
+from .paging import (
+    PagedResult,
+    aiter_pages,
+    iter_pages,
+    keyset_filter,
+    odata_page_fetcher,
+    odata_page_fetcher_async,
 )
-from .paging import PagedResult
 from .timeout import (
     UiPathTimeoutError,
     assert_no_timeout,
@@ -77,6 +65,36 @@ from .timeout import (
     is_timeout,
 )
 
+if TYPE_CHECKING:
+    from .interrupt_models import (
+        CreateBatchTransform,
+        CreateDeepRag,
+        CreateDeepRagRaw,
+        CreateEphemeralIndex,
+        CreateEphemeralIndexRaw,
+        CreateEscalation,
+        CreateTask,
+        DocumentExtraction,
+        DocumentExtractionValidation,
+        InvokeProcess,
+        InvokeProcessRaw,
+        InvokeSystemAgent,
+        WaitBatchTransform,
+        WaitDeepRag,
+        WaitDeepRagRaw,
+        WaitDocumentExtraction,
+        WaitDocumentExtractionValidation,
+        WaitEphemeralIndex,
+        WaitEphemeralIndexRaw,
+        WaitEscalation,
+        WaitIntegrationEvent,
+        WaitJob,
+        WaitJobRaw,
+        WaitSystemAgent,
+        WaitTask,
+        WaitUntil,
+    )
+
 __all__ = [
     "ApiClient",
     "BaseService",
@@ -96,6 +114,11 @@ __all__ = [
     "WaitJob",
     "WaitJobRaw",
     "PagedResult",
+    "aiter_pages",
+    "iter_pages",
+    "keyset_filter",
+    "odata_page_fetcher",
+    "odata_page_fetcher_async",
     "CreateDeepRag",
     "CreateDeepRagRaw",
     "WaitDeepRag",
@@ -120,6 +143,11 @@ __all__ = [
     "user_agent_value",
     "get_ca_bundle_path",
     "get_httpx_client_kwargs",
+    "get_shared_transport",
+    "get_shared_async_transport",
+    "configure_http_transport",
+    "reset_http_transport",
+    "aclose_shared_transports",
     "resource_override",
     "header_folder",
     "validate_pagination_params",
@@ -152,3 +180,43 @@ __all__ = [
 ]
 
 from .validation import validate_pagination_params
+
+# The interrupt models reference the models of most services (tasks, jobs,
+# context grounding, documents), so they are only imported on first use.
+_INTERRUPT_MODELS = {
+    "CreateBatchTransform",
+    "CreateDeepRag",
+    "CreateDeepRagRaw",
+    "CreateEphemeralIndex",
+    "CreateEphemeralIndexRaw",
+    "CreateEscalation",
+    "CreateTask",
+    "DocumentExtraction",
+    "DocumentExtractionValidation",
+    "InvokeProcess",
+    "InvokeProcessRaw",
+    "InvokeSystemAgent",
+    "WaitBatchTransform",
+    "WaitDeepRag",
+    "WaitDeepRagRaw",
+    "WaitDocumentExtraction",
+    "WaitDocumentExtractionValidation",
+    "WaitEphemeralIndex",
+    "WaitEphemeralIndexRaw",
+    "WaitEscalation",
+    "WaitIntegrationEvent",
+    "WaitJob",
+    "WaitJobRaw",
+    "WaitSystemAgent",
+    "WaitTask",
+    "WaitUntil",
+}
+
+
+def __getattr__(name: str):
+    """Resolve the interrupt models on demand."""
+    if name in _INTERRUPT_MODELS:
+        from . import interrupt_models
+
+        return getattr(interrupt_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,16 @@
 import sys
 import types
+from contextlib import asynccontextmanager, contextmanager
 from logging import getLogger
-from typing import Any, Literal, Union
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    ContextManager,
+    Iterator,
+    Literal,
+    Union,
+)
 
 from anyio import to_thread
 from httpx import (
@@ -10,6 +19,7 @@ from httpx import (
     Client,
     Headers,
     HTTPStatusError,
+    Request,
     Response,
 )
 from opentelemetry import trace
@@ -27,6 +37,7 @@ from ..errors import EnrichedException
 from ._config import UiPathApiConfig
 from ._execution_context import UiPathExecutionContext
 from ._http_config import get_httpx_client_kwargs
+from ._http_transport import get_shared_async_transport, get_shared_transport
 from ._service_url_overrides import inject_routing_headers, resolve_service_url
 from ._url import UiPathUrl
 from ._user_agent import user_agent_value
@@ -161,12 +172,17 @@ class BaseService:
 
         self._url = UiPathUrl(self._config.base_url)
 
-        client_kwargs = get_httpx_client_kwargs(headers=self.default_headers)
+        client_kwargs = get_httpx_client_kwargs(
+            headers=self.default_headers, pooled=True
+        )
         client_kwargs["base_url"] = self._url.base_url
         client_kwargs["headers"] = Headers(client_kwargs.get("headers", {}))
 
-        self._client = Client(**client_kwargs)
-        self._client_async = AsyncClient(**client_kwargs)
+        # Clients are per service; the connection pools behind them are shared.
+        self._client = Client(**client_kwargs, transport=get_shared_transport())
+        self._client_async = AsyncClient(
+            **client_kwargs, transport=get_shared_async_transport()
+        )
 
         self._logger.debug(f"HEADERS: {self.default_headers}")
 
@@ -177,7 +193,9 @@ class BaseService:
 
         The asynchronous client is closed by the active async backend. Closing the
         synchronous client can block while its transport is torn down, so that work
-        runs in a backend-neutral worker thread.
+        runs in a backend-neutral worker thread. The shared connection pools stay
+        open for other services; use :func:`aclose_shared_transports` to release
+        them.
         """
         try:
             await self._client_async.aclose()
@@ -205,17 +223,7 @@ class BaseService:
         self._logger.debug(f"HEADERS: {kwargs.get('headers', self._client.headers)}")
 
         specific_component = _get_caller_component()
-
-        kwargs.setdefault("headers", {})
-        kwargs["headers"][HEADER_USER_AGENT] = user_agent_value(specific_component)
-        _inject_trace_context(kwargs["headers"])
-
-        override = resolve_service_url(str(url))
-        if override:
-            scoped_url = override
-            inject_routing_headers(kwargs["headers"])
-        else:
-            scoped_url = self._url.scope_url(str(url), scoped)
+        scoped_url = self._prepare_request(url, scoped, specific_component, kwargs)
 
         response = self._client.request(method, scoped_url, **kwargs)
 
@@ -249,18 +257,9 @@ class BaseService:
             f"HEADERS: {kwargs.get('headers', self._client_async.headers)}"
         )
 
-        kwargs.setdefault("headers", {})
-        kwargs["headers"][HEADER_USER_AGENT] = user_agent_value(
-            self._specific_component
+        scoped_url = self._prepare_request(
+            url, scoped, self._specific_component, kwargs
         )
-        _inject_trace_context(kwargs["headers"])
-
-        override = resolve_service_url(str(url))
-        if override:
-            scoped_url = override
-            inject_routing_headers(kwargs["headers"])
-        else:
-            scoped_url = self._url.scope_url(str(url), scoped)
 
         response = await self._client_async.request(method, scoped_url, **kwargs)
 
@@ -271,6 +270,90 @@ class BaseService:
             raise EnrichedException(e) from e
         return response
 
+    def stream(
+        self,
+        method: str,
+        url: Union[URL, str],
+        *,
+        scoped: Literal["org", "tenant"] = "tenant",
+        **kwargs: Any,
+    ) -> ContextManager[Response]:
+        """Send a request and stream the response body instead of loading it.
+
+        Same headers and URL scoping as :meth:`request`, without automatic
+        retries: a body that has been partially consumed cannot be replayed
+        transparently, so callers own their retry policy.
+
+        Examples:
+            >>> with service.stream("GET", url) as response:
+            ...     for chunk in response.iter_bytes():
+            ...         file.write(chunk)
+        """
+        self._logger.debug(f"Stream: {method} {url}")
+        scoped_url = self._prepare_request(url, scoped, _get_caller_component(), kwargs)
+        request = self._client.build_request(method, scoped_url, **kwargs)
+        return self._send_stream(request)
+
+    def stream_async(
+        self,
+        method: str,
+        url: Union[URL, str],
+        *,
+        scoped: Literal["org", "tenant"] = "tenant",
+        **kwargs: Any,
+    ) -> AsyncContextManager[Response]:
+        """Asynchronous version of :meth:`stream`."""
+        self._logger.debug(f"Stream: {method} {url}")
+        scoped_url = self._prepare_request(
+            url, scoped, self._specific_component, kwargs
+        )
+        request = self._client_async.build_request(method, scoped_url, **kwargs)
+        return self._send_stream_async(request)
+
+    @contextmanager
+    def _send_stream(self, request: Request) -> Iterator[Response]:
+        response = self._client.send(request, stream=True)
+        try:
+            try:
+                response.raise_for_status()
+            except HTTPStatusError as e:
+                response.read()
+                raise EnrichedException(e) from e
+            yield response
+        finally:
+            response.close()
+
+    @asynccontextmanager
+    async def _send_stream_async(self, request: Request) -> AsyncIterator[Response]:
+        response = await self._client_async.send(request, stream=True)
+        try:
+            try:
+                response.raise_for_status()
+            except HTTPStatusError as e:
+                await response.aread()
+                raise EnrichedException(e) from e
+            yield response
+        finally:
+            await response.aclose()
+
+    def _prepare_request(
+        self,
+        url: Union[URL, str],
+        scoped: Literal["org", "tenant"],
+        specific_component: str,
+        kwargs: dict[str, Any],
+    ) -> str:
+        """Add the platform headers to ``kwargs`` and return the resolved URL."""
+        kwargs.setdefault("headers", {})
+        kwargs["headers"][HEADER_USER_AGENT] = user_agent_value(specific_component)
+        _inject_trace_context(kwargs["headers"])
+
+        override = resolve_service_url(str(url))
+        if override:
+            inject_routing_headers(kwargs["headers"])
+            return override
+        return self._url.scope_url(str(url), scoped)
+
     @property
     def default_headers(self) -> dict[str, str]:
         return {
@@ -54,17 +54,27 @@ def create_ssl_context(cafile: str):
 
 def get_httpx_client_kwargs(
     headers: Dict[str, str] | None = None,
+    *,
+    pooled: bool = False,
 ) -> Dict[str, Any]:
     """Get standardized httpx client configuration.
 
     Args:
         headers: Optional headers to merge with platform headers (e.g. licensing).
             Caller headers take priority on key conflicts.
+        pooled: Reuse the SSL context of the process-wide shared transport
+            instead of building a new one. Use together with
+            ``transport=get_shared_transport()`` (or the async variant).
     """
     client_kwargs: Dict[str, Any] = {"follow_redirects": True, "timeout": 30.0}
 
-    ca_bundle = get_ca_bundle_path()
-    client_kwargs["verify"] = create_ssl_context(ca_bundle) if ca_bundle else False
+    if pooled:
+        from ._http_transport import get_shared_ssl_context
+
+        client_kwargs["verify"] = get_shared_ssl_context()
+    else:
+        ca_bundle = get_ca_bundle_path()
+        client_kwargs["verify"] = create_ssl_context(ca_bundle) if ca_bundle else False
 
     from uipath.platform.constants import HEADER_LICENSING_CONTEXT
 
@@ -0,0 +1,243 @@
+"""Process-wide pooled HTTP transports shared by all platform services.
+
+Every service owns its own ``httpx.Client``/``httpx.AsyncClient`` (headers,
+base URL and timeouts differ per service), but the connection pools behind
+them are shared through this module. Creating a service is therefore cheap:
+no new SSL context is built and keep-alive connections to the same host are
+reused across services and across ``UiPath`` property accesses.
+
+Closing a client does not close the shared pool. Call
+:func:`aclose_shared_transports` on shutdown to release the pooled
+connections.
+"""
+
+import asyncio
+import os
+import ssl
+import sys
+import threading
+import weakref
+from importlib.util import find_spec
+from typing import Any, TypeAlias
+
+import httpx
+import sniffio
+from anyio import to_thread
+
+from . import _http_config
+from ._http_config import expand_path, get_ca_bundle_path
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+_max_connections: int | None = DEFAULT_MAX_CONNECTIONS
+_max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+_keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY
+_http2: bool = False
+
+_VerifyKey: TypeAlias = tuple[str | None, str | None]
+
+_lock = threading.Lock()
+# Pools and SSL contexts are keyed by the SSL verification settings in effect
+# when they were created, so toggling ``UIPATH_DISABLE_SSL_VERIFY`` or the CA
+# bundle env vars never reuses a pool built with a different trust store.
+_ssl_contexts: dict[_VerifyKey, ssl.SSLContext | bool] = {}
+_sync_pools: dict[_VerifyKey, httpx.HTTPTransport] = {}
+# Async connections are bound to the event loop that opened them, so async
+# pools are kept per loop (or per trio run) and dropped with it.
+_async_pools: "weakref.WeakKeyDictionary[Any, dict[_VerifyKey, httpx.AsyncHTTPTransport]]" = weakref.WeakKeyDictionary()
+
+
+def _verify_key() -> _VerifyKey:
+    return get_ca_bundle_path(), expand_path(os.environ.get("SSL_CERT_DIR"))
+
+
+def _get_ssl_context(key: _VerifyKey) -> ssl.SSLContext | bool:
+    context = _ssl_contexts.get(key)
+    if context is None:
+        ca_bundle = key[0]
+        context = _http_config.create_ssl_context(ca_bundle) if ca_bundle else False
+        _ssl_contexts[key] = context
+    return context
+
+
+def get_shared_ssl_context() -> ssl.SSLContext | bool:
+    """Get the SSL context used by the shared pools, building it once per trust settings.
+
+    Returns ``False`` when SSL verification is disabled.
+    """
+    return _get_ssl_context(_verify_key())
+
+
+def current_event_loop_key() -> Any:
+    """Hashable, weak-referenceable identity of the running event loop.
+
+    Objects bound to an event loop (pools, events) are kept per key, so asyncio
+    loops and trio runs never share them.
+    """
+    if sniffio.current_async_library() == "trio":
+        # trio is not a dependency; it is already imported if it is running.
+        return sys.modules["trio"].lowlevel.current_trio_token()
+    return asyncio.get_running_loop()
+
+
+def _transport_kwargs(key: _VerifyKey) -> dict[str, Any]:
+    return {
+        "verify": _get_ssl_context(key),
+        "limits": httpx.Limits(
+            max_connections=_max_connections,
+            max_keepalive_connections=_max_keepalive_connections,
+            keepalive_expiry=_keepalive_expiry,
+        ),
+        "http2": _http2,
+    }
+
+
+def _get_sync_pool() -> httpx.HTTPTransport:
+    key = _verify_key()
+    pool = _sync_pools.get(key)
+    if pool is None:
+        with _lock:
+            pool = _sync_pools.get(key)
+            if pool is None:
+                pool = httpx.HTTPTransport(**_transport_kwargs(key))
+                _sync_pools[key] = pool
+    return pool
+
+
+def _get_async_pool() -> httpx.AsyncHTTPTransport:
+    key = _verify_key()
+    loop_key = current_event_loop_key()
+    with _lock:
+        pools = _async_pools.setdefault(loop_key, {})
+        pool = pools.get(key)
+        if pool is None:
+            pool = httpx.AsyncHTTPTransport(**_transport_kwargs(key))
+            pools[key] = pool
+    return pool
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Sync transport that routes every request through the shared pool.
+
+    ``close`` is a no-op so that closing one client never tears down the
+    connections other services are using.
+    """
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return _get_sync_pool().handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`_SharedTransport`."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await _get_async_pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+_shared_transport = _SharedTransport()
+_shared_async_transport = _SharedAsyncTransport()
+
+
+def get_shared_transport() -> httpx.BaseTransport:
+    """Get the process-wide sync transport to pass as ``httpx.Client(transport=...)``."""
+    return _shared_transport
+
+
+def get_shared_async_transport() -> httpx.AsyncBaseTransport:
+    """Get the process-wide async transport to pass as ``httpx.AsyncClient(transport=...)``."""
+    return _shared_async_transport
+
+
+def configure_http_transport(
+    *,
+    max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+) -> None:
+    """Configure the shared connection pools. Call before making any requests.
+
+    Pools created before this call are dropped; in-flight requests on them
+    complete normally and their connections are released once unreferenced.
+
+    Args:
+        max_connections: Maximum number of concurrent connections per pool
+            (``None`` for no limit).
+        max_keepalive_connections: Maximum number of idle keep-alive
+            connections kept per pool (``None`` for no limit).
+        keepalive_expiry: Seconds an idle connection is kept alive.
+        http2: Negotiate HTTP/2 when the server supports it. Requires the
+            ``h2`` package (``pip install 'httpx[http2]'``).
+
+    Raises:
+        ValueError: If a limit is less than 1 or ``keepalive_expiry`` is negative.
+        ImportError: If ``http2`` is requested and ``h2`` is not installed.
+    """
+    if max_connections is not None and max_connections < 1:
+        raise ValueError("max_connections must be at least 1")
+    if max_keepalive_connections is not None and max_keepalive_connections < 1:
+        raise ValueError("max_keepalive_connections must be at least 1")
+    if keepalive_expiry is not None and keepalive_expiry < 0:
+        raise ValueError("keepalive_expiry must not be negative")
+    if http2 and find_spec("h2") is None:
+        raise ImportError(
+            "HTTP/2 was requested but the 'h2' package is not installed. "
+            "Install it with: pip install 'httpx[http2]'"
+        )
+
+    global _max_connections, _max_keepalive_connections, _keepalive_expiry, _http2
+    with _lock:
+        _max_connections = max_connections
+        _max_keepalive_connections = max_keepalive_connections
+        _keepalive_expiry = keepalive_expiry
+        _http2 = http2
+        _sync_pools.clear()
+        _async_pools.clear()
+
+
+def reset_http_transport() -> None:
+    """Reset the shared pool configuration to defaults and drop existing pools."""
+    configure_http_transport()
+
+
+async def aclose_shared_transports() -> None:
+    """Close the shared connection pools.
+
+    Closes every sync pool and the async pools owned by the running event
+    loop. Pools bound to other event loops are dropped, since their
+    connections can only be closed from the loop that opened them. New
+    requests transparently open fresh pools.
+    """
+    with _lock:
+        sync_pools = list(_sync_pools.values())
+        _sync_pools.clear()
+        async_pools = list(_async_pools.pop(current_event_loop_key(), {}).values())
+        _async_pools.clear()
+
+    try:
+        for async_pool in async_pools:
+            await async_pool.aclose()
+    finally:
+        for sync_pool in sync_pools:
+            await to_thread.run_sync(sync_pool.close)
+
+
+def _reset_after_fork() -> None:
+    # Pooled sockets are shared with the parent after fork(); the child must
+    # open its own connections instead of writing into the parent's streams.
+    global _lock
+    _lock = threading.Lock()
+    _sync_pools.clear()
+    _async_pools.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,31 @@
+"""Task groups that raise the first task error instead of an ExceptionGroup."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import anyio
+from anyio.abc import TaskGroup
+
+
+@asynccontextmanager
+async def first_error_task_group() -> AsyncIterator[TaskGroup]:
+    """Like :func:`anyio.create_task_group`, but re-raise the first task error.
+
+    anyio task groups wrap task errors in an ``ExceptionGroup``. Services that
+    fan requests out over a task group use this instead, so a failed request
+    raises the same error as when it is sent on its own. The other tasks are
+    still cancelled as soon as one of them fails.
+    """
+    try:
+        async with anyio.create_task_group() as task_group:
+            yield task_group
+    except BaseExceptionGroup as group:
+        # No ``from``: the error keeps the __cause__ it was raised with.
+        raise _first_error(group)  # noqa: B904
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    error: BaseException = group
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
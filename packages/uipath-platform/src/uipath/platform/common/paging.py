@@ -1,12 +1,39 @@
-"""Pagination result types for UiPath SDK."""
+"""Pagination result types and lazy iterators for UiPath SDK."""
 
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Generic, Iterator, List, Optional, TypeVar
+from operator import attrgetter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-__all__ = ["PagedResult"]
+__all__ = [
+    "Page",
+    "PagedResult",
+    "aiter_pages",
+    "iter_pages",
+    "keyset_filter",
+    "odata_page_fetcher",
+    "odata_page_fetcher_async",
+]
 
 T = TypeVar("T")
 
+Page = Tuple[Sequence[T], Optional[Any]]
+"""A page of items and the cursor of the next page (None on the last page)."""
+
 
 @dataclass(frozen=True)
 class PagedResult(Generic[T]):
@@ -42,6 +69,10 @@ class PagedResult(Generic[T]):
             if not result.continuation_token:
                 break
             token = result.continuation_token
+
+        # Or let the service walk every page lazily
+        for file in sdk.buckets.iter_files(name="my-storage"):
+            process(file)
     """
 
     items: List[T]
@@ -61,3 +92,205 @@ class PagedResult(Generic[T]):
     def __bool__(self) -> bool:
         """Return True if page contains items."""
         return bool(self.items)
+
+
+def keyset_filter(filter: Optional[str], last_id: Optional[int]) -> Optional[str]:
+    """Combine an OData ``$filter`` with ``Id gt last_id`` for keyset paging.
+
+    Paging by ``Id`` instead of ``$skip`` keeps every page equally cheap and is
+    not bound by the server's maximum skip offset.
+    """
+    if last_id is None:
+        return filter
+    if not filter:
+        return f"Id gt {last_id}"
+    return f"({filter}) and Id gt {last_id}"
+
+
+def _next_odata_cursor(
+    page: PagedResult[T],
+    cursor: Any,
+    keyset: bool,
+    page_size: int,
+    id_of: Callable[[T], Any],
+) -> Any:
+    if not page.has_more or not page.items:
+        return None
+    if keyset:
+        return id_of(page.items[-1])
+    return (cursor or 0) + page_size
+
+
+def odata_page_fetcher(
+    list_page: Callable[..., PagedResult[T]],
+    *,
+    filter: Optional[str] = None,
+    orderby: Optional[str] = None,
+    page_size: int,
+    id_of: Callable[[T], Any] = attrgetter("id"),
+) -> Callable[[Any], Page[T]]:
+    """Adapt an OData ``list`` method into a ``fetch_page`` for :func:`iter_pages`.
+
+    ``list_page`` is called with ``filter``, ``orderby``, ``skip`` and ``top``.
+    Without an ``orderby`` the pages are walked by ascending ``Id`` (see
+    :func:`keyset_filter`); with one, by ``$skip``, which the server caps.
+    """
+    keyset = orderby is None
+
+    def fetch_page(cursor: Any) -> Page[T]:
+        if keyset:
+            page = list_page(
+                filter=keyset_filter(filter, cursor),
+                orderby="Id asc",
+                skip=0,
+                top=page_size,
+            )
+        else:
+            page = list_page(
+                filter=filter, orderby=orderby, skip=cursor or 0, top=page_size
+            )
+        return page.items, _next_odata_cursor(page, cursor, keyset, page_size, id_of)
+
+    return fetch_page
+
+
+def odata_page_fetcher_async(
+    list_page: Callable[..., Awaitable[PagedResult[T]]],
+    *,
+    filter: Optional[str] = None,
+    orderby: Optional[str] = None,
+    page_size: int,
+    id_of: Callable[[T], Any] = attrgetter("id"),
+) -> Callable[[Any], Awaitable[Page[T]]]:
+    """Asynchronous version of :func:`odata_page_fetcher`."""
+    keyset = orderby is None
+
+    async def fetch_page(cursor: Any) -> Page[T]:
+        if keyset:
+            page = await list_page(
+                filter=keyset_filter(filter, cursor),
+                orderby="Id asc",
+                skip=0,
+                top=page_size,
+            )
+        else:
+            page = await list_page(
+                filter=filter, orderby=orderby, skip=cursor or 0, top=page_size
+            )
+        return page.items, _next_odata_cursor(page, cursor, keyset, page_size, id_of)
+
+    return fetch_page
+
+
+def _remaining(limit: Optional[int], yielded: int) -> Optional[int]:
+    return None if limit is None else limit - yielded
+
+
+def _running_asyncio() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _discard_result(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+def iter_pages(
+    fetch_page: Callable[[Any], Page[T]],
+    cursor: Any = None,
+    *,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Lazily yield the items of a paginated API.
+
+    ``fetch_page(cursor)`` returns the items of one page and the cursor of the
+    next one, or None when there are no more pages. Only the current page and,
+    with ``prefetch``, the next one are held in memory. The next page is fetched
+    in a background thread while the current one is consumed.
+
+    Iteration stops after ``limit`` items, or when the caller stops consuming;
+    a prefetched page is then discarded.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+    executor: Optional[ThreadPoolExecutor] = None
+    pending: Optional[Future[Page[T]]] = None
+    yielded = 0
+    try:
+        items, next_cursor = fetch_page(cursor)
+        while True:
+            remaining = _remaining(limit, yielded)
+            if remaining is not None and remaining <= len(items):
+                yield from items[:remaining]
+                return
+            if prefetch and next_cursor is not None:
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="uipath-paging"
+                    )
+                # Run in a copy of the caller's context so spans nest correctly.
+                context = contextvars.copy_context()
+                pending = executor.submit(context.run, fetch_page, next_cursor)
+            yield from items
+            yielded += len(items)
+            if next_cursor is None:
+                return
+            if pending is not None:
+                items, next_cursor = pending.result()
+                pending = None
+            else:
+                items, next_cursor = fetch_page(next_cursor)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[Any], Awaitable[Page[T]]],
+    cursor: Any = None,
+    *,
+    limit: Optional[int] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """Asynchronous version of :func:`iter_pages`.
+
+    Under asyncio the next page is fetched in a background task while the
+    current one is consumed. Other backends fetch pages one after another.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+    prefetch = prefetch and _running_asyncio()
+    pending: Optional[asyncio.Future[Page[T]]] = None
+    yielded = 0
+    try:
+        items, next_cursor = await fetch_page(cursor)
+        while True:
+            remaining = _remaining(limit, yielded)
+            if remaining is not None and remaining <= len(items):
+                for item in items[:remaining]:
+                    yield item
+                return
+            if prefetch and next_cursor is not None:
+                pending = asyncio.ensure_future(fetch_page(next_cursor))
+            for item in items:
+                yield item
+            yielded += len(items)
+            if next_cursor is None:
+                return
+            if pending is not None:
+                items, next_cursor = await pending
+                pending = None
+            else:
+                items, next_cursor = await fetch_page(next_cursor)
+    finally:
+        if pending is not None:
+            # An abandoned prefetch may already have failed; don't log that.
+            pending.add_done_callback(_discard_result)
+            pending.cancel()
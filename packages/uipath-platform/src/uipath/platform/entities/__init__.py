@@ -4,6 +4,7 @@ This module contains models related to UiPath Entities service.
 """
 
 from ._entities_service import EntitiesService
+from ._entity_bulk import records_to_ndjson
 from ._entity_ontology_service import DataFabricOntologyItem
 from .entities import (
     AggregateRow,
@@ -81,4 +82,5 @@ __all__ = [
     "ReferenceType",
     "RetrieveEntityRecordsResponse",
     "SourceJoinCriteria",
+    "records_to_ndjson",
 ]
@@ -15,7 +15,7 @@ resolution.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Type
 
 from httpx import Response
 from uipath.core.tracing import traced
@@ -24,8 +24,14 @@ from ..common._base_service import BaseService
 from ..common._bindings import _resource_overwrites
 from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
+from ..common.paging import Page, aiter_pages, iter_pages
 from ..errors._datafabric_error import attach_datafabric_error_mapping
 from ..orchestrator._folder_service import FolderService
+from ._entity_bulk import (
+    DEFAULT_BULK_BATCH_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_EXPORT_PAGE_SIZE,
+)
 from ._entity_data_service import EntityDataService, FileContent
 from ._entity_ontology_service import EntityOntologyService
 from ._entity_resolution import (
@@ -60,6 +66,16 @@ from .entities import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RECORDS_PAGE_SIZE = 1000
+
+
+def _next_records_start(
+    records: EntityRecordsListResponse, start: int
+) -> Optional[int]:
+    if not records or not records.has_next_page:
+        return None
+    return start + len(records)
+
 
 class EntitiesService(BaseService):
     """Service for managing UiPath Data Service entities.
@@ -845,6 +861,219 @@ class EntitiesService(BaseService):
             expand=expand,
         )
 
+    def iter_records(
+        self,
+        entity_key: str,
+        schema: Optional[Type[Any]] = None,
+        *,
+        expansion_level: Optional[int] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page_size: int = DEFAULT_RECORDS_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[EntityRecord]:
+        """Lazily iterate over every record of an entity, page by page.
+
+        Pages are read with :meth:`list_records`, so ``schema``, ``filter``,
+        ``orderby``, ``select`` and ``expand`` behave the same way. Only one or
+        two pages are held in memory at a time; with ``prefetch`` the next page
+        is requested while the current one is consumed.
+
+        Args:
+            entity_key (str): The unique key/identifier of the entity.
+            schema (Optional[Type[Any]]): Optional schema class each record is validated against.
+            expansion_level (Optional[int]): Depth of foreign-key expansion.
+            filter (Optional[str]): OData ``$filter`` expression.
+            orderby (Optional[str]): OData ``$orderby`` expression.
+            select (Optional[List[str]]): Field names to include.
+            expand (Optional[List[str]]): Relationship names to expand inline.
+            page_size (int): Records requested per page (default 1000).
+            limit (Optional[int]): Stop after this many records.
+            prefetch (bool): Fetch the next page in the background (default True).
+
+        Raises:
+            ValueError: If page_size is less than 1.
+
+        Examples:
+            Scan an entity with constant memory::
+
+                for record in entities_service.iter_records(
+                    "Customers", filter="status eq 'active'"
+                ):
+                    print(record.id)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        def fetch_page(start: Optional[int]) -> Page[EntityRecord]:
+            start = start or 0
+            records = self.list_records(
+                entity_key,
+                schema=schema,
+                start=start,
+                limit=page_size,
+                expansion_level=expansion_level,
+                filter=filter,
+                orderby=orderby,
+                select=select,
+                expand=expand,
+            )
+            return records, _next_records_start(records, start)
+
+        return iter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def aiter_records(
+        self,
+        entity_key: str,
+        schema: Optional[Type[Any]] = None,
+        *,
+        expansion_level: Optional[int] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page_size: int = DEFAULT_RECORDS_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[EntityRecord]:
+        """Asynchronously iterate over every record of an entity, page by page.
+
+        See :meth:`iter_records` for the arguments.
+
+        Examples:
+            Scan an entity with constant memory::
+
+                async for record in entities_service.aiter_records("Customers"):
+                    print(record.id)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        async def fetch_page(start: Optional[int]) -> Page[EntityRecord]:
+            start = start or 0
+            records = await self.list_records_async(
+                entity_key,
+                schema=schema,
+                start=start,
+                limit=page_size,
+                expansion_level=expansion_level,
+                filter=filter,
+                orderby=orderby,
+                select=select,
+                expand=expand,
+            )
+            return records, _next_records_start(records, start)
+
+        return aiter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def export_records(
+        self,
+        entity_key: str,
+        *,
+        expansion_level: Optional[int] = None,
+        filter: Optional[str] = None,
+        orderby: str = "Id",
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream every record of an entity as batches of raw dicts.
+
+        The first page is read to learn the total record count; the remaining
+        pages are then read with up to ``max_concurrency`` requests in flight
+        and yielded in order. Rows are returned as the plain dicts sent by Data
+        Service, without building an :class:`EntityRecord` per row, and at
+        most ``max_concurrency`` pages are held in memory at a time.
+
+        Pages are addressed by offset, so rows are read in ``orderby`` order
+        (``Id`` by default) to keep concurrent pages from overlapping. Records
+        inserted or deleted while the export runs may be skipped or repeated.
+
+        Args:
+            entity_key (str): The unique key/identifier of the entity.
+            expansion_level (Optional[int]): Depth of foreign-key expansion.
+            filter (Optional[str]): OData ``$filter`` expression.
+            orderby (str): OData ``$orderby`` expression (default ``"Id"``).
+            select (Optional[List[str]]): Field names to include.
+            expand (Optional[List[str]]): Relationship names to expand inline.
+            page_size (int): Records per request (default 1000).
+            max_concurrency (int): Maximum pages read at once (default 4).
+
+        Returns:
+            Iterator[List[Dict[str, Any]]]: One list of record dicts per page.
+
+        Raises:
+            ValueError: If page_size or max_concurrency is less than 1.
+
+        Examples:
+            Export an entity to NDJSON::
+
+                from uipath.platform.entities import records_to_ndjson
+
+                with open("customers.ndjson", "wb") as file:
+                    for batch in entities_service.export_records("Customers"):
+                        file.write(records_to_ndjson(batch))
+
+            Build Arrow record batches (requires ``pyarrow``)::
+
+                import pyarrow as pa
+
+                for batch in entities_service.export_records(
+                    "Customers", select=["Id", "name", "email"]
+                ):
+                    table = pa.Table.from_pylist(batch)
+        """
+        return self._data.export_records(
+            entity_key,
+            expansion_level=expansion_level,
+            filter=filter,
+            orderby=orderby,
+            select=select,
+            expand=expand,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+
+    def export_records_async(
+        self,
+        entity_key: str,
+        *,
+        expansion_level: Optional[int] = None,
+        filter: Optional[str] = None,
+        orderby: str = "Id",
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Asynchronously stream every record of an entity as batches of raw dicts.
+
+        See :meth:`export_records` for the arguments.
+
+        Examples:
+            Count the records of an entity::
+
+                total = 0
+                async for batch in entities_service.export_records_async(
+                    "Customers", select=["Id"]
+                ):
+                    total += len(batch)
+        """
+        return self._data.export_records_async(
+            entity_key,
+            expansion_level=expansion_level,
+            filter=filter,
+            orderby=orderby,
+            select=select,
+            expand=expand,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        )
+
     @traced(name="entity_insert_record", run_type="uipath")
     def insert_record(
         self,
@@ -1147,16 +1376,35 @@ class EntitiesService(BaseService):
     def insert_records(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> EntityRecordsBatchResponse:
-        """Insert multiple records into an entity in a single batch operation.
+        """Insert multiple records into an entity in batch operations.
+
+        ``records`` may be any iterable, including a generator, and is
+        consumed lazily. Input larger than ``batch_size`` records or 4 MiB of
+        JSON is split into several batch requests, up to ``max_concurrency`` in
+        flight, and their responses are merged in input order. With
+        ``fail_on_first`` the batches are sent one at a time and no batch is
+        sent after one reports a failure.
+
+        Input that fits in one request succeeds or raises as a single request.
+        Once it spans several requests, a request that fails does not discard
+        the batches already applied: it is resent with backoff after a
+        transient error (connection error, timeout, 429 or 5xx), and otherwise
+        its records are reported in ``failure_records`` with the error. Insert
+        batches are only resent after a connection error or 429, since a batch
+        may already be inserted when the server answers 5xx or the response
+        times out.
 
         Args:
             entity_key (str): The unique key/identifier of the entity.
-            records (List[Any]): List of records to insert. Each record may be
+            records (Iterable[Any]): Records to insert. Each record may be
                 a dict, a Pydantic model, an :class:`EntityRecord`, or any
                 object exposing ``__dict__``.
             schema (Optional[Type[Any]]): Optional schema class for validation. When provided,
@@ -1167,12 +1415,18 @@ class EntitiesService(BaseService):
                 the first per-record failure. When ``False`` (default), all
                 records are attempted and the response lists both
                 ``success_records`` and ``failure_records``.
+            batch_size (int): Maximum records per request (default 1000).
+            max_concurrency (int): Maximum requests in flight at once
+                (default 4).
 
         Returns:
             EntityRecordsBatchResponse: Response containing successful and failed record operations.
                 - success_records: List of successfully inserted :class:`EntityRecord` objects
                 - failure_records: List of :class:`FailureRecord` describing per-record errors
 
+        Raises:
+            ValueError: If batch_size or max_concurrency is less than 1.
+
         Examples:
             Insert records without schema::
 
@@ -1228,6 +1482,18 @@ class EntitiesService(BaseService):
                 # Access inserted records with validated structure
                 for record in response.success_records:
                     print(f"Inserted: {record.name} (ID: {record.id})")
+
+            Copy an entity into another one::
+
+                response = entities_service.insert_records(
+                    "CustomersArchive",
+                    (
+                        {k: v for k, v in row.items() if k != "Id"}
+                        for batch in entities_service.export_records("Customers")
+                        for row in batch
+                    ),
+                )
+                print(f"Failed: {len(response.failure_records)}")
         """
         return self._data.insert_records(
             entity_key,
@@ -1235,22 +1501,29 @@ class EntitiesService(BaseService):
             schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
         )
 
     @traced(name="entity_record_insert_batch", run_type="uipath")
     async def insert_records_async(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> EntityRecordsBatchResponse:
-        """Asynchronously insert multiple records into an entity in a single batch operation.
+        """Asynchronously insert multiple records into an entity in batch operations.
+
+        Batches records like :meth:`insert_records`.
 
         Args:
             entity_key (str): The unique key/identifier of the entity.
-            records (List[Any]): List of records to insert. Each record may be
+            records (Iterable[Any]): Records to insert. Each record may be
                 a dict, a Pydantic model, an :class:`EntityRecord`, or any
                 object exposing ``__dict__``.
             schema (Optional[Type[Any]]): Optional schema class for validation. When provided,
@@ -1261,6 +1534,9 @@ class EntitiesService(BaseService):
                 the first per-record failure. When ``False`` (default), all
                 records are attempted and the response lists both
                 ``success_records`` and ``failure_records``.
+            batch_size (int): Maximum records per request (default 1000).
+            max_concurrency (int): Maximum requests in flight at once
+                (default 4).
 
         Returns:
             EntityRecordsBatchResponse: Response containing successful and failed record operations.
@@ -1320,22 +1596,42 @@ class EntitiesService(BaseService):
             schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
         )
 
     @traced(name="entity_record_update_batch", run_type="uipath")
     def update_records(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
     ) -> EntityRecordsBatchResponse:
-        """Update multiple records in an entity in a single batch operation.
+        """Update multiple records in an entity in batch operations.
+
+        ``records`` may be any iterable, including a generator, and is
+        consumed lazily; with a ``schema`` every record is validated before
+        the first request is sent. Input larger than ``batch_size`` records or
+        4 MiB of JSON is split into several batch requests, up to
+        ``max_concurrency`` in flight, and their responses are merged in input
+        order. With ``fail_on_first`` the batches are sent one at a time and no
+        batch is sent after one reports a failure.
+
+        Input that fits in one request succeeds or raises as a single request.
+        Once it spans several requests, a request that fails does not discard
+        the batches already applied: it is resent with backoff after a
+        transient error (connection error, timeout, 429 or 5xx), and otherwise
+        its records are reported in ``failure_records`` with the error.
 
         Args:
             entity_key (str): The unique key/identifier of the entity.
-            records (List[Any]): List of records to update. Each record must
+            records (Iterable[Any]): Records to update. Each record must
                 include its ``Id`` field. A record may be a dict, a Pydantic
                 model, an :class:`EntityRecord`, or any object exposing
                 ``__dict__``.
@@ -1347,12 +1643,22 @@ class EntitiesService(BaseService):
                 the first per-record failure. When ``False`` (default), all
                 records are attempted and the response lists both
                 ``success_records`` and ``failure_records``.
+            batch_size (int): Maximum records per request (default 1000).
+            max_concurrency (int): Maximum requests in flight at once
+                (default 4).
+            record_retries (int): How many times records listed in
+                ``failure_records`` are resent (default 0, since most
+                per-record failures are validation errors).
 
         Returns:
             EntityRecordsBatchResponse: Response containing successful and failed record operations.
                 - success_records: List of successfully updated :class:`EntityRecord` objects
                 - failure_records: List of :class:`FailureRecord` describing per-record errors
 
+        Raises:
+            ValueError: If batch_size or max_concurrency is less than 1, or
+                record_retries is negative.
+
         Examples:
             Update records::
 
@@ -1406,22 +1712,31 @@ class EntitiesService(BaseService):
             schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
         )
 
     @traced(name="entity_record_update_batch", run_type="uipath")
     async def update_records_async(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
     ) -> EntityRecordsBatchResponse:
-        """Asynchronously update multiple records in an entity in a single batch operation.
+        """Asynchronously update multiple records in an entity in batch operations.
+
+        Batches records like :meth:`update_records`.
 
         Args:
             entity_key (str): The unique key/identifier of the entity.
-            records (List[Any]): List of records to update. Each record must
+            records (Iterable[Any]): Records to update. Each record must
                 include its ``Id`` field. A record may be a dict, a Pydantic
                 model, an :class:`EntityRecord`, or any object exposing
                 ``__dict__``.
@@ -1433,6 +1748,12 @@ class EntitiesService(BaseService):
                 the first per-record failure. When ``False`` (default), all
                 records are attempted and the response lists both
                 ``success_records`` and ``failure_records``.
+            batch_size (int): Maximum records per request (default 1000).
+            max_concurrency (int): Maximum requests in flight at once
+                (default 4).
+            record_retries (int): How many times records listed in
+                ``failure_records`` are resent (default 0, since most
+                per-record failures are validation errors).
 
         Returns:
             EntityRecordsBatchResponse: Response containing successful and failed record operations.
@@ -1492,30 +1813,60 @@ class EntitiesService(BaseService):
             schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
         )
 
     @traced(name="entity_record_delete_batch", run_type="uipath")
     def delete_records(
         self,
         entity_key: str,
-        record_ids: List[str],
+        record_ids: Iterable[str],
         fail_on_first: Optional[bool] = None,
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
     ) -> EntityRecordsBatchResponse:
-        """Delete multiple records from an entity in a single batch operation.
+        """Delete multiple records from an entity in batch operations.
+
+        ``record_ids`` may be any iterable, including a generator, and is
+        consumed lazily. Input larger than ``batch_size`` records or 4 MiB of
+        JSON is split into several batch requests, up to ``max_concurrency`` in
+        flight, and their responses are merged in input order. With
+        ``fail_on_first`` the batches are sent one at a time and no batch is
+        sent after one reports a failure.
+
+        Input that fits in one request succeeds or raises as a single request.
+        Once it spans several requests, a request that fails does not discard
+        the batches already applied: it is resent with backoff after a
+        transient error (connection error, timeout, 429 or 5xx), and otherwise
+        its records are reported in ``failure_records`` with the error.
 
         Args:
             entity_key (str): The unique key/identifier of the entity.
-            record_ids (List[str]): List of record IDs (GUIDs) to delete.
+            record_ids (Iterable[str]): Record IDs (GUIDs) to delete.
             fail_on_first (Optional[bool]): When ``True``, stop the batch on
                 the first per-record failure. When ``False`` (default), all
                 records are attempted and the response lists both
                 ``success_records`` and ``failure_records``.
+            batch_size (int): Maximum records per request (default 1000).
+            max_concurrency (int): Maximum requests in flight at once
+                (default 4).
+            record_retries (int): How many times records listed in
+                ``failure_records`` are resent (default 0, since most
+                per-record failures are validation errors).
 
         Returns:
             EntityRecordsBatchResponse: Response containing successful and failed record operations.
                 - success_records: List of successfully deleted :class:`EntityRecord` objects
                 - failure_records: List of :class:`FailureRecord` describing per-record errors
 
+        Raises:
+            ValueError: If batch_size or max_concurrency is less than 1, or
+                record_retries is negative.
+
         Examples:
             Delete specific records by ID::
 
@@ -1552,25 +1903,42 @@ class EntitiesService(BaseService):
                     print(f"Deleted {len(response.success_records)} inactive records")
         """
         return self._data.delete_records(
-            entity_key, record_ids, fail_on_first=fail_on_first
+            entity_key,
+            record_ids,
+            fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
         )
 
     @traced(name="entity_record_delete_batch", run_type="uipath")
     async def delete_records_async(
         self,
         entity_key: str,
-        record_ids: List[str],
+        record_ids: Iterable[str],
         fail_on_first: Optional[bool] = None,
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
     ) -> EntityRecordsBatchResponse:
-        """Asynchronously delete multiple records from an entity in a single batch operation.
+        """Asynchronously delete multiple records from an entity in batch operations.
+
+        Batches records like :meth:`delete_records`.
 
         Args:
             entity_key (str): The unique key/identifier of the entity.
-            record_ids (List[str]): List of record IDs (GUIDs) to delete.
+            record_ids (Iterable[str]): Record IDs (GUIDs) to delete.
             fail_on_first (Optional[bool]): When ``True``, stop the batch on
                 the first per-record failure. When ``False`` (default), all
                 records are attempted and the response lists both
                 ``success_records`` and ``failure_records``.
+            batch_size (int): Maximum records per request (default 1000).
+            max_concurrency (int): Maximum requests in flight at once
+                (default 4).
+            record_retries (int): How many times records listed in
+                ``failure_records`` are resent (default 0, since most
+                per-record failures are validation errors).
 
         Returns:
             EntityRecordsBatchResponse: Response containing successful and failed record operations.
@@ -1613,7 +1981,12 @@ class EntitiesService(BaseService):
                     print(f"Deleted {len(response.success_records)} inactive records")
         """
         return await self._data.delete_records_async(
-            entity_key, record_ids, fail_on_first=fail_on_first
+            entity_key,
+            record_ids,
+            fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
         )
 
     @traced(name="entity_retrieve_records", run_type="uipath")
@@ -0,0 +1,178 @@
+"""Helpers for bulk record export and import.
+
+Exports read raw record dicts page by page with several pages in flight, so
+no :class:`EntityRecord` is built per row and memory is bounded by
+``max_concurrency * page_size`` rows. Batch writes are split by record count
+and JSON payload size and sent concurrently; once a write spans several
+batches, a batch whose request fails is reported through ``failure_records``
+so the outcome of the batches already applied is not lost.
+"""
+
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Sequence, Tuple
+
+import anyio
+from httpx import ConnectError, ConnectTimeout, PoolTimeout, TransportError
+
+from ..common.retry import exponential_backoff_with_jitter
+from ..errors import EnrichedException
+from .entities import EntityRecordsBatchResponse, FailureRecord
+
+DEFAULT_EXPORT_PAGE_SIZE = 1000
+DEFAULT_BULK_BATCH_SIZE = 1000
+DEFAULT_BULK_CONCURRENCY = 4
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+MAX_BATCH_ATTEMPTS = 3
+
+_MAX_BATCH_BACKOFF = 30.0
+
+BatchOperation = Literal["insert", "update", "delete"]
+
+
+def validate_bulk_params(size: int, max_concurrency: int) -> None:
+    """Reject non-positive page/batch sizes and concurrency limits."""
+    if size < 1:
+        raise ValueError("page_size and batch_size must be >= 1")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+
+def plan_batches(
+    items: Iterable[Any],
+    max_records: int,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Iterator[List[Any]]:
+    """Lazily group ``items`` into batches bounded by count and JSON size.
+
+    An item whose payload alone exceeds ``max_bytes`` is sent in a batch of
+    its own so the server can report it as a per-record failure.
+    """
+    batch: List[Any] = []
+    batch_bytes = 2
+    for item in items:
+        item_bytes = len(json.dumps(item, ensure_ascii=False, default=str).encode()) + 1
+        if batch and (
+            len(batch) >= max_records or batch_bytes + item_bytes > max_bytes
+        ):
+            yield batch
+            batch, batch_bytes = [], 2
+        batch.append(item)
+        batch_bytes += item_bytes
+    if batch:
+        yield batch
+
+
+def records_to_ndjson(records: Iterable[Dict[str, Any]]) -> bytes:
+    """Serialize record dicts as newline-delimited JSON.
+
+    Examples:
+        Stream an entity to an NDJSON file::
+
+            from uipath.platform.entities import records_to_ndjson
+
+            with open("customers.ndjson", "wb") as file:
+                for batch in sdk.entities.export_records("Customers"):
+                    file.write(records_to_ndjson(batch))
+    """
+    return b"".join(
+        json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
+        for record in records
+    )
+
+
+def is_batch_request_error(exception: BaseException) -> bool:
+    """Errors of a batch request, reported per batch once a write spans several."""
+    return isinstance(exception, (TransportError, EnrichedException))
+
+
+def is_retryable_batch_error(exception: BaseException) -> bool:
+    """Transient errors after which a batch may be resent."""
+    if isinstance(exception, TransportError):
+        return True
+    if isinstance(exception, EnrichedException):
+        return exception.status_code in (408, 429) or exception.status_code >= 500
+    return False
+
+
+def can_resend_batch(operation: BatchOperation, exception: BaseException) -> bool:
+    """Whether a batch that failed with a transient error can be sent again.
+
+    Updates and deletes are idempotent. An insert may already have been
+    applied when the server answered 5xx or the response timed out, so it is
+    only resent when the server never processed it.
+    """
+    if operation != "insert":
+        return True
+    if isinstance(exception, (ConnectError, ConnectTimeout, PoolTimeout)):
+        return True
+    return isinstance(exception, EnrichedException) and exception.status_code == 429
+
+
+def batch_backoff(attempt: int) -> float:
+    """Delay before resending a batch after failed ``attempt``."""
+    return min(exponential_backoff_with_jitter(attempt, 2.0), _MAX_BATCH_BACKOFF)
+
+
+def sleep_before_batch_retry(attempt: int) -> None:
+    """Block the calling thread for the backoff of ``attempt``."""
+    time.sleep(batch_backoff(attempt))
+
+
+async def sleep_before_batch_retry_async(attempt: int) -> None:
+    """Asynchronous version of :func:`sleep_before_batch_retry`."""
+    await anyio.sleep(batch_backoff(attempt))
+
+
+def failed_batch(
+    items: Sequence[Any], error: BaseException
+) -> EntityRecordsBatchResponse:
+    """Report every record (or record id) of a batch that could not be sent."""
+    failures = []
+    for item in items:
+        if isinstance(item, dict):
+            record_id = item.get("Id")
+            failures.append(
+                FailureRecord(
+                    id=record_id if isinstance(record_id, str) else None,
+                    error=str(error),
+                    record=item,
+                )
+            )
+        else:
+            failures.append(FailureRecord(id=str(item), error=str(error)))
+    return EntityRecordsBatchResponse(failure_records=failures)
+
+
+def split_retryable_failures(
+    operation: BatchOperation, failures: Sequence[FailureRecord]
+) -> Tuple[List[Any], List[FailureRecord]]:
+    """Split failures into payloads that can be resent and failures to keep.
+
+    Deletes are resent by id and updates by the ``record`` payload the server
+    echoed back; failures carrying neither are kept as they are. Insert
+    failures are always kept, since resending a record that may already have
+    been inserted would duplicate it.
+    """
+    if operation == "insert":
+        return [], list(failures)
+    retry: List[Any] = []
+    kept: List[FailureRecord] = []
+    for failure in failures:
+        payload = failure.id if operation == "delete" else failure.record
+        if payload:
+            retry.append(payload)
+        else:
+            kept.append(failure)
+    return retry, kept
+
+
+def merge_batch_responses(
+    responses: Iterable[EntityRecordsBatchResponse],
+) -> EntityRecordsBatchResponse:
+    """Concatenate the successes and failures of several batch responses."""
+    merged = EntityRecordsBatchResponse()
+    for response in responses:
+        merged.success_records.extend(response.success_records)
+        merged.failure_records.extend(response.failure_records)
+    return merged
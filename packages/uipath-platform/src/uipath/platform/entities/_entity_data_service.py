@@ -6,12 +6,28 @@ definitions are managed by :class:`EntitySchemaService` and exposed alongside
 data operations through :class:`EntitiesService`.
 """
 
+import contextvars
 import json as json_module
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import nullcontext
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
+import anyio
 import sqlparse
 from httpx import HTTPStatusError, Response
 from pydantic import BaseModel
@@ -22,8 +38,26 @@ from ..common._base_service import BaseService
 from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
 from ..common._models import Endpoint, RequestSpec
+from ..common._task_group import first_error_task_group
 from ..errors._enriched_exception import EnrichedException
 from ..orchestrator._folder_service import FolderService
+from ._entity_bulk import (
+    DEFAULT_BULK_BATCH_SIZE,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_EXPORT_PAGE_SIZE,
+    MAX_BATCH_ATTEMPTS,
+    BatchOperation,
+    can_resend_batch,
+    failed_batch,
+    is_batch_request_error,
+    is_retryable_batch_error,
+    merge_batch_responses,
+    plan_batches,
+    sleep_before_batch_retry,
+    sleep_before_batch_retry_async,
+    split_retryable_failures,
+    validate_bulk_params,
+)
 from ._entity_resolution import RoutingStrategy, create_routing_strategy
 from .entities import (
     AggregateRow,
@@ -37,6 +71,7 @@ from .entities import (
     EntityRecord,
     EntityRecordsBatchResponse,
     EntityRecordsListResponse,
+    FailureRecord,
     QueryRoutingOverrideContext,
     RetrieveEntityRecordsResponse,
 )
@@ -290,152 +325,570 @@ class EntityDataService(BaseService):
     def insert_records(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> EntityRecordsBatchResponse:
         """Internal implementation; see :meth:`EntitiesService.insert_records`."""
-        spec = self._insert_batch_spec(
+        return self._write_batches(
+            "insert",
             entity_key,
-            records,
+            map(self._record_to_dict, records),
+            schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
         )
-        response = self._request_or_extract_batch(
-            sync_call=lambda: self.request(
-                spec.method, spec.endpoint, params=spec.params, json=spec.json
-            )
-        )
-        if isinstance(response, EntityRecordsBatchResponse):
-            return response
-        return self.validate_entity_batch(response, schema)
 
     async def insert_records_async(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
     ) -> EntityRecordsBatchResponse:
         """Async variant of :meth:`insert_records`."""
-        spec = self._insert_batch_spec(
+        return await self._write_batches_async(
+            "insert",
             entity_key,
-            records,
+            map(self._record_to_dict, records),
+            schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
         )
 
-        async def _send_batch() -> Response:
-            return await self.request_async(
-                spec.method, spec.endpoint, params=spec.params, json=spec.json
-            )
-
-        result = await self._request_or_extract_batch_async(_send_batch)
-        if isinstance(result, EntityRecordsBatchResponse):
-            return result
-        return self.validate_entity_batch(result, schema)
-
     def update_records(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
     ) -> EntityRecordsBatchResponse:
         """Internal implementation; see :meth:`EntitiesService.update_records`."""
-        normalized = [self._record_to_dict(record) for record in records]
-        if schema is not None:
-            for record in normalized:
-                EntityRecord.from_data(data=record, model=schema)
-
-        spec = self._update_batch_spec(
+        return self._write_batches(
+            "update",
             entity_key,
-            normalized,
+            self._records_to_update(records, schema),
+            schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
         )
-        response = self._request_or_extract_batch(
-            sync_call=lambda: self.request(
-                spec.method, spec.endpoint, params=spec.params, json=spec.json
-            )
-        )
-        if isinstance(response, EntityRecordsBatchResponse):
-            return response
-        return self.validate_entity_batch(response, schema)
 
     async def update_records_async(
         self,
         entity_key: str,
-        records: List[Any],
+        records: Iterable[Any],
         schema: Optional[Type[Any]] = None,
         expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
     ) -> EntityRecordsBatchResponse:
         """Async variant of :meth:`update_records`."""
-        normalized = [self._record_to_dict(record) for record in records]
-        if schema is not None:
-            for record in normalized:
-                EntityRecord.from_data(data=record, model=schema)
-
-        spec = self._update_batch_spec(
+        return await self._write_batches_async(
+            "update",
             entity_key,
-            normalized,
+            self._records_to_update(records, schema),
+            schema=schema,
             expansion_level=expansion_level,
             fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
         )
 
-        async def _send_batch() -> Response:
-            return await self.request_async(
-                spec.method, spec.endpoint, params=spec.params, json=spec.json
+    def delete_records(
+        self,
+        entity_key: str,
+        record_ids: Iterable[str],
+        fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
+    ) -> EntityRecordsBatchResponse:
+        """Delete multiple records by id, split into batches when needed."""
+        return self._write_batches(
+            "delete",
+            entity_key,
+            record_ids,
+            fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
+        )
+
+    async def delete_records_async(
+        self,
+        entity_key: str,
+        record_ids: Iterable[str],
+        fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
+    ) -> EntityRecordsBatchResponse:
+        """Async variant of :meth:`delete_records`."""
+        return await self._write_batches_async(
+            "delete",
+            entity_key,
+            record_ids,
+            fail_on_first=fail_on_first,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            record_retries=record_retries,
+        )
+
+    @staticmethod
+    def _records_to_update(
+        records: Iterable[Any], schema: Optional[Type[Any]]
+    ) -> Iterable[Dict[str, Any]]:
+        """Normalize records to update, validating them all first with a schema."""
+        normalized: Iterable[Dict[str, Any]] = map(
+            EntityDataService._record_to_dict, records
+        )
+        if schema is not None:
+            normalized = list(normalized)
+            EntityRecord.from_page(normalized, model=schema)
+        return normalized
+
+    # ------------------------------------------------------------------
+    # Bulk export / import (concurrent pages and batches)
+    # ------------------------------------------------------------------
+
+    def export_records(
+        self,
+        entity_key: str,
+        expansion_level: Optional[int] = None,
+        filter: Optional[str] = None,
+        orderby: str = "Id",
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Internal implementation; see :meth:`EntitiesService.export_records`."""
+        validate_bulk_params(page_size, max_concurrency)
+
+        def read_page(start: int) -> Tuple[List[Dict[str, Any]], int]:
+            spec = self._list_records_spec(
+                entity_key,
+                start=start,
+                limit=page_size,
+                expansion_level=expansion_level,
+                filter=filter,
+                orderby=orderby,
+                select=select,
+                expand=expand,
+            )
+            response = self.request(spec.method, spec.endpoint, params=spec.params)
+            return self._raw_records_page(response)
+
+        def pages() -> Iterator[List[Dict[str, Any]]]:
+            rows, total_count = read_page(0)
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            starts = range(page_size, total_count, page_size)
+            pending: Deque[Future[Tuple[List[Dict[str, Any]], int]]] = deque()
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                try:
+                    for start in starts:
+                        # Run in a copy of the caller's context so spans nest correctly.
+                        context = contextvars.copy_context()
+                        pending.append(executor.submit(context.run, read_page, start))
+                        if len(pending) >= max_concurrency:
+                            rows, _ = pending.popleft().result()
+                            if rows:
+                                yield rows
+                    while pending:
+                        rows, _ = pending.popleft().result()
+                        if rows:
+                            yield rows
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+        return pages()
+
+    def export_records_async(
+        self,
+        entity_key: str,
+        expansion_level: Optional[int] = None,
+        filter: Optional[str] = None,
+        orderby: str = "Id",
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Async variant of :meth:`export_records`."""
+        validate_bulk_params(page_size, max_concurrency)
+
+        async def read_page(start: int) -> Tuple[List[Dict[str, Any]], int]:
+            spec = self._list_records_spec(
+                entity_key,
+                start=start,
+                limit=page_size,
+                expansion_level=expansion_level,
+                filter=filter,
+                orderby=orderby,
+                select=select,
+                expand=expand,
+            )
+            response = await self.request_async(
+                spec.method, spec.endpoint, params=spec.params
+            )
+            return self._raw_records_page(response)
+
+        async def fetch(
+            results: List[List[Dict[str, Any]]], index: int, start: int
+        ) -> None:
+            results[index], _ = await read_page(start)
+
+        async def pages() -> AsyncIterator[List[Dict[str, Any]]]:
+            rows, total_count = await read_page(0)
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            starts = range(page_size, total_count, page_size)
+            for offset in range(0, len(starts), max_concurrency):
+                wave = starts[offset : offset + max_concurrency]
+                results: List[List[Dict[str, Any]]] = [[] for _ in wave]
+                async with first_error_task_group() as task_group:
+                    for index, start in enumerate(wave):
+                        task_group.start_soon(fetch, results, index, start)
+                for rows in results:
+                    if rows:
+                        yield rows
+
+        return pages()
+
+    def _write_batches(
+        self,
+        operation: BatchOperation,
+        entity_key: str,
+        items: Iterable[Any],
+        schema: Optional[Type[Any]] = None,
+        expansion_level: Optional[int] = None,
+        fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
+    ) -> EntityRecordsBatchResponse:
+        """Send ``items`` as count- and size-limited batches and merge the results.
+
+        Input that fits in one batch is sent as a single request, exactly as
+        before, and its errors are raised. Larger input is split with
+        :func:`plan_batches` and sent with up to ``max_concurrency`` batches in
+        flight; with ``fail_on_first`` batches go one at a time and sending
+        stops at the first failure. Since other batches may already be
+        applied, a batch whose request fails is reported in
+        ``failure_records`` instead of raising. Responses are merged in input
+        order.
+        """
+        validate_bulk_params(batch_size, max_concurrency)
+        if record_retries < 0:
+            raise ValueError("record_retries must be >= 0")
+
+        def send(
+            batch: List[Any], isolate_errors: bool = True
+        ) -> EntityRecordsBatchResponse:
+            return self._send_batch_with_retries(
+                operation,
+                entity_key,
+                batch,
+                schema=schema,
+                expansion_level=expansion_level,
+                fail_on_first=fail_on_first,
+                isolate_errors=isolate_errors,
+                record_retries=record_retries,
             )
 
-        result = await self._request_or_extract_batch_async(_send_batch)
-        if isinstance(result, EntityRecordsBatchResponse):
-            return result
-        return self.validate_entity_batch(result, schema)
+        batches = plan_batches(items, batch_size)
+        first = next(batches, [])
+        second = next(batches, None)
+        if second is None:
+            return send(first, isolate_errors=False)
+
+        remaining = chain([first, second], batches)
+        responses: List[EntityRecordsBatchResponse] = []
+        if fail_on_first:
+            for batch in remaining:
+                responses.append(send(batch))
+                if responses[-1].failure_records:
+                    break
+            return merge_batch_responses(responses)
+
+        pending: Deque[Future[EntityRecordsBatchResponse]] = deque()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            try:
+                for batch in remaining:
+                    # Run in a copy of the caller's context so spans nest correctly.
+                    context = contextvars.copy_context()
+                    pending.append(executor.submit(context.run, send, batch))
+                    if len(pending) >= max_concurrency:
+                        responses.append(pending.popleft().result())
+                while pending:
+                    responses.append(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+        return merge_batch_responses(responses)
+
+    async def _write_batches_async(
+        self,
+        operation: BatchOperation,
+        entity_key: str,
+        items: Iterable[Any],
+        schema: Optional[Type[Any]] = None,
+        expansion_level: Optional[int] = None,
+        fail_on_first: Optional[bool] = None,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        record_retries: int = 0,
+    ) -> EntityRecordsBatchResponse:
+        """Async variant of :meth:`_write_batches`."""
+        validate_bulk_params(batch_size, max_concurrency)
+        if record_retries < 0:
+            raise ValueError("record_retries must be >= 0")
+
+        async def send(
+            batch: List[Any], isolate_errors: bool = True
+        ) -> EntityRecordsBatchResponse:
+            return await self._send_batch_with_retries_async(
+                operation,
+                entity_key,
+                batch,
+                schema=schema,
+                expansion_level=expansion_level,
+                fail_on_first=fail_on_first,
+                isolate_errors=isolate_errors,
+                record_retries=record_retries,
+            )
 
-    def delete_records(
+        batches = plan_batches(items, batch_size)
+        first = next(batches, [])
+        second = next(batches, None)
+        if second is None:
+            return await send(first, isolate_errors=False)
+
+        remaining = chain([first, second], batches)
+        if fail_on_first:
+            ordered: List[EntityRecordsBatchResponse] = []
+            for batch in remaining:
+                ordered.append(await send(batch))
+                if ordered[-1].failure_records:
+                    break
+            return merge_batch_responses(ordered)
+
+        responses: Dict[int, EntityRecordsBatchResponse] = {}
+        limiter = anyio.Semaphore(max_concurrency)
+
+        async def send_at(index: int, batch: List[Any]) -> None:
+            try:
+                responses[index] = await send(batch)
+            finally:
+                limiter.release()
+
+        async with first_error_task_group() as task_group:
+            for index, batch in enumerate(remaining):
+                await limiter.acquire()
+                task_group.start_soon(send_at, index, batch)
+        return merge_batch_responses(responses[i] for i in sorted(responses))
+
+    def _send_batch_with_retries(
         self,
+        operation: BatchOperation,
         entity_key: str,
-        record_ids: List[str],
+        batch: List[Any],
+        schema: Optional[Type[Any]] = None,
+        expansion_level: Optional[int] = None,
         fail_on_first: Optional[bool] = None,
+        isolate_errors: bool = False,
+        record_retries: int = 0,
+    ) -> EntityRecordsBatchResponse:
+        """Send one batch, then resend only the records it reported as failed.
+
+        With ``isolate_errors`` a batch whose request fails with a transient
+        error is resent with backoff when that is safe (see
+        :func:`can_resend_batch`). Otherwise, or once its attempts are
+        exhausted, its records are reported as failed instead of raising.
+        """
+        attempt = 1
+        while True:
+            try:
+                response = self._send_batch(
+                    operation, entity_key, batch, schema, expansion_level, fail_on_first
+                )
+                break
+            except Exception as exc:
+                if not isolate_errors or not is_batch_request_error(exc):
+                    raise
+                if (
+                    attempt >= MAX_BATCH_ATTEMPTS
+                    or not is_retryable_batch_error(exc)
+                    or not can_resend_batch(operation, exc)
+                ):
+                    logger.warning(
+                        "Giving up on a batch of %d records after %d attempts: %s",
+                        len(batch),
+                        attempt,
+                        exc,
+                    )
+                    return failed_batch(batch, exc)
+                sleep_before_batch_retry(attempt)
+                attempt += 1
+
+        for _ in range(record_retries):
+            retry, kept = split_retryable_failures(operation, response.failure_records)
+            if not retry:
+                break
+            retried = self._send_batch_with_retries(
+                operation,
+                entity_key,
+                retry,
+                schema=schema,
+                expansion_level=expansion_level,
+                fail_on_first=fail_on_first,
+                isolate_errors=isolate_errors,
+            )
+            response = EntityRecordsBatchResponse(
+                success_records=response.success_records + retried.success_records,
+                failure_records=kept + retried.failure_records,
+            )
+        return response
+
+    async def _send_batch_with_retries_async(
+        self,
+        operation: BatchOperation,
+        entity_key: str,
+        batch: List[Any],
+        schema: Optional[Type[Any]] = None,
+        expansion_level: Optional[int] = None,
+        fail_on_first: Optional[bool] = None,
+        isolate_errors: bool = False,
+        record_retries: int = 0,
+    ) -> EntityRecordsBatchResponse:
+        """Async variant of :meth:`_send_batch_with_retries`."""
+        attempt = 1
+        while True:
+            try:
+                response = await self._send_batch_async(
+                    operation, entity_key, batch, schema, expansion_level, fail_on_first
+                )
+                break
+            except Exception as exc:
+                if not isolate_errors or not is_batch_request_error(exc):
+                    raise
+                if (
+                    attempt >= MAX_BATCH_ATTEMPTS
+                    or not is_retryable_batch_error(exc)
+                    or not can_resend_batch(operation, exc)
+                ):
+                    logger.warning(
+                        "Giving up on a batch of %d records after %d attempts: %s",
+                        len(batch),
+                        attempt,
+                        exc,
+                    )
+                    return failed_batch(batch, exc)
+                await sleep_before_batch_retry_async(attempt)
+                attempt += 1
+
+        for _ in range(record_retries):
+            retry, kept = split_retryable_failures(operation, response.failure_records)
+            if not retry:
+                break
+            retried = await self._send_batch_with_retries_async(
+                operation,
+                entity_key,
+                retry,
+                schema=schema,
+                expansion_level=expansion_level,
+                fail_on_first=fail_on_first,
+                isolate_errors=isolate_errors,
+            )
+            response = EntityRecordsBatchResponse(
+                success_records=response.success_records + retried.success_records,
+                failure_records=kept + retried.failure_records,
+            )
+        return response
+
+    def _send_batch(
+        self,
+        operation: BatchOperation,
+        entity_key: str,
+        batch: List[Any],
+        schema: Optional[Type[Any]],
+        expansion_level: Optional[int],
+        fail_on_first: Optional[bool],
     ) -> EntityRecordsBatchResponse:
-        """Delete multiple records by id in a single batch."""
-        spec = self._delete_batch_spec(
-            entity_key, record_ids, fail_on_first=fail_on_first
+        """Send a single batch request and parse its response."""
+        spec = self._batch_spec(
+            operation, entity_key, batch, expansion_level, fail_on_first
         )
         result = self._request_or_extract_batch(
             sync_call=lambda: self.request(
                 spec.method, spec.endpoint, params=spec.params, json=spec.json
             )
         )
-        if isinstance(result, EntityRecordsBatchResponse):
-            return result
-        return EntityRecordsBatchResponse.model_validate(result.json())
+        return self._batch_result(operation, result, schema)
 
-    async def delete_records_async(
+    async def _send_batch_async(
         self,
+        operation: BatchOperation,
         entity_key: str,
-        record_ids: List[str],
-        fail_on_first: Optional[bool] = None,
+        batch: List[Any],
+        schema: Optional[Type[Any]],
+        expansion_level: Optional[int],
+        fail_on_first: Optional[bool],
     ) -> EntityRecordsBatchResponse:
-        """Async variant of :meth:`delete_records`."""
-        spec = self._delete_batch_spec(
-            entity_key, record_ids, fail_on_first=fail_on_first
+        """Async variant of :meth:`_send_batch`."""
+        spec = self._batch_spec(
+            operation, entity_key, batch, expansion_level, fail_on_first
         )
 
-        async def _send_batch() -> Response:
+        async def _send() -> Response:
             return await self.request_async(
                 spec.method, spec.endpoint, params=spec.params, json=spec.json
             )
 
-        result = await self._request_or_extract_batch_async(_send_batch)
+        result = await self._request_or_extract_batch_async(_send)
+        return self._batch_result(operation, result, schema)
+
+    def _batch_result(
+        self,
+        operation: BatchOperation,
+        result: Response | EntityRecordsBatchResponse,
+        schema: Optional[Type[Any]],
+    ) -> EntityRecordsBatchResponse:
+        """Turn a batch response (or recovered 400 body) into a batch result."""
         if isinstance(result, EntityRecordsBatchResponse):
             return result
-        return EntityRecordsBatchResponse.model_validate(result.json())
+        if operation == "delete":
+            return EntityRecordsBatchResponse.model_validate(result.json())
+        # Updated records were validated against the schema before sending.
+        return self.validate_entity_batch(
+            result, schema, trusted=operation == "update" and schema is not None
+        )
 
     # ------------------------------------------------------------------
     # Structured query (POST /entity/{id}/query)
@@ -663,21 +1116,25 @@ class EntityDataService(BaseService):
         self,
         batch_response: Response,
         schema: Optional[Type[Any]] = None,
+        trusted: bool = False,
     ) -> EntityRecordsBatchResponse:
-        """Internal implementation; see :meth:`EntitiesService.validate_entity_batch`."""
-        parsed = EntityRecordsBatchResponse.model_validate(batch_response.json())
-
-        validated_successful_records = []
-        for successful_record in parsed.success_records:
-            data = successful_record.model_dump(by_alias=True)
-            if data.get("Id") is not None:
-                validated_successful_records.append(
-                    EntityRecord.from_data(data=data, model=schema)
-                )
+        """Internal implementation; see :meth:`EntitiesService.validate_entity_batch`.
 
+        ``trusted`` skips ``schema`` validation of the returned records, for
+        batches whose records were validated before being sent.
+        """
+        body = batch_response.json() or {}
+        success_rows = [
+            row for row in body.get("successRecords") or [] if row.get("Id") is not None
+        ]
         return EntityRecordsBatchResponse(
-            success_records=validated_successful_records,
-            failure_records=parsed.failure_records,
+            success_records=EntityRecord.from_page(
+                success_rows, model=schema, trusted=trusted
+            ),
+            failure_records=[
+                FailureRecord.model_validate(failure)
+                for failure in body.get("failureRecords") or []
+            ],
         )
 
     # ------------------------------------------------------------------
@@ -867,6 +1324,33 @@ class EntityDataService(BaseService):
             json=record_ids,
         )
 
+    @staticmethod
+    def _batch_spec(
+        operation: BatchOperation,
+        entity_key: str,
+        batch: List[Any],
+        expansion_level: Optional[int] = None,
+        fail_on_first: Optional[bool] = None,
+    ) -> RequestSpec:
+        """Build the POST spec of the batch endpoint for ``operation``."""
+        if operation == "insert":
+            return EntityDataService._insert_batch_spec(
+                entity_key,
+                batch,
+                expansion_level=expansion_level,
+                fail_on_first=fail_on_first,
+            )
+        if operation == "update":
+            return EntityDataService._update_batch_spec(
+                entity_key,
+                batch,
+                expansion_level=expansion_level,
+                fail_on_first=fail_on_first,
+            )
+        return EntityDataService._delete_batch_spec(
+            entity_key, batch, fail_on_first=fail_on_first
+        )
+
     @staticmethod
     def _batch_params(
         expansion_level: Optional[int] = None,
@@ -1088,9 +1572,10 @@ class EntityDataService(BaseService):
         total_count = int(
             body.get("totalRecordCount", body.get("totalCount", len(records_data))) or 0
         )
-        records = [
-            EntityRecord.from_data(data=record, model=schema) for record in records_data
-        ]
+        # Server rows only need schema validation when the caller asks for it.
+        records = EntityRecord.from_page(
+            records_data, model=schema, trusted=schema is None
+        )
 
         next_cursor = body.get("nextCursor")
         if limit is not None and limit > 0:
@@ -1106,6 +1591,16 @@ class EntityDataService(BaseService):
             next_cursor=next_cursor,
         )
 
+    @staticmethod
+    def _raw_records_page(response: Response) -> Tuple[List[Dict[str, Any]], int]:
+        """Return the raw record dicts and total count of a list-records body."""
+        body = response.json() or {}
+        records_data = body.get("value", []) or []
+        total_count = int(
+            body.get("totalRecordCount", body.get("totalCount", len(records_data))) or 0
+        )
+        return records_data, total_count
+
     @staticmethod
     def _parse_query_response(
         response: Response,
@@ -1123,12 +1618,18 @@ class EntityDataService(BaseService):
         """
         body = response.json() or {}
         items_raw = body.get("value", []) or []
-        items: List[EntityRecord | AggregateRow] = []
-        for raw in items_raw:
-            if isinstance(raw, dict) and isinstance(raw.get("Id"), str):
-                items.append(EntityRecord.from_data(data=raw))
-            else:
-                items.append(AggregateRow.model_validate(raw))
+        record_rows = [
+            raw
+            for raw in items_raw
+            if isinstance(raw, dict) and isinstance(raw.get("Id"), str)
+        ]
+        records = iter(EntityRecord.from_page(record_rows, trusted=True))
+        items: List[EntityRecord | AggregateRow] = [
+            next(records)
+            if isinstance(raw, dict) and isinstance(raw.get("Id"), str)
+            else AggregateRow.model_validate(raw)
+            for raw in items_raw
+        ]
 
         total_count = int(body.get("totalRecordCount", body.get("totalCount", 0)) or 0)
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum, IntEnum
+from functools import lru_cache
 from types import EllipsisType
 from typing import (
     TYPE_CHECKING,
@@ -23,6 +24,7 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    TypeAdapter,
     create_model,
     model_validator,
 )
@@ -30,6 +32,8 @@ from pydantic import (
 if TYPE_CHECKING:
     from ._entities_service import EntitiesService
 
+_USER_MODEL_CACHE_SIZE = 128
+
 
 class ReferenceType(Enum):
     """Enum representing types of references between entities."""
@@ -289,44 +293,89 @@ class EntityRecord(BaseModel):
 
         return cls(**data)
 
+    @classmethod
+    def from_page(
+        cls,
+        rows: List[Dict[str, Any]],
+        model: Optional[Any] = None,
+        *,
+        trusted: bool = False,
+    ) -> List["EntityRecord"]:
+        """Create EntityRecord instances for a whole page of raw rows.
+
+        Equivalent to calling :meth:`from_data` on every row, but the rows are
+        validated against ``model`` and built in one call each. With
+        ``trusted`` the ``Id`` checks and the ``model`` validation are skipped,
+        for rows that were already validated before being sent.
+
+        :param rows: Raw data dictionaries, one per record.
+        :param model: Optional user-defined class for validation.
+        :param trusted: Skip validation against ``model``.
+        :return: List of EntityRecord instances, in input order.
+        """
+        if not trusted:
+            for data in rows:
+                id_value = data.get("Id", None)
+                if id_value is None or not isinstance(id_value, str):
+                    raise ValueError("Field 'Id' is mandatory and must be a string.")
+            if model:
+                _user_model_page_adapter(model).validate_python(rows)
+        return _entity_record_page_adapter().validate_python(rows)
+
     @staticmethod
-    def _validate_against_user_model(
-        data: Dict[str, Any], user_class: Type[Any]
-    ) -> None:
-        user_class_annotations = getattr(user_class, "__annotations__", None)
-        if user_class_annotations is None:
-            raise ValueError(
-                f"User-provided class '{user_class.__name__}' is missing type annotations."
-            )
+    def _validate_against_user_model(data: Dict[str, Any], user_class: type) -> None:
+        _user_model(user_class).model_validate(data)
+
 
-        # Dynamically define a Pydantic model based on the user's class annotations
-        # Fields must be valid type annotations directly
-        pydantic_fields: dict[str, tuple[Any, EllipsisType | None]] = {}
+@lru_cache(maxsize=_USER_MODEL_CACHE_SIZE)
+def _user_model(user_class: type) -> Type[BaseModel]:
+    """Pydantic model mirroring the annotations of ``user_class``.
 
-        for name, annotation in user_class_annotations.items():
-            is_optional = False
+    Building the model compiles its validator, which costs far more than
+    validating a row, so one model is kept per user class.
+    """
+    user_class_annotations = getattr(user_class, "__annotations__", None)
+    if user_class_annotations is None:
+        raise ValueError(
+            f"User-provided class '{user_class.__name__}' is missing type annotations."
+        )
 
-            origin = get_origin(annotation)
-            args = get_args(annotation)
+    # Dynamically define a Pydantic model based on the user's class annotations
+    # Fields must be valid type annotations directly
+    pydantic_fields: dict[str, tuple[Any, EllipsisType | None]] = {}
 
-            # Handle Optional[...] or X | None
-            if origin is Union and type(None) in args:
-                is_optional = True
+    for name, annotation in user_class_annotations.items():
+        is_optional = False
 
-            # Check for optional fields
-            if is_optional:
-                pydantic_fields[name] = (annotation, None)  # Not required
-            else:
-                pydantic_fields[name] = (annotation, ...)
+        origin = get_origin(annotation)
+        args = get_args(annotation)
+
+        # Handle Optional[...] or X | None
+        if origin is Union and type(None) in args:
+            is_optional = True
+
+        # Check for optional fields
+        if is_optional:
+            pydantic_fields[name] = (annotation, None)  # Not required
+        else:
+            pydantic_fields[name] = (annotation, ...)
+
+    # Dynamically create the Pydantic model class
+    return create_model(
+        f"Dynamic_{user_class.__name__}",
+        **pydantic_fields,  # type: ignore[call-overload] # __base__ causes an issue. type checker cannot know that the key does not contain "__base__"
+    )
+
+
+@lru_cache(maxsize=_USER_MODEL_CACHE_SIZE)
+def _user_model_page_adapter(user_class: type) -> TypeAdapter[List[Any]]:
+    """Validator for a list of rows against the model of ``user_class``."""
+    return TypeAdapter(List[_user_model(user_class)])  # type: ignore[misc]
 
-        # Dynamically create the Pydantic model class
-        dynamic_model = create_model(
-            f"Dynamic_{user_class.__name__}",
-            **pydantic_fields,  # type: ignore[call-overload] # __base__ causes an issue. type checker cannot know that the key does not contain "__base__"
-        )
 
-        # Validate input data
-        dynamic_model.model_validate(data)
+@lru_cache(maxsize=1)
+def _entity_record_page_adapter() -> TypeAdapter[List[EntityRecord]]:
+    return TypeAdapter(List[EntityRecord])
 
 
 class Entity(BaseModel):
@@ -6,6 +6,11 @@ This module contains models related to UiPath Orchestrator services.
 from ._assets_service import AssetsService
 from ._attachments_service import AttachmentsService
 from ._buckets_service import BucketsService
+from ._folder_cache import (
+    configure_folder_cache,
+    invalidate_folder_cache,
+    reset_folder_cache,
+)
 from ._folder_service import FolderService
 from ._jobs_service import JobsService
 from ._mcp_service import McpService
@@ -19,7 +24,13 @@ from ._server_version import (
 )
 from .assets import Asset, UserAsset
 from .attachment import Attachment
-from .buckets import Bucket, BucketFile
+from .buckets import (
+    Bucket,
+    BucketFile,
+    BucketSyncAction,
+    BucketSyncEvent,
+    BucketSyncResult,
+)
 from .job import Job, JobErrorInfo, JobState
 from .mcp import McpServer, McpServerStatus, McpServerType
 from .processes import Process
@@ -41,6 +52,9 @@ __all__ = [
     "ProcessesService",
     "QueuesService",
     "OrchestratorSetupService",
+    "configure_folder_cache",
+    "invalidate_folder_cache",
+    "reset_folder_cache",
     "get_server_info_async",
     "get_server_version",
     "get_server_version_async",
@@ -49,6 +63,9 @@ __all__ = [
     "Attachment",
     "Bucket",
     "BucketFile",
+    "BucketSyncAction",
+    "BucketSyncEvent",
+    "BucketSyncResult",
     "Job",
     "JobErrorInfo",
     "JobState",
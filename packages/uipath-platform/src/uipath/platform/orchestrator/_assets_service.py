@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
 
 from httpx import Response
 from uipath.core import traced
@@ -9,7 +10,13 @@ from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
 from ..common._folder_context import FolderContext, header_folder
 from ..common._models import Endpoint, RequestSpec
-from ..common.paging import PagedResult
+from ..common.paging import (
+    PagedResult,
+    aiter_pages,
+    iter_pages,
+    odata_page_fetcher,
+    odata_page_fetcher_async,
+)
 from ..common.validation import validate_pagination_params
 from .assets import Asset, UserAsset
 
@@ -180,6 +187,79 @@ class AssetsService(FolderContext, BaseService):
             top=top,
         )
 
+    def iter_assets(
+        self,
+        *,
+        folder_path: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Asset]:
+        """Lazily iterate over every asset matching the filter, page by page.
+
+        Only one or two pages are held in memory at a time; with ``prefetch`` the
+        next page is requested while the current one is consumed. Without an
+        ``orderby`` the assets are walked by ascending Id, which is not bound by
+        the 10000-item skip limit of :meth:`list`.
+
+        Args:
+            folder_path: Folder path to filter assets
+            folder_key: Folder key (mutually exclusive with folder_path)
+            filter: OData $filter expression
+            orderby: OData $orderby expression; paging then uses $skip
+            page_size: Items requested per page (default and max 1000)
+            limit: Stop after this many assets
+            prefetch: Fetch the next page in the background (default True)
+
+        Raises:
+            ValueError: If page_size is not between 1 and 1000
+
+        Examples:
+            >>> for asset in sdk.assets.iter_assets(filter="ValueType eq 'Text'"):
+            ...     print(asset.name)
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=self.MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher(
+            functools.partial(
+                self.list, folder_path=folder_path, folder_key=folder_key
+            ),
+            filter=filter,
+            orderby=orderby,
+            page_size=page_size,
+        )
+        return iter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def aiter_assets(
+        self,
+        *,
+        folder_path: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Asset]:
+        """Async version of :meth:`iter_assets`.
+
+        Examples:
+            >>> async for asset in sdk.assets.aiter_assets(limit=10):
+            ...     print(asset.name)
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=self.MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher_async(
+            functools.partial(
+                self.list_async, folder_path=folder_path, folder_key=folder_key
+            ),
+            filter=filter,
+            orderby=orderby,
+            page_size=page_size,
+        )
+        return aiter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
     @resource_override(resource_type="asset")
     @traced(
         name="assets_retrieve", run_type="uipath", hide_input=True, hide_output=True
@@ -0,0 +1,210 @@
+"""Planning helpers for directory <-> bucket syncs.
+
+Buckets do not expose content hashes, so a file is considered unchanged when
+its size matches and the destination copy is not older than the source.
+"""
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from .buckets import (
+    BucketFile,
+    BucketSyncAction,
+    BucketSyncEvent,
+    BucketSyncResult,
+)
+
+
+class SyncItem(NamedTuple):
+    """A file to transfer (or skip) during a sync."""
+
+    relative_path: str
+    blob_path: str
+    local_path: Path
+    size: int
+    source_mtime: Optional[float]
+    transfer: bool
+
+
+def normalize_prefix(prefix: str) -> str:
+    """Strip slashes so the prefix can be joined with relative paths."""
+    return prefix.strip("/")
+
+
+def blob_path_for(prefix: str, relative_path: str) -> str:
+    """Bucket path of ``relative_path`` under ``prefix``."""
+    return f"{prefix}/{relative_path}" if prefix else relative_path
+
+
+def relative_blob_path(prefix: str, full_path: str) -> Optional[str]:
+    """Path of ``full_path`` relative to ``prefix``, or None if outside it."""
+    path = full_path.lstrip("/")
+    if not prefix:
+        return path
+    if not path.startswith(f"{prefix}/"):
+        return None
+    return path[len(prefix) + 1 :]
+
+
+def parse_last_modified(value: Optional[str]) -> Optional[float]:
+    """Parse a bucket ``lastModified`` timestamp into a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def is_unchanged(
+    size: int,
+    source_mtime: Optional[float],
+    destination_size: Optional[int],
+    destination_mtime: Optional[float],
+) -> bool:
+    """Whether the destination copy already matches the source."""
+    if destination_size is None or destination_size != size:
+        return False
+    if source_mtime is None or destination_mtime is None:
+        return True
+    return destination_mtime >= source_mtime
+
+
+def walk_local_files(local_dir: Path) -> Dict[str, os.stat_result]:
+    """Map every file under ``local_dir`` (as a posix relative path) to its stat."""
+    files: Dict[str, os.stat_result] = {}
+    for root, _, names in os.walk(local_dir):
+        for file_name in names:
+            path = Path(root, file_name)
+            files[path.relative_to(local_dir).as_posix()] = path.stat()
+    return files
+
+
+def remote_file_map(prefix: str, files: Iterable[BucketFile]) -> Dict[str, BucketFile]:
+    """Map bucket files under ``prefix`` by their path relative to it."""
+    remote: Dict[str, BucketFile] = {}
+    for file in files:
+        if file.is_directory:
+            continue
+        relative_path = relative_blob_path(prefix, file.full_path)
+        if relative_path:
+            remote[relative_path] = file
+    return remote
+
+
+def plan_upload(
+    local_dir: Path,
+    prefix: str,
+    remote: Dict[str, BucketFile],
+    skip_unchanged: bool,
+) -> List[SyncItem]:
+    """Plan the transfers that mirror ``local_dir`` into the bucket."""
+    items = []
+    for relative_path, stat in sorted(walk_local_files(local_dir).items()):
+        remote_file = remote.get(relative_path)
+        unchanged = remote_file is not None and is_unchanged(
+            stat.st_size,
+            stat.st_mtime,
+            remote_file.size,
+            parse_last_modified(remote_file.last_modified),
+        )
+        items.append(
+            SyncItem(
+                relative_path=relative_path,
+                blob_path=blob_path_for(prefix, relative_path),
+                local_path=local_dir / relative_path,
+                size=stat.st_size,
+                source_mtime=stat.st_mtime,
+                transfer=not (skip_unchanged and unchanged),
+            )
+        )
+    return items
+
+
+def plan_download(
+    local_dir: Path,
+    remote: Dict[str, BucketFile],
+    skip_unchanged: bool,
+) -> List[SyncItem]:
+    """Plan the transfers that mirror the bucket into ``local_dir``."""
+    items = []
+    for relative_path, remote_file in sorted(remote.items()):
+        if ".." in Path(relative_path).parts:
+            # Never write outside local_dir, whatever the bucket contains.
+            continue
+        local_path = local_dir / relative_path
+        try:
+            stat: Optional[os.stat_result] = local_path.stat()
+        except FileNotFoundError:
+            stat = None
+        remote_mtime = parse_last_modified(remote_file.last_modified)
+        unchanged = stat is not None and is_unchanged(
+            remote_file.size, remote_mtime, stat.st_size, stat.st_mtime
+        )
+        items.append(
+            SyncItem(
+                relative_path=relative_path,
+                blob_path=remote_file.full_path,
+                local_path=local_path,
+                size=remote_file.size,
+                source_mtime=remote_mtime,
+                transfer=not (skip_unchanged and unchanged),
+            )
+        )
+    return items
+
+
+class SyncTracker:
+    """Collects per-file outcomes into a result and forwards progress events.
+
+    Safe to call from worker threads; events are emitted one at a time.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        transfer_action: BucketSyncAction,
+        on_progress: Optional[Callable[[BucketSyncEvent], None]],
+    ) -> None:
+        self.result = BucketSyncResult()
+        self._total = total
+        self._transfer_action = transfer_action
+        self._on_progress = on_progress
+        self._completed = 0
+        self._lock = threading.Lock()
+
+    def skipped(self, item: SyncItem) -> None:
+        with self._lock:
+            self.result.skipped.append(item.relative_path)
+            self._emit(item, BucketSyncAction.SKIPPED)
+
+    def transferred(self, item: SyncItem) -> None:
+        with self._lock:
+            self.result.transferred.append(item.relative_path)
+            self.result.bytes_transferred += item.size
+            self._emit(item, self._transfer_action)
+
+    def failed(self, item: SyncItem, error: BaseException) -> None:
+        with self._lock:
+            self.result.failed[item.relative_path] = str(error)
+            self._emit(item, BucketSyncAction.FAILED, str(error))
+
+    def _emit(
+        self, item: SyncItem, action: BucketSyncAction, error: Optional[str] = None
+    ) -> None:
+        self._completed += 1
+        if self._on_progress is None:
+            return
+        self._on_progress(
+            BucketSyncEvent(
+                path=item.relative_path,
+                action=action,
+                size=item.size,
+                error=error,
+                completed=self._completed,
+                total=self._total,
+            )
+        )
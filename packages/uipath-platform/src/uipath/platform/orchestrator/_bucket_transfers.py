@@ -0,0 +1,167 @@
+"""Streaming helpers for bucket file transfers.
+
+Bucket downloads are written to disk chunk by chunk and uploads are read from
+disk chunk by chunk, so peak memory stays bounded regardless of file size.
+Files above :data:`BLOCK_UPLOAD_THRESHOLD` that target Azure block blobs are
+uploaded as independently retried blocks (Put Block / Put Block List).
+"""
+
+import base64
+import os
+import time
+from typing import AsyncIterator, Iterator, Mapping
+from xml.sax.saxutils import escape
+
+import anyio
+from anyio import to_thread
+from httpx import TransportError
+
+from ..common.retry import (
+    MAX_RETRY_ATTEMPTS,
+    exponential_backoff_with_jitter,
+    is_retryable_platform_exception,
+)
+from ..errors import EnrichedException
+
+TRANSFER_CHUNK_SIZE = 1024 * 1024
+BLOCK_SIZE = 8 * 1024 * 1024
+BLOCK_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+MAX_BLOCK_CONCURRENCY = 4
+
+_MAX_BLOCKS = 50_000
+_MAX_TRANSFER_BACKOFF = 10.0
+_AZURE_BLOB_TYPE_HEADER = "x-ms-blob-type"
+
+
+class FileByteStream:
+    """Re-iterable sync request body that reads a file slice in chunks.
+
+    Each iteration starts from ``offset`` again, so a retried request resends
+    the whole slice instead of the unread remainder.
+    """
+
+    def __init__(self, path: str, offset: int = 0, length: int | None = None):
+        self._path = path
+        self._offset = offset
+        self.length = os.path.getsize(path) - offset if length is None else length
+
+    def __iter__(self) -> Iterator[bytes]:
+        remaining = self.length
+        with open(self._path, "rb") as file:
+            file.seek(self._offset)
+            while remaining > 0:
+                chunk = file.read(min(TRANSFER_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class AsyncFileByteStream:
+    """Asynchronous counterpart of :class:`FileByteStream`.
+
+    File reads run in a worker thread so the event loop never blocks on disk.
+    """
+
+    def __init__(self, path: str, offset: int = 0, length: int | None = None):
+        self._path = path
+        self._offset = offset
+        self.length = os.path.getsize(path) - offset if length is None else length
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        remaining = self.length
+        file = await anyio.open_file(self._path, "rb")
+        try:
+            await file.seek(self._offset)
+            while remaining > 0:
+                chunk = await file.read(min(TRANSFER_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            await file.aclose()
+
+
+def read_block(path: str, offset: int, length: int) -> bytes:
+    """Read ``length`` bytes of ``path`` starting at ``offset``."""
+    with open(path, "rb") as file:
+        file.seek(offset)
+        return file.read(length)
+
+
+async def read_block_async(path: str, offset: int, length: int) -> bytes:
+    """Asynchronous version of :func:`read_block`."""
+    return await to_thread.run_sync(read_block, path, offset, length)
+
+
+def is_azure_block_blob(headers: Mapping[str, str]) -> bool:
+    """Whether the write URI headers describe an Azure block blob."""
+    return any(
+        key.lower() == _AZURE_BLOB_TYPE_HEADER and value.lower() == "blockblob"
+        for key, value in headers.items()
+    )
+
+
+def plan_blocks(size: int) -> list[tuple[int, int]]:
+    """Split ``size`` bytes into ``(offset, length)`` blocks.
+
+    The block size grows past :data:`BLOCK_SIZE` when needed to stay within
+    Azure's block count limit.
+    """
+    block_size = max(BLOCK_SIZE, -(-size // _MAX_BLOCKS))
+    return [
+        (offset, min(block_size, size - offset))
+        for offset in range(0, size, block_size)
+    ]
+
+
+def block_id(index: int) -> str:
+    """Base64 block id; all ids of a blob must have the same length."""
+    return base64.b64encode(f"{index:08d}".encode()).decode()
+
+
+def block_list_xml(block_ids: list[str]) -> bytes:
+    """Body of the Put Block List request committing ``block_ids`` in order."""
+    latest = "".join(f"<Latest>{escape(id_)}</Latest>" for id_ in block_ids)
+    return (
+        f'<?xml version="1.0" encoding="utf-8"?><BlockList>{latest}</BlockList>'
+    ).encode()
+
+
+def block_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Write URI headers that apply to Put Block requests."""
+    return {
+        key: value
+        for key, value in headers.items()
+        if key.lower() not in (_AZURE_BLOB_TYPE_HEADER, "content-type")
+    }
+
+
+def is_retryable_transfer_error(exception: BaseException) -> bool:
+    """Transient errors after which a chunk or block transfer is retried."""
+    if isinstance(exception, TransportError):
+        return True
+    if isinstance(exception, EnrichedException) and exception.status_code >= 500:
+        return True
+    return is_retryable_platform_exception(exception)
+
+
+def transfer_backoff(attempt: int) -> float:
+    """Delay before retry ``attempt`` of a transfer."""
+    return min(exponential_backoff_with_jitter(attempt, 1.0), _MAX_TRANSFER_BACKOFF)
+
+
+def should_retry_transfer(exception: BaseException, attempt: int) -> bool:
+    """Whether a failed transfer ``attempt`` (1-based) should be retried."""
+    return attempt < MAX_RETRY_ATTEMPTS and is_retryable_transfer_error(exception)
+
+
+def sleep_before_retry(attempt: int) -> None:
+    """Block the calling thread for the backoff of ``attempt``."""
+    time.sleep(transfer_backoff(attempt))
+
+
+async def sleep_before_retry_async(attempt: int) -> None:
+    """Asynchronous version of :func:`sleep_before_retry`."""
+    await anyio.sleep(transfer_backoff(attempt))
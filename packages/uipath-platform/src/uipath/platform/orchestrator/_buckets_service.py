@@ -1,9 +1,27 @@
-import asyncio
+import contextvars
+import functools
 import mimetypes
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, contextmanager, suppress
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
-
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import anyio
 import httpx
 from anyio import to_thread
 from uipath.core.tracing import traced
@@ -14,16 +32,70 @@ from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
 from ..common._folder_context import FolderContext, header_folder
 from ..common._http_config import get_httpx_client_kwargs
+from ..common._http_transport import (
+    get_shared_async_transport,
+    get_shared_transport,
+)
 from ..common._models import Endpoint, RequestSpec
-from ..common.paging import PagedResult
+from ..common._task_group import first_error_task_group
+from ..common.paging import (
+    Page,
+    PagedResult,
+    aiter_pages,
+    iter_pages,
+    odata_page_fetcher,
+    odata_page_fetcher_async,
+)
 from ..common.validation import validate_pagination_params
-from .buckets import Bucket, BucketFile
+from ..errors import EnrichedException
+from ._bucket_sync import (
+    SyncItem,
+    SyncTracker,
+    normalize_prefix,
+    plan_download,
+    plan_upload,
+    remote_file_map,
+)
+from ._bucket_transfers import (
+    BLOCK_UPLOAD_THRESHOLD,
+    MAX_BLOCK_CONCURRENCY,
+    AsyncFileByteStream,
+    FileByteStream,
+    block_headers,
+    block_id,
+    block_list_xml,
+    is_azure_block_blob,
+    plan_blocks,
+    read_block,
+    read_block_async,
+    should_retry_transfer,
+    sleep_before_retry,
+    sleep_before_retry_async,
+)
+from .buckets import (
+    Bucket,
+    BucketFile,
+    BucketSyncAction,
+    BucketSyncEvent,
+    BucketSyncResult,
+)
 
 # Pagination limits
 MAX_PAGE_SIZE = 1000  # Maximum items per page (top parameter)
 MAX_SKIP_OFFSET = 10000  # Maximum skip offset for offset-based pagination
 
 
+def _guess_content_type(path: Path) -> str:
+    content_type, _ = mimetypes.guess_type(str(path))
+    return content_type or "application/octet-stream"
+
+
+def _apply_source_mtime(item: SyncItem) -> None:
+    """Stamp a downloaded file with the remote mtime so later syncs skip it."""
+    if item.source_mtime is not None:
+        os.utime(item.local_path, (item.source_mtime, item.source_mtime))
+
+
 class BucketsService(FolderContext, BaseService):
     """Service for managing UiPath storage buckets.
 
@@ -35,8 +107,13 @@ class BucketsService(FolderContext, BaseService):
         self, config: UiPathApiConfig, execution_context: UiPathExecutionContext
     ) -> None:
         super().__init__(config=config, execution_context=execution_context)
-        self.custom_client = httpx.Client(**get_httpx_client_kwargs())
-        self.custom_client_async = httpx.AsyncClient(**get_httpx_client_kwargs())
+        self.custom_client = httpx.Client(
+            **get_httpx_client_kwargs(pooled=True), transport=get_shared_transport()
+        )
+        self.custom_client_async = httpx.AsyncClient(
+            **get_httpx_client_kwargs(pooled=True),
+            transport=get_shared_async_transport(),
+        )
 
     async def aclose(self) -> None:
         """Close the additional HTTP clients used for bucket transfers."""
@@ -118,29 +195,13 @@ class BucketsService(FolderContext, BaseService):
             max_top=MAX_PAGE_SIZE,
         )
 
-        spec = self._list_spec(
+        return self._list_page(
             folder_path=folder_path,
             folder_key=folder_key,
             name=name,
             skip=skip,
             top=top,
         )
-        response = self.request(
-            spec.method,
-            url=spec.endpoint,
-            params=spec.params,
-            headers=spec.headers,
-        ).json()
-
-        items = response.get("value", [])
-        buckets = [Bucket.model_validate(item) for item in items]
-
-        return PagedResult(
-            items=buckets,
-            has_more=len(items) == top,
-            skip=skip,
-            top=top,
-        )
 
     @traced(name="buckets_list", run_type="uipath")
     async def list_async(
@@ -194,31 +255,85 @@ class BucketsService(FolderContext, BaseService):
             max_top=MAX_PAGE_SIZE,
         )
 
-        spec = self._list_spec(
+        return await self._list_page_async(
             folder_path=folder_path,
             folder_key=folder_key,
             name=name,
             skip=skip,
             top=top,
         )
-        response = (
-            await self.request_async(
-                spec.method,
-                url=spec.endpoint,
-                params=spec.params,
-                headers=spec.headers,
-            )
-        ).json()
 
-        items = response.get("value", [])
-        buckets = [Bucket.model_validate(item) for item in items]
+    def iter_buckets(
+        self,
+        *,
+        folder_path: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        name: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Bucket]:
+        """Lazily iterate over every bucket, page by page.
 
-        return PagedResult(
-            items=buckets,
-            has_more=len(items) == top,
-            skip=skip,
-            top=top,
+        Only one or two pages are held in memory at a time; with ``prefetch`` the
+        next page is requested while the current one is consumed. Buckets are
+        walked by ascending Id, so unlike :meth:`list` the iteration is not
+        bound by the maximum skip offset.
+
+        Args:
+            folder_path: Folder path to filter buckets
+            folder_key: Folder key (mutually exclusive with folder_path)
+            name: Filter by bucket name (contains match)
+            page_size: Buckets requested per page (default and max 1000)
+            limit: Stop after this many buckets
+            prefetch: Fetch the next page in the background (default True)
+
+        Raises:
+            ValueError: If page_size is not between 1 and 1000
+
+        Examples:
+            >>> for bucket in sdk.buckets.iter_buckets(name="invoices"):
+            ...     print(bucket.name)
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher(
+            functools.partial(
+                self._list_page,
+                folder_path=folder_path,
+                folder_key=folder_key,
+                name=name,
+            ),
+            page_size=page_size,
+        )
+        return iter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def aiter_buckets(
+        self,
+        *,
+        folder_path: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        name: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Bucket]:
+        """Async version of :meth:`iter_buckets`.
+
+        Examples:
+            >>> async for bucket in sdk.buckets.aiter_buckets():
+            ...     print(bucket.name)
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher_async(
+            functools.partial(
+                self._list_page_async,
+                folder_path=folder_path,
+                folder_key=folder_key,
+                name=name,
+            ),
+            page_size=page_size,
         )
+        return aiter_pages(fetch_page, limit=limit, prefetch=prefetch)
 
     @traced(name="buckets_exists", run_type="uipath")
     def exists(
@@ -429,31 +544,13 @@ class BucketsService(FolderContext, BaseService):
         bucket = self.retrieve(
             name=name, key=key, folder_key=folder_key, folder_path=folder_path
         )
-        spec = self._retrieve_readUri_spec(
-            bucket.id, blob_file_path, folder_key=folder_key, folder_path=folder_path
+        self._download_blob(
+            bucket.id,
+            blob_file_path,
+            destination_path,
+            folder_key=folder_key,
+            folder_path=folder_path,
         )
-        result = self.request(
-            spec.method,
-            url=spec.endpoint,
-            params=spec.params,
-            headers=spec.headers,
-        ).json()
-
-        read_uri = result["Uri"]
-
-        headers = {
-            key: value
-            for key, value in zip(
-                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
-            )
-        }
-
-        with open(destination_path, "wb") as file:
-            if result["RequiresAuth"]:
-                file_content = self.request("GET", read_uri, headers=headers).content
-            else:
-                file_content = self.custom_client.get(read_uri, headers=headers).content
-            file.write(file_content)
 
     @resource_override(resource_type="bucket")
     @traced(name="buckets_download", run_type="uipath")
@@ -484,37 +581,13 @@ class BucketsService(FolderContext, BaseService):
         bucket = await self.retrieve_async(
             name=name, key=key, folder_key=folder_key, folder_path=folder_path
         )
-        spec = self._retrieve_readUri_spec(
-            bucket.id, blob_file_path, folder_key=folder_key, folder_path=folder_path
+        await self._download_blob_async(
+            bucket.id,
+            blob_file_path,
+            destination_path,
+            folder_key=folder_key,
+            folder_path=folder_path,
         )
-        result = (
-            await self.request_async(
-                spec.method,
-                url=spec.endpoint,
-                params=spec.params,
-                headers=spec.headers,
-            )
-        ).json()
-
-        read_uri = result["Uri"]
-
-        headers = {
-            key: value
-            for key, value in zip(
-                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
-            )
-        }
-
-        if result["RequiresAuth"]:
-            file_content = (
-                await self.request_async("GET", read_uri, headers=headers)
-            ).content
-        else:
-            file_content = (
-                await self.custom_client_async.get(read_uri, headers=headers)
-            ).content
-
-        await asyncio.to_thread(Path(destination_path).write_bytes, file_content)
 
     @resource_override(resource_type="bucket")
     @traced(name="buckets_upload", run_type="uipath")
@@ -561,53 +634,16 @@ class BucketsService(FolderContext, BaseService):
             _content_type = content_type
         _content_type = _content_type or "application/octet-stream"
 
-        spec = self._retrieve_writeri_spec(
+        self._upload_blob(
             bucket.id,
-            _content_type,
             blob_file_path,
+            _content_type,
+            source_path=source_path,
+            content=content,
             folder_key=folder_key,
             folder_path=folder_path,
         )
 
-        result = self.request(
-            spec.method,
-            url=spec.endpoint,
-            params=spec.params,
-            headers=spec.headers,
-        ).json()
-
-        write_uri = result["Uri"]
-
-        headers = {
-            key: value
-            for key, value in zip(
-                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
-            )
-        }
-
-        headers["Content-Type"] = _content_type
-
-        if content is not None:
-            if isinstance(content, str):
-                content = content.encode("utf-8")
-
-            if result["RequiresAuth"]:
-                self.request("PUT", write_uri, headers=headers, content=content)
-            else:
-                self.custom_client.put(write_uri, headers=headers, content=content)
-
-        if source_path is not None:
-            with open(source_path, "rb") as file:
-                file_content = file.read()
-                if result["RequiresAuth"]:
-                    self.request(
-                        "PUT", write_uri, headers=headers, content=file_content
-                    )
-                else:
-                    self.custom_client.put(
-                        write_uri, headers=headers, content=file_content
-                    )
-
     @resource_override(resource_type="bucket")
     @traced(name="buckets_upload", run_type="uipath")
     async def upload_async(
@@ -653,57 +689,203 @@ class BucketsService(FolderContext, BaseService):
             _content_type = content_type
         _content_type = _content_type or "application/octet-stream"
 
-        spec = self._retrieve_writeri_spec(
+        await self._upload_blob_async(
             bucket.id,
-            _content_type,
             blob_file_path,
+            _content_type,
+            source_path=source_path,
+            content=content,
             folder_key=folder_key,
             folder_path=folder_path,
         )
 
-        result = (
-            await self.request_async(
-                spec.method,
-                url=spec.endpoint,
-                params=spec.params,
-                headers=spec.headers,
-            )
-        ).json()
+    @resource_override(resource_type="bucket")
+    @traced(name="buckets_sync", run_type="uipath")
+    def sync(
+        self,
+        local_dir: Union[str, os.PathLike[str]],
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        prefix: str = "",
+        direction: Literal["upload", "download"] = "upload",
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        max_concurrency: int = 8,
+        skip_unchanged: bool = True,
+        on_progress: Optional[Callable[[BucketSyncEvent], None]] = None,
+    ) -> BucketSyncResult:
+        """Mirror a local directory into a bucket prefix, or the prefix into the directory.
+
+        The bucket is resolved once and its files are listed once, then the files
+        are transferred in parallel. Buckets do not expose content hashes, so a file
+        is skipped when its size matches and the destination copy is not older than
+        the source. Downloaded files get the remote modification time, so the next
+        sync skips them. Files are never deleted on either side.
 
-        write_uri = result["Uri"]
+        Args:
+            local_dir (Union[str, os.PathLike[str]]): The local directory to sync.
+            name (Optional[str]): The name of the bucket.
+            key (Optional[str]): The key of the bucket.
+            prefix (str): The bucket path that mirrors ``local_dir``. Default is the bucket root.
+            direction (Literal["upload", "download"]): "upload" copies ``local_dir`` into the bucket, "download" copies the bucket into ``local_dir``.
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+            max_concurrency (int): Maximum number of files transferred at once. Default is 8.
+            skip_unchanged (bool): Skip files whose destination copy is up to date. Default is True.
+            on_progress (Optional[Callable[[BucketSyncEvent], None]]): Called once per file as it completes.
 
-        headers = {
-            key: value
-            for key, value in zip(
-                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
-            )
-        }
+        Returns:
+            BucketSyncResult: The files transferred, skipped and failed. A failed file does not stop the sync.
 
-        headers["Content-Type"] = _content_type
+        Raises:
+            ValueError: If max_concurrency is less than 1, or ``local_dir`` is missing when uploading.
+            Exception: If the bucket with the specified key or name is not found.
 
-        if content is not None:
-            if isinstance(content, str):
-                content = content.encode("utf-8")
+        Examples:
+            >>> result = sdk.buckets.sync("./reports", name="my-storage", prefix="reports")
+            >>> print(len(result.transferred), "uploaded,", len(result.skipped), "unchanged")
+            >>>
+            >>> sdk.buckets.sync("./reports", name="my-storage", prefix="reports", direction="download")
+        """
+        root = self._sync_root(local_dir, direction, max_concurrency)
+        bucket = self.retrieve(
+            name=name, key=key, folder_key=folder_key, folder_path=folder_path
+        )
+        sync_prefix = normalize_prefix(prefix)
+        remote = remote_file_map(
+            sync_prefix,
+            self._iter_files(
+                bucket.id, sync_prefix, folder_key=folder_key, folder_path=folder_path
+            ),
+        )
+        items, tracker = self._plan_sync(
+            root, sync_prefix, remote, direction, skip_unchanged, on_progress
+        )
 
-            if result["RequiresAuth"]:
-                await self.request_async(
-                    "PUT", write_uri, headers=headers, content=content
-                )
+        def transfer(item: SyncItem) -> None:
+            try:
+                if direction == "upload":
+                    self._upload_blob(
+                        bucket.id,
+                        item.blob_path,
+                        _guess_content_type(item.local_path),
+                        source_path=str(item.local_path),
+                        folder_key=folder_key,
+                        folder_path=folder_path,
+                    )
+                else:
+                    item.local_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._download_blob(
+                        bucket.id,
+                        item.blob_path,
+                        str(item.local_path),
+                        folder_key=folder_key,
+                        folder_path=folder_path,
+                    )
+                    _apply_source_mtime(item)
+            except Exception as e:
+                tracker.failed(item, e)
             else:
-                await self.custom_client_async.put(
-                    write_uri, headers=headers, content=content
-                )
+                tracker.transferred(item)
 
-        if source_path is not None:
-            file_content = await asyncio.to_thread(Path(source_path).read_bytes)
-            if result["RequiresAuth"]:
-                await self.request_async(
-                    "PUT", write_uri, headers=headers, content=file_content
-                )
-            else:
-                await self.custom_client_async.put(
-                    write_uri, headers=headers, content=file_content
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            # Run in copies of the caller's context so spans nest correctly.
+            futures = [
+                executor.submit(contextvars.copy_context().run, transfer, item)
+                for item in items
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+        return tracker.result
+
+    @resource_override(resource_type="bucket")
+    @traced(name="buckets_sync", run_type="uipath")
+    async def sync_async(
+        self,
+        local_dir: Union[str, os.PathLike[str]],
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        prefix: str = "",
+        direction: Literal["upload", "download"] = "upload",
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        max_concurrency: int = 8,
+        skip_unchanged: bool = True,
+        on_progress: Optional[Callable[[BucketSyncEvent], None]] = None,
+    ) -> BucketSyncResult:
+        """Asynchronously mirror a local directory and a bucket prefix.
+
+        See :meth:`sync` for the semantics of each argument.
+
+        Examples:
+            >>> result = await sdk.buckets.sync_async("./reports", name="my-storage")
+            >>> print(result.succeeded)
+        """
+        root = self._sync_root(local_dir, direction, max_concurrency)
+        bucket = await self.retrieve_async(
+            name=name, key=key, folder_key=folder_key, folder_path=folder_path
+        )
+        sync_prefix = normalize_prefix(prefix)
+        remote = remote_file_map(
+            sync_prefix,
+            [
+                file
+                async for file in self._iter_files_async(
+                    bucket.id,
+                    sync_prefix,
+                    folder_key=folder_key,
+                    folder_path=folder_path,
                 )
+            ],
+        )
+        items, tracker = await to_thread.run_sync(
+            self._plan_sync,
+            root,
+            sync_prefix,
+            remote,
+            direction,
+            skip_unchanged,
+            on_progress,
+        )
+        limiter = anyio.Semaphore(max_concurrency)
+
+        async def transfer(item: SyncItem) -> None:
+            async with limiter:
+                try:
+                    if direction == "upload":
+                        await self._upload_blob_async(
+                            bucket.id,
+                            item.blob_path,
+                            _guess_content_type(item.local_path),
+                            source_path=str(item.local_path),
+                            folder_key=folder_key,
+                            folder_path=folder_path,
+                        )
+                    else:
+                        await anyio.Path(item.local_path.parent).mkdir(
+                            parents=True, exist_ok=True
+                        )
+                        await self._download_blob_async(
+                            bucket.id,
+                            item.blob_path,
+                            str(item.local_path),
+                            folder_key=folder_key,
+                            folder_path=folder_path,
+                        )
+                        await to_thread.run_sync(_apply_source_mtime, item)
+                except Exception as e:
+                    tracker.failed(item, e)
+                else:
+                    tracker.transferred(item)
+
+        async with first_error_task_group() as task_group:
+            for item in items:
+                task_group.start_soon(transfer, item)
+
+        return tracker.result
 
     @resource_override(resource_type="bucket")
     @traced(name="buckets_retrieve", run_type="uipath")
@@ -944,32 +1126,15 @@ class BucketsService(FolderContext, BaseService):
             name=name, key=key, folder_key=folder_key, folder_path=folder_path
         )
 
-        spec = self._list_files_spec(
+        return self._list_files_page(
             bucket.id,
             prefix,
-            continuation_token=continuation_token,
-            take_hint=take_hint,
+            continuation_token,
+            take_hint,
             folder_key=folder_key,
             folder_path=folder_path,
         )
 
-        response = self.request(
-            spec.method,
-            url=spec.endpoint,
-            params=spec.params,
-            headers=spec.headers,
-        ).json()
-
-        items = response.get("items", [])
-        files = [BucketFile.model_validate(item) for item in items]
-        next_token = response.get("continuationToken")
-
-        return PagedResult(
-            items=files,
-            continuation_token=next_token,
-            has_more=next_token is not None,
-        )
-
     @resource_override(resource_type="bucket")
     @traced(name="buckets_list_files", run_type="uipath")
     async def list_files_async(
@@ -1029,34 +1194,103 @@ class BucketsService(FolderContext, BaseService):
             name=name, key=key, folder_key=folder_key, folder_path=folder_path
         )
 
-        spec = self._list_files_spec(
+        return await self._list_files_page_async(
             bucket.id,
             prefix,
-            continuation_token=continuation_token,
-            take_hint=take_hint,
+            continuation_token,
+            take_hint,
             folder_key=folder_key,
             folder_path=folder_path,
         )
 
-        response = (
-            await self.request_async(
-                spec.method,
-                url=spec.endpoint,
-                params=spec.params,
-                headers=spec.headers,
-            )
-        ).json()
+    @resource_override(resource_type="bucket")
+    def iter_files(
+        self,
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        prefix: str = "",
+        page_size: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> Iterator[BucketFile]:
+        """Lazily iterate over every file in a bucket, page by page.
 
-        items = response.get("items", [])
-        files = [BucketFile.model_validate(item) for item in items]
-        next_token = response.get("continuationToken")
+        The bucket is resolved once, then pages are requested with continuation
+        tokens. Only one or two pages are held in memory at a time; with
+        ``prefetch`` the next page is requested while the current one is consumed.
 
-        return PagedResult(
-            items=files,
-            continuation_token=next_token,
-            has_more=next_token is not None,
+        Args:
+            name: Bucket name
+            key: Bucket identifier
+            prefix: Filter files by prefix
+            page_size: take_hint of each page request (default and max 1000)
+            limit: Stop after this many files
+            prefetch: Fetch the next page in the background (default True)
+            folder_key: Folder key
+            folder_path: Folder path
+
+        Raises:
+            ValueError: If page_size is not between 1 and 1000
+
+        Examples:
+            >>> for file in sdk.buckets.iter_files(name="my-storage", prefix="reports/"):
+            ...     print(file.path)
+        """
+        if page_size < 1 or page_size > MAX_PAGE_SIZE:
+            raise ValueError("page_size must be between 1 and 1000")
+
+        bucket = self.retrieve(
+            name=name, key=key, folder_key=folder_key, folder_path=folder_path
+        )
+        return self._iter_files(
+            bucket.id,
+            prefix,
+            take_hint=page_size,
+            limit=limit,
+            prefetch=prefetch,
+            folder_key=folder_key,
+            folder_path=folder_path,
         )
 
+    @resource_override(resource_type="bucket")
+    async def aiter_files(
+        self,
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        prefix: str = "",
+        page_size: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> AsyncIterator[BucketFile]:
+        """Async version of :meth:`iter_files`.
+
+        Examples:
+            >>> async for file in sdk.buckets.aiter_files(name="my-storage"):
+            ...     print(file.path)
+        """
+        if page_size < 1 or page_size > MAX_PAGE_SIZE:
+            raise ValueError("page_size must be between 1 and 1000")
+
+        bucket = await self.retrieve_async(
+            name=name, key=key, folder_key=folder_key, folder_path=folder_path
+        )
+        async for file in self._iter_files_async(
+            bucket.id,
+            prefix,
+            take_hint=page_size,
+            limit=limit,
+            prefetch=prefetch,
+            folder_key=folder_key,
+            folder_path=folder_path,
+        ):
+            yield file
+
     @resource_override(resource_type="bucket")
     @traced(name="buckets_exists_file", run_type="uipath")
     def exists_file(
@@ -1578,10 +1812,704 @@ class BucketsService(FolderContext, BaseService):
             top=top,
         )
 
+    def _sync_root(
+        self,
+        local_dir: Union[str, os.PathLike[str]],
+        direction: str,
+        max_concurrency: int,
+    ) -> Path:
+        if direction not in ("upload", "download"):
+            raise ValueError("direction must be 'upload' or 'download'")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        root = Path(local_dir)
+        if direction == "upload" and not root.is_dir():
+            raise ValueError(f"Local directory '{root}' does not exist")
+        return root
+
+    def _plan_sync(
+        self,
+        root: Path,
+        prefix: str,
+        remote: Dict[str, BucketFile],
+        direction: str,
+        skip_unchanged: bool,
+        on_progress: Optional[Callable[[BucketSyncEvent], None]],
+    ) -> Tuple[List[SyncItem], SyncTracker]:
+        """Plan a sync, record the skipped files and return what to transfer."""
+        if direction == "upload":
+            plan = plan_upload(root, prefix, remote, skip_unchanged)
+            action = BucketSyncAction.UPLOADED
+        else:
+            plan = plan_download(root, remote, skip_unchanged)
+            action = BucketSyncAction.DOWNLOADED
+        tracker = SyncTracker(len(plan), action, on_progress)
+        for item in plan:
+            if not item.transfer:
+                tracker.skipped(item)
+        return [item for item in plan if item.transfer], tracker
+
+    def _list_files_page(
+        self,
+        bucket_id: int,
+        prefix: str,
+        continuation_token: Optional[str],
+        take_hint: int,
+        *,
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+    ) -> PagedResult[BucketFile]:
+        spec = self._list_files_spec(
+            bucket_id,
+            prefix,
+            continuation_token=continuation_token,
+            take_hint=take_hint,
+            folder_key=folder_key,
+            folder_path=folder_path,
+        )
+        response = self.request(
+            spec.method,
+            url=spec.endpoint,
+            params=spec.params,
+            headers=spec.headers,
+        ).json()
+        return self._files_page(response)
+
+    async def _list_files_page_async(
+        self,
+        bucket_id: int,
+        prefix: str,
+        continuation_token: Optional[str],
+        take_hint: int,
+        *,
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+    ) -> PagedResult[BucketFile]:
+        spec = self._list_files_spec(
+            bucket_id,
+            prefix,
+            continuation_token=continuation_token,
+            take_hint=take_hint,
+            folder_key=folder_key,
+            folder_path=folder_path,
+        )
+        response = (
+            await self.request_async(
+                spec.method,
+                url=spec.endpoint,
+                params=spec.params,
+                headers=spec.headers,
+            )
+        ).json()
+        return self._files_page(response)
+
+    @staticmethod
+    def _files_page(response: Dict[str, Any]) -> PagedResult[BucketFile]:
+        files = [BucketFile.model_validate(item) for item in response.get("items", [])]
+        next_token = response.get("continuationToken")
+        return PagedResult(
+            items=files,
+            continuation_token=next_token,
+            has_more=next_token is not None,
+        )
+
+    def _iter_files(
+        self,
+        bucket_id: int,
+        prefix: str,
+        *,
+        take_hint: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+    ) -> Iterator[BucketFile]:
+        """Yield every file under ``prefix``, following continuation tokens."""
+
+        def fetch_page(token: Optional[str]) -> Page[BucketFile]:
+            page = self._list_files_page(
+                bucket_id,
+                prefix,
+                token,
+                take_hint,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+            return page.items, page.continuation_token
+
+        return iter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def _iter_files_async(
+        self,
+        bucket_id: int,
+        prefix: str,
+        *,
+        take_hint: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+    ) -> AsyncIterator[BucketFile]:
+        """Asynchronous version of :meth:`_iter_files`."""
+
+        async def fetch_page(token: Optional[str]) -> Page[BucketFile]:
+            page = await self._list_files_page_async(
+                bucket_id,
+                prefix,
+                token,
+                take_hint,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+            return page.items, page.continuation_token
+
+        return aiter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def _download_blob(
+        self,
+        bucket_id: int,
+        blob_file_path: str,
+        destination_path: str,
+        *,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> None:
+        spec = self._retrieve_readUri_spec(
+            bucket_id, blob_file_path, folder_key=folder_key, folder_path=folder_path
+        )
+        result = self.request(
+            spec.method,
+            url=spec.endpoint,
+            params=spec.params,
+            headers=spec.headers,
+        ).json()
+
+        read_uri = result["Uri"]
+
+        headers = {
+            key: value
+            for key, value in zip(
+                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
+            )
+        }
+
+        self._download_to_file(
+            result["RequiresAuth"], read_uri, headers, destination_path
+        )
+
+    async def _download_blob_async(
+        self,
+        bucket_id: int,
+        blob_file_path: str,
+        destination_path: str,
+        *,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> None:
+        spec = self._retrieve_readUri_spec(
+            bucket_id, blob_file_path, folder_key=folder_key, folder_path=folder_path
+        )
+        result = (
+            await self.request_async(
+                spec.method,
+                url=spec.endpoint,
+                params=spec.params,
+                headers=spec.headers,
+            )
+        ).json()
+
+        read_uri = result["Uri"]
+
+        headers = {
+            key: value
+            for key, value in zip(
+                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
+            )
+        }
+
+        await self._download_to_file_async(
+            result["RequiresAuth"], read_uri, headers, destination_path
+        )
+
+    def _upload_blob(
+        self,
+        bucket_id: int,
+        blob_file_path: str,
+        _content_type: str,
+        *,
+        source_path: Optional[str] = None,
+        content: Optional[Union[str, bytes]] = None,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> None:
+        spec = self._retrieve_writeri_spec(
+            bucket_id,
+            _content_type,
+            blob_file_path,
+            folder_key=folder_key,
+            folder_path=folder_path,
+        )
+
+        result = self.request(
+            spec.method,
+            url=spec.endpoint,
+            params=spec.params,
+            headers=spec.headers,
+        ).json()
+
+        write_uri = result["Uri"]
+
+        headers = {
+            key: value
+            for key, value in zip(
+                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
+            )
+        }
+
+        headers["Content-Type"] = _content_type
+
+        if content is not None:
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+
+            self._put_blob(result["RequiresAuth"], write_uri, headers, content)
+
+        if source_path is not None:
+            size = os.path.getsize(source_path)
+            if (
+                not result["RequiresAuth"]
+                and size > BLOCK_UPLOAD_THRESHOLD
+                and is_azure_block_blob(headers)
+            ):
+                self._upload_blocks(write_uri, headers, _content_type, source_path)
+            else:
+                self._put_blob(
+                    result["RequiresAuth"],
+                    write_uri,
+                    {**headers, "Content-Length": str(size)},
+                    FileByteStream(source_path),
+                )
+
+    async def _upload_blob_async(
+        self,
+        bucket_id: int,
+        blob_file_path: str,
+        _content_type: str,
+        *,
+        source_path: Optional[str] = None,
+        content: Optional[Union[str, bytes]] = None,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> None:
+        spec = self._retrieve_writeri_spec(
+            bucket_id,
+            _content_type,
+            blob_file_path,
+            folder_key=folder_key,
+            folder_path=folder_path,
+        )
+
+        result = (
+            await self.request_async(
+                spec.method,
+                url=spec.endpoint,
+                params=spec.params,
+                headers=spec.headers,
+            )
+        ).json()
+
+        write_uri = result["Uri"]
+
+        headers = {
+            key: value
+            for key, value in zip(
+                result["Headers"]["Keys"], result["Headers"]["Values"], strict=False
+            )
+        }
+
+        headers["Content-Type"] = _content_type
+
+        if content is not None:
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+
+            await self._put_blob_async(
+                result["RequiresAuth"], write_uri, headers, content
+            )
+
+        if source_path is not None:
+            size = os.path.getsize(source_path)
+            if (
+                not result["RequiresAuth"]
+                and size > BLOCK_UPLOAD_THRESHOLD
+                and is_azure_block_blob(headers)
+            ):
+                await self._upload_blocks_async(
+                    write_uri, headers, _content_type, source_path
+                )
+            else:
+                await self._put_blob_async(
+                    result["RequiresAuth"],
+                    write_uri,
+                    {**headers, "Content-Length": str(size)},
+                    AsyncFileByteStream(source_path),
+                )
+
+    def _open_blob_stream(
+        self, requires_auth: bool, uri: str, headers: Dict[str, str]
+    ) -> ContextManager[httpx.Response]:
+        if requires_auth:
+            return self.stream("GET", uri, headers=headers)
+        return self._stream_unauthenticated(uri, headers)
+
+    def _open_blob_stream_async(
+        self, requires_auth: bool, uri: str, headers: Dict[str, str]
+    ) -> AsyncContextManager[httpx.Response]:
+        if requires_auth:
+            return self.stream_async("GET", uri, headers=headers)
+        return self._stream_unauthenticated_async(uri, headers)
+
+    @contextmanager
+    def _stream_unauthenticated(
+        self, uri: str, headers: Dict[str, str]
+    ) -> Iterator[httpx.Response]:
+        with self.custom_client.stream("GET", uri, headers=headers) as response:
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                response.read()
+                raise EnrichedException(e) from e
+            yield response
+
+    @asynccontextmanager
+    async def _stream_unauthenticated_async(
+        self, uri: str, headers: Dict[str, str]
+    ) -> AsyncIterator[httpx.Response]:
+        async with self.custom_client_async.stream(
+            "GET", uri, headers=headers
+        ) as response:
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                await response.aread()
+                raise EnrichedException(e) from e
+            yield response
+
+    def _download_to_file(
+        self,
+        requires_auth: bool,
+        read_uri: str,
+        headers: Dict[str, str],
+        destination_path: str,
+    ) -> None:
+        """Stream a blob to ``destination_path``, resuming after transient errors.
+
+        Chunks are written to a ``.part`` file that replaces the destination
+        only once complete. When a transfer breaks, the next attempt asks for
+        the remaining bytes with a ``Range`` header and falls back to a full
+        download if the storage ignores it.
+        """
+        part_path = f"{destination_path}.part"
+        written = 0
+        attempt = 0
+        resumable = True
+        while True:
+            attempt += 1
+            resumed_from = written
+            request_headers = dict(headers)
+            if written:
+                request_headers["Range"] = f"bytes={written}-"
+            try:
+                with self._open_blob_stream(
+                    requires_auth, read_uri, request_headers
+                ) as response:
+                    if response.status_code != 206:
+                        written = 0
+                    # Range offsets refer to encoded bytes; decoded bodies restart.
+                    resumable = "content-encoding" not in response.headers
+                    with open(part_path, "r+b" if written else "wb") as file:
+                        file.seek(written)
+                        file.truncate()
+                        for chunk in response.iter_bytes():
+                            file.write(chunk)
+                            written += len(chunk)
+                break
+            except Exception as e:
+                if written > resumed_from:
+                    attempt = 1
+                if not resumable:
+                    written = 0
+                if not should_retry_transfer(e, attempt):
+                    with suppress(FileNotFoundError):
+                        os.remove(part_path)
+                    raise
+                sleep_before_retry(attempt)
+        os.replace(part_path, destination_path)
+
+    async def _download_to_file_async(
+        self,
+        requires_auth: bool,
+        read_uri: str,
+        headers: Dict[str, str],
+        destination_path: str,
+    ) -> None:
+        """Asynchronous version of :meth:`_download_to_file`."""
+        part_path = f"{destination_path}.part"
+        written = 0
+        attempt = 0
+        resumable = True
+        while True:
+            attempt += 1
+            resumed_from = written
+            request_headers = dict(headers)
+            if written:
+                request_headers["Range"] = f"bytes={written}-"
+            try:
+                async with self._open_blob_stream_async(
+                    requires_auth, read_uri, request_headers
+                ) as response:
+                    if response.status_code != 206:
+                        written = 0
+                    resumable = "content-encoding" not in response.headers
+                    file = await anyio.open_file(part_path, "r+b" if written else "wb")
+                    try:
+                        await file.seek(written)
+                        await file.truncate()
+                        async for chunk in response.aiter_bytes():
+                            await file.write(chunk)
+                            written += len(chunk)
+                    finally:
+                        await file.aclose()
+                break
+            except Exception as e:
+                if written > resumed_from:
+                    attempt = 1
+                if not resumable:
+                    written = 0
+                if not should_retry_transfer(e, attempt):
+                    with suppress(FileNotFoundError):
+                        await anyio.Path(part_path).unlink()
+                    raise
+                await sleep_before_retry_async(attempt)
+        await anyio.Path(part_path).replace(destination_path)
+
+    def _put_blob(
+        self,
+        requires_auth: bool,
+        uri: str,
+        headers: Dict[str, str],
+        content: Union[bytes, FileByteStream],
+        params: Optional[Dict[str, str]] = None,
+    ) -> None:
+        url = str(httpx.URL(uri).copy_merge_params(params)) if params else uri
+        if requires_auth:
+            self.request("PUT", url, headers=headers, content=content)
+            return
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self.custom_client.put(url, headers=headers, content=content)
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    raise EnrichedException(e) from e
+                return
+            except Exception as e:
+                if not should_retry_transfer(e, attempt):
+                    raise
+                sleep_before_retry(attempt)
+
+    async def _put_blob_async(
+        self,
+        requires_auth: bool,
+        uri: str,
+        headers: Dict[str, str],
+        content: Union[bytes, AsyncFileByteStream],
+        params: Optional[Dict[str, str]] = None,
+    ) -> None:
+        url = str(httpx.URL(uri).copy_merge_params(params)) if params else uri
+        if requires_auth:
+            await self.request_async("PUT", url, headers=headers, content=content)
+            return
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.custom_client_async.put(
+                    url, headers=headers, content=content
+                )
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    raise EnrichedException(e) from e
+                return
+            except Exception as e:
+                if not should_retry_transfer(e, attempt):
+                    raise
+                await sleep_before_retry_async(attempt)
+
+    def _upload_blocks(
+        self,
+        write_uri: str,
+        headers: Dict[str, str],
+        content_type: str,
+        source_path: str,
+    ) -> None:
+        """Upload a file as Azure blocks in parallel, then commit the block list.
+
+        Each block is read from disk by the worker sending it and retried on
+        its own, so memory stays at ``MAX_BLOCK_CONCURRENCY * BLOCK_SIZE`` and
+        a transient failure only resends the affected block.
+        """
+        blocks = plan_blocks(os.path.getsize(source_path))
+        block_ids = [block_id(index) for index in range(len(blocks))]
+        put_headers = block_headers(headers)
+
+        def put_block(index: int) -> None:
+            offset, length = blocks[index]
+            self._put_blob(
+                False,
+                write_uri,
+                put_headers,
+                read_block(source_path, offset, length),
+                params={"comp": "block", "blockid": block_ids[index]},
+            )
+
+        with ThreadPoolExecutor(max_workers=MAX_BLOCK_CONCURRENCY) as executor:
+            # Run in copies of the caller's context so spans nest correctly.
+            futures = [
+                executor.submit(contextvars.copy_context().run, put_block, i)
+                for i in range(len(blocks))
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        self._put_blob(
+            False,
+            write_uri,
+            {**put_headers, "x-ms-blob-content-type": content_type},
+            block_list_xml(block_ids),
+            params={"comp": "blocklist"},
+        )
+
+    async def _upload_blocks_async(
+        self,
+        write_uri: str,
+        headers: Dict[str, str],
+        content_type: str,
+        source_path: str,
+    ) -> None:
+        """Asynchronous version of :meth:`_upload_blocks`."""
+        blocks = plan_blocks(os.path.getsize(source_path))
+        block_ids = [block_id(index) for index in range(len(blocks))]
+        put_headers = block_headers(headers)
+        limiter = anyio.Semaphore(MAX_BLOCK_CONCURRENCY)
+
+        async def put_block(index: int) -> None:
+            async with limiter:
+                offset, length = blocks[index]
+                await self._put_blob_async(
+                    False,
+                    write_uri,
+                    put_headers,
+                    await read_block_async(source_path, offset, length),
+                    params={"comp": "block", "blockid": block_ids[index]},
+                )
+
+        async with first_error_task_group() as task_group:
+            for index in range(len(blocks)):
+                task_group.start_soon(put_block, index)
+
+        await self._put_blob_async(
+            False,
+            write_uri,
+            {**put_headers, "x-ms-blob-content-type": content_type},
+            block_list_xml(block_ids),
+            params={"comp": "blocklist"},
+        )
+
     @property
     def custom_headers(self) -> Dict[str, str]:
         return self.folder_headers
 
+    def _list_page(
+        self,
+        *,
+        folder_path: Optional[str],
+        folder_key: Optional[str],
+        name: Optional[str],
+        skip: int,
+        top: int,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+    ) -> PagedResult[Bucket]:
+        spec = self._list_spec(
+            folder_path=folder_path,
+            folder_key=folder_key,
+            name=name,
+            skip=skip,
+            top=top,
+            filter=filter,
+            orderby=orderby,
+        )
+        response = self.request(
+            spec.method,
+            url=spec.endpoint,
+            params=spec.params,
+            headers=spec.headers,
+        ).json()
+        return self._buckets_page(response, skip=skip, top=top)
+
+    async def _list_page_async(
+        self,
+        *,
+        folder_path: Optional[str],
+        folder_key: Optional[str],
+        name: Optional[str],
+        skip: int,
+        top: int,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+    ) -> PagedResult[Bucket]:
+        spec = self._list_spec(
+            folder_path=folder_path,
+            folder_key=folder_key,
+            name=name,
+            skip=skip,
+            top=top,
+            filter=filter,
+            orderby=orderby,
+        )
+        response = (
+            await self.request_async(
+                spec.method,
+                url=spec.endpoint,
+                params=spec.params,
+                headers=spec.headers,
+            )
+        ).json()
+        return self._buckets_page(response, skip=skip, top=top)
+
+    @staticmethod
+    def _buckets_page(
+        response: Dict[str, Any], *, skip: int, top: int
+    ) -> PagedResult[Bucket]:
+        items = response.get("value", [])
+        return PagedResult(
+            items=[Bucket.model_validate(item) for item in items],
+            has_more=len(items) == top,
+            skip=skip,
+            top=top,
+        )
+
     def _list_spec(
         self,
         folder_path: Optional[str],
@@ -1589,18 +2517,24 @@ class BucketsService(FolderContext, BaseService):
         name: Optional[str],
         skip: int,
         top: int,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
     ) -> RequestSpec:
         """Build OData request for listing buckets."""
         filters = []
         if name:
             escaped_name = name.replace("'", "''")
             filters.append(f"contains(tolower(Name), tolower('{escaped_name}'))")
+        if filter:
+            filters.append(filter)
 
         filter_str = " and ".join(filters) if filters else None
 
         params: Dict[str, Any] = {"$skip": skip, "$top": top}
         if filter_str:
             params["$filter"] = filter_str
+        if orderby:
+            params["$orderby"] = orderby
 
         return RequestSpec(
             method="GET",
@@ -0,0 +1,183 @@
+"""Process-wide cache for folder path -> folder key resolution.
+
+Resolving a folder path pages through the folders visible to the current user,
+so the result is cached per base URL and access token for
+:data:`DEFAULT_FOLDER_CACHE_TTL` seconds. Concurrent lookups of the same path share a single request. Paths that
+are not found are never cached, so a folder created later is picked up on the
+next lookup.
+"""
+
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import anyio
+
+from ..common._http_transport import current_event_loop_key
+
+DEFAULT_FOLDER_CACHE_TTL = 300.0
+
+_CacheKey = Tuple[str, str]
+
+
+class FolderLookup:
+    """Outcome of a coalesced lookup.
+
+    ``resolved`` is True when another caller already resolved the path; the
+    caller then uses ``key`` instead of querying Orchestrator. Otherwise the
+    caller queries Orchestrator and stores its answer in ``key``.
+    """
+
+    def __init__(self) -> None:
+        self.resolved = False
+        self.key: Optional[str] = None
+
+
+class _Flight:
+    def __init__(self, done: Any) -> None:
+        self.done = done
+        self.lookup = FolderLookup()
+        self.failed = True
+
+
+class FolderKeyCache:
+    """TTL cache of folder keys keyed by ``(scope, folder_path)``.
+
+    The scope identifies the tenant and the caller's token, since each user
+    sees different folders.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_FOLDER_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[_CacheKey, Tuple[str, float]] = {}
+        self._flights: Dict[_CacheKey, _Flight] = {}
+        self._async_flights: WeakKeyDictionary[Any, Dict[_CacheKey, _Flight]] = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, scope: str, folder_path: str) -> Optional[str]:
+        """Cached key of ``folder_path``, or None if missing or expired."""
+        entry = self._entries.get((scope, folder_path))
+        if entry is None:
+            return None
+        key, expires_at = entry
+        if time.monotonic() >= expires_at:
+            with self._lock:
+                if self._entries.get((scope, folder_path)) == entry:
+                    del self._entries[(scope, folder_path)]
+            return None
+        return key
+
+    def put(self, scope: str, folder_path: str, key: str) -> None:
+        self.put_many(scope, {folder_path: key})
+
+    def put_many(self, scope: str, keys: Dict[str, str]) -> None:
+        if self.ttl <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for folder_path, key in keys.items():
+                self._entries[(scope, folder_path)] = (key, expires_at)
+
+    def invalidate(self, folder_path: Optional[str] = None) -> None:
+        """Drop ``folder_path`` (under every scope), or every entry."""
+        with self._lock:
+            if folder_path is None:
+                self._entries.clear()
+                return
+            for cache_key in [k for k in self._entries if k[1] == folder_path]:
+                del self._entries[cache_key]
+
+    @contextmanager
+    def lookup(self, scope: str, folder_path: str) -> Iterator[FolderLookup]:
+        """Coalesce concurrent lookups of ``folder_path`` across threads.
+
+        The first caller runs the body and stores its answer in the yielded
+        :class:`FolderLookup`; callers arriving meanwhile wait for it and get a
+        resolved lookup. If the first caller fails, waiters query on their own.
+        """
+        cache_key = (scope, folder_path)
+        with self._lock:
+            flight = self._flights.get(cache_key)
+            owner = flight is None
+            if flight is None:
+                flight = self._flights[cache_key] = _Flight(threading.Event())
+
+        if not owner:
+            flight.done.wait()
+            yield flight.lookup if not flight.failed else FolderLookup()
+            return
+
+        try:
+            yield flight.lookup
+            if flight.lookup.key is not None:
+                self.put(scope, folder_path, flight.lookup.key)
+            flight.lookup.resolved = True
+            flight.failed = False
+        finally:
+            with self._lock:
+                del self._flights[cache_key]
+            flight.done.set()
+
+    @asynccontextmanager
+    async def lookup_async(
+        self, scope: str, folder_path: str
+    ) -> AsyncIterator[FolderLookup]:
+        """Asynchronous version of :meth:`lookup`, coalescing per event loop."""
+        cache_key = (scope, folder_path)
+        with self._lock:
+            flights = self._async_flights.setdefault(current_event_loop_key(), {})
+            flight = flights.get(cache_key)
+            owner = flight is None
+            if flight is None:
+                flight = flights[cache_key] = _Flight(anyio.Event())
+
+        if not owner:
+            await flight.done.wait()
+            yield flight.lookup if not flight.failed else FolderLookup()
+            return
+
+        try:
+            yield flight.lookup
+            if flight.lookup.key is not None:
+                self.put(scope, folder_path, flight.lookup.key)
+            flight.lookup.resolved = True
+            flight.failed = False
+        finally:
+            with self._lock:
+                del flights[cache_key]
+            flight.done.set()
+
+
+folder_key_cache = FolderKeyCache()
+
+
+def configure_folder_cache(*, ttl: float = DEFAULT_FOLDER_CACHE_TTL) -> None:
+    """Set how long resolved folder keys are reused, in seconds.
+
+    A ``ttl`` of 0 disables caching; concurrent lookups are still coalesced.
+    Existing entries are dropped.
+
+    Raises:
+        ValueError: If ttl is negative.
+    """
+    if ttl < 0:
+        raise ValueError("ttl must be >= 0")
+    folder_key_cache.ttl = ttl
+    folder_key_cache.invalidate()
+
+
+def invalidate_folder_cache(folder_path: Optional[str] = None) -> None:
+    """Forget the cached key of ``folder_path``, or of every folder.
+
+    Call this after renaming, moving or deleting a folder.
+    """
+    folder_key_cache.invalidate(folder_path)
+
+
+def reset_folder_cache() -> None:
+    """Restore the default TTL and drop every cached folder key."""
+    configure_folder_cache(ttl=DEFAULT_FOLDER_CACHE_TTL)
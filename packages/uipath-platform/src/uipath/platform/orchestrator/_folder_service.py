@@ -1,4 +1,5 @@
-from typing import Optional
+import hashlib
+from typing import Dict, Optional
 
 from typing_extensions import deprecated
 from uipath.core import traced
@@ -8,8 +9,11 @@ from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
 from ..common._models import Endpoint, RequestSpec
 from ..errors import FolderNotFoundException
+from ._folder_cache import folder_key_cache
 from .folder import PersonalWorkspace
 
+_PREFETCH_PAGE_SIZE = 100
+
 
 class FolderService(BaseService):
     """Service for managing UiPath Folders.
@@ -78,38 +82,50 @@ class FolderService(BaseService):
 
         Returns:
             The folder key if found, None otherwise.
+
+        Resolved keys are cached process-wide (see :func:`configure_folder_cache`)
+        and concurrent lookups of the same path share one query.
         """
-        skip = 0
-        take = 20
+        cached_key = folder_key_cache.get(self._cache_scope, folder_path)
+        if cached_key is not None:
+            return cached_key
 
-        while True:
-            spec = self._retrieve_spec(folder_path, skip=skip, take=take)
-            response = self.request(
-                spec.method,
-                url=spec.endpoint,
-                params=spec.params,
-            ).json()
-
-            # Search for the folder in current page
-            folder_key = next(
-                (
-                    item["Key"]
-                    for item in response["PageItems"]
-                    if item["FullyQualifiedName"] == folder_path
-                ),
-                None,
-            )
+        with folder_key_cache.lookup(self._cache_scope, folder_path) as lookup:
+            if lookup.resolved:
+                return lookup.key
 
-            if folder_key is not None:
-                return folder_key
+            skip = 0
+            take = 20
 
-            page_items = response["PageItems"]
-            if len(page_items) < take:
-                break
+            while True:
+                spec = self._retrieve_spec(folder_path, skip=skip, take=take)
+                response = self.request(
+                    spec.method,
+                    url=spec.endpoint,
+                    params=spec.params,
+                ).json()
+
+                # Search for the folder in current page
+                folder_key = next(
+                    (
+                        item["Key"]
+                        for item in response["PageItems"]
+                        if item["FullyQualifiedName"] == folder_path
+                    ),
+                    None,
+                )
+
+                if folder_key is not None:
+                    lookup.key = folder_key
+                    return folder_key
+
+                page_items = response["PageItems"]
+                if len(page_items) < take:
+                    break
 
-            skip += take
+                skip += take
 
-        return None
+            return None
 
     @traced(name="folder_retrieve_key", run_type="uipath")
     async def retrieve_key_async(self, *, folder_path: str) -> Optional[str]:
@@ -120,40 +136,134 @@ class FolderService(BaseService):
 
         Returns:
             The folder key if found, None otherwise.
+
+        Resolved keys are cached process-wide (see :func:`configure_folder_cache`)
+        and concurrent lookups of the same path share one query.
+        """
+        cached_key = folder_key_cache.get(self._cache_scope, folder_path)
+        if cached_key is not None:
+            return cached_key
+
+        async with folder_key_cache.lookup_async(
+            self._cache_scope, folder_path
+        ) as lookup:
+            if lookup.resolved:
+                return lookup.key
+
+            skip = 0
+            take = 20
+
+            while True:
+                spec = self._retrieve_spec(folder_path, skip=skip, take=take)
+                response = (
+                    await self.request_async(
+                        spec.method,
+                        url=spec.endpoint,
+                        params=spec.params,
+                    )
+                ).json()
+
+                # Search for the folder in current page
+                folder_key = next(
+                    (
+                        item["Key"]
+                        for item in response["PageItems"]
+                        if item["FullyQualifiedName"] == folder_path
+                    ),
+                    None,
+                )
+
+                if folder_key is not None:
+                    lookup.key = folder_key
+                    return folder_key
+
+                page_items = response["PageItems"]
+                if len(page_items) < take:
+                    break
+
+                skip += take
+
+            return None
+
+    @traced(name="folder_prefetch_keys", run_type="uipath")
+    def prefetch_keys(self) -> Dict[str, str]:
+        """Resolve and cache the keys of every folder visible to the current user.
+
+        Call this once before resolving many folder paths to replace one lookup
+        per path with a few paged requests.
+
+        Returns:
+            A mapping of fully qualified folder path to folder key.
+
+        Examples:
+            >>> sdk.folders.prefetch_keys()
+            >>> sdk.folders.retrieve_key(folder_path="Shared/Finance")  # no request
         """
+        keys: Dict[str, str] = {}
         skip = 0
-        take = 20
+        while True:
+            spec = self._list_spec(skip=skip, take=_PREFETCH_PAGE_SIZE)
+            page_items = self.request(
+                spec.method,
+                url=spec.endpoint,
+                params=spec.params,
+            ).json()["PageItems"]
+            keys.update(
+                (item["FullyQualifiedName"], item["Key"]) for item in page_items
+            )
+            if len(page_items) < _PREFETCH_PAGE_SIZE:
+                break
+            skip += _PREFETCH_PAGE_SIZE
+
+        folder_key_cache.put_many(self._cache_scope, keys)
+        return keys
 
+    @traced(name="folder_prefetch_keys", run_type="uipath")
+    async def prefetch_keys_async(self) -> Dict[str, str]:
+        """Asynchronously resolve and cache the keys of every visible folder.
+
+        Returns:
+            A mapping of fully qualified folder path to folder key.
+        """
+        keys: Dict[str, str] = {}
+        skip = 0
         while True:
-            spec = self._retrieve_spec(folder_path, skip=skip, take=take)
-            response = (
+            spec = self._list_spec(skip=skip, take=_PREFETCH_PAGE_SIZE)
+            page_items = (
                 await self.request_async(
                     spec.method,
                     url=spec.endpoint,
                     params=spec.params,
                 )
-            ).json()
-
-            # Search for the folder in current page
-            folder_key = next(
-                (
-                    item["Key"]
-                    for item in response["PageItems"]
-                    if item["FullyQualifiedName"] == folder_path
-                ),
-                None,
+            ).json()["PageItems"]
+            keys.update(
+                (item["FullyQualifiedName"], item["Key"]) for item in page_items
             )
-
-            if folder_key is not None:
-                return folder_key
-
-            page_items = response["PageItems"]
-            if len(page_items) < take:
+            if len(page_items) < _PREFETCH_PAGE_SIZE:
                 break
-
-            skip += take
-
-        return None
+            skip += _PREFETCH_PAGE_SIZE
+
+        folder_key_cache.put_many(self._cache_scope, keys)
+        return keys
+
+    @property
+    def _cache_scope(self) -> str:
+        # Folders are looked up for the current user, so the token is part of
+        # the scope; only a digest of it is kept in the cache.
+        url = self._url
+        identity = hashlib.blake2b(
+            self._config.secret.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return f"{url.base_url}/{url.org_name}/{url.tenant_name}/{identity}"
+
+    def _list_spec(self, *, skip: int, take: int) -> RequestSpec:
+        return RequestSpec(
+            method="GET",
+            endpoint=Endpoint(
+                "orchestrator_/api/FoldersNavigation/GetFoldersForCurrentUser"
+            ),
+            params={"skip": skip, "take": take},
+        )
 
     def _retrieve_spec(
         self, folder_path: str, *, skip: int = 0, take: int = 20
@@ -1,9 +1,20 @@
+import functools
 import os
 import shutil
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast, overload
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
 
 from uipath.core.tracing import traced
 
@@ -15,7 +26,13 @@ from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
 from ..common._folder_context import FolderContext, header_folder
 from ..common._models import Endpoint, RequestSpec
-from ..common.paging import PagedResult
+from ..common.paging import (
+    PagedResult,
+    aiter_pages,
+    iter_pages,
+    odata_page_fetcher,
+    odata_page_fetcher_async,
+)
 from ..common.validation import validate_pagination_params
 from ..errors import EnrichedException
 from ._attachments_service import AttachmentsService
@@ -280,6 +297,79 @@ class JobsService(FolderContext, BaseService):
             top=top,
         )
 
+    def iter_jobs(
+        self,
+        *,
+        folder_path: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Job]:
+        """Lazily iterate over every job matching the filter, page by page.
+
+        Only one or two pages are held in memory at a time; with ``prefetch`` the
+        next page is requested while the current one is consumed. Without an
+        ``orderby`` the jobs are walked by ascending Id, which is not bound by
+        the 10000-item skip limit of :meth:`list`.
+
+        Args:
+            folder_path: Folder path to filter jobs
+            folder_key: Folder key (mutually exclusive with folder_path)
+            filter: OData $filter expression
+            orderby: OData $orderby expression; paging then uses $skip
+            page_size: Items requested per page (default and max 1000)
+            limit: Stop after this many jobs
+            prefetch: Fetch the next page in the background (default True)
+
+        Raises:
+            ValueError: If page_size is not between 1 and 1000
+
+        Examples:
+            >>> for job in sdk.jobs.iter_jobs(filter="State eq 'Faulted'"):
+            ...     print(job.key)
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=self.MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher(
+            functools.partial(
+                self.list, folder_path=folder_path, folder_key=folder_key
+            ),
+            filter=filter,
+            orderby=orderby,
+            page_size=page_size,
+        )
+        return iter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    def aiter_jobs(
+        self,
+        *,
+        folder_path: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        page_size: int = 1000,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Job]:
+        """Async version of :meth:`iter_jobs`.
+
+        Examples:
+            >>> async for job in sdk.jobs.aiter_jobs(limit=10):
+            ...     print(job.key)
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=self.MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher_async(
+            functools.partial(
+                self.list_async, folder_path=folder_path, folder_key=folder_key
+            ),
+            filter=filter,
+            orderby=orderby,
+            page_size=page_size,
+        )
+        return aiter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
     @traced(name="jobs_stop", run_type="uipath")
     def stop(
         self,
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Optional, Union
+import functools
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from httpx import Response
 from uipath.core.tracing import traced
@@ -9,6 +11,14 @@ from ..common._config import UiPathApiConfig
 from ..common._execution_context import UiPathExecutionContext
 from ..common._folder_context import FolderContext, header_folder
 from ..common._models import Endpoint, RequestSpec
+from ..common.paging import (
+    PagedResult,
+    aiter_pages,
+    iter_pages,
+    odata_page_fetcher,
+    odata_page_fetcher_async,
+)
+from ..common.validation import validate_pagination_params
 from .queues import (
     CommitType,
     QueueItem,
@@ -16,6 +26,9 @@ from .queues import (
     TransactionItemResult,
 )
 
+# Pagination limits
+MAX_PAGE_SIZE = 1000  # Maximum items per page (top parameter)
+
 
 class QueuesService(FolderContext, BaseService):
     """Service for managing UiPath queues and queue items.
@@ -84,6 +97,148 @@ class QueuesService(FolderContext, BaseService):
         )
         return response.json()
 
+    @resource_override(resource_type="queue", resource_identifier="queue_name")
+    def iter_items(
+        self,
+        queue_name: Optional[str] = None,
+        *,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over every queue item, page by page.
+
+        Only one or two pages are held in memory at a time; with ``prefetch`` the
+        next page is requested while the current one is consumed. Without an
+        ``orderby`` the items are walked by ascending Id, so scanning millions of
+        items keeps every request equally cheap.
+
+        Args:
+            queue_name (Optional[str]): The name of the queue to filter items by.
+            folder_key (Optional[str]): The key of the folder. Overrides the default one set in the SDK config.
+            folder_path (Optional[str]): The path of the folder. Overrides the default one set in the SDK config.
+            filter (Optional[str]): Additional OData $filter expression (e.g. "Status eq 'New'").
+            orderby (Optional[str]): OData $orderby expression; paging then uses $skip.
+            page_size (int): Items requested per page (default and max 1000).
+            limit (Optional[int]): Stop after this many items.
+            prefetch (bool): Fetch the next page in the background (default True).
+
+        Returns:
+            Iterator[Dict[str, Any]]: The queue items as returned by Orchestrator.
+
+        Examples:
+            >>> for item in sdk.queues.iter_items("invoices", filter="Status eq 'New'"):
+            ...     print(item["Id"], item["Reference"])
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher(
+            functools.partial(
+                self._list_items_page,
+                queue_name=queue_name,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            ),
+            filter=filter,
+            orderby=orderby,
+            page_size=page_size,
+            id_of=itemgetter("Id"),
+        )
+        return iter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    @resource_override(resource_type="queue", resource_identifier="queue_name")
+    def aiter_items(
+        self,
+        queue_name: Optional[str] = None,
+        *,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Asynchronously iterate over every queue item, page by page.
+
+        See :meth:`iter_items` for the arguments.
+
+        Examples:
+            >>> async for item in sdk.queues.aiter_items("invoices", limit=100):
+            ...     print(item["Id"])
+        """
+        validate_pagination_params(skip=0, top=page_size, max_top=MAX_PAGE_SIZE)
+        fetch_page = odata_page_fetcher_async(
+            functools.partial(
+                self._list_items_page_async,
+                queue_name=queue_name,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            ),
+            filter=filter,
+            orderby=orderby,
+            page_size=page_size,
+            id_of=itemgetter("Id"),
+        )
+        return aiter_pages(fetch_page, limit=limit, prefetch=prefetch)
+
+    @traced(name="queues_list_items", run_type="uipath")
+    def _list_items_page(
+        self,
+        *,
+        queue_name: Optional[str],
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+        filter: Optional[str],
+        orderby: Optional[str],
+        skip: int,
+        top: int,
+    ) -> PagedResult[Dict[str, Any]]:
+        spec = self._list_items_spec(
+            queue_name=queue_name,
+            folder_key=folder_key,
+            folder_path=folder_path,
+            filter=filter,
+            orderby=orderby,
+            skip=skip,
+            top=top,
+        )
+        items = self.request(
+            spec.method, url=spec.endpoint, params=spec.params, headers=spec.headers
+        ).json()["value"]
+        return PagedResult(items=items, has_more=len(items) == top, skip=skip, top=top)
+
+    @traced(name="queues_list_items", run_type="uipath")
+    async def _list_items_page_async(
+        self,
+        *,
+        queue_name: Optional[str],
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+        filter: Optional[str],
+        orderby: Optional[str],
+        skip: int,
+        top: int,
+    ) -> PagedResult[Dict[str, Any]]:
+        spec = self._list_items_spec(
+            queue_name=queue_name,
+            folder_key=folder_key,
+            folder_path=folder_path,
+            filter=filter,
+            orderby=orderby,
+            skip=skip,
+            top=top,
+        )
+        items = (
+            await self.request_async(
+                spec.method, url=spec.endpoint, params=spec.params, headers=spec.headers
+            )
+        ).json()["value"]
+        return PagedResult(items=items, has_more=len(items) == top, skip=skip, top=top)
+
     @resource_override(resource_type="queue", resource_identifier="queue_name")
     @traced(name="queues_create_item", run_type="uipath")
     def create_item(
@@ -428,10 +583,25 @@ class QueuesService(FolderContext, BaseService):
         queue_name: Optional[str] = None,
         folder_key: Optional[str] = None,
         folder_path: Optional[str] = None,
+        filter: Optional[str] = None,
+        orderby: Optional[str] = None,
+        skip: Optional[int] = None,
+        top: Optional[int] = None,
     ) -> RequestSpec:
-        params = {}
+        params: Dict[str, Any] = {}
+        filters = []
         if queue_name is not None:
-            params["$filter"] = f"QueueDefinitionName eq '{queue_name}'"
+            filters.append(f"QueueDefinitionName eq '{queue_name}'")
+        if filter:
+            filters.append(f"({filter})" if filters else filter)
+        if filters:
+            params["$filter"] = " and ".join(filters)
+        if orderby:
+            params["$orderby"] = orderby
+        if skip is not None:
+            params["$skip"] = skip
+        if top is not None:
+            params["$top"] = top
         return RequestSpec(
             method="GET",
             endpoint=Endpoint("/orchestrator_/odata/QueueItems"),
@@ -1,6 +1,7 @@
 """Models for Orchestrator Buckets API responses."""
 
-from typing import Any, List, Optional
+from enum import Enum
+from typing import Any, Dict, List, Optional
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
@@ -78,3 +79,45 @@ class Bucket(BaseModel):
     encrypted: Optional[bool] = Field(default=None, alias="Encrypted")
     id: Optional[int] = Field(default=None, alias="Id")
     tags: Optional[List[Any]] = Field(default=None, alias="Tags")
+
+
+class BucketSyncAction(str, Enum):
+    """Outcome of a single file during a bucket sync."""
+
+    UPLOADED = "uploaded"
+    DOWNLOADED = "downloaded"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class BucketSyncEvent(BaseModel):
+    """Progress event emitted once per file during a bucket sync."""
+
+    path: str = Field(description="File path relative to the synced directory")
+    action: BucketSyncAction
+    size: int = Field(default=0, description="File size in bytes")
+    error: Optional[str] = Field(
+        default=None, description="Error message when the transfer failed"
+    )
+    completed: int = Field(description="Number of files processed so far")
+    total: int = Field(description="Number of files considered by the sync")
+
+
+class BucketSyncResult(BaseModel):
+    """Summary of a bucket sync."""
+
+    transferred: List[str] = Field(
+        default_factory=list, description="Relative paths uploaded or downloaded"
+    )
+    skipped: List[str] = Field(
+        default_factory=list, description="Relative paths already up to date"
+    )
+    failed: Dict[str, str] = Field(
+        default_factory=dict, description="Relative path to error message"
+    )
+    bytes_transferred: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every file was transferred or skipped."""
+        return not self.failed
@@ -0,0 +1,60 @@
+"""Import-time budget for the ``UiPath`` facade.
+
+Services are imported when first accessed, so ``from uipath.platform import
+UiPath`` must not pull in the service layer. Each check runs in a fresh
+interpreter; the module checks pin the lazy import graph. The time budget
+catches regressions the module lists do not name; it only runs with
+``UIPATH_TEST_IMPORT_TIME=1``, on an otherwise idle machine.
+"""
+
+import pytest
+
+# Cumulative import time in ms; several times what it takes on a developer
+# machine, so it only trips on real regressions.
+FACADE_BUDGET_MS = 1500
+
+
+def test_facade_does_not_import_services(loaded_after) -> None:
+    loaded = loaded_after(
+        "from uipath.platform import UiPath",
+        [
+            "uipath.platform.action_center",
+            "uipath.platform.context_grounding",
+            "uipath.platform.documents",
+            "uipath.platform.entities",
+            "uipath.platform.governance",
+            "uipath.platform.guardrails",
+            "uipath.platform.orchestrator",
+            "sqlparse",
+        ],
+    )
+    assert loaded == []
+
+
+def test_common_does_not_import_interrupt_models(loaded_after) -> None:
+    loaded = loaded_after(
+        "import uipath.platform.common",
+        [
+            "uipath.platform.common.interrupt_models",
+            "uipath.platform.context_grounding",
+            "uipath.platform.orchestrator",
+        ],
+    )
+    assert loaded == []
+
+
+def test_lazy_exports_resolve() -> None:
+    from uipath.platform import common
+    from uipath.platform.common.interrupt_models import CreateTask
+
+    assert common.CreateTask is CreateTask
+    with pytest.raises(AttributeError):
+        common.NoSuchModel  # noqa: B018
+
+
+def test_facade_import_time_budget(import_time_ms) -> None:
+    elapsed = import_time_ms("uipath.platform._uipath")
+    assert elapsed < FACADE_BUDGET_MS, (
+        f"importing the UiPath facade took {elapsed:.0f}ms "
+        f"(budget {FACADE_BUDGET_MS}ms)"
+    )
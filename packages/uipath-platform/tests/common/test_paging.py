@@ -0,0 +1,169 @@
+import threading
+from typing import Any
+
+import anyio
+import pytest
+
+from uipath.platform.common import (
+    PagedResult,
+    aiter_pages,
+    iter_pages,
+    keyset_filter,
+    odata_page_fetcher,
+)
+
+
+def make_fetcher(pages: list[list[int]], calls: list[int]):
+    def fetch_page(cursor):
+        index = cursor or 0
+        calls.append(index)
+        next_cursor = index + 1 if index + 1 < len(pages) else None
+        return pages[index], next_cursor
+
+    return fetch_page
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_pages_yields_every_item_in_order(prefetch: bool) -> None:
+    calls: list[int] = []
+    fetch_page = make_fetcher([[1, 2], [3, 4], [5]], calls)
+
+    assert list(iter_pages(fetch_page, prefetch=prefetch)) == [1, 2, 3, 4, 5]
+    assert calls == [0, 1, 2]
+
+
+def test_iter_pages_is_lazy() -> None:
+    calls: list[int] = []
+
+    items = iter_pages(make_fetcher([[1], [2]], calls))
+
+    assert calls == []
+    assert next(items) == 1
+
+
+def test_iter_pages_prefetches_next_page_while_consuming() -> None:
+    fetched = threading.Event()
+
+    def fetch_page(cursor):
+        if cursor is None:
+            return [1, 2], "next"
+        fetched.set()
+        return [3], None
+
+    items = iter_pages(fetch_page)
+
+    assert next(items) == 1
+    assert fetched.wait(timeout=5)
+    assert list(items) == [2, 3]
+
+
+def test_iter_pages_limit_stops_without_fetching_more() -> None:
+    calls: list[int] = []
+    fetch_page = make_fetcher([[1, 2], [3, 4], [5]], calls)
+
+    assert list(iter_pages(fetch_page, limit=3, prefetch=False)) == [1, 2, 3]
+    assert calls == [0, 1]
+
+
+def test_iter_pages_rejects_negative_limit() -> None:
+    with pytest.raises(ValueError):
+        list(iter_pages(make_fetcher([[1]], []), limit=-1))
+
+
+def test_iter_pages_propagates_prefetch_errors() -> None:
+    def fetch_page(cursor):
+        if cursor is None:
+            return [1], "next"
+        raise RuntimeError("boom")
+
+    items = iter_pages(fetch_page)
+
+    assert next(items) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(items)
+
+
+@pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+@pytest.mark.anyio
+async def test_aiter_pages_yields_every_item(anyio_backend: str) -> None:
+    calls: list[int] = []
+
+    async def fetch_page(cursor):
+        await anyio.sleep(0)
+        return make_fetcher([[1, 2], [3]], calls)(cursor)
+
+    assert [item async for item in aiter_pages(fetch_page)] == [1, 2, 3]
+    assert calls == [0, 1]
+
+
+@pytest.mark.anyio
+async def test_aiter_pages_early_break_cancels_prefetch() -> None:
+    started = anyio.Event()
+    cancelled = False
+
+    async def fetch_page(cursor):
+        nonlocal cancelled
+        if cursor is None:
+            return [1, 2], "next"
+        started.set()
+        try:
+            await anyio.sleep(10)
+        except BaseException:
+            cancelled = True
+            raise
+        return [3], None
+
+    items = aiter_pages(fetch_page)
+    async for _ in items:
+        await started.wait()
+        break
+    await items.aclose()  # type: ignore[attr-defined]
+    await anyio.sleep(0)
+
+    assert cancelled
+
+
+def test_keyset_filter() -> None:
+    assert keyset_filter(None, None) is None
+    assert keyset_filter("State eq 'New'", None) == "State eq 'New'"
+    assert keyset_filter(None, 5) == "Id gt 5"
+    assert keyset_filter("A or B", 5) == "(A or B) and Id gt 5"
+
+
+class _Item:
+    def __init__(self, id: int) -> None:
+        self.id = id
+
+
+def test_odata_page_fetcher_walks_by_id_without_orderby() -> None:
+    calls: list[dict[str, Any]] = []
+
+    def list_page(**kwargs):
+        calls.append(kwargs)
+        ids = [1, 2] if kwargs["filter"] == "X" else [3]
+        items = [_Item(i) for i in ids]
+        return PagedResult(items=items, has_more=len(items) == kwargs["top"])
+
+    fetch_page = odata_page_fetcher(list_page, filter="X", page_size=2)
+
+    assert [item.id for item in iter_pages(fetch_page, prefetch=False)] == [1, 2, 3]
+    assert calls[1] == {
+        "filter": "(X) and Id gt 2",
+        "orderby": "Id asc",
+        "skip": 0,
+        "top": 2,
+    }
+
+
+def test_odata_page_fetcher_uses_skip_with_orderby() -> None:
+    calls: list[dict[str, Any]] = []
+
+    def list_page(**kwargs):
+        calls.append(kwargs)
+        items = [_Item(i) for i in range(2 if kwargs["skip"] == 0 else 1)]
+        return PagedResult(items=items, has_more=len(items) == kwargs["top"])
+
+    fetch_page = odata_page_fetcher(list_page, orderby="Name", page_size=2)
+
+    assert len(list(iter_pages(fetch_page, prefetch=False))) == 3
+    assert [call["skip"] for call in calls] == [0, 2]
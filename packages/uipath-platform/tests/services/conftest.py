@@ -4,6 +4,21 @@ from pathlib import Path
 import pytest
 
 from uipath.platform import UiPathApiConfig, UiPathExecutionContext
+from uipath.platform.orchestrator import configure_folder_cache, reset_folder_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_folder_cache():
+    """Start and end every test with an empty folder cache and the default TTL."""
+    reset_folder_cache()
+    yield
+    reset_folder_cache()
+
+
+@pytest.fixture
+def no_folder_cache():
+    """Resolve folder keys on every call, for tests that mock each lookup."""
+    configure_folder_cache(ttl=0)
 
 
 @pytest.fixture
@@ -1,11 +1,19 @@
+import contextvars
 import os
+import re
 from pathlib import Path
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from uipath.platform import UiPathApiConfig, UiPathExecutionContext
+from uipath.platform.errors import EnrichedException
+from uipath.platform.orchestrator import _bucket_transfers, _buckets_service
 from uipath.platform.orchestrator._buckets_service import BucketsService
+from uipath.platform.orchestrator.buckets import BucketSyncAction, BucketSyncEvent
+
+_caller: contextvars.ContextVar[str] = contextvars.ContextVar("caller", default="")
 
 
 @pytest.fixture
@@ -431,6 +439,59 @@ class TestList:
 
         assert len(buckets) == 10
 
+    def test_iter_buckets_pages_by_id(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        """iter_buckets() walks by Id, so it never hits the skip offset cap."""
+        url = f"{base_url}{org}{tenant}/orchestrator_/odata/Buckets"
+        name_filter = "contains%28tolower%28Name%29%2C+tolower%28%27inv%27%29%29"
+        httpx_mock.add_response(
+            url=f"{url}?$skip=0&$top=2&$filter={name_filter}&$orderby=Id+asc",
+            json={
+                "value": [
+                    {"Id": i, "Name": f"inv-{i}", "Identifier": f"id-{i}"}
+                    for i in (10001, 10002)
+                ]
+            },
+        )
+        httpx_mock.add_response(
+            url=f"{url}?$skip=0&$top=2&$filter={name_filter}+and+Id+gt+10002&$orderby=Id+asc",
+            json={"value": [{"Id": 10003, "Name": "inv-10003", "Identifier": "id"}]},
+        )
+
+        buckets = list(service.iter_buckets(name="inv", page_size=2))
+
+        assert [bucket.id for bucket in buckets] == [10001, 10002, 10003]
+
+    @pytest.mark.asyncio
+    async def test_aiter_buckets_pages_by_id(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        """Test async version of iter_buckets()."""
+        url = f"{base_url}{org}{tenant}/orchestrator_/odata/Buckets"
+        httpx_mock.add_response(
+            url=f"{url}?$skip=0&$top=1&$orderby=Id+asc",
+            json={"value": [{"Id": 4, "Name": "a", "Identifier": "id-4"}]},
+        )
+        httpx_mock.add_response(
+            url=f"{url}?$skip=0&$top=1&$filter=Id+gt+4&$orderby=Id+asc",
+            json={"value": []},
+        )
+
+        buckets = [bucket async for bucket in service.aiter_buckets(page_size=1)]
+
+        assert [bucket.id for bucket in buckets] == [4]
+
 
 class TestExists:
     """Tests for exists() method."""
@@ -2033,3 +2094,502 @@ class TestTopParameterValidation:
         )
         result = service.list(skip=10000, top=1000)
         assert result is not None
+
+
+class TestStreamingTransfers:
+    """Tests for streaming, resumable and block-based bucket transfers."""
+
+    STORAGE_URL = "https://test-storage.com/test-file.bin"
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_bucket_transfers, "transfer_backoff", lambda _: 0)
+
+    @pytest.fixture
+    def bucket_responses(
+        self, httpx_mock: HTTPXMock, base_url: str, org: str, tenant: str
+    ):
+        def add(uri_kind: str, headers: dict[str, str] | None = None) -> None:
+            headers = headers or {}
+            httpx_mock.add_response(
+                url=f"{base_url}{org}{tenant}/orchestrator_/odata/Buckets/UiPath.Server.Configuration.OData.GetByKey(identifier='bucket-key')",
+                json={"value": [{"Id": 123, "Name": "b", "Identifier": "bucket-key"}]},
+            )
+            httpx_mock.add_response(
+                url=re.compile(
+                    rf".*/Buckets\(123\)/UiPath\.Server\.Configuration\.OData\.{uri_kind}.*"
+                ),
+                json={
+                    "Uri": f"{self.STORAGE_URL}?sig=abc",
+                    "Headers": {
+                        "Keys": list(headers.keys()),
+                        "Values": list(headers.values()),
+                    },
+                    "RequiresAuth": False,
+                },
+            )
+
+        return add
+
+    def test_download_resumes_with_range_after_broken_stream(
+        self,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+    ):
+        bucket_responses("GetReadUri")
+        storage_requests: list[httpx.Request] = []
+
+        def storage(request: httpx.Request) -> httpx.Response:
+            storage_requests.append(request)
+            if "Range" not in request.headers:
+                return httpx.Response(200, stream=_BrokenStream([b"hello "]))
+            return httpx.Response(206, content=b"world")
+
+        service.custom_client = httpx.Client(transport=httpx.MockTransport(storage))
+
+        destination = tmp_path / "out.bin"
+        service.download(
+            key="bucket-key",
+            blob_file_path="test-file.bin",
+            destination_path=str(destination),
+        )
+
+        assert destination.read_bytes() == b"hello world"
+        assert storage_requests[1].headers["Range"] == "bytes=6-"
+        assert not (tmp_path / "out.bin.part").exists()
+
+    def test_download_restarts_when_range_is_ignored(
+        self,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+    ):
+        bucket_responses("GetReadUri")
+        responses = iter(
+            [
+                httpx.Response(200, stream=_BrokenStream([b"hel"])),
+                httpx.Response(200, content=b"hello"),
+            ]
+        )
+        service.custom_client = httpx.Client(
+            transport=httpx.MockTransport(lambda _: next(responses))
+        )
+
+        destination = tmp_path / "out.bin"
+        service.download(
+            key="bucket-key",
+            blob_file_path="test-file.bin",
+            destination_path=str(destination),
+        )
+
+        assert destination.read_bytes() == b"hello"
+
+    def test_download_error_raises_and_removes_partial_file(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+    ):
+        bucket_responses("GetReadUri")
+        httpx_mock.add_response(url=f"{self.STORAGE_URL}?sig=abc", status_code=403)
+
+        destination = tmp_path / "out.bin"
+        with pytest.raises(EnrichedException):
+            service.download(
+                key="bucket-key",
+                blob_file_path="test-file.bin",
+                destination_path=str(destination),
+            )
+
+        assert not destination.exists()
+        assert not (tmp_path / "out.bin.part").exists()
+
+    @pytest.mark.anyio
+    async def test_download_async_streams_to_file(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+    ):
+        bucket_responses("GetReadUri")
+        httpx_mock.add_response(
+            url=f"{self.STORAGE_URL}?sig=abc", content=b"x" * 3_000_000
+        )
+
+        destination = tmp_path / "out.bin"
+        await service.download_async(
+            key="bucket-key",
+            blob_file_path="test-file.bin",
+            destination_path=str(destination),
+        )
+
+        assert destination.read_bytes() == b"x" * 3_000_000
+
+    def test_upload_from_path_streams_with_content_length(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+    ):
+        bucket_responses("GetWriteUri")
+        httpx_mock.add_response(url=f"{self.STORAGE_URL}?sig=abc", status_code=503)
+        httpx_mock.add_response(url=f"{self.STORAGE_URL}?sig=abc", status_code=201)
+        source = tmp_path / "in.bin"
+        source.write_bytes(b"y" * 2_500_000)
+
+        service.upload(
+            key="bucket-key", blob_file_path="test-file.bin", source_path=str(source)
+        )
+
+        puts = [r for r in httpx_mock.get_requests() if r.method == "PUT"]
+        assert len(puts) == 2
+        for put in puts:
+            assert put.headers["Content-Length"] == "2500000"
+            assert put.content == b"y" * 2_500_000
+
+    def test_upload_large_file_to_azure_uses_blocks(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(_buckets_service, "BLOCK_UPLOAD_THRESHOLD", 10)
+        monkeypatch.setattr(_bucket_transfers, "BLOCK_SIZE", 4)
+        bucket_responses("GetWriteUri", {"x-ms-blob-type": "BlockBlob"})
+        httpx_mock.add_response(
+            url=re.compile(re.escape(self.STORAGE_URL) + r".*comp=block&.*"),
+            status_code=201,
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            url=re.compile(re.escape(self.STORAGE_URL) + r".*comp=blocklist.*"),
+            status_code=201,
+        )
+        source = tmp_path / "in.bin"
+        source.write_bytes(b"0123456789ab")
+
+        service.upload(
+            key="bucket-key", blob_file_path="test-file.bin", source_path=str(source)
+        )
+
+        self._assert_block_upload(httpx_mock, b"0123456789ab", block_count=3)
+
+    @pytest.mark.anyio
+    async def test_upload_async_large_file_to_azure_uses_blocks(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(_buckets_service, "BLOCK_UPLOAD_THRESHOLD", 10)
+        monkeypatch.setattr(_bucket_transfers, "BLOCK_SIZE", 4)
+        bucket_responses("GetWriteUri", {"x-ms-blob-type": "BlockBlob"})
+        httpx_mock.add_response(
+            url=re.compile(re.escape(self.STORAGE_URL) + r".*comp=block&.*"),
+            status_code=201,
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            url=re.compile(re.escape(self.STORAGE_URL) + r".*comp=blocklist.*"),
+            status_code=201,
+        )
+        source = tmp_path / "in.bin"
+        source.write_bytes(b"0123456789ab")
+
+        await service.upload_async(
+            key="bucket-key", blob_file_path="test-file.bin", source_path=str(source)
+        )
+
+        self._assert_block_upload(httpx_mock, b"0123456789ab", block_count=3)
+
+    @pytest.mark.anyio
+    async def test_upload_async_block_error_raises_the_http_error(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BucketsService,
+        bucket_responses,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(_buckets_service, "BLOCK_UPLOAD_THRESHOLD", 10)
+        monkeypatch.setattr(_bucket_transfers, "BLOCK_SIZE", 4)
+        bucket_responses("GetWriteUri", {"x-ms-blob-type": "BlockBlob"})
+        httpx_mock.add_response(
+            url=re.compile(re.escape(self.STORAGE_URL) + r".*comp=block&.*"),
+            status_code=403,
+            is_reusable=True,
+        )
+        source = tmp_path / "in.bin"
+        source.write_bytes(b"0123456789ab")
+
+        with pytest.raises(EnrichedException) as excinfo:
+            await service.upload_async(
+                key="bucket-key",
+                blob_file_path="test-file.bin",
+                source_path=str(source),
+            )
+
+        assert excinfo.value.status_code == 403
+
+    @staticmethod
+    def _assert_block_upload(
+        httpx_mock: HTTPXMock, payload: bytes, block_count: int
+    ) -> None:
+        puts = [r for r in httpx_mock.get_requests() if r.method == "PUT"]
+        blocks = [r for r in puts if r.url.params.get("comp") == "block"]
+        commit = puts[-1]
+
+        assert len(blocks) == block_count
+        assert all(r.url.params["sig"] == "abc" for r in puts)
+        assert all("x-ms-blob-type" not in r.headers for r in blocks)
+        ordered = sorted(blocks, key=lambda r: r.url.params["blockid"])
+        assert b"".join(r.content for r in ordered) == payload
+        assert commit.url.params["comp"] == "blocklist"
+        for block in ordered:
+            assert f"<Latest>{block.url.params['blockid']}</Latest>".encode() in (
+                commit.content
+            )
+
+
+class TestIterFiles:
+    """Tests for lazily iterating bucket files."""
+
+    @pytest.fixture
+    def pages(self, httpx_mock: HTTPXMock, base_url: str, org: str, tenant: str):
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/orchestrator_/odata/Buckets/UiPath.Server.Configuration.OData.GetByKey(identifier='bucket-key')",
+            json={"value": [{"Id": 123, "Name": "b", "Identifier": "bucket-key"}]},
+        )
+        list_url = f"{base_url}{org}{tenant}/api/Buckets/123/ListFiles"
+        httpx_mock.add_response(
+            url=f"{list_url}?prefix=data&takeHint=2",
+            json={
+                "items": [
+                    {"fullPath": "data/a", "size": 1},
+                    {"fullPath": "data/b", "size": 2},
+                ],
+                "continuationToken": "page-2",
+            },
+        )
+        httpx_mock.add_response(
+            url=f"{list_url}?prefix=data&continuationToken=page-2&takeHint=2",
+            json={"items": [{"fullPath": "data/c", "size": 3}]},
+        )
+
+    def test_iter_files_follows_continuation_tokens(
+        self, httpx_mock: HTTPXMock, service: BucketsService, pages
+    ):
+        files = service.iter_files(key="bucket-key", prefix="data", page_size=2)
+
+        assert [f.path for f in files] == ["data/a", "data/b", "data/c"]
+        assert len(httpx_mock.get_requests()) == 3
+
+    @pytest.mark.anyio
+    async def test_aiter_files_follows_continuation_tokens(
+        self, service: BucketsService, pages
+    ):
+        files = [
+            f
+            async for f in service.aiter_files(
+                key="bucket-key", prefix="data", page_size=2
+            )
+        ]
+
+        assert [f.size for f in files] == [1, 2, 3]
+
+
+class TestSync:
+    """Tests for directory <-> bucket sync."""
+
+    OLD = "2024-01-01T00:00:00Z"
+    NEW = "2099-01-01T00:00:00Z"
+
+    @pytest.fixture
+    def bucket(self, httpx_mock: HTTPXMock) -> dict[str, tuple[bytes, str]]:
+        """In-memory bucket served through the Orchestrator and storage APIs."""
+        files: dict[str, tuple[bytes, str]] = {}
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if "GetByKey" in path:
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": [{"Id": 123, "Name": "b", "Identifier": "bucket-key"}]
+                    },
+                )
+            if path.endswith("/api/Buckets/123/ListFiles"):
+                prefix = request.url.params.get("prefix", "")
+                items = [
+                    {"fullPath": name, "size": len(data), "lastModified": modified}
+                    for name, (data, modified) in sorted(files.items())
+                    if name.startswith(prefix)
+                ]
+                return httpx.Response(200, json={"items": items})
+            if path.endswith(("GetReadUri", "GetWriteUri")):
+                blob = request.url.params["path"]
+                return httpx.Response(
+                    200,
+                    json={
+                        "Uri": f"https://storage.test/{blob}",
+                        "Headers": {"Keys": [], "Values": []},
+                        "RequiresAuth": False,
+                    },
+                )
+            blob = path.lstrip("/")
+            if blob.startswith("forbidden"):
+                return httpx.Response(403)
+            if request.method == "PUT":
+                files[blob] = (request.read(), self.NEW)
+                return httpx.Response(201)
+            return httpx.Response(200, content=files[blob][0])
+
+        httpx_mock.add_callback(handle, is_reusable=True)
+        return files
+
+    def test_sync_upload_skips_unchanged_files(
+        self,
+        service: BucketsService,
+        bucket: dict[str, tuple[bytes, str]],
+        tmp_path: Path,
+    ):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "same.txt").write_bytes(b"same")
+        (tmp_path / "changed.txt").write_bytes(b"changed")
+        (tmp_path / "sub" / "new.txt").write_bytes(b"new")
+        bucket["reports/same.txt"] = (b"same", self.NEW)
+        bucket["reports/changed.txt"] = (b"old", self.NEW)
+
+        result = service.sync(tmp_path, key="bucket-key", prefix="/reports/")
+
+        assert sorted(result.transferred) == ["changed.txt", "sub/new.txt"]
+        assert result.skipped == ["same.txt"]
+        assert result.succeeded
+        assert result.bytes_transferred == len(b"changed") + len(b"new")
+        assert bucket["reports/sub/new.txt"][0] == b"new"
+        assert bucket["reports/changed.txt"][0] == b"changed"
+
+    def test_sync_download_sets_mtime_so_resync_skips(
+        self,
+        service: BucketsService,
+        bucket: dict[str, tuple[bytes, str]],
+        tmp_path: Path,
+    ):
+        bucket["data/a.txt"] = (b"alpha", self.OLD)
+        bucket["data/nested/b.txt"] = (b"beta", self.OLD)
+        bucket["other/c.txt"] = (b"gamma", self.OLD)
+
+        first = service.sync(
+            tmp_path, key="bucket-key", prefix="data", direction="download"
+        )
+        second = service.sync(
+            tmp_path, key="bucket-key", prefix="data", direction="download"
+        )
+
+        assert sorted(first.transferred) == ["a.txt", "nested/b.txt"]
+        assert (tmp_path / "nested" / "b.txt").read_bytes() == b"beta"
+        assert not (tmp_path / "c.txt").exists()
+        assert second.transferred == []
+        assert sorted(second.skipped) == ["a.txt", "nested/b.txt"]
+
+    def test_sync_collects_failures_and_reports_progress(
+        self,
+        service: BucketsService,
+        bucket: dict[str, tuple[bytes, str]],
+        tmp_path: Path,
+    ):
+        (tmp_path / "ok.txt").write_bytes(b"ok")
+        (tmp_path / "denied.txt").write_bytes(b"denied")
+        events: list[BucketSyncEvent] = []
+
+        result = service.sync(
+            tmp_path,
+            key="bucket-key",
+            prefix="forbidden",
+            max_concurrency=1,
+            on_progress=events.append,
+        )
+
+        assert not result.succeeded
+        assert set(result.failed) == {"denied.txt", "ok.txt"}
+        assert [e.action for e in events] == [BucketSyncAction.FAILED] * 2
+        assert [e.completed for e in events] == [1, 2]
+        assert all(e.total == 2 and e.error for e in events)
+
+    def test_sync_transfers_in_the_caller_context(
+        self,
+        service: BucketsService,
+        bucket: dict[str, tuple[bytes, str]],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        (tmp_path / "a.txt").write_bytes(b"a")
+        (tmp_path / "b.txt").write_bytes(b"b")
+        seen: list[str] = []
+        upload_blob = BucketsService._upload_blob
+
+        def spy(self, *args, **kwargs):
+            seen.append(_caller.get())
+            return upload_blob(self, *args, **kwargs)
+
+        monkeypatch.setattr(BucketsService, "_upload_blob", spy)
+        token = _caller.set("caller")
+        try:
+            service.sync(tmp_path, key="bucket-key", prefix="mirror")
+        finally:
+            _caller.reset(token)
+
+        assert seen == ["caller", "caller"]
+
+    def test_sync_rejects_invalid_arguments(
+        self, service: BucketsService, tmp_path: Path
+    ):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            service.sync(tmp_path, key="bucket-key", max_concurrency=0)
+        with pytest.raises(ValueError, match="does not exist"):
+            service.sync(tmp_path / "missing", key="bucket-key")
+
+    @pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+    @pytest.mark.anyio
+    async def test_sync_async_round_trip(
+        self,
+        service: BucketsService,
+        bucket: dict[str, tuple[bytes, str]],
+        tmp_path: Path,
+    ):
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "a.txt").write_bytes(b"alpha")
+        (source / "b.bin").write_bytes(b"beta")
+        events: list[BucketSyncEvent] = []
+
+        uploaded = await service.sync_async(
+            source, key="bucket-key", prefix="mirror", on_progress=events.append
+        )
+        downloaded = await service.sync_async(
+            tmp_path / "copy", key="bucket-key", prefix="mirror", direction="download"
+        )
+
+        assert sorted(uploaded.transferred) == ["a.txt", "b.bin"]
+        assert {e.action for e in events} == {BucketSyncAction.UPLOADED}
+        assert sorted(downloaded.transferred) == ["a.txt", "b.bin"]
+        assert (tmp_path / "copy" / "a.txt").read_bytes() == b"alpha"
+
+
+class _BrokenStream(httpx.SyncByteStream):
+    """Response body that yields some chunks, then drops the connection."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+        raise httpx.ReadError("connection reset")
@@ -76,6 +76,7 @@ def service_no_folder(
 
 
 class TestContextGroundingService:
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_search(
         self,
         httpx_mock: HTTPXMock,
@@ -169,6 +170,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.search/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     @pytest.mark.anyio
     async def test_search_async(
         self,
@@ -2099,6 +2101,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.retrieve_deep_rag_async/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_start_deep_rag(
         self,
         httpx_mock: HTTPXMock,
@@ -2196,6 +2199,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.start_deep_rag/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     @pytest.mark.anyio
     async def test_start_deep_rag_task(
         self,
@@ -2294,6 +2298,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.start_deep_rag_async/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_start_batch_transform(
         self,
         httpx_mock: HTTPXMock,
@@ -2395,6 +2400,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.start_batch_transform/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     @pytest.mark.anyio
     async def test_start_batch_transform_async(
         self,
@@ -2491,6 +2497,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.start_batch_transform_async/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_start_batch_transform_with_target_file_name(
         self,
         httpx_mock: HTTPXMock,
@@ -2596,6 +2603,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.start_batch_transform/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     @pytest.mark.anyio
     async def test_start_batch_transform_async_with_target_file_name(
         self,
@@ -2702,6 +2710,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.start_batch_transform_async/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_start_batch_transform_with_combined_prefix_and_filename(
         self,
         httpx_mock: HTTPXMock,
@@ -3515,6 +3524,7 @@ class TestContextGroundingService:
         assert "Authorization" in download_request.headers
         assert download_request.headers["Authorization"].startswith("Bearer ")
 
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_unified_search(
         self,
         httpx_mock: HTTPXMock,
@@ -3628,6 +3638,7 @@ class TestContextGroundingService:
             == f"UiPath.Python.Sdk/UiPath.Python.Sdk.Activities.ContextGroundingService.unified_search/{version}"
         )
 
+    @pytest.mark.usefixtures("no_folder_cache")
     @pytest.mark.anyio
     async def test_unified_search_async(
         self,
@@ -3713,6 +3724,7 @@ class TestContextGroundingService:
         assert response.semantic_results.metadata is not None
         assert len(response.semantic_results.values) == 1
 
+    @pytest.mark.usefixtures("no_folder_cache")
     def test_unified_search_with_scope(
         self,
         httpx_mock: HTTPXMock,
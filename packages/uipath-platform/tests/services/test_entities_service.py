@@ -1,10 +1,12 @@
+import contextvars
 import json
 import re
 import uuid
 from dataclasses import make_dataclass
-from typing import Optional
+from typing import Any, Optional
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -13,11 +15,20 @@ from uipath.platform.common._bindings import (
     EntityResourceOverwrite,
     _resource_overwrites,
 )
-from uipath.platform.entities import ChoiceSetValue, DataFabricEntityItem, Entity
+from uipath.platform.entities import (
+    ChoiceSetValue,
+    DataFabricEntityItem,
+    Entity,
+    EntityRecord,
+    _entity_bulk,
+)
+from uipath.platform.entities import entities as entities_models
 from uipath.platform.entities._entities_service import EntitiesService
 from uipath.platform.entities._entity_data_service import EntityDataService
 from uipath.platform.errors import EnrichedException
 
+_caller: contextvars.ContextVar[str] = contextvars.ContextVar("caller", default="")
+
 
 @pytest.fixture
 def service(
@@ -187,6 +198,29 @@ class TestEntitiesService:
         assert records[1].name == "record_name2"
         assert records[1].integer_field == 11
 
+    def test_iter_records_pages_with_start_and_limit(
+        self,
+        httpx_mock: HTTPXMock,
+        service: EntitiesService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ) -> None:
+        entity_key = str(uuid.uuid4())
+        read_url = f"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/{entity_key}/read"
+        httpx_mock.add_response(
+            url=f"{read_url}?start=0&limit=2",
+            json={"totalCount": 3, "value": [{"Id": "1"}, {"Id": "2"}]},
+        )
+        httpx_mock.add_response(
+            url=f"{read_url}?start=2&limit=2",
+            json={"totalCount": 3, "value": [{"Id": "3"}]},
+        )
+
+        records = service.iter_records(entity_key, page_size=2)
+
+        assert [record.id for record in records] == ["1", "2", "3"]
+
     def test_retrieve_records_with_schema_succeeds(
         self,
         httpx_mock: HTTPXMock,
@@ -2821,3 +2855,530 @@ class TestGetOntologyFileAsync:
         assert api_message in exc.response_content
         assert exc.error_info is not None
         assert exc.error_info.message == api_message
+
+
+class TestEntitiesBulkTransfer:
+    """Tests for concurrent export and batched import of records."""
+
+    @pytest.fixture
+    def read_url(self, base_url: str, org: str, tenant: str) -> str:
+        return f"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1/read"
+
+    @pytest.fixture
+    def five_rows(self, httpx_mock: HTTPXMock, read_url: str) -> None:
+        def read(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params["start"])
+            limit = int(request.url.params["limit"])
+            rows = [{"Id": str(i)} for i in range(start, min(start + limit, 5))]
+            return httpx.Response(200, json={"totalCount": 5, "value": rows})
+
+        httpx_mock.add_callback(read, is_reusable=True, url=re.compile(read_url))
+
+    def test_export_records_yields_raw_pages_in_order(
+        self, httpx_mock: HTTPXMock, service: EntitiesService, five_rows
+    ) -> None:
+        batches = list(service.export_records("e1", page_size=2, max_concurrency=2))
+
+        assert batches == [
+            [{"Id": "0"}, {"Id": "1"}],
+            [{"Id": "2"}, {"Id": "3"}],
+            [{"Id": "4"}],
+        ]
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 3
+        assert {r.url.params["$orderby"] for r in requests} == {"Id"}
+
+    @pytest.mark.parametrize("anyio_backend", ["asyncio", "trio"])
+    @pytest.mark.anyio
+    async def test_export_records_async_yields_raw_pages_in_order(
+        self, service: EntitiesService, five_rows
+    ) -> None:
+        batches = [
+            batch
+            async for batch in service.export_records_async(
+                "e1", page_size=2, max_concurrency=2
+            )
+        ]
+
+        assert [row["Id"] for batch in batches for row in batch] == list("01234")
+
+    @pytest.mark.anyio
+    async def test_export_records_async_raises_the_page_error(
+        self, httpx_mock: HTTPXMock, service: EntitiesService, read_url: str
+    ) -> None:
+        def read(request: httpx.Request) -> httpx.Response:
+            if request.url.params["start"] != "0":
+                return httpx.Response(403)
+            rows = [{"Id": "0"}, {"Id": "1"}]
+            return httpx.Response(200, json={"totalCount": 6, "value": rows})
+
+        httpx_mock.add_callback(read, is_reusable=True, url=re.compile(read_url))
+
+        with pytest.raises(EnrichedException) as excinfo:
+            async for _ in service.export_records_async("e1", page_size=2):
+                pass
+
+        assert excinfo.value.status_code == 403
+
+    def test_export_records_reads_pages_in_the_caller_context(
+        self,
+        service: EntitiesService,
+        five_rows,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        seen: list[str] = []
+        raw_records_page = EntityDataService._raw_records_page
+
+        def spy(response):
+            seen.append(_caller.get())
+            return raw_records_page(response)
+
+        monkeypatch.setattr(EntityDataService, "_raw_records_page", staticmethod(spy))
+        token = _caller.set("caller")
+        try:
+            list(service.export_records("e1", page_size=2, max_concurrency=2))
+        finally:
+            _caller.reset(token)
+
+        assert seen == ["caller"] * 3
+
+    def test_export_records_rejects_invalid_page_size(
+        self, service: EntitiesService
+    ) -> None:
+        with pytest.raises(ValueError):
+            service.export_records("e1", page_size=0)
+
+    @pytest.fixture
+    def insert_batch(
+        self,
+        httpx_mock: HTTPXMock,
+        base_url: str,
+        org: str,
+        tenant: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> list[list[dict[str, Any]]]:
+        monkeypatch.setattr(_entity_bulk, "batch_backoff", lambda attempt: 0)
+        sent: list[list[dict[str, Any]]] = []
+
+        def insert(request: httpx.Request) -> httpx.Response:
+            batch = json.loads(request.content)
+            sent.append(batch)
+            if any(record["name"] == "flaky" for record in batch):
+                raise httpx.ConnectError("connection refused")
+            if any(record["name"] == "unsure" for record in batch):
+                raise httpx.ReadError("connection reset")
+            return httpx.Response(
+                200,
+                json={
+                    "successRecords": [
+                        {"Id": record["name"], **record} for record in batch
+                    ],
+                    "failureRecords": [],
+                },
+            )
+
+        httpx_mock.add_callback(
+            insert,
+            is_reusable=True,
+            url=re.compile(
+                rf"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1/insert-batch.*"
+            ),
+        )
+        return sent
+
+    def test_insert_records_splits_an_iterable_into_batches(
+        self, service: EntitiesService, insert_batch: list[list[dict[str, Any]]]
+    ) -> None:
+        records = ({"name": f"r{i}"} for i in range(5))
+
+        response = service.insert_records("e1", records, batch_size=2)
+
+        assert sorted(len(batch) for batch in insert_batch) == [1, 2, 2]
+        assert [r.id for r in response.success_records] == [
+            "r0",
+            "r1",
+            "r2",
+            "r3",
+            "r4",
+        ]
+        assert response.failure_records == []
+
+    def test_insert_records_reports_exhausted_batches_as_failures(
+        self, service: EntitiesService, insert_batch: list[list[dict[str, Any]]]
+    ) -> None:
+        records = [{"name": "ok"}, {"name": "flaky"}]
+
+        response = service.insert_records("e1", records, batch_size=1)
+
+        assert [r.id for r in response.success_records] == ["ok"]
+        assert len(response.failure_records) == 1
+        assert response.failure_records[0].record == {"name": "flaky"}
+        assert "connection refused" in (response.failure_records[0].error or "")
+        assert (
+            insert_batch.count([{"name": "flaky"}]) == _entity_bulk.MAX_BATCH_ATTEMPTS
+        )
+
+    def test_insert_records_does_not_resend_possibly_applied_batches(
+        self, service: EntitiesService, insert_batch: list[list[dict[str, Any]]]
+    ) -> None:
+        response = service.insert_records(
+            "e1", [{"name": "ok"}, {"name": "unsure"}], batch_size=1
+        )
+
+        assert insert_batch.count([{"name": "unsure"}]) == 1
+        assert [r.id for r in response.success_records] == ["ok"]
+        assert response.failure_records[0].record == {"name": "unsure"}
+
+    def test_insert_records_raises_the_error_of_a_single_batch(
+        self, service: EntitiesService, insert_batch: list[list[dict[str, Any]]]
+    ) -> None:
+        with pytest.raises(httpx.ReadError):
+            service.insert_records("e1", [{"name": "ok"}, {"name": "unsure"}])
+
+        assert insert_batch == [[{"name": "ok"}, {"name": "unsure"}]]
+
+    @pytest.mark.anyio
+    async def test_insert_records_async_merges_in_input_order(
+        self, service: EntitiesService, insert_batch: list[list[dict[str, Any]]]
+    ) -> None:
+        records = [{"name": "a"}, {"name": "flaky"}, {"name": "b"}]
+
+        response = await service.insert_records_async(
+            "e1", records, batch_size=1, max_concurrency=3
+        )
+
+        assert [r.id for r in response.success_records] == ["a", "b"]
+        assert response.failure_records[0].record == {"name": "flaky"}
+
+
+class TestEntitiesBatchChunking:
+    """Tests for splitting batch writes by record count and payload size."""
+
+    @pytest.fixture
+    def batch_url(self, base_url: str, org: str, tenant: str) -> str:
+        return f"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1"
+
+    @pytest.fixture
+    def echo_batches(self, httpx_mock: HTTPXMock, batch_url: str) -> list[list[Any]]:
+        sent: list[list[Any]] = []
+
+        def echo(request: httpx.Request) -> httpx.Response:
+            batch = json.loads(request.content)
+            sent.append(batch)
+            records = [
+                item if isinstance(item, dict) else {"Id": item} for item in batch
+            ]
+            failed = [r for r in records if r.get("name") == "bad"]
+            return httpx.Response(
+                200,
+                json={
+                    "successRecords": [
+                        {"Id": r.get("name", r.get("Id")), **r}
+                        for r in records
+                        if r not in failed
+                    ],
+                    "failureRecords": [
+                        {"error": "invalid", "record": r} for r in failed
+                    ],
+                },
+            )
+
+        httpx_mock.add_callback(
+            echo, is_reusable=True, url=re.compile(rf"{batch_url}/\w+-batch.*")
+        )
+        return sent
+
+    def test_plan_batches_limits_records_and_bytes(self) -> None:
+        records = [{"name": "x" * 10} for _ in range(5)]
+
+        assert [len(b) for b in _entity_bulk.plan_batches(records, 2)] == [2, 2, 1]
+        assert [
+            len(b) for b in _entity_bulk.plan_batches(records, 10, max_bytes=40)
+        ] == [1, 1, 1, 1, 1]
+        assert list(_entity_bulk.plan_batches([], 10)) == []
+
+    def test_insert_records_splits_large_lists(
+        self, service: EntitiesService, echo_batches: list[list[Any]]
+    ) -> None:
+        records = [{"name": f"r{i}"} for i in range(2500)]
+
+        response = service.insert_records("e1", records)
+
+        assert sorted(len(batch) for batch in echo_batches) == [500, 1000, 1000]
+        assert [r.id for r in response.success_records] == [
+            f"r{i}" for i in range(2500)
+        ]
+
+    def test_insert_records_fail_on_first_stops_after_failing_batch(
+        self, service: EntitiesService, echo_batches: list[list[Any]]
+    ) -> None:
+        records = [{"name": f"r{i}"} for i in range(1500)] + [{"name": "bad"}]
+        records += [{"name": f"s{i}"} for i in range(1000)]
+
+        response = service.insert_records("e1", records, fail_on_first=True)
+
+        assert len(echo_batches) == 2
+        assert len(response.success_records) == 1999
+        assert len(response.failure_records) == 1
+
+    @pytest.mark.anyio
+    async def test_delete_records_async_splits_large_lists(
+        self, service: EntitiesService, echo_batches: list[list[Any]]
+    ) -> None:
+        record_ids = [str(i) for i in range(1001)]
+
+        response = await service.delete_records_async("e1", record_ids)
+
+        assert sorted(len(batch) for batch in echo_batches) == [1, 1000]
+        assert [r.id for r in response.success_records] == record_ids
+
+    @pytest.mark.anyio
+    async def test_insert_records_async_raises_the_error_of_a_single_batch(
+        self, httpx_mock: HTTPXMock, service: EntitiesService, batch_url: str
+    ) -> None:
+        httpx_mock.add_response(
+            url=re.compile(rf"{batch_url}/insert-batch.*"), status_code=403
+        )
+
+        with pytest.raises(EnrichedException) as excinfo:
+            await service.insert_records_async(
+                "e1", [{"name": f"r{i}"} for i in range(10)]
+            )
+
+        assert excinfo.value.status_code == 403
+
+    @pytest.mark.anyio
+    async def test_insert_records_async_keeps_applied_batches_when_one_fails(
+        self, httpx_mock: HTTPXMock, service: EntitiesService, batch_url: str
+    ) -> None:
+        def insert(request: httpx.Request) -> httpx.Response:
+            batch = json.loads(request.content)
+            if batch[0]["name"] == "r1":
+                return httpx.Response(500)
+            return httpx.Response(
+                200,
+                json={
+                    "successRecords": [{"Id": r["name"], **r} for r in batch],
+                    "failureRecords": [],
+                },
+            )
+
+        httpx_mock.add_callback(
+            insert, is_reusable=True, url=re.compile(rf"{batch_url}/insert-batch.*")
+        )
+
+        response = await service.insert_records_async(
+            "e1", [{"name": f"r{i}"} for i in range(3)], batch_size=1
+        )
+
+        assert [r.id for r in response.success_records] == ["r0", "r2"]
+        assert [f.record for f in response.failure_records] == [{"name": "r1"}]
+
+    def test_insert_records_sends_batches_in_the_caller_context(
+        self,
+        service: EntitiesService,
+        echo_batches: list[list[Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        seen: list[str] = []
+        send_batch = EntityDataService._send_batch
+
+        def spy(self, *args, **kwargs):
+            seen.append(_caller.get())
+            return send_batch(self, *args, **kwargs)
+
+        monkeypatch.setattr(EntityDataService, "_send_batch", spy)
+        token = _caller.set("caller")
+        try:
+            service.insert_records("e1", [{"name": f"r{i}"} for i in range(1500)])
+        finally:
+            _caller.reset(token)
+
+        assert seen == ["caller", "caller"]
+
+    def test_update_records_resends_only_failed_records(
+        self, httpx_mock: HTTPXMock, service: EntitiesService, batch_url: str
+    ) -> None:
+        sent: list[list[dict[str, Any]]] = []
+
+        def flaky(request: httpx.Request) -> httpx.Response:
+            batch = json.loads(request.content)
+            sent.append(batch)
+            retry_round = len(sent) > 1
+            return httpx.Response(
+                200,
+                json={
+                    "successRecords": [
+                        {"Id": r["name"]}
+                        for r in batch
+                        if r["name"] != "busy" or retry_round
+                    ],
+                    "failureRecords": [
+                        {"error": "locked", "record": r}
+                        for r in batch
+                        if r["name"] == "busy" and not retry_round
+                    ],
+                },
+            )
+
+        httpx_mock.add_callback(
+            flaky, is_reusable=True, url=re.compile(rf"{batch_url}/update-batch.*")
+        )
+
+        response = service.update_records(
+            "e1",
+            [{"name": "a"}, {"name": "busy"}, {"name": "b"}],
+            record_retries=1,
+        )
+
+        assert sent[1] == [{"name": "busy"}]
+        assert sorted(r.id for r in response.success_records) == ["a", "b", "busy"]
+        assert response.failure_records == []
+
+
+class TestEntityRecordPageValidation:
+    """Tests for validating whole pages of records with cached validators."""
+
+    @pytest.fixture
+    def schema(self):
+        return make_dataclass("PageSchema", [("name", str), ("age", Optional[int])])
+
+    def test_from_page_matches_from_data(self, schema) -> None:
+        rows: list[dict[str, Any]] = [
+            {"Id": "1", "name": "a", "age": 3},
+            {"Id": "2", "name": "b"},
+        ]
+
+        records = EntityRecord.from_page(rows, model=schema)
+
+        assert records == [EntityRecord.from_data(row, model=schema) for row in rows]
+
+    def test_user_model_is_compiled_once_per_class(self, schema) -> None:
+        rows = [{"Id": str(i), "name": "x"} for i in range(3)]
+
+        for row in rows:
+            EntityRecord.from_data(row, model=schema)
+
+        assert entities_models._user_model(schema) is entities_models._user_model(
+            schema
+        )
+        assert entities_models._user_model.cache_info().hits >= 2
+
+    @pytest.mark.parametrize(
+        "rows",
+        [[{"name": "a"}], [{"Id": 1, "name": "a"}], [{"Id": "1", "name": 5}]],
+        ids=["missing_id", "non_string_id", "schema_mismatch"],
+    )
+    def test_from_page_rejects_invalid_rows(self, schema, rows) -> None:
+        with pytest.raises(ValueError):
+            EntityRecord.from_page(rows, model=schema)
+
+    def test_from_page_trusted_skips_schema_validation(self, schema) -> None:
+        records = EntityRecord.from_page(
+            [{"Id": "1", "name": 5}], model=schema, trusted=True
+        )
+
+        assert records[0].model_dump()["name"] == 5
+
+    @pytest.fixture
+    def page_calls(self, monkeypatch) -> list[bool]:
+        calls: list[bool] = []
+        from_page = EntityRecord.from_page
+
+        def spy(rows, model=None, *, trusted=False):
+            calls.append(trusted)
+            return from_page(rows, model=model, trusted=trusted)
+
+        monkeypatch.setattr(EntityRecord, "from_page", spy)
+        return calls
+
+    def test_list_records_without_schema_uses_trusted_path(
+        self,
+        httpx_mock: HTTPXMock,
+        service: EntitiesService,
+        base_url: str,
+        org: str,
+        tenant: str,
+        page_calls: list[bool],
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1/read",
+            json={"totalCount": 2, "value": [{"Id": "1"}, {"Id": "2", "x": 1}]},
+        )
+
+        records = service.list_records("e1")
+
+        assert page_calls == [True]
+        assert [record.id for record in records] == ["1", "2"]
+        assert records[1].x == 1
+
+    def test_list_records_with_schema_still_validates(
+        self,
+        httpx_mock: HTTPXMock,
+        service: EntitiesService,
+        base_url: str,
+        org: str,
+        tenant: str,
+        schema,
+        page_calls: list[bool],
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1/read",
+            json={"totalCount": 1, "value": [{"Id": "1", "name": 5}]},
+        )
+
+        with pytest.raises(ValueError):
+            service.list_records("e1", schema=schema)
+        assert page_calls == [False]
+
+    def test_retrieve_records_uses_trusted_path_and_keeps_row_order(
+        self,
+        httpx_mock: HTTPXMock,
+        service: EntitiesService,
+        base_url: str,
+        org: str,
+        tenant: str,
+        page_calls: list[bool],
+    ) -> None:
+        from uipath.platform.entities import AggregateRow
+
+        httpx_mock.add_response(
+            url=re.compile(
+                rf"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1/query.*"
+            ),
+            json={
+                "value": [{"Id": "1"}, {"total": 3}, {"Id": "2"}],
+                "totalRecordCount": 3,
+            },
+        )
+
+        result = service.retrieve_records("e1")
+
+        assert page_calls == [True]
+        assert isinstance(result.items[0], EntityRecord)
+        assert isinstance(result.items[1], AggregateRow)
+        assert isinstance(result.items[2], EntityRecord)
+        assert [result.items[0].id, result.items[2].id] == ["1", "2"]
+
+    def test_update_records_does_not_revalidate_returned_records(
+        self,
+        httpx_mock: HTTPXMock,
+        service: EntitiesService,
+        base_url: str,
+        org: str,
+        tenant: str,
+        schema,
+    ) -> None:
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/datafabric_/api/EntityService/entity/e1/update-batch",
+            json={
+                "successRecords": [{"Id": "1", "name": "a", "computed": 1}],
+                "failureRecords": [],
+            },
+        )
+
+        response = service.update_records(
+            "e1", [{"Id": "1", "name": "a"}], schema=schema
+        )
+
+        assert response.success_records[0].computed == 1
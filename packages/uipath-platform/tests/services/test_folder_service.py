@@ -1,9 +1,21 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import anyio
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from uipath.platform import UiPathApiConfig, UiPathExecutionContext
 from uipath.platform.constants import HEADER_USER_AGENT
 from uipath.platform.errors import FolderNotFoundException
+from uipath.platform.orchestrator import (
+    configure_folder_cache,
+    invalidate_folder_cache,
+)
 from uipath.platform.orchestrator._folder_service import FolderService
 
 
@@ -499,3 +511,153 @@ class TestFolderService:
             await service.retrieve_folder_key_async(folder_path="NonExistent/Folder")
 
         assert "Folder NonExistent/Folder not found" in str(exc_info.value)
+
+
+class TestFolderKeyCache:
+    SEARCH_URL = re.compile(r".*/GetFoldersForCurrentUser\?searchText=.*")
+
+    @staticmethod
+    def page(*paths: str) -> dict[str, Any]:
+        return {
+            "PageItems": [
+                {"Key": f"key-{path}", "FullyQualifiedName": path} for path in paths
+            ]
+        }
+
+    def test_retrieve_key_is_cached(
+        self, httpx_mock: HTTPXMock, service: FolderService
+    ) -> None:
+        httpx_mock.add_response(url=self.SEARCH_URL, json=self.page("Shared/Finance"))
+
+        first = service.retrieve_key(folder_path="Shared/Finance")
+        second = service.retrieve_key(folder_path="Shared/Finance")
+
+        assert first == second == "key-Shared/Finance"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cache_is_not_shared_between_tokens(
+        self,
+        httpx_mock: HTTPXMock,
+        service: FolderService,
+        config: UiPathApiConfig,
+        execution_context: UiPathExecutionContext,
+    ) -> None:
+        httpx_mock.add_response(url=self.SEARCH_URL, json=self.page("Shared"))
+        httpx_mock.add_response(url=self.SEARCH_URL, json=self.page())
+        other_user = FolderService(
+            config=config.model_copy(update={"secret": "other-secret"}),
+            execution_context=execution_context,
+        )
+
+        assert service.retrieve_key(folder_path="Shared") == "key-Shared"
+        assert other_user.retrieve_key(folder_path="Shared") is None
+        assert [
+            request.headers["Authorization"] for request in httpx_mock.get_requests()
+        ] == ["Bearer secret", "Bearer other-secret"]
+
+    def test_cache_expires_after_ttl(
+        self,
+        httpx_mock: HTTPXMock,
+        service: FolderService,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        httpx_mock.add_response(
+            url=self.SEARCH_URL, json=self.page("Shared"), is_reusable=True
+        )
+        configure_folder_cache(ttl=10)
+        now = time.monotonic()
+        service.retrieve_key(folder_path="Shared")
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        service.retrieve_key(folder_path="Shared")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_invalidate_forgets_path(
+        self, httpx_mock: HTTPXMock, service: FolderService
+    ) -> None:
+        httpx_mock.add_response(
+            url=self.SEARCH_URL, json=self.page("Shared"), is_reusable=True
+        )
+        service.retrieve_key(folder_path="Shared")
+
+        invalidate_folder_cache("Shared")
+        service.retrieve_key(folder_path="Shared")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_missing_folder_is_not_cached(
+        self, httpx_mock: HTTPXMock, service: FolderService
+    ) -> None:
+        httpx_mock.add_response(url=self.SEARCH_URL, json=self.page())
+        httpx_mock.add_response(url=self.SEARCH_URL, json=self.page("New"))
+
+        assert service.retrieve_key(folder_path="New") is None
+        assert service.retrieve_key(folder_path="New") == "key-New"
+
+    def test_prefetch_keys_populates_cache(
+        self,
+        httpx_mock: HTTPXMock,
+        service: FolderService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ) -> None:
+        paths = [f"Folder{i}" for i in range(150)]
+        list_url = f"{base_url}{org}{tenant}/orchestrator_/api/FoldersNavigation/GetFoldersForCurrentUser"
+        httpx_mock.add_response(
+            url=f"{list_url}?skip=0&take=100", json=self.page(*paths[:100])
+        )
+        httpx_mock.add_response(
+            url=f"{list_url}?skip=100&take=100", json=self.page(*paths[100:])
+        )
+
+        keys = service.prefetch_keys()
+
+        assert len(keys) == 150
+        assert service.retrieve_key(folder_path="Folder120") == "key-Folder120"
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_concurrent_lookups_share_one_request(
+        self, httpx_mock: HTTPXMock, service: FolderService
+    ) -> None:
+        release = threading.Event()
+
+        def slow_search(request: httpx.Request) -> httpx.Response:
+            release.wait(timeout=5)
+            return httpx.Response(200, json=self.page("Shared"))
+
+        httpx_mock.add_callback(slow_search, url=self.SEARCH_URL)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(service.retrieve_key, folder_path="Shared")
+                for _ in range(4)
+            ]
+            time.sleep(0.1)
+            release.set()
+            keys = [future.result() for future in futures]
+
+        assert keys == ["key-Shared"] * 4
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.anyio
+    async def test_concurrent_async_lookups_share_one_request(
+        self, httpx_mock: HTTPXMock, service: FolderService
+    ) -> None:
+        async def slow_search(request: httpx.Request) -> httpx.Response:
+            await anyio.sleep(0.05)
+            return httpx.Response(200, json=self.page("Shared"))
+
+        httpx_mock.add_callback(slow_search, url=self.SEARCH_URL)
+        keys: list[str | None] = []
+
+        async def lookup() -> None:
+            keys.append(await service.retrieve_key_async(folder_path="Shared"))
+
+        async with anyio.create_task_group() as task_group:
+            for _ in range(4):
+                task_group.start_soon(lookup)
+
+        assert keys == ["key-Shared"] * 4
+        assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,212 @@
+"""Tests for the process-wide shared HTTP transport."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from uipath.platform import UiPathApiConfig, UiPathExecutionContext
+from uipath.platform.common import _http_config, _http_transport
+from uipath.platform.common._base_service import BaseService
+from uipath.platform.common._http_transport import (
+    aclose_shared_transports,
+    configure_http_transport,
+    get_shared_async_transport,
+    get_shared_transport,
+    reset_http_transport,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_transport():
+    reset_http_transport()
+    _http_transport._ssl_contexts.clear()
+    yield
+    reset_http_transport()
+    _http_transport._ssl_contexts.clear()
+
+
+@pytest.fixture
+def service(
+    config: UiPathApiConfig, execution_context: UiPathExecutionContext
+) -> BaseService:
+    return BaseService(config=config, execution_context=execution_context)
+
+
+class TestSharedTransport:
+    def test_services_share_transports(
+        self, config: UiPathApiConfig, execution_context: UiPathExecutionContext
+    ):
+        first = BaseService(config=config, execution_context=execution_context)
+        second = BaseService(config=config, execution_context=execution_context)
+
+        assert first._client._transport is get_shared_transport()
+        assert second._client._transport is get_shared_transport()
+        assert first._client_async._transport is get_shared_async_transport()
+        assert second._client_async._transport is get_shared_async_transport()
+
+    def test_ssl_context_built_once(
+        self, config: UiPathApiConfig, execution_context: UiPathExecutionContext
+    ):
+        with patch.object(
+            _http_config,
+            "create_ssl_context",
+            wraps=_http_config.create_ssl_context,
+        ) as create_ssl_context:
+            for _ in range(5):
+                BaseService(config=config, execution_context=execution_context)
+
+        assert create_ssl_context.call_count == 1
+
+    def test_sync_requests_reuse_pool(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BaseService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/endpoint", json={}, is_reusable=True
+        )
+
+        service.request("GET", "/endpoint")
+        pool = _http_transport._sync_pools[_http_transport._verify_key()]
+        service.request("GET", "/endpoint")
+
+        assert list(_http_transport._sync_pools.values()) == [pool]
+
+    def test_closing_service_keeps_shared_pool_open(
+        self,
+        httpx_mock: HTTPXMock,
+        config: UiPathApiConfig,
+        execution_context: UiPathExecutionContext,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/endpoint", json={}, is_reusable=True
+        )
+        first = BaseService(config=config, execution_context=execution_context)
+        second = BaseService(config=config, execution_context=execution_context)
+
+        first.request("GET", "/endpoint")
+        asyncio.run(first.aclose())
+        response = second.request("GET", "/endpoint")
+
+        assert first._client.is_closed
+        assert response.status_code == 200
+
+    @pytest.mark.anyio
+    async def test_async_pools_are_per_event_loop(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BaseService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/endpoint", json={}, is_reusable=True
+        )
+
+        await service.request_async("GET", "/endpoint")
+
+        loop = asyncio.get_running_loop()
+        assert list(_http_transport._async_pools.keys()) == [loop]
+
+    def test_async_pools_under_trio(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BaseService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        trio = pytest.importorskip("trio")
+        httpx_mock.add_response(url=f"{base_url}{org}{tenant}/endpoint", json={})
+
+        async def request() -> object:
+            await service.request_async("GET", "/endpoint")
+            return trio.lowlevel.current_trio_token()
+
+        token = trio.run(request)
+
+        assert list(_http_transport._async_pools.keys()) == [token]
+
+    @pytest.mark.anyio
+    async def test_aclose_shared_transports_releases_pools(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BaseService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        httpx_mock.add_response(
+            url=f"{base_url}{org}{tenant}/endpoint", json={}, is_reusable=True
+        )
+        service.request("GET", "/endpoint")
+        await service.request_async("GET", "/endpoint")
+
+        await aclose_shared_transports()
+
+        assert not _http_transport._sync_pools
+        assert not _http_transport._async_pools
+
+        response = await service.request_async("GET", "/endpoint")
+        assert response.status_code == 200
+
+    def test_reset_after_fork_drops_pools(
+        self,
+        httpx_mock: HTTPXMock,
+        service: BaseService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ):
+        httpx_mock.add_response(url=f"{base_url}{org}{tenant}/endpoint", json={})
+        service.request("GET", "/endpoint")
+
+        _http_transport._reset_after_fork()
+
+        assert not _http_transport._sync_pools
+
+
+class TestConfigureHttpTransport:
+    def test_configure_applies_limits_to_new_pools(self):
+        configure_http_transport(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=1.0
+        )
+
+        pool = _http_transport._get_sync_pool()
+
+        assert pool._pool._max_connections == 10
+        assert pool._pool._max_keepalive_connections == 5
+        assert pool._pool._keepalive_expiry == 1.0
+
+    def test_configure_drops_existing_pools(self):
+        pool = _http_transport._get_sync_pool()
+
+        configure_http_transport(max_connections=10)
+
+        assert _http_transport._get_sync_pool() is not pool
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_connections": 0},
+            {"max_keepalive_connections": 0},
+            {"keepalive_expiry": -1},
+        ],
+    )
+    def test_configure_rejects_invalid_limits(self, kwargs):
+        with pytest.raises(ValueError):
+            configure_http_transport(**kwargs)
+
+    def test_http2_requires_h2(self):
+        with patch.object(_http_transport, "find_spec", return_value=None):
+            with pytest.raises(ImportError, match="httpx\\[http2\\]"):
+                configure_http_transport(http2=True)
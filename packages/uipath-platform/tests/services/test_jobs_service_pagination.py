@@ -1,5 +1,8 @@
 """Tests for JobsService PagedResult pagination."""
 
+import re
+
+import httpx
 import pytest
 
 from uipath.platform.common.paging import PagedResult
@@ -219,3 +222,58 @@ class TestJobsListAsync:
 
         assert isinstance(result, PagedResult)
         assert len(result.items) == 1
+
+
+class TestJobsIteration:
+    """Test iter_jobs()/aiter_jobs() lazy pagination."""
+
+    @staticmethod
+    def serve_jobs(httpx_mock, count):
+        def handle(request):
+            params = request.url.params
+            keyset = re.search(r"Id gt (\d+)", params.get("$filter", ""))
+            last_id = int(keyset.group(1)) if keyset else 0
+            top = int(params["$top"])
+            ids = range(last_id + 1, min(last_id + top, count) + 1)
+            return httpx.Response(
+                200,
+                json={
+                    "value": [
+                        {"Key": f"job-{i}", "Id": i, "FolderKey": "folder"} for i in ids
+                    ]
+                },
+            )
+
+        httpx_mock.add_callback(handle, is_reusable=True)
+
+    def test_iter_jobs_walks_pages_by_id(self, jobs_service, httpx_mock):
+        self.serve_jobs(httpx_mock, count=5)
+
+        jobs = list(jobs_service.iter_jobs(filter="State eq 'Faulted'", page_size=2))
+
+        assert [job.id for job in jobs] == [1, 2, 3, 4, 5]
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 3
+        assert requests[0].url.params["$orderby"] == "Id asc"
+        assert requests[0].url.params["$filter"] == "State eq 'Faulted'"
+        assert requests[2].url.params["$filter"] == "(State eq 'Faulted') and Id gt 4"
+
+    def test_iter_jobs_limit(self, jobs_service, httpx_mock):
+        self.serve_jobs(httpx_mock, count=100)
+
+        jobs = list(jobs_service.iter_jobs(page_size=10, limit=15, prefetch=False))
+
+        assert len(jobs) == 15
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_iter_jobs_rejects_invalid_page_size(self, jobs_service):
+        with pytest.raises(ValueError):
+            jobs_service.iter_jobs(page_size=1001)
+
+    @pytest.mark.anyio
+    async def test_aiter_jobs(self, jobs_service, httpx_mock):
+        self.serve_jobs(httpx_mock, count=3)
+
+        jobs = [job async for job in jobs_service.aiter_jobs(page_size=2)]
+
+        assert [job.id for job in jobs] == [1, 2, 3]
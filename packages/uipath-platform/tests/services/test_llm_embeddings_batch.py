@@ -0,0 +1,242 @@
+"""Tests for UiPathOpenAIService.embeddings_batch and EmbeddingCache."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import anyio
+import httpx
+import pytest
+
+from uipath.platform import UiPathApiConfig, UiPathExecutionContext
+from uipath.platform.chat import (
+    EmbeddingCache,
+    EmbeddingModels,
+    UiPathOpenAIService,
+    set_llm_concurrency,
+)
+from uipath.platform.chat._llm_gateway_service import _split_embedding_batches
+from uipath.platform.chat.llm_throttle import reset_llm_concurrency
+from uipath.platform.errors import EnrichedException
+
+
+def _vector(text: str) -> list[float]:
+    # 0.1 has no exact 32-bit float, so a lossy cache would change it.
+    return [float(len(text)), ord(text[0]) + 0.1]
+
+
+class FakeGateway:
+    """Stands in for request_async, answering embedding requests."""
+
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.requests: list[list[str]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, method, endpoint, json, **kwargs):
+        self.requests.append(json["input"])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        response = MagicMock()
+        response.json.return_value = {
+            # Items may come back in any order; index says which input they embed.
+            "data": [
+                {"embedding": _vector(text), "index": index, "object": "embedding"}
+                for index, text in reversed(list(enumerate(json["input"])))
+            ],
+            "model": "text-embedding-ada-002",
+            "object": "list",
+            "usage": {
+                "prompt_tokens": len(json["input"]),
+                "total_tokens": len(json["input"]),
+            },
+        }
+        return response
+
+
+@pytest.fixture
+def service():
+    return UiPathOpenAIService(
+        config=UiPathApiConfig(base_url="https://example.com", secret="test_secret"),
+        execution_context=UiPathExecutionContext(),
+    )
+
+
+@pytest.fixture
+def gateway(service):
+    gateway = FakeGateway()
+    with patch.object(service, "request_async", new=gateway):
+        yield gateway
+
+
+@pytest.fixture(autouse=True)
+def _reset_concurrency():
+    yield
+    reset_llm_concurrency()
+
+
+class TestEmbeddingsBatch:
+    async def test_returns_one_item_per_input_in_order(self, service, gateway):
+        texts = ["alpha", "be", "alpha", "gamma"]
+
+        result = await service.embeddings_batch(texts)
+
+        assert [item.index for item in result.data] == [0, 1, 2, 3]
+        assert [item.embedding for item in result.data] == [_vector(t) for t in texts]
+        assert result.model == EmbeddingModels.text_embedding_ada_002
+        # Duplicates are sent once.
+        assert gateway.requests == [["alpha", "be", "gamma"]]
+        assert result.usage.total_tokens == 3
+
+    async def test_splits_batches_and_sends_them_concurrently(self, service):
+        gateway = FakeGateway(delay=0.05)
+        texts = [f"text {i}" for i in range(10)]
+
+        with patch.object(service, "request_async", new=gateway):
+            result = await service.embeddings_batch(texts, batch_size=3)
+
+        assert [len(batch) for batch in gateway.requests] == [3, 3, 3, 1]
+        assert gateway.max_running == 4
+        assert [item.embedding for item in result.data] == [_vector(t) for t in texts]
+
+    async def test_batches_share_the_llm_semaphore(self, service):
+        set_llm_concurrency(2)
+        gateway = FakeGateway(delay=0.05)
+
+        with patch.object(service, "request_async", new=gateway):
+            await service.embeddings_batch(
+                [f"text {i}" for i in range(10)], batch_size=1
+            )
+
+        assert len(gateway.requests) == 10
+        assert gateway.max_running == 2
+
+    async def test_unknown_models_use_conservative_limits(self, service, gateway):
+        await service.embeddings_batch(
+            [f"text {i}" for i in range(20)], embedding_model="custom-embedding"
+        )
+
+        assert [len(batch) for batch in gateway.requests] == [16, 4]
+
+    async def test_cached_texts_are_not_sent(self, service, gateway, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite3")
+        await service.embeddings_batch(["alpha", "beta"], cache=cache)
+
+        result = await service.embeddings_batch(["beta", "gamma"], cache=cache)
+
+        assert gateway.requests == [["alpha", "beta"], ["gamma"]]
+        assert [item.embedding for item in result.data] == [
+            _vector("beta"),
+            _vector("gamma"),
+        ]
+        assert result.usage.total_tokens == 1
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    async def test_cache_is_keyed_by_model(self, service, gateway):
+        cache = EmbeddingCache()
+        await service.embeddings_batch(["alpha"], cache=cache)
+
+        await service.embeddings_batch(
+            ["alpha"],
+            embedding_model=EmbeddingModels.text_embedding_3_large,
+            cache=cache,
+        )
+
+        assert gateway.requests == [["alpha"], ["alpha"]]
+
+    async def test_failing_batch_cancels_the_others(self, service):
+        class FailingGateway(FakeGateway):
+            async def __call__(self, method, endpoint, json, **kwargs):
+                if json["input"] == ["broken"]:
+                    request = httpx.Request("POST", "https://example.com/embeddings")
+                    response = httpx.Response(500, request=request)
+                    raise EnrichedException(
+                        httpx.HTTPStatusError(
+                            "gateway error", request=request, response=response
+                        )
+                    )
+                return await super().__call__(method, endpoint, json, **kwargs)
+
+        gateway = FailingGateway(delay=5)
+
+        with patch.object(service, "request_async", new=gateway):
+            with pytest.raises(EnrichedException) as excinfo:
+                with anyio.fail_after(1):
+                    await service.embeddings_batch(
+                        ["slow", "broken", "slower"], batch_size=1
+                    )
+
+        assert excinfo.value.status_code == 500
+        assert gateway.running == 0
+
+    async def test_empty_input(self, service, gateway):
+        result = await service.embeddings_batch([])
+
+        assert result.data == []
+        assert gateway.requests == []
+
+    async def test_rejects_invalid_batch_size(self, service, gateway):
+        with pytest.raises(ValueError):
+            await service.embeddings_batch(["alpha"], batch_size=0)
+
+
+class TestSplitEmbeddingBatches:
+    def test_respects_token_limit(self):
+        texts = ["x" * 30, "x" * 30, "x" * 30]
+
+        # Each text is estimated at 11 tokens.
+        assert _split_embedding_batches(texts, max_inputs=10, max_tokens=25) == [
+            texts[:2],
+            texts[2:],
+        ]
+
+    def test_oversized_text_gets_its_own_batch(self):
+        texts = ["short", "x" * 300, "short"]
+
+        assert _split_embedding_batches(texts, max_inputs=10, max_tokens=50) == [
+            ["short"],
+            ["x" * 300],
+            ["short"],
+        ]
+
+
+class TestEmbeddingCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache" / "embeddings.sqlite3"
+        cache = EmbeddingCache(path)
+        cache.set_many("model", {"alpha": [0.5, 0.25]})
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+
+        assert reopened.get_many("model", ["alpha", "beta"]) == {"alpha": [0.5, 0.25]}
+        assert reopened.get_many("other-model", ["alpha"]) == {}
+
+    @pytest.mark.parametrize("max_memory_entries", [0, 10])
+    def test_round_trip_keeps_full_precision(self, tmp_path, max_memory_entries):
+        vector = [0.1, -1 / 3, 1e-300, 123456.789012345]
+        cache = EmbeddingCache(
+            tmp_path / "embeddings.sqlite3", max_memory_entries=max_memory_entries
+        )
+        cache.set_many("model", {"alpha": vector})
+
+        assert cache.get_many("model", ["alpha"]) == {"alpha": vector}
+
+    def test_memory_is_least_recently_used(self):
+        cache = EmbeddingCache(max_memory_entries=2)
+        cache.set_many("model", {"a": [1.0], "b": [2.0]})
+        cache.get_many("model", ["a"])
+        cache.set_many("model", {"c": [3.0]})
+
+        assert cache.get_many("model", ["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+    def test_lookups_beyond_the_sqlite_parameter_limit(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite3", max_memory_entries=0)
+        vectors = {f"text {i}": [float(i)] for i in range(1200)}
+        cache.set_many("model", vectors)
+
+        assert cache.get_many("model", list(vectors)) == vectors
@@ -1204,3 +1204,48 @@ class TestQueuesService:
         assert sent_request is not None
         assert HEADER_FOLDER_PATH in sent_request.headers
         assert sent_request.headers[HEADER_FOLDER_PATH] == "Custom/Folder/Path"
+
+    def test_iter_items_pages_by_id(
+        self,
+        httpx_mock: HTTPXMock,
+        service: QueuesService,
+        base_url: str,
+        org: str,
+        tenant: str,
+    ) -> None:
+        url = f"{base_url}{org}{tenant}/orchestrator_/odata/QueueItems"
+        httpx_mock.add_response(
+            url=f"{url}?%24filter=QueueDefinitionName+eq+%27invoices%27&%24orderby=Id+asc&%24skip=0&%24top=2",
+            json={"value": [{"Id": 1}, {"Id": 2}]},
+        )
+        httpx_mock.add_response(
+            url=f"{url}?%24filter=QueueDefinitionName+eq+%27invoices%27+and+%28Id+gt+2%29&%24orderby=Id+asc&%24skip=0&%24top=2",
+            json={"value": [{"Id": 3}]},
+        )
+
+        items = list(service.iter_items("invoices", page_size=2))
+
+        assert [item["Id"] for item in items] == [1, 2, 3]
+
+    @pytest.mark.anyio
+    async def test_aiter_items_combines_filters(
+        self,
+        httpx_mock: HTTPXMock,
+        service: QueuesService,
+    ) -> None:
+        httpx_mock.add_response(json={"value": [{"Id": 7}]})
+
+        items = [
+            item
+            async for item in service.aiter_items(
+                "invoices", filter="Status eq 'New'", page_size=5
+            )
+        ]
+
+        assert items == [{"Id": 7}]
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert (
+            request.url.params["$filter"]
+            == "QueueDefinitionName eq 'invoices' and (Status eq 'New')"
+        )
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Compare how fast `uipath server` jobs start in each execution mode.
+
+For every mode the script runs a trivial entrypoint several times and reports
+the time from submitting the job to the entrypoint's first instruction, and
+to the job's result:
+
+- cold: a fresh `uipath run` process per job
+- preloaded (new worker): the first job of a freshly started worker of
+  `uipath server --workers N`, as after a worker restart
+- preloaded (reused worker): later jobs of that worker, which find the
+  project's modules still imported by earlier jobs
+- forked: a fork of the template process of `uipath server --template DIR`
+
+The generated project imports a module that sleeps on import, standing in
+for the import cost of a real project's dependencies.
+
+Usage:
+    python scripts/benchmark_server_start.py [--jobs 5] [--import-seconds 0.5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+DEPENDENCY = """
+import time
+
+time.sleep({import_seconds})
+"""
+
+SCRIPT = """
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+import dependency
+
+def main(input: dict) -> str:
+    with open(os.environ["BENCHMARK_MARK_FILE"], "w") as f:
+        f.write(str(time.time()))
+    return "ok"
+"""
+
+RunJob = Callable[[dict[str, str]], Awaitable[object]]
+Timings = tuple[list[float], list[float]]
+
+
+def create_project(directory: Path, import_seconds: float) -> None:
+    """Write a one-function project whose dependency takes a while to import."""
+    (directory / "dependency.py").write_text(
+        DEPENDENCY.format(import_seconds=import_seconds)
+    )
+    (directory / "main.py").write_text(SCRIPT)
+    (directory / "uipath.json").write_text(
+        json.dumps({"functions": {"main": "main.py:main"}})
+    )
+
+
+async def measure(run_job: RunJob, jobs: int, mark_file: Path) -> Timings:
+    """Seconds to first instruction and to result of each job."""
+    to_first_instruction = []
+    to_result = []
+    for _ in range(jobs):
+        mark_file.unlink(missing_ok=True)
+        submitted = time.time()
+        await run_job({"BENCHMARK_MARK_FILE": str(mark_file)})
+        finished = time.time()
+        to_first_instruction.append(float(mark_file.read_text()) - submitted)
+        to_result.append(finished - submitted)
+    return to_first_instruction, to_result
+
+
+async def benchmark(project: Path, jobs: int) -> dict[str, Timings]:
+    """Run ``jobs`` jobs in each mode; timings keyed by mode."""
+    from uipath._cli._server_pool import JobWorkerPool
+    from uipath._cli._server_template import TemplateJobRunner
+    from uipath._cli.cli_server import preload_modules
+
+    mark_file = project / "mark.txt"
+    args = ["main", "{}"]
+    results: dict[str, Timings] = {}
+
+    async def cold(env_vars: dict[str, str]) -> None:
+        await asyncio.to_thread(
+            subprocess.run,
+            [
+                sys.executable,
+                "-c",
+                "from uipath._cli import cli; cli()",
+                "run",
+                *args,
+            ],
+            cwd=project,
+            env={**os.environ, **env_vars},
+            capture_output=True,
+            check=True,
+        )
+
+    results["cold"] = await measure(cold, jobs, mark_file)
+
+    preload = preload_modules()
+
+    async def new_worker(env_vars: dict[str, str]) -> None:
+        pool = JobWorkerPool(1, preload)
+        pool.start()
+        try:
+            await pool.run("run", args, env_vars, str(project))
+        finally:
+            await pool.close()
+
+    results["preloaded (new worker)"] = await measure(new_worker, jobs, mark_file)
+
+    pool = JobWorkerPool(1, preload)
+    pool.start()
+    try:
+        await pool.run("run", args, {}, str(project))
+        results["preloaded (reused worker)"] = await measure(
+            lambda env_vars: pool.run("run", args, env_vars, str(project)),
+            jobs,
+            mark_file,
+        )
+    finally:
+        await pool.close()
+
+    if hasattr(os, "fork"):
+        runner = TemplateJobRunner(str(project), 1, preload)
+        runner.start()
+        try:
+            await runner.run("run", args, {}, str(project))
+            results["forked"] = await measure(
+                lambda env_vars: runner.run("run", args, env_vars, str(project)),
+                jobs,
+                mark_file,
+            )
+        finally:
+            await runner.close()
+
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print the median timings of each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=5, help="Jobs per mode")
+    parser.add_argument(
+        "--import-seconds",
+        type=float,
+        default=0.5,
+        help="Import time of the generated project's dependency",
+    )
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        project = Path(directory)
+        create_project(project, options.import_seconds)
+        results = asyncio.run(benchmark(project, options.jobs))
+
+    print(f"{'mode':<26} {'first instruction (ms)':>24} {'result (ms)':>14}")
+    for mode, (to_first_instruction, to_result) in results.items():
+        print(
+            f"{mode:<26} "
+            f"{statistics.median(to_first_instruction) * 1000:>24.1f} "
+            f"{statistics.median(to_result) * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
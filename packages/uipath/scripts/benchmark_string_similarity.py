@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Compare the edit distance kernels behind the JSON similarity evaluators.
+
+For strings of several lengths the script times:
+
+- matrix: the m x n dynamic programming table the evaluators used before
+- bit-parallel: `uipath.eval._helpers.similarity.levenshtein_distance`
+
+Each pair is a random string and a copy of it with a few characters changed,
+like an agent output compared against its expected value.
+
+Usage:
+    python scripts/benchmark_string_similarity.py [--repeat 5] [--lengths 100 1000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from uipath.eval._helpers.similarity import levenshtein_distance  # noqa: E402
+
+Distance = Callable[[str, str], int]
+
+
+def matrix_distance(source_text: str, target_text: str) -> int:
+    """The full-matrix edit distance the evaluators used to compute."""
+    if not source_text:
+        return len(target_text)
+    if not target_text:
+        return len(source_text)
+    source_len, target_len = len(source_text), len(target_text)
+    distance_matrix = [[0] * (target_len + 1) for _ in range(source_len + 1)]
+    for row_idx in range(source_len + 1):
+        distance_matrix[row_idx][0] = row_idx
+    for col_idx in range(target_len + 1):
+        distance_matrix[0][col_idx] = col_idx
+    for row_idx in range(1, source_len + 1):
+        for col_idx in range(1, target_len + 1):
+            substitution_cost = (
+                0 if source_text[row_idx - 1] == target_text[col_idx - 1] else 1
+            )
+            distance_matrix[row_idx][col_idx] = min(
+                distance_matrix[row_idx - 1][col_idx] + 1,
+                distance_matrix[row_idx][col_idx - 1] + 1,
+                distance_matrix[row_idx - 1][col_idx - 1] + substitution_cost,
+            )
+    return distance_matrix[source_len][target_len]
+
+
+def make_pair(length: int, rng: random.Random) -> tuple[str, str]:
+    """A random string and a copy with about 5% of its characters replaced."""
+    alphabet = "abcdefghijklmnopqrstuvwxyz "
+    source = [rng.choice(alphabet) for _ in range(length)]
+    target = list(source)
+    for _ in range(max(1, length // 20)):
+        target[rng.randrange(length)] = rng.choice(alphabet)
+    return "".join(source), "".join(target)
+
+
+def measure(distance: Distance, pair: tuple[str, str], repeat: int) -> float:
+    """Median seconds of ``repeat`` calls of ``distance`` on ``pair``."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        distance(*pair)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print the median time of each kernel."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per timing")
+    parser.add_argument(
+        "--lengths",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="String lengths to compare",
+    )
+    options = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'length':>8} {'matrix (ms)':>14} {'bit-parallel (ms)':>19} {'speedup':>9}")
+    for length in options.lengths:
+        pair = make_pair(length, rng)
+        if matrix_distance(*pair) != levenshtein_distance(*pair):
+            raise SystemExit(f"kernels disagree for length {length}")
+        matrix = measure(matrix_distance, pair, options.repeat)
+        bit_parallel = measure(levenshtein_distance, pair, options.repeat)
+        print(
+            f"{length:>8} {matrix * 1000:>14.3f} {bit_parallel * 1000:>19.3f} "
+            f"{matrix / bit_parallel:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -388,7 +388,7 @@ def generate_cli_docs() -> str:
             output.write("uv run uipath eval --output-file eval_results.json\n")
             output.write("```\n\n")
             output.write(
-                "**When to use:** Run this command to test your agent's performance against a predefined evaluation set. This helps validate agent behavior and measure quality metrics.\n\n"
+                "**When to use:** Run this command to test your agent's performance against a predefined evaluation set. This helps validate agent behavior and measure quality metrics. How long each evaluation took is kept in `.uipath/eval_durations.json`, so later runs start the slowest evaluations first; the file keeps the 10,000 most recently run evaluations and can be deleted at any time.\n\n"
             )
 
         output.write("---\n\n")
@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 import os
+import time
 from collections import deque
 from typing import Any
 from urllib.parse import urlparse
@@ -42,6 +43,38 @@ ToolResumeValue = (
 # Wrapper that pairs a resume value with its tool_call_id for keyed matching
 ToolResumeItem = dict[str, Any]  # {"tool_call_id": str, "value": ToolResumeValue}
 
+# Content chunks for the same content part that arrive within this window
+# after the previous frame are merged into one frame...
+DEFAULT_CHUNK_WINDOW_SECONDS = 0.02
+# ...unless the merged text grows past this size.
+DEFAULT_CHUNK_MAX_BYTES = 4096
+
+
+def _text_chunk(message_event: UiPathConversationMessageEvent) -> str | None:
+    """The text of a plain content chunk event, or None for any other event.
+
+    Only chunks that carry nothing but text can be merged with their
+    neighbours; starts, ends, citations, tool calls and errors are sent as is.
+    """
+    content_part = message_event.content_part
+    if (
+        content_part is None
+        or message_event.start is not None
+        or message_event.end is not None
+        or message_event.tool_call is not None
+        or message_event.meta_event is not None
+        or message_event.error is not None
+        or content_part.start is not None
+        or content_part.end is not None
+        or content_part.meta_event is not None
+        or content_part.error is not None
+        or content_part.chunk is None
+        or content_part.chunk.citation is not None
+        or content_part.chunk.data is None
+    ):
+        return None
+    return content_part.chunk.data
+
 
 class CASErrorId:
     """Error IDs for the Conversational Agent Service (CAS), matching the Temporal backend."""
@@ -124,6 +157,8 @@ class SocketIOChatBridge:
         headers: dict[str, str],
         auth: dict[str, Any] | None = None,
         end_exchange: bool = True,
+        chunk_window: float = DEFAULT_CHUNK_WINDOW_SECONDS,
+        chunk_max_bytes: int = DEFAULT_CHUNK_MAX_BYTES,
     ):
         """Initialize the WebSocket chat bridge.
 
@@ -135,6 +170,11 @@ class SocketIOChatBridge:
             auth: Optional authentication data to send during connection
             end_exchange: Whether to send the exchange-end event to CAS on
                 completion.
+            chunk_window: Seconds during which consecutive text chunks of a
+                content part are merged into one frame; 0 sends every chunk
+                as its own frame.
+            chunk_max_bytes: Size at which merged text is sent without
+                waiting for the window to end.
         """
         self.websocket_url = websocket_url
         self.websocket_path = websocket_path
@@ -146,6 +186,25 @@ class SocketIOChatBridge:
         self._client: Any | None = None
         self._connected_event = asyncio.Event()
 
+        # --- Chunk coalescing state ---
+        # Models stream content as token-sized chunks. A chunk that arrives
+        # after a quiet period is sent right away; chunks that follow it
+        # within chunk_window are merged into one frame for the same content
+        # part. Any other event first flushes the merged text, so the client
+        # sees events in the order they were emitted. _send_lock keeps
+        # frames in order between the flush timer and the emit calls.
+        self.chunk_window = chunk_window
+        self.chunk_max_bytes = chunk_max_bytes
+        self._send_lock = asyncio.Lock()
+        self._pending_chunk_key: tuple[str, str] | None = None
+        self._pending_chunk_text: list[str] = []
+        self._pending_chunk_bytes = 0
+        self._last_chunk_frame_at = float("-inf")
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_error: Exception | None = None
+        self.chunks_received = 0
+        self.chunk_frames_sent = 0
+
         # --- Tool call resume state ---
         # When the LLM invokes multiple tools in one turn, the client can send
         # back confirmToolCall / endToolCall responses concurrently and in any
@@ -256,6 +315,7 @@ class SocketIOChatBridge:
             return
 
         try:
+            await self.flush()
             # Wait for last event to be sent (usually endExchange). Without this, it seems that the disconnect races
             # with the send and sometimes the last event isn't sent. Since the wait happens after the agent has
             # completed it doesn't add latency for the user, but it does create a larger window where the job isn't
@@ -281,39 +341,141 @@ class SocketIOChatBridge:
             raise RuntimeError("WebSocket client not in connected state")
         return client
 
+    def _envelope(self, **exchange_fields: Any) -> dict[str, Any]:
+        """Serialized conversation event for this conversation and exchange.
+
+        Builds the same dict as dumping a ``UiPathConversationEvent`` with
+        ``exclude_none`` and aliases, without validating and dumping the
+        wrapper models for every chunk.
+        """
+        return {
+            "conversationId": self.conversation_id,
+            "exchange": {"exchangeId": self.exchange_id, **exchange_fields},
+        }
+
+    async def _emit(self, event_data: dict[str, Any]) -> None:
+        """Send one serialized event; the caller holds ``_send_lock``."""
+        if self._websocket_disabled:
+            logger.info(
+                f"SocketIOChatBridge is in debug mode. Not sending event: {json.dumps(event_data)}"
+            )
+        else:
+            await self._require_client().emit("ConversationEvent", event_data)
+
+    async def _emit_pending_chunks(self) -> None:
+        """Send the merged text chunks, if any; the caller holds ``_send_lock``."""
+        if self._pending_chunk_key is None:
+            return
+        message_id, content_part_id = self._pending_chunk_key
+        text = "".join(self._pending_chunk_text)
+        self._pending_chunk_key = None
+        self._pending_chunk_text = []
+        self._pending_chunk_bytes = 0
+        self._last_chunk_frame_at = time.monotonic()
+        self.chunk_frames_sent += 1
+        await self._emit(
+            self._envelope(
+                message={
+                    "messageId": message_id,
+                    "contentPart": {
+                        "contentPartId": content_part_id,
+                        "chunk": {"data": text},
+                    },
+                }
+            )
+        )
+
+    async def _send(self, event_data: dict[str, Any]) -> None:
+        """Send an event after any merged chunks that precede it."""
+        self._raise_flush_error()
+        async with self._send_lock:
+            await self._emit_pending_chunks()
+            await self._emit(event_data)
+
+    def _raise_flush_error(self) -> None:
+        if self._flush_error is not None:
+            error, self._flush_error = self._flush_error, None
+            raise error
+
+    async def flush(self) -> None:
+        """Send any merged text chunks that are still waiting for their window.
+
+        Raises:
+            RuntimeError: If client is not connected
+        """
+        self._raise_flush_error()
+        if self._pending_chunk_key is None:
+            return
+        async with self._send_lock:
+            await self._emit_pending_chunks()
+
+    async def _flush_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self.flush()
+        except Exception as e:
+            # Surfaces on the next emit, like a failed direct send would.
+            logger.error(f"Error sending conversation event to WebSocket: {e}")
+            self._flush_error = e
+
+    async def _add_text_chunk(
+        self, message_id: str, content_part_id: str, text: str
+    ) -> None:
+        self.chunks_received += 1
+        key = (message_id, content_part_id)
+        async with self._send_lock:
+            if self._pending_chunk_key not in (None, key):
+                await self._emit_pending_chunks()
+            self._pending_chunk_key = key
+            self._pending_chunk_text.append(text)
+            self._pending_chunk_bytes += len(text.encode())
+
+            idle = time.monotonic() - self._last_chunk_frame_at
+            if idle >= self.chunk_window or (
+                self._pending_chunk_bytes >= self.chunk_max_bytes
+            ):
+                await self._emit_pending_chunks()
+                return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(
+                self._flush_later(self.chunk_window - idle)
+            )
+
     async def emit_message_event(
         self, message_event: UiPathConversationMessageEvent
     ) -> None:
         """Wrap and send a message event to the WebSocket server.
 
+        Plain text chunks may be merged with the chunks that follow them for
+        the same content part (see ``chunk_window``); every other event is
+        sent right away, after any merged chunks.
+
         Args:
             message_event: UiPathConversationMessageEvent to wrap and send
 
         Raises:
             RuntimeError: If client is not connected
         """
-        client = self._require_client()
+        self._require_client()
 
         try:
-            # Wrap message event with conversation/exchange IDs
-            wrapped_event = UiPathConversationEvent(
-                conversation_id=self.conversation_id,
-                exchange=UiPathConversationExchangeEvent(
-                    exchange_id=self.exchange_id,
-                    message=message_event,
-                ),
-            )
-
-            event_data = wrapped_event.model_dump(
-                mode="json", exclude_none=True, by_alias=True
-            )
-
-            if self._websocket_disabled:
-                logger.info(
-                    f"SocketIOChatBridge is in debug mode. Not sending event: {json.dumps(event_data)}"
+            text = _text_chunk(message_event)
+            if text is not None and self.chunk_window > 0:
+                assert message_event.content_part is not None
+                await self._add_text_chunk(
+                    message_event.message_id,
+                    message_event.content_part.content_part_id,
+                    text,
                 )
             else:
-                await client.emit("ConversationEvent", event_data)
+                await self._send(
+                    self._envelope(
+                        message=message_event.model_dump(
+                            mode="json", exclude_none=True, by_alias=True
+                        )
+                    )
+                )
 
             # Store the current message ID, used for emitting interrupt events.
             self._current_message_id = message_event.message_id
@@ -324,7 +486,7 @@ class SocketIOChatBridge:
 
     async def emit_meta_event(self, meta_event: dict[str, Any]) -> None:
         """Send an exchange-scoped conversation metadata event."""
-        client = self._require_client()
+        self._require_client()
 
         try:
             event = UiPathConversationEvent(
@@ -334,15 +496,9 @@ class SocketIOChatBridge:
                     meta_event=meta_event,
                 ),
             )
-            event_data = event.model_dump(mode="json", exclude_none=True, by_alias=True)
-
-            if self._websocket_disabled:
-                logger.info(
-                    "SocketIOChatBridge is in debug mode. Not sending event: %s",
-                    json.dumps(event_data),
-                )
-            else:
-                await client.emit("ConversationEvent", event_data)
+            await self._send(
+                event.model_dump(mode="json", exclude_none=True, by_alias=True)
+            )
         except Exception as e:
             logger.error(f"Error sending conversation event to WebSocket: {e}")
             raise RuntimeError(f"Failed to send conversation event: {e}") from e
@@ -360,7 +516,7 @@ class SocketIOChatBridge:
             logger.info("end_exchange is False; leaving the exchange open.")
             return
 
-        client = self._require_client()
+        self._require_client()
 
         try:
             exchange_end_event = UiPathConversationEvent(
@@ -371,16 +527,11 @@ class SocketIOChatBridge:
                 ),
             )
 
-            event_data = exchange_end_event.model_dump(
-                mode="json", exclude_none=True, by_alias=True
-            )
-
-            if self._websocket_disabled:
-                logger.info(
-                    f"SocketIOChatBridge is in debug mode. Not sending event: {json.dumps(event_data)}"
+            await self._send(
+                exchange_end_event.model_dump(
+                    mode="json", exclude_none=True, by_alias=True
                 )
-            else:
-                await client.emit("ConversationEvent", event_data)
+            )
 
         except Exception as e:
             logger.error(f"Error sending conversation event to WebSocket: {e}")
@@ -396,7 +547,7 @@ class SocketIOChatBridge:
         Args:
             error: The exception that caused the error.
         """
-        client = self._require_client()
+        self._require_client()
 
         # Extract and map error to CAS-specific error ID and message.
         cas_error_id, cas_message = _resolve_cas_error(error)
@@ -415,16 +566,11 @@ class SocketIOChatBridge:
                 ),
             )
 
-            event_data = exchange_error_event.model_dump(
-                mode="json", exclude_none=True, by_alias=True
-            )
-
-            if self._websocket_disabled:
-                logger.info(
-                    f"SocketIOChatBridge is in debug mode. Not sending event: {json.dumps(event_data)}"
+            await self._send(
+                exchange_error_event.model_dump(
+                    mode="json", exclude_none=True, by_alias=True
                 )
-            else:
-                await client.emit("ConversationEvent", event_data)
+            )
 
         except Exception as e:
             logger.error(f"Error sending exchange error event to WebSocket: {e}")
@@ -437,7 +583,11 @@ class SocketIOChatBridge:
         events are handled elsewhere.  The runtime calls this immediately
         before wait_for_resume() for each trigger, so we record the
         tool_call_id here so wait_for_resume() knows which response to match.
+        Merged text chunks are sent first, so the client has the full text
+        before the agent waits for it.
         """
+        if self._client is not None:
+            await self.flush()
         if resume_trigger.api_resume and isinstance(
             resume_trigger.api_resume.request, dict
         ):
@@ -585,6 +735,13 @@ class SocketIOChatBridge:
 
     async def _cleanup_client(self) -> None:
         """Clean up client resources."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        logger.debug(
+            f"Sent {self.chunks_received} content chunks in "
+            f"{self.chunk_frames_sent} frames"
+        )
         self._connected_event.clear()
         self._client = None
 
@@ -0,0 +1,353 @@
+"""Run `uipath eval` with the evaluation set sharded across worker processes.
+
+The parent process owns the eval set run: its span, its created/updated
+events, Studio Web reporting and the aggregated output. Each worker is a
+spawned process that re-enters ``uipath eval`` for its shard of eval ids, with
+its own runtime factory and trace manager, and sends every per-item event and
+result back over a queue. Per-item spans reach LLM Ops from the workers
+directly; spans written to ``--trace-file`` are merged into the parent's file
+once the workers finish, mocker cache entries are flushed by each worker to
+the shared cache database, and with ``--report-coverage`` the parent combines
+the coverage data the workers saved into one report.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+import coverage
+from opentelemetry import trace
+from opentelemetry.trace import SpanContext, TraceFlags
+
+from uipath.core.events import EventBus
+from uipath.core.tracing import UiPathTraceManager
+from uipath.eval.runtime import UiPathEvalContext, UiPathEvalRunResult
+from uipath.eval.runtime._sharding import (
+    pack_event,
+    pack_result,
+    split_into_shards,
+    unpack_event,
+    unpack_result,
+)
+from uipath.eval.runtime.events import EvaluationEvents
+from uipath.eval.runtime.runtime import UiPathEvalRuntime
+from uipath.runtime import (
+    UiPathRuntimeFactoryProtocol,
+    UiPathRuntimeResult,
+    UiPathRuntimeStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# How often the parent checks on workers while waiting for messages.
+_POLL_INTERVAL_SECONDS = 1.0
+
+
+@dataclass
+class EvalShard:
+    """What a worker process needs to evaluate its shard."""
+
+    index: int
+    channel: Any
+    """``multiprocessing.Queue`` the worker sends its messages to."""
+
+    parent_span: tuple[int, int, int] | None
+    """Trace id, span id and trace flags of the parent's eval set run span."""
+
+    live_tracking: bool
+    """Whether the worker exports its spans to LLM Ops."""
+
+    coverage_dir: str | None = None
+    """Directory the worker saves its coverage data to, with --report-coverage."""
+
+
+_current_shard: EvalShard | None = None
+
+
+def get_current_shard() -> EvalShard | None:
+    """The shard this process evaluates, if it is an eval worker process."""
+    return _current_shard
+
+
+def shard_trace_file(trace_file: str, index: int) -> str:
+    """Trace file a worker writes to before the parent merges it."""
+    root, ext = os.path.splitext(trace_file)
+    return f"{root}.shard{index}{ext}"
+
+
+def _run_shard_process(cli_args: list[str], shard: EvalShard) -> None:
+    """Worker process entry point: run ``uipath eval`` on one shard."""
+    global _current_shard
+    _current_shard = shard
+
+    # Go through the top-level group so runtime factories and the CLI
+    # context are set up exactly as for ``uipath eval``.
+    from uipath._cli import cli
+
+    try:
+        exit_code = cli.main(
+            args=["eval", *cli_args], prog_name="uipath", standalone_mode=False
+        )
+    except BaseException as e:
+        shard.channel.put(("error", shard.index, f"{type(e).__name__}: {e}"))
+        return
+    if exit_code:
+        shard.channel.put(("error", shard.index, f"exited with code {exit_code}"))
+
+
+def _coverage_data_file(coverage_dir: str) -> str:
+    return os.path.join(coverage_dir, ".coverage")
+
+
+class _ShardEvalRuntime(UiPathEvalRuntime):
+    """Eval runtime of a worker, which leaves coverage reporting to the parent."""
+
+    def __init__(self, *args: Any, coverage_dir: str | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        if coverage_dir is not None:
+            # Suffixed, so the parent can combine the data of all workers.
+            self.coverage = coverage.Coverage(
+                branch=True,
+                data_file=_coverage_data_file(coverage_dir),
+                data_suffix=True,
+            )
+
+    def _report_coverage(self) -> None:
+        self.coverage.save()
+
+
+async def run_eval_shard(
+    runtime_factory: UiPathRuntimeFactoryProtocol,
+    trace_manager: UiPathTraceManager,
+    eval_context: UiPathEvalContext,
+    shard: EvalShard,
+) -> UiPathRuntimeResult:
+    """Evaluate a worker's shard, forwarding its events and results to the parent."""
+    event_bus = EventBus()
+
+    def forwarder(
+        event_type: EvaluationEvents,
+    ) -> Callable[[Any], Awaitable[None]]:
+        async def forward(payload: Any) -> None:
+            shard.channel.put(pack_event(event_type, payload))
+
+        return forward
+
+    for event_type in (
+        EvaluationEvents.CREATE_EVAL_RUN,
+        EvaluationEvents.UPDATE_EVAL_RUN,
+    ):
+        event_bus.subscribe(event_type, forwarder(event_type))
+
+    eval_item_ids = [item.id for item in eval_context.evaluation_set.evaluations]
+    parent_span_context = None
+    if shard.parent_span is not None:
+        trace_id, span_id, trace_flags = shard.parent_span
+        parent_span_context = SpanContext(
+            trace_id=trace_id,
+            span_id=span_id,
+            is_remote=True,
+            trace_flags=TraceFlags(trace_flags),
+        )
+
+    try:
+        async with _ShardEvalRuntime(
+            context=eval_context,
+            factory=runtime_factory,
+            trace_manager=trace_manager,
+            event_bus=event_bus,
+            coverage_dir=shard.coverage_dir,
+        ) as eval_runtime:
+            await eval_runtime.execute_shard(
+                parent_span_context,
+                lambda index, result: shard.channel.put(
+                    pack_result(eval_item_ids[index], result)
+                ),
+            )
+            await event_bus.wait_for_all(timeout=10)
+    except Exception as e:
+        shard.channel.put(("error", shard.index, f"{type(e).__name__}: {e}"))
+        raise
+
+    shard.channel.put(("done", shard.index))
+    return UiPathRuntimeResult(status=UiPathRuntimeStatus.SUCCESSFUL)
+
+
+class ProcessShardedEvalRuntime(UiPathEvalRuntime):
+    """Eval runtime that runs the evaluation set in worker processes.
+
+    ``shard_args`` builds the ``uipath eval`` arguments of a worker from its
+    eval ids and, when traces are written to a file, its own trace file.
+
+    With ``report_coverage``, the agent code runs in the workers, so each
+    worker saves its coverage data and the parent combines it into one report.
+    """
+
+    def __init__(
+        self,
+        context: UiPathEvalContext,
+        factory: UiPathRuntimeFactoryProtocol,
+        trace_manager: UiPathTraceManager,
+        event_bus: EventBus,
+        *,
+        processes: int,
+        shard_args: Callable[[list[str], str | None], list[str]],
+        live_tracking: bool = False,
+        trace_file: str | None = None,
+    ):
+        """Initialize the runtime with the number of worker processes."""
+        super().__init__(context, factory, trace_manager, event_bus)
+        if processes < 1:
+            raise ValueError("processes must be >= 1")
+        self.processes = processes
+        self.shard_args = shard_args
+        self.live_tracking = live_tracking
+        self.trace_file = trace_file
+        self._coverage_dir: str | None = None
+        if context.report_coverage:
+            self._coverage_dir = tempfile.mkdtemp(prefix="uipath-eval-coverage-")
+            self.coverage = coverage.Coverage(
+                branch=True, data_file=_coverage_data_file(self._coverage_dir)
+            )
+
+    async def _run_evaluations(
+        self,
+        evaluation_iterable: Iterable[Awaitable[UiPathEvalRunResult]],
+        workers: int,
+        on_result: Callable[[int, UiPathEvalRunResult], None],
+    ) -> None:
+        if self.context.resume:
+            raise ValueError("Resume mode is not supported with multiple processes.")
+
+        evaluations = self.context.evaluation_set.evaluations
+        index_of = {item.id: index for index, item in enumerate(evaluations)}
+        shards = split_into_shards([item.id for item in evaluations], self.processes)
+
+        span_context = trace.get_current_span().get_span_context()
+        parent_span = (
+            (span_context.trace_id, span_context.span_id, int(span_context.trace_flags))
+            if span_context.is_valid
+            else None
+        )
+
+        mp_context = multiprocessing.get_context("spawn")
+        channel = mp_context.Queue()
+        workers_by_index = {}
+        for index, eval_ids in enumerate(shards):
+            trace_file = (
+                shard_trace_file(self.trace_file, index) if self.trace_file else None
+            )
+            shard = EvalShard(
+                index=index,
+                channel=channel,
+                parent_span=parent_span,
+                live_tracking=self.live_tracking,
+                coverage_dir=self._coverage_dir,
+            )
+            process = mp_context.Process(
+                target=_run_shard_process,
+                args=(self.shard_args(eval_ids, trace_file), shard),
+                name=f"uipath-eval-shard-{index}",
+            )
+            process.start()
+            workers_by_index[index] = process
+        logger.info(
+            f"Evaluating {len(evaluations)} item(s) in {len(shards)} worker process(es)"
+        )
+
+        errors: list[str] = []
+        pending = set(workers_by_index)
+        try:
+            while pending:
+                try:
+                    message = await asyncio.to_thread(
+                        channel.get, True, _POLL_INTERVAL_SECONDS
+                    )
+                except queue.Empty:
+                    for index in list(pending):
+                        exitcode = workers_by_index[index].exitcode
+                        if exitcode is not None and channel.empty():
+                            pending.discard(index)
+                            errors.append(
+                                f"shard {index} exited with code {exitcode} "
+                                "before finishing"
+                            )
+                    continue
+
+                kind = message[0]
+                if kind == "event":
+                    event_type, event = unpack_event(message)
+                    await self.event_bus.publish(event_type, event)
+                elif kind == "result":
+                    eval_item_id, result = unpack_result(message)
+                    on_result(index_of[eval_item_id], result)
+                elif kind == "done":
+                    pending.discard(message[1])
+                elif kind == "error":
+                    pending.discard(message[1])
+                    errors.append(f"shard {message[1]}: {message[2]}")
+        finally:
+            for process in workers_by_index.values():
+                if pending:
+                    process.terminate()
+                process.join()
+            if self.trace_file:
+                self._merge_trace_files(len(shards))
+
+        if errors:
+            raise RuntimeError(
+                "Evaluation worker process(es) failed: " + "; ".join(errors)
+            )
+
+    def _report_coverage(self) -> None:
+        assert self._coverage_dir is not None
+        try:
+            self.coverage.combine(data_paths=[self._coverage_dir])
+            super()._report_coverage()
+        finally:
+            shutil.rmtree(self._coverage_dir, ignore_errors=True)
+
+    def _merge_trace_files(self, shard_count: int) -> None:
+        assert self.trace_file is not None
+        with open(self.trace_file, "a") as merged:
+            for index in range(shard_count):
+                path = shard_trace_file(self.trace_file, index)
+                if not os.path.exists(path):
+                    continue
+                with open(path) as shard_file:
+                    for line in shard_file:
+                        merged.write(line)
+                os.remove(path)
+
+
+async def evaluate_in_processes(
+    runtime_factory: UiPathRuntimeFactoryProtocol,
+    trace_manager: UiPathTraceManager,
+    eval_context: UiPathEvalContext,
+    event_bus: EventBus,
+    *,
+    processes: int,
+    shard_args: Callable[[list[str], str | None], list[str]],
+    live_tracking: bool = False,
+    trace_file: str | None = None,
+) -> UiPathRuntimeResult:
+    """Like :func:`uipath.eval.runtime.evaluate`, with the items run in worker processes."""
+    async with ProcessShardedEvalRuntime(
+        context=eval_context,
+        factory=runtime_factory,
+        trace_manager=trace_manager,
+        event_bus=event_bus,
+        processes=processes,
+        shard_args=shard_args,
+        live_tracking=live_tracking,
+        trace_file=trace_file,
+    ) as eval_runtime:
+        results = await eval_runtime.execute()
+        await event_bus.wait_for_all(timeout=10)
+        return results
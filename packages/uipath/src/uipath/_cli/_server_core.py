@@ -3,12 +3,17 @@
 import asyncio
 import os
 import shlex
-from typing import Any
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
 
 from .cli_debug import debug
 from .cli_eval import eval
 from .cli_run import run
 
+if TYPE_CHECKING:
+    from ._server_pool import JobWorkerPool
+    from ._server_template import TemplateJobRunner
+
 COMMANDS = {
     "run": run,
     "debug": debug,
@@ -16,12 +21,58 @@ COMMANDS = {
 }
 
 
+@dataclass
+class JobMetrics:
+    """Counters of the jobs the server has run."""
+
+    running: int = 0
+    queued: int = 0
+    completed: int = 0
+    failed: int = 0
+    stopped: int = 0
+    worker_restarts: int = 0
+
+    def record(self, result: dict[str, Any]) -> None:
+        """Count a finished job by its result."""
+        if result.get("Stopped"):
+            self.stopped += 1
+        elif result["ExitCode"] == 0:
+            self.completed += 1
+        else:
+            self.failed += 1
+
+    def as_dict(self) -> dict[str, int]:
+        """The counters, keyed by name."""
+        return asdict(self)
+
+
 class _ServerState:
     """Mutable server state, initialized lazily at server startup."""
 
     def __init__(self) -> None:
         self.lock: asyncio.Lock | None = None
         self.baseline_env: dict[str, str] | None = None
+        self.pool_size: int = 1
+        self.preload: list[str] = []
+        self.template_dir: str | None = None
+        self.pool: "JobWorkerPool | TemplateJobRunner | None" = None
+        self.metrics = JobMetrics()
+
+    def configure_pool(
+        self,
+        size: int,
+        preload: list[str] | None = None,
+        template_dir: str | None = None,
+    ) -> None:
+        """Run up to ``size`` jobs at once in worker processes once the server starts.
+
+        With ``template_dir`` every job runs in a fork of a template process
+        that imported that project. Otherwise a size of 1 runs jobs one at a
+        time in the server process.
+        """
+        self.pool_size = size
+        self.preload = preload or []
+        self.template_dir = template_dir
 
     def init(self) -> None:
         """Must be called inside a running event loop at server startup."""
@@ -29,6 +80,30 @@ class _ServerState:
             return
         self.lock = asyncio.Lock()
         self.baseline_env = os.environ.copy()
+        if self.template_dir is not None:
+            from ._server_template import TemplateJobRunner
+
+            self.pool = TemplateJobRunner(
+                self.template_dir, self.pool_size, self.preload, self.metrics
+            )
+            self.pool.start()
+        elif self.pool_size > 1:
+            from ._server_pool import JobWorkerPool
+
+            self.pool = JobWorkerPool(self.pool_size, self.preload, self.metrics)
+            self.pool.start()
+
+    async def close(self) -> None:
+        """Stop the worker pool, if any."""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Job counters for the metrics endpoint."""
+        if self.pool is not None:
+            return self.pool.snapshot()
+        return {"workers": 1, "alive": 1, **self.metrics.as_dict()}
 
 
 _state = _ServerState()
@@ -45,64 +120,114 @@ def parse_args(args: str | list[str] | None) -> list[str]:
     return []
 
 
+def _command_name(cmd: Any) -> str | None:
+    for name, command in COMMANDS.items():
+        if command is cmd:
+            return name
+    return None
+
+
+def execute_job(
+    cmd: Any,
+    args: list[str],
+    env_vars: dict[str, str],
+    working_dir: str | None,
+    baseline_env: dict[str, str],
+) -> dict[str, Any]:
+    """Run one command in this process with the job's env and cwd.
+
+    Blocks until the command finishes; the process env and cwd are restored
+    afterwards, so callers must not run two jobs in one process at once.
+    """
+    original_cwd = os.getcwd()
+    try:
+        # Start from server baseline + request env vars only, so nothing from
+        # a previous job leaks through.
+        os.environ.clear()
+        os.environ.update(baseline_env)
+        if isinstance(env_vars, dict):
+            os.environ.update(env_vars)
+
+        if working_dir and isinstance(working_dir, str):
+            try:
+                os.chdir(working_dir)
+            except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+                # Request-shaped error: the caller gave a bad working dir.
+                # HTTP surfaces this as 400; IPC just returns ExitCode/Error.
+                return {
+                    "ExitCode": 1,
+                    "Error": f"Cannot change to working directory: {e}",
+                    "Result": None,
+                    "Unexpected": False,
+                    "ClientError": True,
+                }
+
+        result_value = cmd.main(args, standalone_mode=False)
+        return {
+            "ExitCode": 0,
+            "Error": None,
+            "Result": result_value,
+            "Unexpected": False,
+        }
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+        return {
+            "ExitCode": exit_code,
+            "Error": None if exit_code == 0 else f"Exit code: {exit_code}",
+            "Result": None,
+            "Unexpected": False,
+        }
+    except Exception as e:  # report any job failure as a result, not a fault
+        return {"ExitCode": 1, "Error": str(e), "Result": None, "Unexpected": True}
+    finally:
+        # Restore to server baseline.
+        try:
+            os.chdir(original_cwd)
+        except OSError:
+            pass
+        os.environ.clear()
+        os.environ.update(baseline_env)
+
+
 async def _run_command_isolated(
     cmd: Any,
     args: list[str],
     env_vars: dict[str, str],
     working_dir: str | None,
+    job_key: str | None = None,
 ) -> dict[str, Any]:
-    """Run one command with per-job env/cwd isolation (the shared job core)."""
+    """Run one command with per-job env/cwd isolation (the shared job core).
+
+    With a worker pool the job runs in the next free worker process;
+    otherwise jobs run one at a time in the server process.
+    """
     if _state.lock is None or _state.baseline_env is None:
         raise RuntimeError("Server state not initialized")
 
-    async with _state.lock:
-        original_cwd = os.getcwd()
-        try:
-            # Start from server baseline + request env vars only, so nothing from
-            # a previous job leaks through.
-            os.environ.clear()
-            os.environ.update(_state.baseline_env)
-            if isinstance(env_vars, dict):
-                os.environ.update(env_vars)
-
-            if working_dir and isinstance(working_dir, str):
-                try:
-                    os.chdir(working_dir)
-                except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
-                    # Request-shaped error: the caller gave a bad working dir.
-                    # HTTP surfaces this as 400; IPC just returns ExitCode/Error.
-                    return {
-                        "ExitCode": 1,
-                        "Error": f"Cannot change to working directory: {e}",
-                        "Result": None,
-                        "Unexpected": False,
-                        "ClientError": True,
-                    }
-
-            result_value = await asyncio.to_thread(
-                cmd.main, args, standalone_mode=False
-            )
-            return {
-                "ExitCode": 0,
-                "Error": None,
-                "Result": result_value,
-                "Unexpected": False,
-            }
-        except SystemExit as e:
-            exit_code = e.code if isinstance(e.code, int) else 1
-            return {
-                "ExitCode": exit_code,
-                "Error": None if exit_code == 0 else f"Exit code: {exit_code}",
-                "Result": None,
-                "Unexpected": False,
-            }
-        except Exception as e:  # report any job failure as a result, not a fault
-            return {"ExitCode": 1, "Error": str(e), "Result": None, "Unexpected": True}
-        finally:
-            # Restore to server baseline.
-            try:
-                os.chdir(original_cwd)
-            except OSError:
-                pass
-            os.environ.clear()
-            os.environ.update(_state.baseline_env)
+    command_name = _command_name(cmd)
+    if _state.pool is not None and command_name is not None:
+        return await _state.pool.run(command_name, args, env_vars, working_dir, job_key)
+
+    metrics = _state.metrics
+    metrics.queued += 1
+    try:
+        await _state.lock.acquire()
+    finally:
+        metrics.queued -= 1
+    metrics.running += 1
+    try:
+        result = await asyncio.to_thread(
+            execute_job, cmd, args, env_vars, working_dir, _state.baseline_env
+        )
+    finally:
+        metrics.running -= 1
+        _state.lock.release()
+    metrics.record(result)
+    return result
+
+
+def stop_job(job_key: str, force: bool) -> bool:
+    """Stop a running job; only jobs run by a worker pool can be stopped."""
+    if _state.pool is None:
+        return False
+    return _state.pool.stop(job_key, force)
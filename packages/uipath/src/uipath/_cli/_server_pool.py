@@ -0,0 +1,274 @@
+"""Pool of warm worker processes that run server jobs concurrently.
+
+Every job mutates ``os.environ`` and the cwd, so one process can only run one
+job at a time. The pool keeps ``size`` worker processes, each running one job
+at a time with its own env and cwd. Workers are forked from a forkserver that
+already imported the server's preloaded modules, so a new or restarted worker
+starts warm. On Windows, where there is no forkserver, each spawned worker
+imports them itself.
+
+Jobs wait in a queue for a free worker. A job can be stopped by its job key:
+the worker gets SIGINT and is killed if the job has not stopped within
+``stop_timeout`` seconds. A forced stop (and any stop on Windows) kills the
+worker right away. A killed worker is replaced by a fresh one.
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from ._server_core import JobMetrics
+
+logger = logging.getLogger(__name__)
+
+# Modules every worker needs, on top of the server's preloaded modules.
+_WORKER_MODULES = ["uipath._cli._server_core"]
+
+_STOPPED_RESULT: dict[str, Any] = {
+    "ExitCode": 1,
+    "Error": "Job was stopped",
+    "Result": None,
+    "Unexpected": False,
+    "Stopped": True,
+}
+
+
+def _import_modules(module_names: list[str]) -> None:
+    for module_name in module_names:
+        if module_name in sys.modules:
+            continue
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.debug(f"Worker could not preload {module_name}: {e}")
+
+
+def _process_context(preload: list[str]) -> Any:
+    """Context that starts warm server processes: forkserver, or spawn on Windows."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([*preload, *_WORKER_MODULES])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _worker_main(conn: Connection, preload: list[str]) -> None:
+    """Worker process loop: run one job per request until the pipe closes."""
+    _import_modules([*preload, *_WORKER_MODULES])
+
+    from uipath._cli import _ensure_runtime_initialized
+
+    from ._server_core import COMMANDS, execute_job
+
+    _ensure_runtime_initialized()
+    baseline_env = os.environ.copy()
+    # SIGINT means "stop the current job"; it is ignored between jobs.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        command_name, args, env_vars, working_dir = request
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            result = execute_job(
+                COMMANDS[command_name], args, env_vars, working_dir, baseline_env
+            )
+        except KeyboardInterrupt:
+            result = dict(_STOPPED_RESULT)
+        finally:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        try:
+            conn.send(result)
+        except Exception:
+            # The command's return value may not be picklable.
+            conn.send({**result, "Result": None})
+
+
+@dataclass
+class _Worker:
+    process: BaseProcess
+    conn: Connection
+    job_key: str | None = None
+    stopping: bool = False
+
+
+class JobWorkerPool:
+    """Runs jobs in a fixed number of warm worker processes."""
+
+    def __init__(
+        self,
+        size: int,
+        preload: list[str] | None = None,
+        metrics: JobMetrics | None = None,
+        stop_timeout: float = 10.0,
+    ):
+        """Prepare a pool of ``size`` workers; :meth:`start` launches them."""
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.stop_timeout = stop_timeout
+        self.preload = preload or []
+        self.metrics = metrics or JobMetrics()
+        self._context = _process_context(self.preload)
+        self._idle: asyncio.Queue[_Worker] = asyncio.Queue()
+        self._workers: list[_Worker] = []
+        self._running: dict[str, _Worker] = {}
+        # One thread per worker waits on its pipe, so waits never queue up
+        # behind the default executor's limit.
+        self._executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="uipath-job-worker"
+        )
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.preload),
+            name="uipath-job-worker",
+            # Not a daemon: jobs may start processes of their own, as
+            # `uipath eval --processes` does. close() shuts workers down.
+            daemon=False,
+        )
+        process.start()
+        # Only the worker holds its end now, so a dead worker reads as EOF.
+        child_conn.close()
+        return _Worker(process=process, conn=parent_conn)
+
+    def start(self) -> None:
+        """Launch the worker processes."""
+        for _ in range(self.size - len(self._workers)):
+            worker = self._spawn()
+            self._workers.append(worker)
+            self._idle.put_nowait(worker)
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.conn.close()
+        if worker.process.is_alive():
+            worker.process.kill()
+        # Reap the old process in a thread rather than blocking the event loop;
+        # nothing has to wait for it, since the replacement is independent.
+        asyncio.get_running_loop().run_in_executor(None, worker.process.join, 5)
+        replacement = self._spawn()
+        self._workers[self._workers.index(worker)] = replacement
+        self.metrics.worker_restarts += 1
+        return replacement
+
+    async def run(
+        self,
+        command_name: str,
+        args: list[str],
+        env_vars: dict[str, str],
+        working_dir: str | None,
+        job_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Run a job in the next free worker and return its result."""
+        job_key = job_key or str(uuid.uuid4())
+        self.metrics.queued += 1
+        try:
+            worker = await self._idle.get()
+        finally:
+            self.metrics.queued -= 1
+
+        self.metrics.running += 1
+        worker.job_key = job_key
+        self._running[job_key] = worker
+        loop = asyncio.get_running_loop()
+        try:
+            worker.conn.send((command_name, args, env_vars, working_dir))
+            result = await loop.run_in_executor(self._executor, worker.conn.recv)
+            if worker.stopping and result["ExitCode"] != 0:
+                # The command may handle the interrupt and exit on its own.
+                result = {**result, "Stopped": True}
+        except (EOFError, OSError):
+            exit_code = worker.process.exitcode
+            if worker.stopping:
+                result = dict(_STOPPED_RESULT)
+            else:
+                result = {
+                    "ExitCode": 1,
+                    "Error": f"Worker process exited unexpectedly (code {exit_code})",
+                    "Result": None,
+                    "Unexpected": True,
+                }
+            worker = self._replace(worker)
+        except asyncio.CancelledError:
+            # Nobody waits for the result any more; the worker may still be
+            # busy, so it is replaced rather than handed to the next job.
+            worker = self._replace(worker)
+            raise
+        finally:
+            self.metrics.running -= 1
+            self._running.pop(job_key, None)
+            worker.job_key = None
+            worker.stopping = False
+            self._idle.put_nowait(worker)
+
+        self.metrics.record(result)
+        return result
+
+    def stop(self, job_key: str, force: bool = False) -> bool:
+        """Stop the job running under ``job_key``; False if no such job runs.
+
+        Must be called from the event loop the pool runs jobs on.
+        """
+        worker = self._running.get(job_key)
+        if worker is None:
+            return False
+        worker.stopping = True
+        if force or sys.platform == "win32" or worker.process.pid is None:
+            worker.process.kill()
+            return True
+
+        os.kill(worker.process.pid, signal.SIGINT)
+        # Blocking code in the job may not notice the interrupt.
+        asyncio.get_running_loop().call_later(
+            self.stop_timeout, self._kill_if_running, worker, job_key
+        )
+        return True
+
+    def _kill_if_running(self, worker: _Worker, job_key: str) -> None:
+        if worker.job_key == job_key and worker.process.is_alive():
+            logger.warning(f"Job {job_key} did not stop in time; killing its worker")
+            worker.process.kill()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Pool size, live workers and job counters."""
+        return {
+            "workers": self.size,
+            "alive": sum(worker.process.is_alive() for worker in self._workers),
+            **self.metrics.as_dict(),
+        }
+
+    async def close(self) -> None:
+        """Shut the workers down, killing any that are still running a job."""
+        for worker in self._workers:
+            if worker.job_key is not None:
+                worker.process.kill()
+                continue
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            await asyncio.to_thread(worker.process.join, 5)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,443 @@
+"""Template process that runs every server job in a fork of a warm project.
+
+Even with warm workers, each job imports the user's project, reads its
+configuration and builds its runtime factory again. In template mode the
+server starts one template process that does all of that once for a given
+project directory and then forks a copy-on-write child per job. A job then
+starts with the project's code and dependencies already imported.
+
+Each child sends its result over a pipe of its own, and the template passes
+it on to the server; the template also reaps the children and reports any
+that died without a result. A job killed while sending its result therefore
+cannot break the template's pipe to the server. Unix only, since it relies
+on ``os.fork()``.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from typing import Any
+
+from ._server_core import JobMetrics
+from ._server_pool import (
+    _STOPPED_RESULT,
+    _WORKER_MODULES,
+    _import_modules,
+    _process_context,
+)
+
+logger = logging.getLogger(__name__)
+
+# How often the template checks for exited children while idle.
+_REAP_INTERVAL_SECONDS = 0.1
+
+
+def _warm_up_project(project_dir: str) -> None:
+    """Import the project the way a job would: factory, entrypoints and schemas."""
+    from uipath.runtime import UiPathRuntimeContext, UiPathRuntimeFactoryRegistry
+
+    original_cwd = os.getcwd()
+    os.chdir(project_dir)
+
+    async def warm_up() -> None:
+        factory = UiPathRuntimeFactoryRegistry.get(
+            context=UiPathRuntimeContext.with_defaults(command="run")
+        )
+        try:
+            for entrypoint in factory.discover_entrypoints():
+                runtime = await factory.new_runtime(entrypoint, "template-warm-up")
+                try:
+                    await runtime.get_schema()
+                finally:
+                    await runtime.dispose()
+        finally:
+            await factory.dispose()
+
+    try:
+        asyncio.run(warm_up())
+    finally:
+        os.chdir(original_cwd)
+
+
+def _run_forked_job(
+    results: Connection,
+    command_name: str,
+    args: list[str],
+    env_vars: dict[str, str],
+    working_dir: str | None,
+    baseline_env: dict[str, str],
+) -> None:
+    """Body of a forked child: run the job, send its result and exit."""
+    from ._server_core import COMMANDS, execute_job
+
+    exit_code = 0
+    try:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            result = execute_job(
+                COMMANDS[command_name], args, env_vars, working_dir, baseline_env
+            )
+        except KeyboardInterrupt:
+            result = dict(_STOPPED_RESULT)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        try:
+            results.send(result)
+        except Exception:
+            # The command's return value may not be picklable.
+            results.send({**result, "Result": None})
+    except BaseException:
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _describe_status(status: int) -> str:
+    if os.WIFSIGNALED(status):
+        return f"killed by signal {os.WTERMSIG(status)}"
+    return f"exited with code {os.waitstatus_to_exitcode(status)}"
+
+
+@dataclass
+class _Child:
+    job_id: str
+    # Read end of the pipe the child sends its result over.
+    results: Connection | None
+    reported: bool = False
+
+
+def _forward_result(conn: Connection, child: _Child) -> None:
+    """Pass the child's result on to the server, if it sent a whole one."""
+    assert child.results is not None
+    try:
+        result = child.results.recv()
+    except (EOFError, OSError):
+        # The child died before or while sending its result.
+        pass
+    else:
+        conn.send(("result", child.job_id, result))
+        child.reported = True
+    child.results.close()
+    child.results = None
+
+
+def _template_main(conn: Connection, preload: list[str], project_dir: str) -> None:
+    """Template process loop: fork a child per job until the pipe closes."""
+    _import_modules([*preload, *_WORKER_MODULES])
+
+    from uipath._cli import _ensure_runtime_initialized
+
+    _ensure_runtime_initialized()
+    start = time.perf_counter()
+    try:
+        _warm_up_project(project_dir)
+    except Exception as e:
+        # Jobs still run, they just import whatever the warm-up did not.
+        logger.warning(f"Could not import project {project_dir}: {e}")
+    conn.send(("ready", time.perf_counter() - start))
+
+    baseline_env = os.environ.copy()
+    # SIGINT is for the job children, never for the template.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    children: dict[int, _Child] = {}
+    # Each child gets a pipe of its own, so a child killed halfway through
+    # sending its result cannot leave a partial message on the server's pipe.
+    pending: dict[Connection, _Child] = {}
+
+    while True:
+        ready = wait([conn, *pending], _REAP_INTERVAL_SECONDS)
+        for results in [results for results in pending if results in ready]:
+            _forward_result(conn, pending.pop(results))
+
+        if conn in ready:
+            try:
+                request = conn.recv()
+            except EOFError:
+                request = None
+            if request is None:
+                break
+
+            job_id, command_name, args, env_vars, working_dir = request
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            pid = os.fork()
+            if pid == 0:
+                conn.close()
+                reader.close()
+                for other in pending:
+                    other.close()
+                _run_forked_job(
+                    writer, command_name, args, env_vars, working_dir, baseline_env
+                )
+            writer.close()
+            children[pid] = pending[reader] = _Child(job_id=job_id, results=reader)
+            conn.send(("started", job_id, pid))
+
+        while children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            child = children.pop(pid)
+            if child.results is not None:
+                pending.pop(child.results)
+                # Whatever the child sent is in the pipe by now, unless a
+                # process it forked still holds the write end.
+                if child.results.poll():
+                    _forward_result(conn, child)
+                else:
+                    child.results.close()
+            if not child.reported:
+                conn.send(("exited", child.job_id, _describe_status(status)))
+
+    for pid in children:
+        os.kill(pid, signal.SIGKILL)
+
+
+@dataclass
+class _Job:
+    key: str
+    future: "asyncio.Future[dict[str, Any]]"
+    pid: int | None = None
+    stopping: bool = False
+    timers: list[asyncio.TimerHandle] = field(default_factory=list)
+
+
+class TemplateJobRunner:
+    """Runs each job in a fork of a template process that imported the project.
+
+    At most ``max_jobs`` jobs run at once; the rest wait for a free slot.
+    """
+
+    def __init__(
+        self,
+        project_dir: str,
+        max_jobs: int = 1,
+        preload: list[str] | None = None,
+        metrics: JobMetrics | None = None,
+        stop_timeout: float = 10.0,
+    ):
+        """Prepare a runner for ``project_dir``; :meth:`start` launches the template."""
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be >= 1")
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Template mode requires os.fork()")
+        self.project_dir = os.path.abspath(project_dir)
+        self.max_jobs = max_jobs
+        self.preload = preload or []
+        self.metrics = metrics or JobMetrics()
+        self.stop_timeout = stop_timeout
+        self.warm_up_seconds: float | None = None
+        self._context = _process_context(self.preload)
+        self._slots = asyncio.Semaphore(max_jobs)
+        self._jobs: dict[str, _Job] = {}
+        self._ready = asyncio.Event()
+        self._closing = False
+        self._process: Any = None
+        self._conn: Connection | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def start(self) -> None:
+        """Launch the template process; must run inside the server's event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._ready.clear()
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=_template_main,
+            args=(child_conn, self.preload, self.project_dir),
+            name="uipath-job-template",
+            # Not a daemon: forked jobs inherit the flag and may start
+            # processes of their own. close() shuts the template down.
+            daemon=False,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        threading.Thread(
+            target=self._read_messages,
+            args=(parent_conn,),
+            name="uipath-job-template-reader",
+            daemon=True,
+        ).start()
+
+    def _read_messages(self, conn: Connection) -> None:
+        assert self._loop is not None
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            self._loop.call_soon_threadsafe(self._dispatch, message)
+        self._loop.call_soon_threadsafe(self._template_exited, conn)
+
+    def _dispatch(self, message: tuple[Any, ...]) -> None:
+        kind = message[0]
+        if kind == "ready":
+            self.warm_up_seconds = message[1]
+            self._ready.set()
+            return
+
+        job = self._jobs.get(message[1])
+        if job is None:
+            return
+        if kind == "started":
+            job.pid = message[2]
+        elif kind == "result":
+            result = message[2]
+            if job.stopping and result["ExitCode"] != 0:
+                # The command may handle the interrupt and exit on its own.
+                result = {**result, "Stopped": True}
+            self._finish(message[1], result)
+        elif kind == "exited":
+            self._finish(
+                message[1],
+                dict(_STOPPED_RESULT)
+                if job.stopping
+                else {
+                    "ExitCode": 1,
+                    "Error": f"Job process {message[2]}",
+                    "Result": None,
+                    "Unexpected": True,
+                },
+            )
+
+    def _finish(self, job_id: str, result: dict[str, Any]) -> None:
+        job = self._jobs.pop(job_id)
+        for timer in job.timers:
+            timer.cancel()
+        if not job.future.done():
+            job.future.set_result(result)
+
+    def _template_exited(self, conn: Connection) -> None:
+        if conn is not self._conn:
+            return
+        conn.close()
+        self._conn = None
+        for job_id in list(self._jobs):
+            self._finish(
+                job_id,
+                {
+                    "ExitCode": 1,
+                    "Error": "Template process exited unexpectedly",
+                    "Result": None,
+                    "Unexpected": True,
+                },
+            )
+        if not self._closing:
+            logger.warning("Template process exited; starting a new one")
+            self.metrics.worker_restarts += 1
+            self.start()
+
+    async def run(
+        self,
+        command_name: str,
+        args: list[str],
+        env_vars: dict[str, str],
+        working_dir: str | None,
+        job_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Run a job in a fork of the template and return its result."""
+        job_key = job_key or str(uuid.uuid4())
+        self.metrics.queued += 1
+        try:
+            await self._slots.acquire()
+            try:
+                await self._ready.wait()
+            except BaseException:
+                self._slots.release()
+                raise
+        finally:
+            self.metrics.queued -= 1
+
+        self.metrics.running += 1
+        job_id = str(uuid.uuid4())
+        job = _Job(key=job_key, future=asyncio.get_running_loop().create_future())
+        self._jobs[job_id] = job
+        try:
+            if self._conn is None:
+                raise OSError("Template process is not running")
+            self._conn.send((job_id, command_name, args, env_vars, working_dir))
+            result = await job.future
+        except OSError as e:
+            self._jobs.pop(job_id, None)
+            result = {
+                "ExitCode": 1,
+                "Error": f"Could not start job: {e}",
+                "Result": None,
+                "Unexpected": True,
+            }
+        except asyncio.CancelledError:
+            # Nobody waits for the result any more.
+            self._jobs.pop(job_id, None)
+            if job.pid is not None:
+                self._kill(job.pid)
+            raise
+        finally:
+            self.metrics.running -= 1
+            self._slots.release()
+
+        self.metrics.record(result)
+        return result
+
+    def _kill(self, pid: int, sig: int = signal.SIGKILL) -> None:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def stop(self, job_key: str, force: bool = False) -> bool:
+        """Stop the job running under ``job_key``; False if no such job runs.
+
+        The job gets SIGINT and is killed if it has not stopped within
+        ``stop_timeout`` seconds; a forced stop kills it right away.
+        """
+        job = next((job for job in self._jobs.values() if job.key == job_key), None)
+        if job is None or job.pid is None:
+            return False
+        job.stopping = True
+        if force:
+            self._kill(job.pid)
+            return True
+
+        self._kill(job.pid, signal.SIGINT)
+        # Blocking code in the job may not notice the interrupt.
+        job.timers.append(
+            asyncio.get_running_loop().call_later(
+                self.stop_timeout, self._kill, job.pid
+            )
+        )
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        """Job slots, template state and job counters."""
+        alive = self._process is not None and self._process.is_alive()
+        return {
+            "workers": self.max_jobs,
+            "alive": int(alive),
+            "template_warm_up_seconds": self.warm_up_seconds,
+            **self.metrics.as_dict(),
+        }
+
+    async def close(self) -> None:
+        """Shut the template down, killing any jobs still running."""
+        self._closing = True
+        for job in list(self._jobs.values()):
+            if job.pid is not None:
+                self._kill(job.pid)
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+        if self._process is not None:
+            await asyncio.to_thread(self._process.join, 5)
+            if self._process.is_alive():
+                self._process.kill()
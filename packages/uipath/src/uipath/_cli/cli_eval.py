@@ -11,6 +11,11 @@ import click
 
 from uipath._cli._errors import EntrypointDiscoveryException
 from uipath._cli._evals._console_progress_reporter import ConsoleProgressReporter
+from uipath._cli._evals._processes import (
+    evaluate_in_processes,
+    get_current_shard,
+    run_eval_shard,
+)
 from uipath._cli._evals._progress_reporter import StudioWebProgressReporter
 from uipath._cli._evals._telemetry import EvalTelemetrySubscriber
 from uipath._cli._utils._folders import get_personal_workspace_key_async
@@ -21,6 +26,7 @@ from uipath.core.events import EventBus
 from uipath.eval.helpers import EVAL_SETS_DIRECTORY_NAME, EvalHelpers, get_agent_model
 from uipath.eval.models.evaluation_set import EvaluationSet
 from uipath.eval.runtime import UiPathEvalContext, evaluate
+from uipath.eval.runtime._scheduling import DEFAULT_DURATION_HISTORY_FILE
 from uipath.platform.chat import set_llm_concurrency
 from uipath.platform.common import (
     ExecutionSourceContext,
@@ -211,6 +217,59 @@ class _EvalDiscoveryError(EntrypointDiscoveryException):
         return lines
 
 
+def _shard_cli_args(
+    entrypoint: str,
+    eval_set_path: str,
+    eval_ids: list[str],
+    *,
+    eval_set_run_id: str | None,
+    workers: int,
+    eval_timeout: float | None,
+    max_retries: int,
+    enable_mocker_cache: bool,
+    model_settings_id: str,
+    agent_memory_settings_id: str,
+    trace_file: str | None,
+    max_llm_concurrency: int,
+    input_overrides: dict[str, Any],
+    verbose: bool,
+    report_coverage: bool = False,
+) -> list[str]:
+    """Arguments of the `uipath eval` run a `--processes` worker executes."""
+    args = [
+        entrypoint,
+        eval_set_path,
+        "--eval-ids",
+        repr(eval_ids),
+        "--no-report",
+        "--workers",
+        str(workers),
+        "--max-retries",
+        str(max_retries),
+        "--model-settings-id",
+        model_settings_id,
+        "--agent-memory-settings-id",
+        agent_memory_settings_id,
+        "--max-llm-concurrency",
+        str(max_llm_concurrency),
+        "--input-overrides",
+        repr(input_overrides),
+    ]
+    if eval_set_run_id:
+        args += ["--eval-set-run-id", eval_set_run_id]
+    if eval_timeout is not None:
+        args += ["--eval-timeout", str(eval_timeout)]
+    if enable_mocker_cache:
+        args.append("--enable-mocker-cache")
+    if trace_file:
+        args += ["--trace-file", trace_file]
+    if verbose:
+        args.append("--verbose")
+    if report_coverage:
+        args.append("--report-coverage")
+    return args
+
+
 def _discover_eval_sets() -> list[Path]:
     """Discover available eval set files."""
     eval_sets_dir = Path(EVAL_SETS_DIRECTORY_NAME)
@@ -241,12 +300,36 @@ def _discover_eval_sets() -> list[Path]:
     default=1,
     help="Number of parallel workers for running evaluations (default: 1)",
 )
+@click.option(
+    "--processes",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes the evaluation set is sharded across, each running --workers evaluations in parallel (default: 1)",
+)
+@click.option(
+    "--eval-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Timeout in seconds for the agent run of each evaluation; runs that exceed it are cancelled and marked as failed",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of times an agent run that fails with a transient error (network, throttling, 5xx) is retried (default: 0)",
+)
 @click.option(
     "--output-file",
     required=False,
     type=click.Path(exists=False),
     help="File path where the output will be written",
 )
+@click.option(
+    "--results-file",
+    required=False,
+    type=click.Path(exists=False),
+    help="File path where each evaluation result is written in JSONL format as it completes. The results are then left out of the output.",
+)
 @click.option(
     "--enable-mocker-cache",
     is_flag=True,
@@ -308,7 +391,11 @@ def eval(
     eval_set_run_id: str | None,
     no_report: bool,
     workers: int,
+    processes: int,
+    eval_timeout: float | None,
+    max_retries: int,
     output_file: str | None,
+    results_file: str | None,
     enable_mocker_cache: bool,
     report_coverage: bool,
     model_settings_id: str,
@@ -327,6 +414,10 @@ def eval(
         eval_ids: Optional list of evaluation IDs
         eval_set_run_id: Custom evaluation set run ID (optional, will generate UUID if not specified)
         workers: Number of parallel workers for running evaluations
+        processes: Number of worker processes the evaluation set is sharded across
+        eval_timeout: Timeout in seconds for the agent run of each evaluation
+        max_retries: Number of retries of agent runs that fail with a transient error
+        results_file: File path where evaluation results are streamed in JSONL format
         no_report: Do not report the evaluation results
         enable_mocker_cache: Enable caching for LLM mocker responses
         report_coverage: Report evaluation coverage
@@ -359,6 +450,13 @@ def eval(
     if result.should_continue:
         eval_context = UiPathEvalContext()
         eval_context.workers = workers
+        eval_context.results_file = results_file
+        eval_context.item_timeout = eval_timeout
+        eval_context.max_retries = max_retries
+        # Slowest items are started first, based on earlier runs.
+        eval_context.duration_history_file = str(
+            Path.cwd() / DEFAULT_DURATION_HISTORY_FILE
+        )
         eval_context.eval_set_run_id = eval_set_run_id
         eval_context.enable_mocker_cache = enable_mocker_cache
         eval_context.report_coverage = report_coverage
@@ -370,17 +468,23 @@ def eval(
 
             async def execute_eval():
                 event_bus = EventBus()
+                # Set when this process is a worker of a `--processes` run; the
+                # parent process reports the events forwarded by its workers.
+                shard = get_current_shard()
 
                 # Only create studio web exporter when reporting to Studio Web
                 if should_register_progress_reporter:
                     progress_reporter = StudioWebProgressReporter()
                     await progress_reporter.subscribe_to_eval_runtime_events(event_bus)
 
-                console_reporter = ConsoleProgressReporter()
-                await console_reporter.subscribe_to_eval_runtime_events(event_bus)
+                if shard is None:
+                    console_reporter = ConsoleProgressReporter()
+                    await console_reporter.subscribe_to_eval_runtime_events(event_bus)
 
-                telemetry_subscriber = EvalTelemetrySubscriber()
-                await telemetry_subscriber.subscribe_to_eval_runtime_events(event_bus)
+                    telemetry_subscriber = EvalTelemetrySubscriber()
+                    await telemetry_subscriber.subscribe_to_eval_runtime_events(
+                        event_bus
+                    )
 
                 trace_manager = create_trace_manager()
 
@@ -390,6 +494,9 @@ def eval(
                     command="eval",
                     resume=resume,
                 )
+                if shard is not None:
+                    # The job's result file belongs to the parent process.
+                    ctx.job_id = None
                 with ExecutionSourceContext(ctx.execution_source), ctx:
                     # Set job_id in eval context for single runtime runs
                     eval_context.job_id = ctx.job_id
@@ -436,9 +543,15 @@ def eval(
                             else None
                         )
 
-                        if (
-                            ctx.job_id or should_register_progress_reporter
-                        ) and UiPathConfig.is_tracing_enabled:
+                        live_tracking = (
+                            bool(
+                                ctx.job_id
+                                or should_register_progress_reporter
+                                or (shard is not None and shard.live_tracking)
+                            )
+                            and UiPathConfig.is_tracing_enabled
+                        )
+                        if live_tracking:
                             # Live tracking for Orchestrator or Studio Web
                             # Uses UIPATH_TRACE_ID from environment for trace correlation
                             trace_manager.add_span_processor(
@@ -519,12 +632,55 @@ def eval(
                             finally:
                                 await runtime.dispose()
 
-                            ctx.result = await evaluate(
-                                runtime_factory,
-                                trace_manager,
-                                eval_context,
-                                event_bus,
-                            )
+                            if shard is not None:
+                                ctx.result = await run_eval_shard(
+                                    runtime_factory,
+                                    trace_manager,
+                                    eval_context,
+                                    shard,
+                                )
+                            elif processes > 1:
+                                worker_entrypoint = eval_context.entrypoint or ""
+
+                                def shard_args(
+                                    shard_eval_ids: list[str],
+                                    shard_trace_file: str | None,
+                                ) -> list[str]:
+                                    return _shard_cli_args(
+                                        worker_entrypoint,
+                                        str(resolved_eval_set_path),
+                                        shard_eval_ids,
+                                        eval_set_run_id=eval_set_run_id,
+                                        workers=workers,
+                                        eval_timeout=eval_timeout,
+                                        max_retries=max_retries,
+                                        enable_mocker_cache=enable_mocker_cache,
+                                        model_settings_id=model_settings_id,
+                                        agent_memory_settings_id=agent_memory_settings_id,
+                                        trace_file=shard_trace_file,
+                                        max_llm_concurrency=max_llm_concurrency,
+                                        input_overrides=input_overrides,
+                                        verbose=verbose,
+                                        report_coverage=report_coverage,
+                                    )
+
+                                ctx.result = await evaluate_in_processes(
+                                    runtime_factory,
+                                    trace_manager,
+                                    eval_context,
+                                    event_bus,
+                                    processes=processes,
+                                    shard_args=shard_args,
+                                    live_tracking=live_tracking,
+                                    trace_file=trace_file,
+                                )
+                            else:
+                                ctx.result = await evaluate(
+                                    runtime_factory,
+                                    trace_manager,
+                                    eval_context,
+                                    event_bus,
+                                )
                     finally:
                         await runtime_factory.dispose()
 
@@ -17,6 +17,7 @@ from ._server_core import (
     _run_command_isolated,
     _state,
     parse_args,
+    stop_job,
 )
 from ._telemetry import track_command
 from ._utils._console import ConsoleLogger
@@ -62,12 +63,18 @@ DEFAULT_PRELOAD_MODULES = [
 ]
 
 
-def preload_modules() -> None:
-    """Pre-load modules registered by all uipath packages."""
+def preload_modules() -> list[str]:
+    """Pre-load modules registered by all uipath packages.
+
+    Returns:
+        The names of the modules that are loaded, for worker processes to
+        load as well.
+    """
     console.info("Pre-loading modules...")
     start = time.perf_counter()
 
     modules_to_load: set[str] = set(DEFAULT_PRELOAD_MODULES)
+    loaded: list[str] = []
 
     for ep in entry_points(group="uipath.preload"):
         try:
@@ -76,20 +83,23 @@ def preload_modules() -> None:
         except Exception as e:
             console.warning(f"Failed to load entry point {ep.name}: {e}")
 
-    for module_name in modules_to_load:
+    for module_name in sorted(modules_to_load):
         if module_name in sys.modules:
+            loaded.append(module_name)
             continue
         try:
             # find_spec raises ModuleNotFoundError when a parent package is missing
             if find_spec(module_name) is None:
                 continue
             importlib.import_module(module_name)
+            loaded.append(module_name)
             console.success(f"Pre-loaded module: {module_name}")
         except ImportError as e:
             console.warning(f"Failed to load {module_name}: {e}")
 
     elapsed = time.perf_counter() - start
     console.success(f"Modules pre-loaded in {elapsed:.2f}s")
+    return loaded
 
 
 def generate_socket_path() -> str:
@@ -136,9 +146,34 @@ async def send_ack(ack_socket_path: str, server_socket_path: str) -> None:
 
 async def handle_health(request: web.Request) -> web.Response:
     """Handle GET /health endpoint."""
+    if _state.pool is not None and _state.snapshot()["alive"] == 0:
+        return web.Response(text="No live workers", status=503)
     return web.Response(text="OK", status=200)
 
 
+async def handle_metrics(request: web.Request) -> web.Response:
+    """Handle GET /metrics — worker count and job counters."""
+    return web.json_response(_state.snapshot())
+
+
+async def handle_stop(request: web.Request) -> web.Response:
+    """Handle POST /jobs/{job_key}/stop — stops a job running in a worker pool."""
+    job_key = request.match_info["job_key"]
+    force = False
+    if request.can_read_body:
+        try:
+            message: dict[str, Any] = await request.json()
+        except json.JSONDecodeError:
+            return web.json_response(
+                {"success": False, "error": "Invalid JSON"},
+                status=400,
+            )
+        force = bool(get_field(message, "forceStop", "ForceStop"))
+
+    stopped = stop_job(job_key, force)
+    return web.json_response({"success": stopped, "job_key": job_key})
+
+
 async def handle_start(request: web.Request) -> web.Response:
     """Handle POST /jobs/{job_key}/start — runs a job via the shared core."""
     job_key = request.match_info.get("job_key")
@@ -186,7 +221,9 @@ async def handle_start(request: web.Request) -> web.Response:
 
     console.info(f"Starting job {job_key}: {command_name} {args}")
 
-    result = await _run_command_isolated(cmd, args, env_vars, working_dir)
+    result = await _run_command_isolated(
+        cmd, args, env_vars, working_dir, job_key=job_key
+    )
 
     if result["Unexpected"]:
         return web.json_response(
@@ -241,7 +278,9 @@ def create_app() -> web.Application:
     """Create the aiohttp application."""
     app = web.Application(middlewares=[host_validation_middleware])
     app.router.add_get("/health", handle_health)
+    app.router.add_get("/metrics", handle_metrics)
     app.router.add_post("/jobs/{job_key}/start", handle_start)
+    app.router.add_post("/jobs/{job_key}/stop", handle_stop)
     return app
 
 
@@ -338,6 +377,21 @@ async def start_tcp_server(host: str, port: int) -> None:
     is_flag=True,
     help="Force TCP mode even on Unix systems.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of jobs run at once, each in its own warm worker process. "
+    "With 1 (the default) jobs run one at a time in the server process.",
+)
+@click.option(
+    "--template",
+    "template_dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Project directory to import once in a template process; each job "
+    "then runs in a fork of it (not available on Windows).",
+)
 @track_command("server")
 def server(
     client_socket: str | None,
@@ -345,9 +399,13 @@ def server(
     ipc_pipe: str | None,
     port: int | None,
     tcp: bool,
+    workers: int,
+    template_dir: str | None,
 ) -> None:
     """Serve run/debug/eval over HTTP, plus uipath-ipc when --ipc-pipe is given."""
-    preload_modules()
+    if template_dir and not hasattr(os, "fork"):
+        raise click.UsageError("--template is not available on this platform.")
+    _state.configure_pool(workers, preload_modules(), template_dir)
     _run_server(client_socket, server_socket, ipc_pipe, port, tcp)
 
 
@@ -373,7 +431,10 @@ async def _serve(
     if ipc_pipe:
         tasks.append(start_ipc_server(ipc_pipe))
 
-    await asyncio.gather(*tasks)
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        await _state.close()
 
 
 def _run_server(
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
-from ._server_core import COMMANDS, _run_command_isolated, _state, parse_args
+from ._server_core import (
+    COMMANDS,
+    _run_command_isolated,
+    _state,
+    parse_args,
+    stop_job,
+)
 from ._utils._console import ConsoleLogger
 
 console = ConsoleLogger()
@@ -64,20 +70,27 @@ class PythonRuntimeService(IPythonRuntimeServer):
 
         args = parse_args(request.Args)
 
-        console.info(
-            f"Running job {_run_id(request.JobKey, request.ResumeVersion)}: {command_name} {args}"
-        )
+        run_id = _run_id(request.JobKey, request.ResumeVersion)
+        console.info(f"Running job {run_id}: {command_name} {args}")
 
         result = await _run_command_isolated(
-            cmd, args, request.EnvironmentVariables, request.WorkingDirectory
+            cmd,
+            args,
+            request.EnvironmentVariables,
+            request.WorkingDirectory,
+            job_key=run_id,
         )
         # IPC contract (RunJobResult) carries only ExitCode + Error.
         return RunJobResult(ExitCode=result["ExitCode"], Error=result["Error"])
 
     async def StopJob(self, request: StopJobRequest) -> bool:
+        run_id = _run_id(request.JobKey, request.ResumeVersion)
+        # Only jobs running in a worker pool (`uipath server --workers N`) can
+        # be stopped; the acknowledgement is returned either way.
+        stopped = stop_job(run_id, request.ForceStop)
         console.info(
-            f"StopJob requested for {_run_id(request.JobKey, request.ResumeVersion)} "
-            f"(force={request.ForceStop}) (no-op)"
+            f"StopJob requested for {run_id} (force={request.ForceStop})"
+            f"{'' if stopped else ' (no-op)'}"
         )
         return True
 
@@ -1,4 +1,4 @@
-from uipath.platform.common import resource_override
+from typing import TYPE_CHECKING
 
 from ._endpoint import Endpoint
 from ._logs import setup_logging
@@ -8,6 +8,9 @@ from ._url import UiPathUrl
 from ._user_agent import header_user_agent, user_agent_value
 from .validation import validate_pagination_params
 
+if TYPE_CHECKING:
+    from uipath.platform.common import resource_override
+
 __all__ = [
     "Endpoint",
     "setup_logging",
@@ -19,3 +22,17 @@ __all__ = [
     "UiPathUrl",
     "validate_pagination_params",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve ``resource_override`` on demand.
+
+    It lives in ``uipath.platform.common``, which pulls in the service layer;
+    importing it eagerly would slow down every ``uipath`` command, since the
+    CLI imports this package for ``setup_logging``.
+    """
+    if name == "resource_override":
+        from uipath.platform.common import resource_override
+
+        return resource_override
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,97 @@
+"""String similarity shared by the JSON similarity evaluators."""
+
+import math
+
+
+def levenshtein_distance(
+    source_text: str, target_text: str, max_distance: int | None = None
+) -> int:
+    """Edit distance between two strings.
+
+    Uses the bit-parallel algorithm of Myers (as adapted by Hyyrö), which keeps
+    one column of the edit matrix as bit vectors: O(n) big-int operations of
+    m bits each instead of an m x n matrix of Python ints.
+
+    Args:
+        source_text: First string.
+        target_text: Second string.
+        max_distance: Stop as soon as the distance is known to exceed this
+            value and return ``max_distance + 1``.
+    """
+    # Common prefixes and suffixes never contribute to the distance.
+    start = 0
+    shortest = min(len(source_text), len(target_text))
+    while start < shortest and source_text[start] == target_text[start]:
+        start += 1
+    source_end, target_end = len(source_text), len(target_text)
+    while (
+        source_end > start
+        and target_end > start
+        and source_text[source_end - 1] == target_text[target_end - 1]
+    ):
+        source_end -= 1
+        target_end -= 1
+    source_text = source_text[start:source_end]
+    target_text = target_text[start:target_end]
+
+    if len(source_text) > len(target_text):
+        source_text, target_text = target_text, source_text
+    limit = max_distance + 1 if max_distance is not None else None
+    if limit is not None and len(target_text) - len(source_text) >= limit:
+        return limit
+    if not source_text:
+        return len(target_text)
+
+    # Bit i of peq[c] is set where source_text[i] == c.
+    peq: dict[str, int] = {}
+    for index, char in enumerate(source_text):
+        peq[char] = peq.get(char, 0) | (1 << index)
+
+    length = len(source_text)
+    mask = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    positive = mask  # +1 vertical deltas
+    negative = 0  # -1 vertical deltas
+    distance = length
+    remaining = len(target_text)
+    for char in target_text:
+        equal = peq.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | ~(horizontal | positive) & mask
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last_bit:
+            distance += 1
+        elif horizontal_negative & last_bit:
+            distance -= 1
+        horizontal_positive = ((horizontal_positive << 1) | 1) & mask
+        horizontal_negative = (horizontal_negative << 1) & mask
+        positive = horizontal_negative | ~(vertical | horizontal_positive) & mask
+        negative = horizontal_positive & vertical
+        remaining -= 1
+        # Each remaining column lowers the distance by at most one.
+        if limit is not None and distance - remaining >= limit:
+            return limit
+    return distance
+
+
+def string_similarity(
+    expected_string: str, actual_string: str, min_similarity: float | None = None
+) -> float:
+    """Similarity in [0, 1]: one minus the edit distance over the longer length.
+
+    With ``min_similarity``, the edit distance stops as soon as the similarity
+    is known to fall below it, and 0.0 is returned.
+    """
+    max_length = max(len(expected_string), len(actual_string))
+    if not max_length:
+        return 1.0
+    max_distance = (
+        math.floor((1.0 - min_similarity) * max_length)
+        if min_similarity is not None
+        else None
+    )
+    distance = levenshtein_distance(expected_string, actual_string, max_distance)
+    if max_distance is not None and distance > max_distance:
+        return 0.0
+    return max(0.0, min(1.0, 1.0 - distance / max_length))
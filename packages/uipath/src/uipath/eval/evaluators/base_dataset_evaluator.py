@@ -19,6 +19,34 @@ from ..models.models import EvaluationResult, EvaluationResultDto
 from ._aggregator_specs import AggregatorSpec
 
 
+class DatasetAccumulator(ABC):
+    """Incremental form of a dataset evaluator's :meth:`BaseDatasetEvaluator.evaluate`.
+
+    Receives the source evaluator's per-datapoint results as they are produced,
+    so the runtime can aggregate a run without keeping every result around.
+    """
+
+    @abstractmethod
+    def add(self, result: EvaluationResultDto) -> None:
+        """Fold one per-datapoint result into the accumulated state."""
+
+    @abstractmethod
+    def result(self) -> EvaluationResult:
+        """Dataset-level result over the results added so far."""
+
+
+class _BufferedDatasetAccumulator(DatasetAccumulator):
+    def __init__(self, evaluator: BaseDatasetEvaluator) -> None:
+        self.evaluator = evaluator
+        self.results: list[EvaluationResultDto] = []
+
+    def add(self, result: EvaluationResultDto) -> None:
+        self.results.append(result)
+
+    def result(self) -> EvaluationResult:
+        return self.evaluator.evaluate(self.results)
+
+
 class BaseDatasetEvaluator(ABC):
     """Abstract base for dataset-level evaluators.
 
@@ -43,3 +71,11 @@ class BaseDatasetEvaluator(ABC):
     @abstractmethod
     def evaluate(self, results: list[EvaluationResultDto]) -> EvaluationResult:
         """Reduce per-datapoint results into a single run-level EvaluationResult."""
+
+    def accumulator(self) -> DatasetAccumulator:
+        """Start an incremental evaluation equivalent to :meth:`evaluate`.
+
+        The default buffers results and calls :meth:`evaluate` at the end;
+        subclasses whose state is smaller than the results should override it.
+        """
+        return _BufferedDatasetAccumulator(self)
@@ -2,7 +2,8 @@
 
 import json
 from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar, Union, cast, get_args
+from collections import Counter
+from typing import Any, Callable, Generic, TypeVar, Union, cast, get_args
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic.alias_generators import to_camel
@@ -64,6 +65,99 @@ class BaseEvaluatorJustification(BaseModel):
         return None
 
 
+class ScoreReducer(ABC):
+    """Incremental counterpart of :meth:`GenericBaseEvaluator.reduce_scores`.
+
+    Receives per-datapoint results one at a time, so a run can be aggregated
+    without holding every result in memory.
+    """
+
+    @abstractmethod
+    def add(self, result: EvaluationResultDto) -> None:
+        """Fold one per-datapoint result into the running aggregate."""
+
+    @abstractmethod
+    def result(self) -> float:
+        """The aggregated score of the results added so far."""
+
+
+class MeanScoreReducer(ScoreReducer):
+    """Running average of the scores, the default reduction."""
+
+    def __init__(self) -> None:
+        """Start with no results."""
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, result: EvaluationResultDto) -> None:
+        """Add a result's score to the running sum."""
+        self.total += result.score
+        self.count += 1
+
+    def result(self) -> float:
+        """Average of the scores added so far, 0.0 if none."""
+        return self.total / self.count if self.count else 0.0
+
+
+class BufferedScoreReducer(ScoreReducer):
+    """Keeps every result and applies a list-based ``reduce_scores`` at the end.
+
+    Fallback for evaluators that override ``reduce_scores`` without providing
+    an incremental reducer.
+    """
+
+    def __init__(self, reduce: Callable[[list[EvaluationResultDto]], float]) -> None:
+        """Wrap a list-based reducer."""
+        self.reduce = reduce
+        self.results: list[EvaluationResultDto] = []
+
+    def add(self, result: EvaluationResultDto) -> None:
+        """Keep the result for the final reduction."""
+        self.results.append(result)
+
+    def result(self) -> float:
+        """Apply the wrapped reducer to every result added so far."""
+        return self.reduce(self.results)
+
+
+def count_label_pairs(
+    results: list[EvaluationResultDto],
+) -> Counter[tuple[str, str]]:
+    """Count the ``(expected, actual)`` justification pairs of the results.
+
+    Results without a parseable :class:`BaseEvaluatorJustification` are skipped.
+    """
+    pairs: Counter[tuple[str, str]] = Counter()
+    for result in results:
+        justification = BaseEvaluatorJustification.try_from(result.details)
+        if justification is not None:
+            pairs[(justification.expected, justification.actual)] += 1
+    return pairs
+
+
+class LabelPairScoreReducer(ScoreReducer):
+    """Counts ``(expected, actual)`` justification pairs for classification metrics.
+
+    Memory is bounded by the number of distinct label pairs rather than the
+    number of datapoints.
+    """
+
+    def __init__(self, score: Callable[[Counter[tuple[str, str]]], float]) -> None:
+        """Wrap a metric computed from label pair counts."""
+        self.score = score
+        self.pairs: Counter[tuple[str, str]] = Counter()
+
+    def add(self, result: EvaluationResultDto) -> None:
+        """Count the result's label pair, if its justification has one."""
+        justification = BaseEvaluatorJustification.try_from(result.details)
+        if justification is not None:
+            self.pairs[(justification.expected, justification.actual)] += 1
+
+    def result(self) -> float:
+        """Metric over the label pairs counted so far."""
+        return self.score(self.pairs)
+
+
 # Additional type variables for Config and Justification
 # Note: C must be BaseEvaluatorConfig[T] to ensure type consistency
 C = TypeVar("C", bound=BaseEvaluatorConfig[Any])
@@ -589,6 +683,17 @@ class GenericBaseEvaluator(BaseModel, Generic[T, C, J], ABC):
             return 0.0
         return sum(r.score for r in results) / len(results)
 
+    def score_reducer(self) -> ScoreReducer:
+        """Create an incremental reducer equivalent to :meth:`reduce_scores`.
+
+        Evaluators keeping the default average get a running mean. Evaluators
+        overriding ``reduce_scores`` fall back to buffering their results
+        unless they also override this method.
+        """
+        if type(self).reduce_scores is GenericBaseEvaluator.reduce_scores:
+            return MeanScoreReducer()
+        return BufferedScoreReducer(self.reduce_scores)
+
     @abstractmethod
     async def validate_and_evaluate_criteria(
         self, workload_execution: WorkloadExecution, evaluation_criteria: Any
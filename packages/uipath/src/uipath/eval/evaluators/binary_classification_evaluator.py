@@ -6,6 +6,7 @@ method reads predicted/expected from justification details to build
 TP/FP/FN/TN counts and compute precision, recall, or F-score.
 """
 
+from collections import Counter
 from typing import Literal
 
 from ..models import (
@@ -19,7 +20,13 @@ from ..models.models import (
     UiPathEvaluationError,
     UiPathEvaluationErrorCategory,
 )
-from .base_evaluator import BaseEvaluationCriteria, BaseEvaluatorJustification
+from .base_evaluator import (
+    BaseEvaluationCriteria,
+    BaseEvaluatorJustification,
+    LabelPairScoreReducer,
+    ScoreReducer,
+    count_label_pairs,
+)
 from .output_evaluator import (
     BaseOutputEvaluator,
     OutputEvaluatorConfig,
@@ -93,28 +100,23 @@ class BinaryClassificationEvaluator(
         """Compute precision, recall, or F-score from per-datapoint results."""
         if not results:
             return 0.0
+        return self._score_label_pairs(count_label_pairs(results))
+
+    def score_reducer(self) -> ScoreReducer:
+        """Count label pairs incrementally instead of buffering results."""
+        return LabelPairScoreReducer(self._score_label_pairs)
 
+    def _score_label_pairs(self, pairs: Counter[tuple[str, str]]) -> float:
         positive_class = self.evaluator_config.positive_class.lower()
         tp = fp = fn = 0
 
-        for r in results:
-            if isinstance(r.details, BaseEvaluatorJustification):
-                details = r.details
-            elif isinstance(r.details, dict):
-                try:
-                    details = BaseEvaluatorJustification.model_validate(r.details)
-                except Exception:
-                    continue
-            else:
-                continue
-            pred = details.actual
-            exp = details.expected
+        for (exp, pred), count in pairs.items():
             if pred == positive_class and exp == positive_class:
-                tp += 1
+                tp += count
             elif pred == positive_class:
-                fp += 1
+                fp += count
             elif exp == positive_class:
-                fn += 1
+                fn += count
 
         metric_type = self.evaluator_config.metric_type
 
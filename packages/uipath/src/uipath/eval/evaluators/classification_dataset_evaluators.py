@@ -31,7 +31,7 @@ from ._aggregator_specs import (
     ConfusionMatrixAggregatorSpec,
     FScoreAggregatorSpec,
 )
-from .base_dataset_evaluator import BaseDatasetEvaluator
+from .base_dataset_evaluator import BaseDatasetEvaluator, DatasetAccumulator
 from .base_evaluator import BaseEvaluatorJustification
 
 
@@ -106,11 +106,8 @@ class _ConfusionData:
     oov_fn: list[int]
 
 
-def _build_confusion(
-    results: list[EvaluationResultDto],
-    classes: list[str],
-) -> _ConfusionData:
-    """Build a confusion matrix from per-datapoint results.
+class _ConfusionCounter:
+    """Internal: incrementally counts results into a confusion matrix.
 
     Results without a parseable justification are counted in ``n_skipped`` and
     omitted. A datapoint whose *predicted* label is out of vocabulary but whose
@@ -122,40 +119,55 @@ def _build_confusion(
     "Book" vs configured "book" still matches, but the user-supplied casing is
     preserved in the returned ``_ConfusionData.classes``.
     """
-    index_of = {c.lower(): i for i, c in enumerate(classes)}
-    k = len(classes)
-    matrix = [[0] * k for _ in range(k)]
-    oov_fn = [0] * k
-
-    n_total = len(results)
-    n_scored = 0
-    n_skipped = 0
 
-    for r in results:
-        j = BaseEvaluatorJustification.try_from(r.details)
+    def __init__(self, classes: list[str]) -> None:
+        self.classes = list(classes)
+        self.index_of = {c.lower(): i for i, c in enumerate(classes)}
+        k = len(classes)
+        self.matrix = [[0] * k for _ in range(k)]
+        self.oov_fn = [0] * k
+        self.n_total = 0
+        self.n_scored = 0
+        self.n_skipped = 0
+
+    def add(self, result: EvaluationResultDto) -> None:
+        self.n_total += 1
+        j = BaseEvaluatorJustification.try_from(result.details)
         if j is None:
-            n_skipped += 1
-            continue
+            self.n_skipped += 1
+            return
         exp = j.expected.lower()
         act = j.actual.lower()
-        if exp not in index_of:
-            n_skipped += 1
-            continue
-        if act not in index_of:
-            oov_fn[index_of[exp]] += 1
-            n_scored += 1
-            continue
-        matrix[index_of[act]][index_of[exp]] += 1
-        n_scored += 1
-
-    return _ConfusionData(
-        classes=list(classes),
-        matrix=matrix,
-        n_total=n_total,
-        n_scored=n_scored,
-        n_skipped=n_skipped,
-        oov_fn=oov_fn,
-    )
+        if exp not in self.index_of:
+            self.n_skipped += 1
+            return
+        if act not in self.index_of:
+            self.oov_fn[self.index_of[exp]] += 1
+            self.n_scored += 1
+            return
+        self.matrix[self.index_of[act]][self.index_of[exp]] += 1
+        self.n_scored += 1
+
+    def data(self) -> _ConfusionData:
+        return _ConfusionData(
+            classes=list(self.classes),
+            matrix=[list(row) for row in self.matrix],
+            n_total=self.n_total,
+            n_scored=self.n_scored,
+            n_skipped=self.n_skipped,
+            oov_fn=list(self.oov_fn),
+        )
+
+
+def _build_confusion(
+    results: list[EvaluationResultDto],
+    classes: list[str],
+) -> _ConfusionData:
+    """Build a confusion matrix from per-datapoint results (see :class:`_ConfusionCounter`)."""
+    counter = _ConfusionCounter(classes)
+    for r in results:
+        counter.add(r)
+    return counter.data()
 
 
 def _f_beta(precision: float, recall: float, beta: float) -> float:
@@ -178,8 +190,13 @@ class ClassificationDatasetEvaluator(BaseDatasetEvaluator):
 
     def evaluate(self, results: list[EvaluationResultDto]) -> EvaluationResult:
         """Compute the configured metric report and return the headline as score."""
-        confusion = _build_confusion(results, self.classes)
+        return self._report(_build_confusion(results, self.classes))
 
+    def accumulator(self) -> DatasetAccumulator:
+        """Count results into the confusion matrix as they arrive."""
+        return _ClassificationAccumulator(self)
+
+    def _report(self, confusion: _ConfusionData) -> EvaluationResult:
         if isinstance(self.spec, ConfusionMatrixAggregatorSpec):
             # No scalar headline — emit the raw grid and let the UI render it.
             details = ClassificationDetails(
@@ -268,3 +285,15 @@ class ClassificationDatasetEvaluator(BaseDatasetEvaluator):
             n_skipped=confusion.n_skipped,
         )
         return NumericEvaluationResult(score=headline, details=details)
+
+
+class _ClassificationAccumulator(DatasetAccumulator):
+    def __init__(self, evaluator: ClassificationDatasetEvaluator) -> None:
+        self.evaluator = evaluator
+        self.counter = _ConfusionCounter(evaluator.classes)
+
+    def add(self, result: EvaluationResultDto) -> None:
+        self.counter.add(result)
+
+    def result(self) -> EvaluationResult:
+        return self.evaluator._report(self.counter.data())
@@ -4,6 +4,7 @@ import math
 from typing import Any, Tuple, TypeVar
 
 from .._helpers.output_path import resolve_output_path
+from .._helpers.similarity import string_similarity
 from ..models import EvaluationResult, NumericEvaluationResult
 from ..models.models import WorkloadExecution
 from .base_legacy_evaluator import LegacyEvaluationCriteria, LegacyEvaluatorConfig
@@ -134,14 +135,7 @@ class LegacyJsonSimilarityEvaluator(
     def _compare_strings(
         self, expected_string: str, actual_string: str
     ) -> Tuple[float, float]:
-        total = 1.0
-        if not expected_string and not actual_string:
-            return 1.0, total
-        distance = self._levenshtein(expected_string, actual_string)
-        max_length = max(len(expected_string), len(actual_string))
-        similarity = 1.0 - (distance / max_length) if max_length else 1.0
-        similarity = max(0.0, min(1.0, similarity))
-        return similarity, total
+        return string_similarity(expected_string, actual_string), 1.0
 
     def _count_leaves(self, token_node: Any) -> float:
         if isinstance(token_node, dict):
@@ -152,29 +146,5 @@ class LegacyJsonSimilarityEvaluator(
             return sum(self._count_leaves(child_value) for child_value in token_node)
         return 1.0
 
-    def _levenshtein(self, source_text: str, target_text: str) -> int:
-        if not source_text:
-            return len(target_text)
-        if not target_text:
-            return len(source_text)
-        source_len, target_len = len(source_text), len(target_text)
-        distance_matrix = [[0] * (target_len + 1) for _ in range(source_len + 1)]
-        for row_idx in range(source_len + 1):
-            distance_matrix[row_idx][0] = row_idx
-        for col_idx in range(target_len + 1):
-            distance_matrix[0][col_idx] = col_idx
-        for row_idx in range(1, source_len + 1):
-            for col_idx in range(1, target_len + 1):
-                substitution_cost = (
-                    0 if source_text[row_idx - 1] == target_text[col_idx - 1] else 1
-                )
-                distance_matrix[row_idx][col_idx] = min(
-                    distance_matrix[row_idx - 1][col_idx] + 1,  # deletion
-                    distance_matrix[row_idx][col_idx - 1] + 1,  # insertion
-                    distance_matrix[row_idx - 1][col_idx - 1]
-                    + substitution_cost,  # substitution
-                )
-        return distance_matrix[source_len][target_len]
-
     def _is_number(self, value: Any) -> bool:
         return isinstance(value, (int, float)) and not isinstance(value, bool)
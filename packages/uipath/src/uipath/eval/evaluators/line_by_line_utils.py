@@ -1,5 +1,6 @@
 """Utilities for line-by-line evaluation."""
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
@@ -82,9 +83,14 @@ async def evaluate_lines(
     workload_execution: "WorkloadExecution",
     evaluate_fn: Callable[[Any, Any], Any],
     create_line_criteria_fn: Callable[[str], Any],
+    max_concurrency: int = 1,
 ) -> tuple[list[Any], list[tuple[int, "EvaluationResult"]]]:
     """Evaluate each line and return details and results.
 
+    Up to ``max_concurrency`` lines are evaluated at once; details and results
+    are always returned in line order. If a line fails, the lines still running
+    are cancelled and the error is raised.
+
     Args:
         actual_lines: List of actual output lines
         expected_lines: List of expected output lines
@@ -92,6 +98,7 @@ async def evaluate_lines(
         workload_execution: Original workload execution
         evaluate_fn: Function to evaluate (line_execution, line_criteria) -> result
         create_line_criteria_fn: Function to create criteria for a line (expected_line) -> criteria
+        max_concurrency: Maximum number of lines evaluated at the same time
 
     Returns:
         Tuple of (line_details, line_results)
@@ -99,45 +106,50 @@ async def evaluate_lines(
     # Import here to avoid circular dependency
     from .output_evaluator import LineEvaluationDetail
 
-    line_details = []
-    line_results: list[tuple[int, Any]] = []
-    max_lines = max(len(actual_lines), len(expected_lines))
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
 
-    for i in range(max_lines):
-        actual_line = actual_lines[i] if i < len(actual_lines) else ""
-        expected_line = expected_lines[i] if i < len(expected_lines) else ""
-
-        # Wrap lines in the same structure as original output
-        line_agent_output = wrap_line_in_structure(actual_line, target_output_key)
-
-        # Create a modified workload execution for this line
-        from ..models.models import WorkloadExecution
-
-        line_agent_execution = WorkloadExecution(
-            agent_input=workload_execution.agent_input,
-            workload_output=line_agent_output,
-            workload_trace=workload_execution.workload_trace,
-            expected_agent_behavior=getattr(
-                workload_execution, "expected_agent_behavior", None
-            ),
-            simulation_instructions=getattr(
-                workload_execution, "simulation_instructions", ""
-            ),
+    max_lines = max(len(actual_lines), len(expected_lines))
+    actual_lines = actual_lines + [""] * (max_lines - len(actual_lines))
+    expected_lines = expected_lines + [""] * (max_lines - len(expected_lines))
+    results: list[Any] = [None] * max_lines
+    limiter = asyncio.Semaphore(max_concurrency)
+
+    async def evaluate_line(index: int) -> None:
+        # Share the original execution (input, trace) and swap in this line
+        line_agent_execution = workload_execution.model_copy(
+            update={
+                "workload_output": wrap_line_in_structure(
+                    actual_lines[index], target_output_key
+                )
+            }
         )
+        line_criteria = create_line_criteria_fn(expected_lines[index])
+        async with limiter:
+            results[index] = await evaluate_fn(line_agent_execution, line_criteria)
+
+    if max_concurrency == 1 or max_lines <= 1:
+        for i in range(max_lines):
+            await evaluate_line(i)
+    else:
+        tasks = [asyncio.ensure_future(evaluate_line(i)) for i in range(max_lines)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-        # Create criteria for this line using the provided function
-        line_criteria = create_line_criteria_fn(expected_line)
-
-        # Evaluate this line
-        line_result = await evaluate_fn(line_agent_execution, line_criteria)
-
-        # Store line evaluation detail
+    line_details = []
+    line_results: list[tuple[int, Any]] = []
+    for i, line_result in enumerate(results):
         score_value = line_result.score if hasattr(line_result, "score") else 0.0
         line_details.append(
             LineEvaluationDetail(
                 line_number=i + 1,
-                actual=actual_line,
-                expected=expected_line,
+                actual=actual_lines[i],
+                expected=expected_lines[i],
                 score=score_value,
                 details=line_result.details
                 if hasattr(line_result, "details")
@@ -7,6 +7,7 @@ confusion matrix and compute precision, recall, or F-score with micro or
 macro averaging.
 """
 
+from collections import Counter
 from typing import Literal
 
 from ..models import (
@@ -20,7 +21,13 @@ from ..models.models import (
     UiPathEvaluationError,
     UiPathEvaluationErrorCategory,
 )
-from .base_evaluator import BaseEvaluationCriteria, BaseEvaluatorJustification
+from .base_evaluator import (
+    BaseEvaluationCriteria,
+    BaseEvaluatorJustification,
+    LabelPairScoreReducer,
+    ScoreReducer,
+    count_label_pairs,
+)
 from .output_evaluator import (
     BaseOutputEvaluator,
     OutputEvaluatorConfig,
@@ -104,7 +111,13 @@ class MulticlassClassificationEvaluator(
         """Reconstruct confusion matrix from details and compute the configured metric."""
         if not results:
             return 0.0
+        return self._score_label_pairs(count_label_pairs(results))
+
+    def score_reducer(self) -> ScoreReducer:
+        """Count label pairs incrementally instead of buffering results."""
+        return LabelPairScoreReducer(self._score_label_pairs)
 
+    def _score_label_pairs(self, pairs: Counter[tuple[str, str]]) -> float:
         classes = [c.lower() for c in self.evaluator_config.classes]
         k = len(classes)
         metric_type = self.evaluator_config.metric_type
@@ -113,20 +126,9 @@ class MulticlassClassificationEvaluator(
 
         # Reconstruct confusion matrix: confusion[pred_idx][exp_idx]
         confusion = [[0] * k for _ in range(k)]
-        for r in results:
-            if isinstance(r.details, BaseEvaluatorJustification):
-                details = r.details
-            elif isinstance(r.details, dict):
-                try:
-                    details = BaseEvaluatorJustification.model_validate(r.details)
-                except Exception:
-                    continue
-            else:
-                continue
-            pred = details.actual
-            exp = details.expected
+        for (exp, pred), count in pairs.items():
             if pred in classes and exp in classes:
-                confusion[classes.index(pred)][classes.index(exp)] += 1
+                confusion[classes.index(pred)][classes.index(exp)] += count
 
         if averaging == "micro":
             return _micro_metric(confusion, k, metric_type, f_value)
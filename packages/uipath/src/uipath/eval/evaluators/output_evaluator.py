@@ -98,6 +98,11 @@ class OutputEvaluatorConfig(BaseEvaluatorConfig[T]):
         default="\n",
         description="Delimiter to split output when line_by_line_evaluator is True",
     )
+    line_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of lines evaluated concurrently when line_by_line_evaluator is True",
+    )
 
 
 C = TypeVar("C", bound=OutputEvaluatorConfig[Any])
@@ -343,6 +348,7 @@ class BaseOutputEvaluator(BaseEvaluator[T, C, J]):
             workload_execution=workload_execution,
             evaluate_fn=self.evaluate,
             create_line_criteria_fn=create_line_criteria,
+            max_concurrency=self.evaluator_config.line_concurrency,
         )
 
         workload_execution.workload_output = original_agent_output
@@ -2,23 +2,81 @@
 
 import hashlib
 import json
+import logging
+import sqlite3
+import time
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+CACHE_DB_FILE_NAME = "cache.sqlite3"
+DEFAULT_MAX_CACHE_SIZE_BYTES = 512 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
 
 class CacheManager:
-    """Manages caching for LLM and input mocker responses."""
+    """Manages caching for LLM and input mocker responses.
+
+    Entries live in a single SQLite database in ``cache_dir``, which several
+    processes can read and write at once. Responses are kept in memory for the
+    run and written in one transaction on :meth:`flush`; least recently used
+    entries are evicted once the database grows past ``max_size_bytes``.
+
+    Caches written by earlier versions (one JSON file per entry) are still
+    read, and an entry found there is moved into the database on flush.
+    """
 
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_size_bytes: int = DEFAULT_MAX_CACHE_SIZE_BYTES,
+    ):
         """Initialize the cache manager with in-memory cache."""
         self.cache_dir = cache_dir or (Path.cwd() / ".uipath" / "eval_cache")
+        self.max_size_bytes = max_size_bytes
         self._memory_cache: dict[str, Any] = {}
         self._dirty_keys: set[str] = set()
+        self._used_keys: set[str] = set()
+        self._connection: sqlite3.Connection | None = None
+        # Legacy entries live in per-mocker subdirectories; without any, misses
+        # skip computing the legacy key and looking for its file.
+        self._has_legacy_layout = self.cache_dir.is_dir() and any(
+            path.is_dir() for path in self.cache_dir.iterdir()
+        )
+        self._migrated_paths: list[Path] = []
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the SQLite database holding the entries."""
+        return self.cache_dir / CACHE_DB_FILE_NAME
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self.db_path, timeout=30, check_same_thread=False
+            )
+            # WAL lets readers proceed while another process writes.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
 
     def _compute_cache_key(self, cache_key_data: dict[str, Any]) -> str:
         """Compute a hash from cache key data."""
-        serialized = json.dumps(cache_key_data, sort_keys=True)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+        serialized = json.dumps(cache_key_data, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
 
     def _get_cache_key_string(
         self,
@@ -30,12 +88,16 @@ class CacheManager:
         cache_key_hash = self._compute_cache_key(cache_key_data)
         return f"{mocker_type}/{function_name}/{cache_key_hash}"
 
-    def _get_cache_path(
+    def _get_legacy_cache_path(
         self,
-        cache_key_string: str,
+        mocker_type: str,
+        cache_key_data: dict[str, Any],
+        function_name: str,
     ) -> Path:
-        """Get the file path for a cache entry from cache key string."""
-        return self.cache_dir / f"{cache_key_string}.json"
+        """Path of an entry in the one-file-per-entry layout of earlier versions."""
+        serialized = json.dumps(cache_key_data, sort_keys=True)
+        cache_key_hash = hashlib.sha256(serialized.encode()).hexdigest()
+        return self.cache_dir / mocker_type / function_name / f"{cache_key_hash}.json"
 
     def get(
         self,
@@ -53,13 +115,28 @@ class CacheManager:
             return self._memory_cache[cache_key_string]
 
         # Check disk cache
-        cache_path = self._get_cache_path(cache_key_string)
-        if not cache_path.exists():
+        row = (
+            self._connect()
+            .execute("SELECT value FROM entries WHERE key = ?", (cache_key_string,))
+            .fetchone()
+        )
+        if row is not None:
+            cached_response = json.loads(row[0])
+            # Recency is recorded on flush rather than on every read.
+            self._used_keys.add(cache_key_string)
+        elif self._has_legacy_layout:
+            legacy_path = self._get_legacy_cache_path(
+                mocker_type, cache_key_data, function_name
+            )
+            if not legacy_path.exists():
+                return None
+            with open(legacy_path, "r") as f:
+                cached_response = json.load(f)
+            self._dirty_keys.add(cache_key_string)
+            self._migrated_paths.append(legacy_path)
+        else:
             return None
 
-        with open(cache_path, "r") as f:
-            cached_response = json.load(f)
-
         # Populate memory cache
         self._memory_cache[cache_key_string] = cached_response
         return cached_response
@@ -83,12 +160,69 @@ class CacheManager:
         self._dirty_keys.add(cache_key_string)
 
     def flush(self) -> None:
-        """Write all dirty cache entries to disk."""
-        for cache_key_string in self._dirty_keys:
-            cache_path = self._get_cache_path(cache_key_string)
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
+        """Write all dirty cache entries to disk and evict if over the size limit."""
+        if not self._dirty_keys and not self._used_keys:
+            return
 
-            with open(cache_path, "w") as f:
-                json.dump(self._memory_cache[cache_key_string], f)
+        now = time.time()
+        rows = []
+        for cache_key_string in self._dirty_keys:
+            value = json.dumps(self._memory_cache[cache_key_string])
+            rows.append((cache_key_string, value, len(value.encode()), now))
+
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            connection.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(now, key) for key in self._used_keys - self._dirty_keys],
+            )
+            self._evict(connection)
 
         self._dirty_keys.clear()
+        self._used_keys.clear()
+        self._remove_migrated_files()
+
+    def _remove_migrated_files(self) -> None:
+        """Delete legacy files whose entries are now in the database."""
+        for path in self._migrated_paths:
+            path.unlink(missing_ok=True)
+            # Drop the function and mocker directories once they are empty.
+            for directory in (path.parent, path.parent.parent):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    break
+        self._migrated_paths.clear()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the cache fits its size limit."""
+        (total_size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if total_size <= self.max_size_bytes:
+            return
+
+        excess = total_size - self.max_size_bytes
+        evicted: list[str] = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_used ASC"
+        ):
+            if excess <= 0:
+                break
+            evicted.append(key)
+            excess -= size
+        connection.executemany(
+            "DELETE FROM entries WHERE key = ?", [(key,) for key in evicted]
+        )
+        logger.debug(f"Evicted {len(evicted)} mocker cache entries")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -1,49 +1,22 @@
 import logging
-from collections import defaultdict
-from typing import Sequence
 
 from opentelemetry import context as context_api
-from opentelemetry.sdk.trace import ReadableSpan, Span
-from opentelemetry.sdk.trace.export import (
-    SpanExporter,
-    SpanExportResult,
-)
+from opentelemetry.sdk.trace import Span
+from opentelemetry.sdk.trace.export import SpanExporter
 
+from uipath.core.tracing.exporters import UiPathRuntimeExecutionSpanExporter
 from uipath.core.tracing.processors import UiPathExecutionBatchTraceProcessor
 from uipath.runtime.logging import UiPathRuntimeExecutionLogHandler
 
 from .._execution_context import ExecutionSpanCollector, execution_id_context
 
 
-class ExecutionSpanExporter(SpanExporter):
-    """Custom exporter that stores spans grouped by execution ids."""
+class ExecutionSpanExporter(UiPathRuntimeExecutionSpanExporter):
+    """Custom exporter that stores spans grouped by execution ids.
 
-    def __init__(self):
-        # { execution_id -> list of spans }
-        self._spans: dict[str, list[ReadableSpan]] = defaultdict(list)
-
-    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        for span in spans:
-            if span.attributes is not None:
-                exec_id = span.attributes.get("execution.id")
-                if exec_id is not None and isinstance(exec_id, str):
-                    self._spans[exec_id].append(span)
-
-        return SpanExportResult.SUCCESS
-
-    def get_spans(self, execution_id: str) -> list[ReadableSpan]:
-        """Retrieve spans for a given execution id."""
-        return self._spans.get(execution_id, [])
-
-    def clear(self, execution_id: str | None = None) -> None:
-        """Clear stored spans for one or all executions."""
-        if execution_id:
-            self._spans.pop(execution_id, None)
-        else:
-            self._spans.clear()
-
-    def shutdown(self) -> None:
-        self.clear()
+    Spans are read and cleared per evaluation run; the store limits from
+    :class:`UiPathRuntimeExecutionSpanExporter` bound long eval sets.
+    """
 
 
 class ExecutionSpanProcessor(UiPathExecutionBatchTraceProcessor):
@@ -1,31 +1,105 @@
 import asyncio
-from typing import Awaitable, Iterable, TypeVar
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Awaitable, Callable, Iterable, TypeVar
 
 T = TypeVar("T")
 
 
+@dataclass
+class SchedulerMetrics:
+    """Live counters of a parallel evaluation run.
+
+    Updated in place while :func:`execute_parallel_streaming` runs, so a
+    reporter can read queue depth and utilization mid-run.
+    """
+
+    workers: int = 0
+    queue_depth: int = 0
+    """Items handed to the queue that no worker has picked up yet."""
+
+    busy_workers: int = 0
+    completed: int = 0
+    busy_seconds: float = 0.0
+    """Total time workers spent running items."""
+
+    started_at: float | None = None
+    finished_at: float | None = None
+    _item_started: dict[int, float] = field(default_factory=dict, repr=False)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Wall-clock time since the run started."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or monotonic()) - self.started_at
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the available worker time spent running items."""
+        capacity = self.workers * self.elapsed_seconds
+        if capacity <= 0:
+            return 0.0
+        busy = self.busy_seconds + sum(
+            monotonic() - started for started in self._item_started.values()
+        )
+        return min(busy / capacity, 1.0)
+
+
 async def execute_parallel(
     evaluation_result_iterable: Iterable[Awaitable[T]],
     workers: int,
 ) -> list[T]:
+    # Dictionary to store results with their original indices
+    results_dict: dict[int, T] = {}
+
+    def store(index: int, result: T) -> None:
+        results_dict[index] = result
+
+    await execute_parallel_streaming(evaluation_result_iterable, workers, store)
+
+    # Return results in the original order
+    return [results_dict[i] for i in range(len(results_dict))]
+
+
+async def execute_parallel_streaming(
+    evaluation_result_iterable: Iterable[Awaitable[T]],
+    workers: int,
+    on_result: Callable[[int, T], None],
+    metrics: SchedulerMetrics | None = None,
+) -> int:
+    """Run the awaitables on ``workers`` workers, handing each result off as it completes.
+
+    ``on_result`` receives the original index and the result, in completion
+    order. Results are not retained, and the iterable is consumed lazily, so
+    memory does not grow with the number of items. Workers share one queue,
+    so whichever worker frees up first takes the next item.
+
+    Returns:
+        The number of results produced.
+    """
     # Create a queue with max concurrency
     queue: asyncio.Queue[tuple[int, Awaitable[T]] | None] = asyncio.Queue(
         maxsize=workers
     )
-
-    # Dictionary to store results with their original indices
-    results_dict: dict[int, T] = {}
+    completed = 0
+    if metrics is not None:
+        metrics.workers = workers
+        metrics.started_at = monotonic()
 
     # Producer task to fill the queue
     async def producer() -> None:
         for index, eval_item in enumerate(evaluation_result_iterable):
             await queue.put((index, eval_item))
+            if metrics is not None:
+                metrics.queue_depth += 1
         # Signal completion by putting None markers
         for _ in range(workers):
             await queue.put(None)
 
     # Worker function to process items from the queue
     async def worker(worker_id: int) -> None:
+        nonlocal completed
         while True:
             item = await queue.get()
 
@@ -35,14 +109,23 @@ async def execute_parallel(
                 break
 
             index, eval_item = item
+            if metrics is not None:
+                metrics.queue_depth -= 1
+                metrics.busy_workers += 1
+                metrics._item_started[index] = monotonic()
 
             try:
                 # Execute the evaluation
                 result = await eval_item
-
-                # Store result with its index to maintain order
-                results_dict[index] = result
+                on_result(index, result)
+                completed += 1
             finally:
+                if metrics is not None:
+                    metrics.busy_workers -= 1
+                    metrics.busy_seconds += monotonic() - metrics._item_started.pop(
+                        index
+                    )
+                    metrics.completed = completed
                 # Mark the task as done
                 queue.task_done()
 
@@ -53,8 +136,11 @@ async def execute_parallel(
     worker_tasks = [asyncio.create_task(worker(i)) for i in range(workers)]
 
     # Wait for producer and all workers to complete
-    await producer_task
-    await asyncio.gather(*worker_tasks)
+    try:
+        await producer_task
+        await asyncio.gather(*worker_tasks)
+    finally:
+        if metrics is not None:
+            metrics.finished_at = monotonic()
 
-    # Return results in the original order
-    return [results_dict[i] for i in range(len(results_dict))]
+    return completed
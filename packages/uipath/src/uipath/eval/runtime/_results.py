@@ -0,0 +1,204 @@
+"""Incremental aggregation and streaming of evaluation set results.
+
+Each :class:`UiPathEvalRunResult` is folded into running per-datapoint score
+sums as soon as its datapoint completes, and can be appended to a
+newline-delimited JSON file, so a run does not need to keep every result in
+memory to report its scores, and an interrupted run still leaves the finished
+datapoints on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import defaultdict
+from typing import IO, Any
+
+from pydantic import BaseModel
+
+from uipath.runtime import UiPathResumeTrigger, UiPathRuntimeStatus
+
+from ..evaluators.base_dataset_evaluator import BaseDatasetEvaluator
+from ..evaluators.base_evaluator import (
+    BaseEvaluatorJustification,
+    GenericBaseEvaluator,
+    ScoreReducer,
+)
+from ..evaluators.dataset_evaluator_factory import (
+    build_dataset_evaluator,
+    dataset_result_key,
+    unique_aggregator_specs,
+)
+from ..evaluators.exact_match_evaluator import ExactMatchEvaluatorConfig
+from ..models.models import EvaluationResultDto
+from ._types import UiPathEvalRunResult
+
+
+class EvalSetResultAggregator:
+    """Running aggregate of an evaluation set run.
+
+    Produces the same evaluator averages as ``compute_evaluator_scores`` and
+    the same dataset evaluator results as ``compute_dataset_evaluator_results``,
+    whatever order the results arrive in. Like those functions it merges the
+    results of a (datapoint, evaluator) pair across the whole run, so it
+    keeps a running score sum and count per pair rather than every result,
+    and runs the evaluator reducers when the averages are requested.
+    """
+
+    def __init__(self, evaluators: list[GenericBaseEvaluator[Any, Any, Any]]):
+        """Prepare the dataset evaluators of every aggregator."""
+        self._evaluators = {evaluator.name: evaluator for evaluator in evaluators}
+        self._dataset_evaluators: dict[str, list[tuple[str, BaseDatasetEvaluator]]] = (
+            defaultdict(list)
+        )
+        for evaluator in evaluators:
+            # See compute_dataset_evaluator_results for why only ExactMatch.
+            config = getattr(evaluator, "evaluator_config", None)
+            if not isinstance(config, ExactMatchEvaluatorConfig):
+                continue
+            if not config.aggregators or not config.classes:
+                continue
+            specs = unique_aggregator_specs(config.aggregators)
+            type_counts: dict[str, int] = defaultdict(int)
+            for spec in specs:
+                type_counts[spec.type] += 1
+            for spec in specs:
+                key = dataset_result_key(config.name, spec, type_counts[spec.type] > 1)
+                self._dataset_evaluators[config.name].append(
+                    (key, build_dataset_evaluator(spec, config.name, config.classes))
+                )
+
+        # Score sum, result count and first details per (datapoint, evaluator).
+        self._scores: dict[tuple[str, str], tuple[float, int, Any]] = {}
+        # The result per (datapoint, evaluator) the dataset evaluators receive.
+        self._dataset_results: dict[tuple[str, str], EvaluationResultDto] = {}
+        self.count = 0
+        self.any_failed = False
+        self.status = UiPathRuntimeStatus.SUCCESSFUL
+        self.triggers: list[UiPathResumeTrigger] = []
+
+    def add(self, eval_run_result: UiPathEvalRunResult) -> None:
+        """Fold one datapoint's results into the aggregate."""
+        self.count += 1
+        datapoint_id = eval_run_result.evaluation_name
+        for eval_run_result_dto in eval_run_result.evaluation_run_results:
+            if eval_run_result_dto.is_line_result:
+                continue
+            evaluator_name = eval_run_result_dto.evaluator_name
+            if evaluator_name not in self._evaluators:
+                known = sorted(self._evaluators.keys())
+                raise ValueError(
+                    f"Evaluator '{evaluator_name}' found in results for "
+                    f"datapoint '{datapoint_id}' but no matching evaluator "
+                    f"instance was provided. Known evaluators: {known}"
+                )
+            key = (datapoint_id, evaluator_name)
+            result = eval_run_result_dto.result
+            total, count, details = self._scores.get(key, (0.0, 0, result.details))
+            self._scores[key] = (total + result.score, count + 1, details)
+
+            if evaluator_name not in self._dataset_evaluators:
+                continue
+            existing = self._dataset_results.get(key)
+            # Keep the entry with a parseable justification over one without.
+            if existing is None or (
+                BaseEvaluatorJustification.try_from(result.details) is not None
+                and BaseEvaluatorJustification.try_from(existing.details) is None
+            ):
+                self._dataset_results[key] = result
+
+        execution_output = eval_run_result.agent_execution_output
+        if execution_output and execution_output.result:
+            runtime_result = execution_output.result
+            if runtime_result.error:
+                self.any_failed = True
+            if runtime_result.triggers:
+                self.triggers.extend(runtime_result.triggers)
+            # Priority: SUSPENDED > FAULTED > SUCCESSFUL
+            if runtime_result.status == UiPathRuntimeStatus.SUSPENDED:
+                self.status = UiPathRuntimeStatus.SUSPENDED
+            elif (
+                runtime_result.status == UiPathRuntimeStatus.FAULTED
+                and self.status != UiPathRuntimeStatus.SUSPENDED
+            ):
+                self.status = UiPathRuntimeStatus.FAULTED
+
+    def evaluator_averages(self) -> dict[str, float]:
+        """Reduced score of every evaluator that produced results."""
+        reducers: dict[str, ScoreReducer] = {}
+        for (_datapoint_id, evaluator_name), score in self._scores.items():
+            total, count, details = score
+            reducer = reducers.get(evaluator_name)
+            if reducer is None:
+                reducer = reducers[evaluator_name] = self._evaluators[
+                    evaluator_name
+                ].score_reducer()
+            reducer.add(EvaluationResultDto(score=total / count, details=details))
+        return {name: reducer.result() for name, reducer in reducers.items()}
+
+    def dataset_evaluator_results(self) -> dict[str, EvaluationResultDto]:
+        """Dataset evaluator results keyed by :func:`dataset_result_key`."""
+        accumulators = {
+            source_name: [
+                (key, dataset_evaluator.accumulator())
+                for key, dataset_evaluator in dataset_evaluators
+            ]
+            for source_name, dataset_evaluators in self._dataset_evaluators.items()
+        }
+        for (_datapoint_id, evaluator_name), result in self._dataset_results.items():
+            for _key, accumulator in accumulators[evaluator_name]:
+                accumulator.add(result)
+
+        dataset_results: dict[str, EvaluationResultDto] = {}
+        for source_accumulators in accumulators.values():
+            for key, accumulator in source_accumulators:
+                accumulated = accumulator.result()
+                details: str | dict[str, Any] | None
+                if isinstance(accumulated.details, BaseModel):
+                    # Same camelCase wire shape the platform worker ships.
+                    details = accumulated.details.model_dump(
+                        by_alias=True, exclude_none=True
+                    )
+                else:
+                    details = accumulated.details
+                dataset_results[key] = EvaluationResultDto(
+                    score=accumulated.score, details=details
+                )
+        return dataset_results
+
+
+class EvalRunResultWriter:
+    """Appends each evaluation run result to a newline-delimited JSON file.
+
+    Every line is one ``UiPathEvalRunResult`` in the same camelCase shape as
+    the entries of ``evaluationSetResults`` in the run output. Lines are
+    flushed as they are written, so a partial file is readable while the run
+    is still going or after it was interrupted.
+    """
+
+    def __init__(self, file_path: str):
+        """Open (and truncate) the results file."""
+        self.file_path = file_path
+        dir_path = os.path.dirname(file_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        self._file: IO[str] = open(file_path, "w", encoding="utf-8")
+
+    def write(self, eval_run_result: UiPathEvalRunResult) -> None:
+        """Append one result as a JSON line."""
+        line = json.dumps(
+            eval_run_result.model_dump(by_alias=True, mode="json"),
+            ensure_ascii=False,
+        )
+        self._file.write(line + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the results file."""
+        self._file.close()
+
+    def __enter__(self) -> EvalRunResultWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
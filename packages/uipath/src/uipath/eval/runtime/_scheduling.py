@@ -0,0 +1,123 @@
+"""Ordering of evaluation items by how long they took in earlier runs.
+
+Workers pull items from one shared queue, so a handful of slow items picked up
+last leave the other workers idle at the end of the run. Starting the items
+that took longest last time first keeps the tail short.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_DURATION_HISTORY_FILE = Path(".uipath") / "eval_durations.json"
+DEFAULT_MAX_HISTORY_ENTRIES = 10_000
+
+
+def longest_first(
+    items: Sequence[T], expected_duration: Callable[[T], float | None]
+) -> list[int]:
+    """Indices of ``items`` in the order they should be started.
+
+    Items with the longest expected duration come first. Items with no
+    history are started before all others, since nothing says they are short;
+    ties keep their input order.
+    """
+    durations = [expected_duration(item) for item in items]
+    return sorted(
+        range(len(items)),
+        key=lambda index: (
+            durations[index] is not None,
+            -(durations[index] or 0.0),
+        ),
+    )
+
+
+class EvalDurationHistory:
+    """Per-item durations of earlier eval runs, persisted as a JSON file.
+
+    Durations are smoothed across runs so one slow outlier does not reorder
+    the whole set. The file lists items from least to most recently run and
+    keeps the ``max_entries`` most recent ones, so items that were renamed or
+    removed from eval sets eventually drop out.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        smoothing: float = 0.5,
+        max_entries: int = DEFAULT_MAX_HISTORY_ENTRIES,
+    ):
+        """Load the history from ``file_path`` if it exists."""
+        self.file_path = Path(file_path)
+        self.smoothing = smoothing
+        self.max_entries = max_entries
+        self._durations: dict[str, float] = self._read()
+        self._updated: dict[str, float] = {}
+
+    def _read(self) -> dict[str, float]:
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable eval duration history: {e}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            key: float(value)
+            for key, value in data.items()
+            if isinstance(value, (int, float))
+        }
+
+    def expected(self, key: str) -> float | None:
+        """Expected duration of an item in seconds, if it ran before."""
+        return self._updated.get(key, self._durations.get(key))
+
+    def record(self, key: str, seconds: float) -> None:
+        """Fold a new duration into the item's expected duration."""
+        previous = self.expected(key)
+        if previous is None:
+            self._updated[key] = seconds
+        else:
+            self._updated[key] = (
+                self.smoothing * seconds + (1 - self.smoothing) * previous
+            )
+
+    def save(self) -> None:
+        """Write the recorded durations back to the history file.
+
+        The file is re-read first, so durations recorded concurrently by
+        other processes for other items are kept. Recorded items move to the
+        end of the file, and the least recently run items beyond
+        ``max_entries`` are dropped.
+        """
+        if not self._updated:
+            return
+        durations = {
+            key: seconds
+            for key, seconds in self._read().items()
+            if key not in self._updated
+        }
+        durations.update(self._updated)
+        if len(durations) > self.max_entries:
+            durations = dict(list(durations.items())[-self.max_entries :])
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(durations, f, indent=2)
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._durations = durations
+        self._updated = {}
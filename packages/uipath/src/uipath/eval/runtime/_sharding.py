@@ -0,0 +1,112 @@
+"""Helpers for running an evaluation set sharded across worker processes.
+
+Workers evaluate their shard and send every per-item event and result back to
+the process that owns the eval set run. Messages are plain picklable tuples:
+spans are sent in their storage form (see :func:`serialize_span`), log records
+and exceptions are reduced to what survives pickling, and results are sent in
+their JSON form.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import pickle
+from typing import Any, Literal, Protocol, TypeVar, Union
+
+from ._spans import deserialize_span, serialize_span
+from ._types import UiPathEvalRunResult
+from .events import (
+    EvalRunCreatedEvent,
+    EvalRunUpdatedEvent,
+    EvaluationEvents,
+)
+
+T = TypeVar("T")
+
+EventMessage = tuple[Literal["event"], str, Any, list[dict[str, Any]]]
+ResultMessage = tuple[Literal["result"], str, dict[str, Any]]
+DoneMessage = tuple[Literal["done"], int]
+ErrorMessage = tuple[Literal["error"], int, str]
+ShardMessage = Union[EventMessage, ResultMessage, DoneMessage, ErrorMessage]
+
+
+class ShardChannel(Protocol):
+    """Where a worker sends its messages, e.g. a ``multiprocessing.Queue``."""
+
+    def put(self, message: Any) -> None: ...
+
+
+def split_into_shards(items: list[T], count: int) -> list[list[T]]:
+    """Deal ``items`` round-robin into at most ``count`` non-empty shards."""
+    if count < 1:
+        raise ValueError("count must be >= 1")
+    shards: list[list[T]] = [[] for _ in range(min(count, len(items)))]
+    for index, item in enumerate(items):
+        shards[index % len(shards)].append(item)
+    return shards
+
+
+def _picklable_log_record(record: logging.LogRecord) -> logging.LogRecord:
+    record = copy.copy(record)
+    record.msg = record.getMessage()
+    record.args = None
+    if record.exc_info:
+        record.exc_text = record.exc_text or logging.Formatter().formatException(
+            record.exc_info
+        )
+        record.exc_info = None
+    return record
+
+
+def _picklable_exception(exception: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
+
+
+def pack_event(
+    event_type: EvaluationEvents,
+    event: EvalRunCreatedEvent | EvalRunUpdatedEvent,
+) -> EventMessage:
+    """Turn a per-item event into a message a worker can send."""
+    if isinstance(event, EvalRunCreatedEvent):
+        return ("event", event_type.value, event, [])
+    exception_details = event.exception_details
+    if exception_details is not None:
+        exception_details = exception_details.model_copy(
+            update={"exception": _picklable_exception(exception_details.exception)}
+        )
+    packed = event.model_copy(
+        update={
+            "spans": [],
+            "logs": [_picklable_log_record(record) for record in event.logs],
+            "exception_details": exception_details,
+        }
+    )
+    return ("event", event_type.value, packed, [serialize_span(s) for s in event.spans])
+
+
+def unpack_event(
+    message: EventMessage,
+) -> tuple[EvaluationEvents, EvalRunCreatedEvent | EvalRunUpdatedEvent]:
+    """Rebuild the event sent by :func:`pack_event`."""
+    _, event_type, event, spans = message
+    if isinstance(event, EvalRunUpdatedEvent):
+        event = event.model_copy(
+            update={"spans": [deserialize_span(span) for span in spans]}
+        )
+    return EvaluationEvents(event_type), event
+
+
+def pack_result(eval_item_id: str, result: UiPathEvalRunResult) -> ResultMessage:
+    """Turn a worker's result for one eval item into a message."""
+    return ("result", eval_item_id, result.model_dump(by_alias=True, mode="json"))
+
+
+def unpack_result(message: ResultMessage) -> tuple[str, UiPathEvalRunResult]:
+    """Rebuild the eval item id and result sent by :func:`pack_result`."""
+    _, eval_item_id, data = message
+    return eval_item_id, UiPathEvalRunResult.model_validate(data)
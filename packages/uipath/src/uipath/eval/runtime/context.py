@@ -20,6 +20,10 @@ class UiPathEvalContext:
     # Optional Fields
     entrypoint: str | None = None
     workers: int | None = 1
+    results_file: str | None = None
+    duration_history_file: str | None = None
+    item_timeout: float | None = None
+    max_retries: int = 0
     eval_set_run_id: str | None = None
     verbose: bool = False
     enable_mocker_cache: bool = False
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from collections import defaultdict
@@ -10,6 +11,7 @@ from time import time
 from typing import (
     Any,
     Awaitable,
+    Callable,
     Iterable,
     Iterator,
     Tuple,
@@ -18,6 +20,7 @@ from typing import (
 import coverage
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.trace import (
+    INVALID_SPAN,
     NonRecordingSpan,
     SpanContext,
     Status,
@@ -29,6 +32,10 @@ from pydantic import BaseModel
 
 from uipath.core.events import EventBus
 from uipath.core.tracing import UiPathTraceManager
+from uipath.platform.common.retry import (
+    exponential_backoff_with_jitter,
+    is_retryable_platform_exception,
+)
 from uipath.runtime import (
     UiPathExecuteOptions,
     UiPathExecutionRuntime,
@@ -76,7 +83,9 @@ from ._exporters import (
     ExecutionSpanExporter,
     ExecutionSpanProcessor,
 )
-from ._parallelization import execute_parallel
+from ._parallelization import SchedulerMetrics, execute_parallel_streaming
+from ._results import EvalRunResultWriter, EvalSetResultAggregator
+from ._scheduling import EvalDurationHistory, longest_first
 from ._spans import (
     configure_eval_set_run_span,
     configure_evaluation_span,
@@ -105,6 +114,9 @@ from .events import (
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the wait between retries of a transient agent failure.
+_MAX_RETRY_BACKOFF_SECONDS = 10.0
+
 
 def _is_user_facing_error(exception: BaseException) -> bool:
     """Whether an exception is a correctly-reported workload failure.
@@ -119,6 +131,22 @@ def _is_user_facing_error(exception: BaseException) -> bool:
     )
 
 
+def _is_transient_error(exception: BaseException) -> bool:
+    """Whether an agent execution failure is worth retrying.
+
+    Walks the cause chain, since agents usually wrap the platform error that
+    actually failed.
+    """
+    current: BaseException | None = exception
+    while current is not None:
+        if isinstance(current, ConnectionError) or is_retryable_platform_exception(
+            current
+        ):
+            return True
+        current = current.__cause__
+    return False
+
+
 def compute_evaluator_scores(
     evaluation_set_results: list[UiPathEvalRunResult],
     evaluators: Iterable[GenericBaseEvaluator[Any, Any, Any]],
@@ -348,6 +376,15 @@ class UiPathEvalRuntime:
 
         self._storage: UiPathRuntimeStorageProtocol | None = None
 
+        self.scheduler_metrics = SchedulerMetrics()
+        self._duration_history = (
+            EvalDurationHistory(context.duration_history_file)
+            if context.duration_history_file
+            else None
+        )
+        # Original index of each item, in the order items are started.
+        self._run_order: list[int] | None = None
+
     async def __aenter__(self) -> UiPathEvalRuntime:
         """Async context manager entry - initialize storage and start coverage if enabled."""
         if self.context.report_coverage:
@@ -360,7 +397,11 @@ class UiPathEvalRuntime:
         """Async context manager exit - stop coverage and clean up execution context."""
         if self.context.report_coverage:
             self.coverage.stop()
-            self.coverage.report(include=["./*"], show_missing=True)
+            self._report_coverage()
+
+    def _report_coverage(self) -> None:
+        """Print the coverage measured while the evaluation set ran."""
+        self.coverage.report(include=["./*"], show_missing=True)
 
     async def get_schema(self) -> UiPathRuntimeSchema:
         """Get the runtime schema from context."""
@@ -380,6 +421,7 @@ class UiPathEvalRuntime:
                 cache_manager = cache_manager_context.get()
                 if cache_manager is not None:
                     cache_manager.flush()
+                    cache_manager.close()
                 cache_manager_context.set(None)
 
     async def initiate_evaluation(
@@ -417,10 +459,65 @@ class UiPathEvalRuntime:
         return (
             self.context.evaluation_set,
             self.context.evaluators,
-            (
-                self._execute_eval(eval_item, self.context.evaluators)
-                for eval_item in self.context.evaluation_set.evaluations
-            ),
+            self._scheduled_evaluations(),
+        )
+
+    def _duration_key(self, eval_item: EvaluationItem) -> str:
+        return f"{self.context.evaluation_set.id}/{eval_item.id}"
+
+    def _scheduled_evaluations(self) -> Iterator[Awaitable[UiPathEvalRunResult]]:
+        """The evaluations of the set, longest expected duration first.
+
+        Without a duration history the items run in eval set order. The
+        original position of each item is kept in ``_run_order``.
+        """
+        evaluations = self.context.evaluation_set.evaluations
+        history = self._duration_history
+        if history is None:
+            self._run_order = None
+            order: list[int] = list(range(len(evaluations)))
+        else:
+            order = longest_first(
+                evaluations, lambda item: history.expected(self._duration_key(item))
+            )
+            self._run_order = order
+        return (
+            self._execute_eval_timed(evaluations[index], self.context.evaluators)
+            for index in order
+        )
+
+    async def _execute_eval_timed(
+        self,
+        eval_item: EvaluationItem,
+        evaluators: list[GenericBaseEvaluator[Any, Any, Any]],
+    ) -> UiPathEvalRunResult:
+        start_time = time()
+        result = await self._execute_eval(eval_item, evaluators)
+        execution_output = result.agent_execution_output
+        suspended = (
+            execution_output is not None
+            and execution_output.result.status == UiPathRuntimeStatus.SUSPENDED
+        )
+        if self._duration_history is not None and not suspended:
+            self._duration_history.record(
+                self._duration_key(eval_item), time() - start_time
+            )
+        return result
+
+    def _save_duration_history(self) -> None:
+        if self._duration_history is None:
+            return
+        try:
+            self._duration_history.save()
+        except OSError as e:
+            logger.warning(f"Could not save eval duration history: {e}")
+
+    def _log_scheduler_metrics(self) -> None:
+        metrics = self.scheduler_metrics
+        logger.debug(
+            f"EVAL RUNTIME: {metrics.completed} evaluation(s) in "
+            f"{metrics.elapsed_seconds:.1f}s on {metrics.workers} worker(s), "
+            f"utilization {metrics.utilization:.0%}"
         )
 
     async def execute(self) -> UiPathRuntimeResult:
@@ -475,35 +572,47 @@ class UiPathEvalRuntime:
                     ) = await self.initiate_evaluation()
                     workers = self.context.workers or 1
                     assert workers >= 1
-                    eval_run_result_list: list[
-                        UiPathEvalRunResult
-                    ] = await execute_parallel(evaluation_iterable, workers)
-
-                    results = UiPathEvalOutput(
-                        evaluation_set_name=evaluation_set.name,
-                        evaluation_set_results=eval_run_result_list,
-                    )
 
-                    # Check for failures
-                    any_failed = any(
-                        eval_run_result.agent_execution_output
-                        and eval_run_result.agent_execution_output.result.error
-                        for eval_run_result in results.evaluation_set_results
+                    # Results are aggregated as each datapoint completes. With a
+                    # results file they are streamed there instead of being kept
+                    # for the final output, so memory does not grow with the set.
+                    aggregator = EvalSetResultAggregator(evaluators)
+                    indexed_results: list[tuple[int, UiPathEvalRunResult]] = []
+                    writer = (
+                        EvalRunResultWriter(self.context.results_file)
+                        if self.context.results_file
+                        else None
                     )
 
-                    # Compute evaluator averages using each evaluator's reducer
-                    _, evaluator_averages = compute_evaluator_scores(
-                        results.evaluation_set_results,
-                        evaluators,
-                    )
+                    def on_result(
+                        index: int, eval_run_result: UiPathEvalRunResult
+                    ) -> None:
+                        aggregator.add(eval_run_result)
+                        if writer is not None:
+                            writer.write(eval_run_result)
+                        else:
+                            indexed_results.append((index, eval_run_result))
 
-                    # Run dataset-level aggregators over the per-datapoint results.
-                    results.dataset_evaluator_results = (
-                        compute_dataset_evaluator_results(
-                            results.evaluation_set_results,
-                            evaluators,
+                    try:
+                        await self._run_evaluations(
+                            evaluation_iterable, workers, on_result
                         )
+                    finally:
+                        if writer is not None:
+                            writer.close()
+                        self._save_duration_history()
+                    self._log_scheduler_metrics()
+
+                    indexed_results.sort(key=lambda item: item[0])
+                    results = UiPathEvalOutput(
+                        evaluation_set_name=evaluation_set.name,
+                        evaluation_set_results=[
+                            eval_run_result for _, eval_run_result in indexed_results
+                        ],
+                        dataset_evaluator_results=aggregator.dataset_evaluator_results(),
                     )
+                    any_failed = aggregator.any_failed
+                    evaluator_averages = aggregator.evaluator_averages()
 
                     # Configure span with output and metadata
                     await configure_eval_set_run_span(
@@ -524,23 +633,9 @@ class UiPathEvalRuntime:
                         wait_for_completion=False,
                     )
 
-                    # Collect triggers from all evaluation runs (pass-through from inner runtime)
+                    # Triggers from all evaluation runs (pass-through from inner runtime)
                     logger.debug("=" * 80)
-                    logger.debug(
-                        "EVAL RUNTIME: Collecting triggers from all evaluation runs"
-                    )
-                    all_triggers = []
-                    for eval_run_result in results.evaluation_set_results:
-                        if (
-                            eval_run_result.agent_execution_output
-                            and eval_run_result.agent_execution_output.result
-                        ):
-                            runtime_result = (
-                                eval_run_result.agent_execution_output.result
-                            )
-                            if runtime_result.triggers:
-                                all_triggers.extend(runtime_result.triggers)
-
+                    all_triggers = aggregator.triggers
                     if all_triggers:
                         logger.debug(
                             f"EVAL RUNTIME: ✅ Passing through {len(all_triggers)} trigger(s) to top-level result"
@@ -553,31 +648,11 @@ class UiPathEvalRuntime:
                         logger.debug("EVAL RUNTIME: No triggers to pass through")
                     logger.debug("=" * 80)
 
-                    # Determine overall status - propagate status from inner runtime
+                    # Overall status propagated from inner runtimes
                     # This is critical for serverless executor to know to save state and suspend job
-                    # Priority: SUSPENDED > FAULTED > SUCCESSFUL
-                    overall_status = UiPathRuntimeStatus.SUCCESSFUL
-                    for eval_run_result in results.evaluation_set_results:
-                        if (
-                            eval_run_result.agent_execution_output
-                            and eval_run_result.agent_execution_output.result
-                        ):
-                            inner_status = (
-                                eval_run_result.agent_execution_output.result.status
-                            )
-                            if inner_status == UiPathRuntimeStatus.SUSPENDED:
-                                overall_status = UiPathRuntimeStatus.SUSPENDED
-                                logger.debug(
-                                    "EVAL RUNTIME: Propagating SUSPENDED status from inner runtime"
-                                )
-                                break  # SUSPENDED takes highest priority, stop checking
-                            elif inner_status == UiPathRuntimeStatus.FAULTED:
-                                overall_status = UiPathRuntimeStatus.FAULTED
-                                # Continue checking in case a later eval is SUSPENDED
-
                     result = UiPathRuntimeResult(
                         output={**results.model_dump(by_alias=True)},
-                        status=overall_status,
+                        status=aggregator.status,
                         triggers=all_triggers if all_triggers else None,
                     )
                     return result
@@ -597,6 +672,61 @@ class UiPathEvalRuntime:
                     )
                     raise
 
+    async def _run_evaluations(
+        self,
+        evaluation_iterable: Iterable[Awaitable[UiPathEvalRunResult]],
+        workers: int,
+        on_result: Callable[[int, UiPathEvalRunResult], None],
+    ) -> None:
+        """Run the evaluations, handing each result to ``on_result`` as it completes.
+
+        Subclasses may run the evaluation set elsewhere (e.g. in worker
+        processes), in which case ``evaluation_iterable`` is left unconsumed.
+        """
+        run_order = self._run_order
+
+        def on_scheduled_result(
+            position: int, eval_run_result: UiPathEvalRunResult
+        ) -> None:
+            index = run_order[position] if run_order is not None else position
+            on_result(index, eval_run_result)
+
+        await execute_parallel_streaming(
+            evaluation_iterable,
+            workers,
+            on_scheduled_result,
+            self.scheduler_metrics,
+        )
+
+    async def execute_shard(
+        self,
+        parent_span_context: SpanContext | None,
+        on_result: Callable[[int, UiPathEvalRunResult], None],
+    ) -> None:
+        """Evaluate this context's items as one shard of a larger eval set run.
+
+        The eval set run itself (its span, its created/updated events and the
+        aggregated output) belongs to the process that sharded the set, so
+        only the per-item work and events happen here. Evaluation spans are
+        parented to ``parent_span_context`` when given.
+        """
+        with self._mocker_cache():
+            parent_span = (
+                NonRecordingSpan(parent_span_context)
+                if parent_span_context is not None
+                else INVALID_SPAN
+            )
+            with use_span(parent_span, end_on_exit=False):
+                try:
+                    await self._run_evaluations(
+                        self._scheduled_evaluations(),
+                        self.context.workers or 1,
+                        on_result,
+                    )
+                finally:
+                    self._save_duration_history()
+            self._log_scheduler_metrics()
+
     async def _execute_eval(
         self,
         eval_item: EvaluationItem,
@@ -664,7 +794,7 @@ class UiPathEvalRuntime:
                                 update={"model": ModelSettings(model=mocking_model)}
                             )
 
-                    agent_execution_output = await self.execute_runtime(
+                    agent_execution_output = await self._execute_runtime_with_retries(
                         eval_item,
                         execution_id,
                         input_overrides=self.context.input_overrides,
@@ -979,6 +1109,40 @@ class UiPathEvalRuntime:
 
         return spans, logs
 
+    async def _execute_runtime_with_retries(
+        self,
+        eval_item: EvaluationItem,
+        execution_id: str,
+        **kwargs: Any,
+    ) -> UiPathEvalRunExecutionOutput:
+        """Execute the runtime, retrying transient failures up to ``max_retries`` times.
+
+        Timeouts are not retried: an agent that hung once will likely hang
+        again. Resumed executions are never retried either.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self.execute_runtime(eval_item, execution_id, **kwargs)
+            except EvaluationRuntimeException as e:
+                attempt += 1
+                if (
+                    self.context.resume
+                    or attempt > self.context.max_retries
+                    or not _is_transient_error(e.root_exception)
+                ):
+                    raise
+                delay = min(
+                    exponential_backoff_with_jitter(attempt, 1.0),
+                    _MAX_RETRY_BACKOFF_SECONDS,
+                )
+                logger.warning(
+                    f"Evaluation '{eval_item.name}' failed with a transient error "
+                    f"({e.root_exception}); retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1} of {self.context.max_retries + 1})"
+                )
+                await asyncio.sleep(delay)
+
     async def execute_runtime(
         self,
         eval_item: EvaluationItem,
@@ -1048,10 +1212,20 @@ class UiPathEvalRuntime:
 
                 # Always pass UiPathExecuteOptions explicitly for consistency with debug flow
                 options = UiPathExecuteOptions(resume=self.context.resume)
-                result = await execution_runtime.execute(
-                    input=input,
-                    options=options,
-                )
+                try:
+                    # The agent run is cancelled when it exceeds the timeout.
+                    result = await asyncio.wait_for(
+                        execution_runtime.execute(
+                            input=input,
+                            options=options,
+                        ),
+                        timeout=self.context.item_timeout,
+                    )
+                except asyncio.TimeoutError as e:
+                    raise TimeoutError(
+                        f"Agent execution exceeded the "
+                        f"{self.context.item_timeout}s evaluation timeout"
+                    ) from e
 
                 # Log suspend status if applicable
                 if result.status == UiPathRuntimeStatus.SUSPENDED:
@@ -1,6 +1,7 @@
 """Tracing utilities and OpenTelemetry exporters."""
 
 from uipath.core import traced
+from uipath.core.tracing import GeneratorOutputCapture
 from uipath.platform.common._reference_context import (
     ReferenceContext,
     ReferenceContextAccessor,
@@ -22,6 +23,7 @@ from ._otel_exporters import (  # noqa: D104
 
 __all__ = [
     "traced",
+    "GeneratorOutputCapture",
     "LlmOpsHttpExporter",
     "JsonLinesFileExporter",
     "LiveTrackingSpanProcessor",
@@ -1,8 +1,13 @@
+import gzip
+import importlib.util
 import json
 import logging
 import os
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, List, Optional, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Tuple
 
 import httpx
 from opentelemetry.sdk.trace import ReadableSpan
@@ -24,10 +29,23 @@ from uipath.platform.constants import (
     HEADER_INTERNAL_TENANT_ID,
 )
 
+from ._span_spool import DEFAULT_SPOOL_MAX_BYTES, SpanSpool
+
 logger = logging.getLogger(__name__)
 
 _NIL_UUID = "00000000-0000-0000-0000-000000000000"
 
+SpanCompression = Literal["gzip", "zstd"]
+
+_COMPRESSION_ENV = "UIPATH_TRACE_COMPRESSION"
+_SPOOL_PATH_ENV = "UIPATH_TRACE_SPOOL_PATH"
+_SPOOL_MAX_BACKOFF = 60.0
+_SPOOL_SHUTDOWN_GRACE_MILLIS = 5000
+# How often to look for batches another process claimed or uploaded.
+_SPOOL_POLL_SECONDS = 0.5
+_MAX_IN_FLIGHT_ENV = "UIPATH_TRACE_MAX_IN_FLIGHT"
+_GZIP_LEVEL = 6
+
 
 def _normalize_process_key(value: Optional[str]) -> Optional[str]:
     return None if not value or value == _NIL_UUID else value
@@ -43,6 +61,68 @@ def _safe_parse_json(s: Any) -> Any:
         return s
 
 
+def _group_by_trace(
+    span_list: List[Dict[str, Any]],
+) -> List[List[Dict[str, Any]]]:
+    """Split spans into batches sharing a trace id and source, keeping order.
+
+    The trace id and source are sent as URL parameters, so spans of different
+    traces must not share a request.
+    """
+    groups: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+    for span_data in span_list:
+        key = (span_data.get("TraceId"), span_data.get("Source"))
+        groups.setdefault(key, []).append(span_data)
+    return list(groups.values())
+
+
+def _resolve_compression(
+    compression: Optional[str],
+) -> Optional[SpanCompression]:
+    """Validate the requested body encoding, falling back from zstd to gzip.
+
+    zstd needs the optional ``zstandard`` package.
+    """
+    if compression is None:
+        compression = os.environ.get(_COMPRESSION_ENV) or None
+        if compression and compression not in ("gzip", "zstd", "none"):
+            logger.warning(
+                "Ignoring unsupported %s value %r", _COMPRESSION_ENV, compression
+            )
+            return None
+    if compression is None or compression == "none":
+        return None
+    if compression not in ("gzip", "zstd"):
+        raise ValueError(f"Unsupported span compression: {compression!r}")
+    if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+        logger.warning("zstandard is not installed; compressing spans with gzip")
+        return "gzip"
+    return compression  # type: ignore[return-value]
+
+
+def _resolve_max_in_flight(max_in_flight: Optional[int]) -> int:
+    if max_in_flight is None:
+        value = os.environ.get(_MAX_IN_FLIGHT_ENV, "")
+        try:
+            max_in_flight = int(value) if value else 0
+        except ValueError:
+            logger.warning(
+                "Ignoring non-integer %s value %r", _MAX_IN_FLIGHT_ENV, value
+            )
+            max_in_flight = 0
+    if max_in_flight < 0:
+        raise ValueError("max_in_flight must be >= 0")
+    return max_in_flight
+
+
+def _compress(body: bytes, compression: SpanCompression) -> bytes:
+    if compression == "zstd":
+        import zstandard  # type: ignore[import-not-found]
+
+        return zstandard.ZstdCompressor().compress(body)
+    return gzip.compress(body, compresslevel=_GZIP_LEVEL)
+
+
 def _get_llm_messages(attributes: Dict[str, Any], prefix: str) -> List[Dict[str, Any]]:
     """Extracts and reconstructs LLM messages from flattened attributes."""
     messages: dict[int, dict[str, Any]] = {}
@@ -107,13 +187,47 @@ class LlmOpsHttpExporter(SpanExporter):
     def __init__(
         self,
         trace_id: Optional[str] = None,
+        *,
+        compression: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+        spool_path: Optional[str] = None,
+        spool_max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
     ):
         """Initialize the exporter with the base URL and authentication token.
 
         Args:
             trace_id: Optional trace ID to use for all spans
+            compression: Request body encoding, ``"gzip"``, ``"zstd"`` (needs
+                the ``zstandard`` package, otherwise gzip is used) or
+                ``"none"``. Defaults to ``UIPATH_TRACE_COMPRESSION``, or no
+                compression when unset.
+            max_in_flight: Maximum span uploads running in the background.
+                With 0, :meth:`export` sends synchronously and reports the
+                upload result. With a positive value, :meth:`export` queues the
+                uploads and returns at once, blocking only while that many
+                uploads are already pending; failures are logged.
+                Defaults to ``UIPATH_TRACE_MAX_IN_FLIGHT``, or 0 when unset.
+            spool_path: SQLite file spans are written to before upload.
+                :meth:`export` then only appends to the spool and a background
+                thread uploads it, keeping batches that cannot be sent for
+                later, including batches left over by a previous process.
+                Takes precedence over ``max_in_flight``. Defaults to
+                ``UIPATH_TRACE_SPOOL_PATH``, or no spool when unset.
+            spool_max_bytes: Size cap of the spool; the oldest batches are
+                dropped beyond it.
         """
         super().__init__()
+        self.compression = _resolve_compression(compression)
+        self.max_in_flight = _resolve_max_in_flight(max_in_flight)
+        self._uploads: Optional[ThreadPoolExecutor] = None
+        self._upload_slots: Optional[threading.BoundedSemaphore] = None
+        self._pending_uploads: Set[Future[SpanExportResult]] = set()
+        self._pending_lock = threading.Lock()
+        if self.max_in_flight:
+            self._uploads = ThreadPoolExecutor(
+                max_workers=self.max_in_flight, thread_name_prefix="llmops-export"
+            )
+            self._upload_slots = threading.BoundedSemaphore(self.max_in_flight)
         self.base_url = self._get_base_url()
         self.auth_token = os.environ.get(ENV_UIPATH_ACCESS_TOKEN)
         self.headers: dict[str, str] = {
@@ -131,6 +245,10 @@ class LlmOpsHttpExporter(SpanExporter):
 
         self.http_client = httpx.Client(**client_kwargs)
         self.trace_id = trace_id
+        self.spool: Optional[SpanSpool] = None
+        spool_path = spool_path or os.environ.get(_SPOOL_PATH_ENV) or None
+        if spool_path:
+            self._start_spool(spool_path, spool_max_bytes)
 
     def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
         """Export spans to UiPath LLM Ops."""
@@ -151,8 +269,6 @@ class LlmOpsHttpExporter(SpanExporter):
             for span in spans
         ]
 
-        url = self._build_url(span_list)
-
         # Process spans in-place - work directly with dict
         for span_data in span_list:
             if "ProcessKey" in span_data:
@@ -170,16 +286,174 @@ class LlmOpsHttpExporter(SpanExporter):
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Payload: %s", json.dumps(span_list))
 
-        return self._send_with_retries(url, span_list)
+        result = SpanExportResult.SUCCESS
+        for group in _group_by_trace(span_list):
+            url = self._build_url(group)
+            if self.spool is not None and self._spool_batch(url, group):
+                continue
+            if self._uploads is not None:
+                self._submit_upload(url, group)
+            elif self._send_with_retries(url, group) != SpanExportResult.SUCCESS:
+                result = SpanExportResult.FAILURE
+        return result
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        """Force flush the exporter."""
-        return True
+        """Wait for background uploads to finish.
+
+        Returns:
+            False if uploads were still pending after ``timeout_millis``.
+        """
+        if self.spool is not None:
+            # Batches exported here may be uploaded, or evicted, by another
+            # process sharing the spool, which will not notify this one.
+            deadline = time.monotonic() + timeout_millis / 1000
+            while self.spool.pending():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                with self._spool_drained:
+                    self._spool_drained.wait(min(remaining, _SPOOL_POLL_SECONDS))
+            return True
+        with self._pending_lock:
+            pending = set(self._pending_uploads)
+        if not pending:
+            return True
+        _, not_done = wait(pending, timeout=timeout_millis / 1000)
+        return not not_done
 
     def shutdown(self) -> None:
-        """Close the HTTP client."""
+        """Flush background uploads and close the HTTP client.
+
+        With a spool, uploads get a short grace period; batches still spooled
+        afterwards are uploaded by the next exporter using the same spool.
+        """
+        if self.spool is not None:
+            self.force_flush(_SPOOL_SHUTDOWN_GRACE_MILLIS)
+            self._spool_stop.set()
+            self._spool_wakeup.set()
+            self._spool_drainer.join(timeout=_SPOOL_SHUTDOWN_GRACE_MILLIS / 1000)
+            if len(self.spool):
+                logger.info(
+                    "%d span batches left in %s", len(self.spool), self.spool.path
+                )
+            if not self._spool_drainer.is_alive():
+                self.spool.close()
+        if self._uploads is not None:
+            if not self.force_flush():
+                logger.warning("Dropping span uploads still pending at shutdown")
+            self._uploads.shutdown(wait=False, cancel_futures=True)
         self.http_client.close()
 
+    def _start_spool(self, path: str, max_bytes: int) -> None:
+        self.spool = SpanSpool(path, max_bytes=max_bytes)
+        self._spool_wakeup = threading.Event()
+        self._spool_stop = threading.Event()
+        self._spool_drained = threading.Condition()
+        self._spool_drainer = threading.Thread(
+            target=self._drain_spool, name="llmops-spool", daemon=True
+        )
+        self._spool_drainer.start()
+
+    def _spool_batch(self, url: str, payload: list[Dict[str, Any]]) -> bool:
+        """Append a batch to the spool; False if it must be sent directly."""
+        assert self.spool is not None
+        if not self._spool_drainer.is_alive():
+            # Nothing would upload the batch, so send it now.
+            return False
+        try:
+            self.spool.append(url, payload)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to spool spans, sending them directly: {e}")
+            return False
+        self._spool_wakeup.set()
+        return True
+
+    def _drain_spool(self) -> None:
+        """Upload spooled batches until stopped, retrying after spool errors."""
+        assert self.spool is not None
+        failures = 0
+        errors = 0
+        while not self._spool_stop.is_set():
+            try:
+                failures = self._drain_spool_once(failures)
+            except sqlite3.Error as e:
+                errors += 1
+                logger.error(f"Failed to drain the span spool: {e}")
+                self._spool_stop.wait(min(1.5**errors, _SPOOL_MAX_BACKOFF))
+            else:
+                errors = 0
+
+    def _drain_spool_once(self, failures: int) -> int:
+        """Upload the next claimed batches oldest first, backing off while offline.
+
+        Returns:
+            The number of consecutive failed uploads.
+        """
+        assert self.spool is not None
+        self._spool_wakeup.clear()
+        batches = self.spool.claim()
+        if not batches:
+            with self._spool_drained:
+                self._spool_drained.notify_all()
+            # Our batches may still be claimed by a process that dies;
+            # look again once its claim can have expired.
+            self._spool_wakeup.wait(
+                _SPOOL_POLL_SECONDS if self.spool.pending() else None
+            )
+            return failures
+        unsent = [batch.id for batch in batches]
+        backoff = 0.0
+        try:
+            for batch in batches:
+                sent = self._try_send(
+                    batch.url, self._request_body(batch.payload), failures
+                )
+                if sent is None:
+                    failures += 1
+                    backoff = min(1.5**failures, _SPOOL_MAX_BACKOFF)
+                    break
+                if not sent:
+                    logger.warning("Dropping a span batch rejected by LLM Ops")
+                failures = 0
+                self.spool.remove(batch.id)
+                unsent.remove(batch.id)
+                with self._spool_drained:
+                    self._spool_drained.notify_all()
+                if self._spool_stop.is_set():
+                    break
+        finally:
+            if unsent:
+                # Let other processes, or the next exporter, upload them.
+                self.spool.release(unsent)
+        if backoff:
+            self._spool_stop.wait(backoff)
+        return failures
+
+    def _submit_upload(self, url: str, payload: list[Dict[str, Any]]) -> None:
+        """Queue an upload, blocking while ``max_in_flight`` are pending."""
+        assert self._uploads is not None and self._upload_slots is not None
+        self._upload_slots.acquire()
+        try:
+            future = self._uploads.submit(self._send_with_retries, url, payload)
+        except BaseException:
+            self._upload_slots.release()
+            raise
+        with self._pending_lock:
+            self._pending_uploads.add(future)
+        future.add_done_callback(self._upload_done)
+
+    def _upload_done(self, future: "Future[SpanExportResult]") -> None:
+        with self._pending_lock:
+            self._pending_uploads.discard(future)
+        if self._upload_slots is not None:
+            self._upload_slots.release()
+        if future.cancelled():
+            return
+        if future.exception() is not None or future.result() != (
+            SpanExportResult.SUCCESS
+        ):
+            logger.warning("Failed to upload a batch of spans to LLM Ops")
+
     def upsert_span(
         self,
         span: ReadableSpan,
@@ -399,26 +673,46 @@ class LlmOpsHttpExporter(SpanExporter):
         self, url: str, payload: list[Dict[str, Any]], max_retries: int = 4
     ) -> SpanExportResult:
         """Send the HTTP request with retry logic."""
+        request_kwargs = self._request_body(payload)
         for attempt in range(max_retries):
-            try:
-                response = self.http_client.post(url, json=payload)
-                if response.status_code == 200:
-                    return SpanExportResult.SUCCESS
-
-                logger.warning(
-                    f"Attempt {attempt + 1} failed with status code {response.status_code}: {response.text}"
-                )
-
-                if response.status_code in NON_RETRYABLE_STATUS_CODES:
-                    return SpanExportResult.FAILURE
-            except Exception as e:
-                logger.error(f"Attempt {attempt + 1} failed with exception: {e}")
+            sent = self._try_send(url, request_kwargs, attempt)
+            if sent is not None:
+                return SpanExportResult.SUCCESS if sent else SpanExportResult.FAILURE
 
             if attempt < max_retries - 1:
                 time.sleep(1.5**attempt)  # Exponential backoff
 
         return SpanExportResult.FAILURE
 
+    def _try_send(
+        self, url: str, request_kwargs: Dict[str, Any], attempt: int
+    ) -> Optional[bool]:
+        """Post once; None if the request may succeed when retried."""
+        try:
+            response = self.http_client.post(url, **request_kwargs)
+            if response.status_code == 200:
+                return True
+
+            logger.warning(
+                f"Attempt {attempt + 1} failed with status code {response.status_code}: {response.text}"
+            )
+
+            if response.status_code in NON_RETRYABLE_STATUS_CODES:
+                return False
+        except Exception as e:
+            logger.error(f"Attempt {attempt + 1} failed with exception: {e}")
+        return None
+
+    def _request_body(self, payload: list[Dict[str, Any]]) -> Dict[str, Any]:
+        """Keyword arguments carrying ``payload``, encoded once for all retries."""
+        if self.compression is None:
+            return {"json": payload}
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return {
+            "content": _compress(body.encode("utf-8"), self.compression),
+            "headers": {"Content-Encoding": self.compression},
+        }
+
     def _get_base_url(self) -> str:
         trace_base_url = os.environ.get("UIPATH_TRACE_BASE_URL")
         if trace_base_url:
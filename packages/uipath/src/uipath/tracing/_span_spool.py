@@ -0,0 +1,200 @@
+"""Disk-backed spool of span batches waiting to be uploaded.
+
+Batches are appended to a SQLite database before any network call, so spans
+survive connectivity loss and process restarts: whatever is still spooled when
+a process exits is replayed by the next exporter opening the same file. The
+spool is capped by payload size; once full, the oldest batches are evicted.
+
+Several processes may share one file (eval workers inherit
+``UIPATH_TRACE_SPOOL_PATH``). Uploaders claim batches for a while before
+sending them, so each batch is uploaded by one process only; batches claimed
+by a process that dies are claimed again once the claim expires.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CLAIM_SECONDS = 300.0
+
+# SQLite limits the number of parameters of a single statement.
+_QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS span_batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    claimed_until REAL NOT NULL DEFAULT 0
+)
+"""
+
+
+class SpooledBatch(NamedTuple):
+    """A span batch read back from the spool."""
+
+    id: int
+    url: str
+    payload: List[Dict[str, Any]]
+
+
+class SpanSpool:
+    """Append-only SQLite queue of span batches, oldest first.
+
+    Safe to share between threads and processes. Counts are read from the
+    database, so they include batches appended by other processes. Batches
+    larger than ``max_bytes`` on their own are still stored, evicting
+    everything older.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_SPOOL_MAX_BYTES,
+        claim_seconds: float = DEFAULT_CLAIM_SECONDS,
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.claim_seconds = claim_seconds
+        self._lock = threading.Lock()
+        self._appended: Set[int] = set()
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM span_batches"
+            ).fetchone()
+        return count
+
+    @property
+    def size_bytes(self) -> int:
+        """Total payload size of the spooled batches."""
+        with self._lock:
+            return self._size_bytes()
+
+    def pending(self) -> int:
+        """Batches appended through this instance that are still spooled."""
+        with self._lock:
+            ids = list(self._appended)
+            remaining: Set[int] = set()
+            for start in range(0, len(ids), _QUERY_CHUNK_SIZE):
+                chunk = ids[start : start + _QUERY_CHUNK_SIZE]
+                rows = self._connection.execute(
+                    "SELECT id FROM span_batches "
+                    f"WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                remaining.update(row_id for (row_id,) in rows)
+            self._appended = remaining
+        return len(remaining)
+
+    def append(self, url: str, payload: List[Dict[str, Any]]) -> None:
+        """Store a batch, evicting the oldest ones beyond ``max_bytes``."""
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        size = len(body.encode("utf-8"))
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO span_batches (url, payload, size) VALUES (?, ?, ?)",
+                (url, body, size),
+            )
+            if cursor.lastrowid is not None:
+                self._appended.add(cursor.lastrowid)
+            if self._size_bytes() > self.max_bytes:
+                self._evict()
+
+    def claim(self, limit: int = 16) -> List[SpooledBatch]:
+        """Oldest ``limit`` batches nobody else is uploading, claimed for us.
+
+        Claimed batches stay in the spool until removed, or until released or
+        their claim expires, after which they can be claimed again.
+        """
+        with self._lock:
+            now = time.time()
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._connection.execute(
+                    "SELECT id, url, payload FROM span_batches "
+                    "WHERE claimed_until <= ? ORDER BY id LIMIT ?",
+                    (now, limit),
+                ).fetchall()
+                self._connection.executemany(
+                    "UPDATE span_batches SET claimed_until = ? WHERE id = ?",
+                    [(now + self.claim_seconds, row[0]) for row in rows],
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return [
+            SpooledBatch(id=row_id, url=url, payload=json.loads(payload))
+            for row_id, url, payload in rows
+        ]
+
+    def release(self, batch_ids: List[int]) -> None:
+        """Give up the claim on batches that could not be uploaded yet."""
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE span_batches SET claimed_until = 0 WHERE id = ?",
+                [(batch_id,) for batch_id in batch_ids],
+            )
+
+    def remove(self, batch_id: int) -> None:
+        """Drop an uploaded (or undeliverable) batch."""
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM span_batches WHERE id = ?", (batch_id,)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _size_bytes(self) -> int:
+        (size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM span_batches"
+        ).fetchone()
+        return size
+
+    def _evict(self) -> None:
+        """Delete the oldest batches until the spool fits ``max_bytes``.
+
+        The newest batch is never evicted, whatever its size.
+        """
+        budget = self._size_bytes() - self.max_bytes
+        evicted = evicted_bytes = 0
+        rows = self._connection.execute(
+            "SELECT id, size FROM span_batches ORDER BY id"
+        ).fetchall()
+        for row_id, size in rows[:-1]:
+            if evicted_bytes >= budget:
+                break
+            evicted += 1
+            evicted_bytes += size
+            last_id = row_id
+        if not evicted:
+            return
+        self._connection.execute("DELETE FROM span_batches WHERE id <= ?", (last_id,))
+        logger.warning(
+            "Span spool %s is full; dropped %d oldest batches (%d bytes)",
+            self.path,
+            evicted,
+            evicted_bytes,
+        )
@@ -10,7 +10,14 @@ import pytest
 
 from uipath._cli._chat._bridge import SocketIOChatBridge, get_chat_bridge
 from uipath._cli._debug._bridge import SignalRDebugBridge
-from uipath.core.chat import UiPathConversationMessageEvent
+from uipath.core.chat import (
+    UiPathConversationContentPartChunkEvent,
+    UiPathConversationContentPartEvent,
+    UiPathConversationEvent,
+    UiPathConversationExchangeEvent,
+    UiPathConversationMessageEndEvent,
+    UiPathConversationMessageEvent,
+)
 from uipath.core.triggers import UiPathApiTrigger, UiPathResumeTrigger
 from uipath.platform.constants import (
     HEADER_INTERNAL_ACCOUNT_ID,
@@ -1200,3 +1207,139 @@ class TestWaitForResumeEdgeCases:
         assert len(bridge._tool_resume_results) == 0
         assert len(bridge._tool_resume_pending) == 0
         assert len(bridge._expected_tool_call_ids) == 0
+
+
+class TestChunkCoalescing:
+    """Tests for merging consecutive text chunks into fewer websocket frames."""
+
+    def _make_bridge(self, **kwargs: Any) -> SocketIOChatBridge:
+        bridge = SocketIOChatBridge(
+            websocket_url="wss://test.example.com",
+            websocket_path="/socket.io",
+            conversation_id="conv-123",
+            exchange_id="exch-456",
+            headers={},
+            **kwargs,
+        )
+        bridge._client = AsyncMock()
+        bridge._connected_event.set()
+        return bridge
+
+    def _chunk(
+        self, data: str, content_part_id: str = "cp-1"
+    ) -> UiPathConversationMessageEvent:
+        return UiPathConversationMessageEvent(
+            message_id="msg-1",
+            content_part=UiPathConversationContentPartEvent(
+                content_part_id=content_part_id,
+                chunk=UiPathConversationContentPartChunkEvent(data=data),
+            ),
+        )
+
+    def _sent(self, bridge: SocketIOChatBridge) -> list[dict[str, Any]]:
+        return [
+            call.args[1]
+            for call in cast(AsyncMock, bridge._client).emit.await_args_list
+        ]
+
+    def _sent_texts(self, bridge: SocketIOChatBridge) -> list[str | None]:
+        return [
+            event["exchange"]
+            .get("message", {})
+            .get("contentPart", {})
+            .get("chunk", {})
+            .get("data")
+            for event in self._sent(bridge)
+        ]
+
+    @pytest.mark.anyio
+    async def test_chunks_within_window_are_merged(self) -> None:
+        bridge = self._make_bridge(chunk_window=10)
+
+        for token in ["Hel", "lo", ", ", "world"]:
+            await bridge.emit_message_event(self._chunk(token))
+        # The first chunk after a quiet period goes out right away.
+        assert self._sent_texts(bridge) == ["Hel"]
+
+        await bridge.flush()
+
+        assert self._sent_texts(bridge) == ["Hel", "lo, world"]
+        assert bridge.chunks_received == 4
+        assert bridge.chunk_frames_sent == 2
+
+    @pytest.mark.anyio
+    async def test_merged_chunks_are_sent_when_window_ends(self) -> None:
+        bridge = self._make_bridge(chunk_window=0.05)
+
+        await bridge.emit_message_event(self._chunk("a"))
+        await bridge.emit_message_event(self._chunk("b"))
+        await bridge.emit_message_event(self._chunk("c"))
+        await asyncio.sleep(0.2)
+
+        assert self._sent_texts(bridge) == ["a", "bc"]
+
+    @pytest.mark.anyio
+    async def test_other_events_flush_merged_chunks_first(self) -> None:
+        bridge = self._make_bridge(chunk_window=10)
+
+        await bridge.emit_message_event(self._chunk("a"))
+        await bridge.emit_message_event(self._chunk("b"))
+        await bridge.emit_message_event(self._chunk("c", content_part_id="cp-2"))
+        await bridge.emit_message_event(
+            UiPathConversationMessageEvent(
+                message_id="msg-1", end=UiPathConversationMessageEndEvent()
+            )
+        )
+        await bridge.emit_exchange_end_event()
+
+        sent = self._sent(bridge)
+        assert self._sent_texts(bridge)[:3] == ["a", "b", "c"]
+        assert sent[2]["exchange"]["message"]["contentPart"]["contentPartId"] == "cp-2"
+        assert "endMessage" in sent[3]["exchange"]["message"]
+        assert "endExchange" in sent[4]["exchange"]
+
+    @pytest.mark.anyio
+    async def test_size_limit_sends_without_waiting(self) -> None:
+        bridge = self._make_bridge(chunk_window=10, chunk_max_bytes=4)
+
+        for token in ["a", "bb", "cc", "d"]:
+            await bridge.emit_message_event(self._chunk(token))
+
+        assert self._sent_texts(bridge) == ["a", "bbcc"]
+
+    @pytest.mark.anyio
+    async def test_zero_window_sends_every_chunk(self) -> None:
+        bridge = self._make_bridge(chunk_window=0)
+
+        for token in ["a", "b", "c"]:
+            await bridge.emit_message_event(self._chunk(token))
+
+        assert self._sent_texts(bridge) == ["a", "b", "c"]
+
+    @pytest.mark.anyio
+    async def test_interrupt_flushes_merged_chunks(self) -> None:
+        bridge = self._make_bridge(chunk_window=10)
+
+        await bridge.emit_message_event(self._chunk("a"))
+        await bridge.emit_message_event(self._chunk("b"))
+        await bridge.emit_interrupt_event(
+            UiPathResumeTrigger(
+                api_resume=UiPathApiTrigger(request={"tool_call_id": "tc-1"})
+            )
+        )
+
+        assert self._sent_texts(bridge) == ["a", "b"]
+
+    @pytest.mark.anyio
+    async def test_merged_frame_matches_the_model_serialization(self) -> None:
+        bridge = self._make_bridge(chunk_window=10)
+
+        await bridge.emit_message_event(self._chunk("hi"))
+
+        expected = UiPathConversationEvent(
+            conversation_id="conv-123",
+            exchange=UiPathConversationExchangeEvent(
+                exchange_id="exch-456", message=self._chunk("hi")
+            ),
+        ).model_dump(mode="json", exclude_none=True, by_alias=True)
+        assert self._sent(bridge) == [expected]
@@ -2,6 +2,7 @@
 
 import tempfile
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -16,6 +17,7 @@ def cache_manager():
         cm = CacheManager(cache_dir=Path(tmpdir))
         cache_manager_context.set(cm)
         yield cm
+        cm.close()
         cache_manager_context.set(None)
 
 
@@ -160,3 +162,97 @@ def test_cache_invalidation_on_model_settings_change(cache_manager):
     )
 
     assert cached_response is None
+
+
+def _key(i: int) -> dict[str, Any]:
+    return {"prompt_generation_args": {"input": f"input {i}"}}
+
+
+def test_entries_persist_across_instances(tmp_path):
+    """Flushed entries are read back by a new cache manager."""
+    writer = CacheManager(cache_dir=tmp_path)
+    writer.set("llm_mocker", _key(1), {"result": 1}, "fn")
+    writer.flush()
+    writer.close()
+
+    reader = CacheManager(cache_dir=tmp_path)
+    assert reader.get("llm_mocker", _key(1), "fn") == {"result": 1}
+    assert reader.get("llm_mocker", _key(2), "fn") is None
+    reader.close()
+    # A single database file instead of one file per entry.
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".json"] == []
+
+
+def test_concurrent_writers_keep_each_others_entries(tmp_path):
+    """Managers sharing a cache directory (e.g. eval worker processes) do not clobber each other."""
+    first = CacheManager(cache_dir=tmp_path)
+    second = CacheManager(cache_dir=tmp_path)
+    first.set("llm_mocker", _key(1), "one", "fn")
+    second.set("llm_mocker", _key(2), "two", "fn")
+    first.flush()
+    second.flush()
+    first.close()
+    second.close()
+
+    reader = CacheManager(cache_dir=tmp_path)
+    assert reader.get("llm_mocker", _key(1), "fn") == "one"
+    assert reader.get("llm_mocker", _key(2), "fn") == "two"
+    reader.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Once over the size limit, the entries used longest ago are dropped."""
+    cm = CacheManager(cache_dir=tmp_path, max_size_bytes=30)
+    cm.set("llm_mocker", _key(1), "a" * 10, "fn")
+    cm.flush()
+    cm.set("llm_mocker", _key(2), "b" * 10, "fn")
+    cm.flush()
+    cm.close()
+
+    # Reading entry 1 makes entry 2 the least recently used one.
+    cm = CacheManager(cache_dir=tmp_path, max_size_bytes=30)
+    assert cm.get("llm_mocker", _key(1), "fn") == "a" * 10
+    cm.set("llm_mocker", _key(3), "c" * 10, "fn")
+    cm.flush()
+    cm.close()
+
+    reader = CacheManager(cache_dir=tmp_path)
+    assert reader.get("llm_mocker", _key(1), "fn") == "a" * 10
+    assert reader.get("llm_mocker", _key(2), "fn") is None
+    assert reader.get("llm_mocker", _key(3), "fn") == "c" * 10
+    reader.close()
+
+
+def test_reads_and_migrates_legacy_json_entries(tmp_path):
+    """Entries cached by earlier versions as JSON files are still found."""
+    import hashlib
+    import json
+
+    key_hash = hashlib.sha256(json.dumps(_key(1), sort_keys=True).encode()).hexdigest()
+    legacy_path = tmp_path / "llm_mocker" / "fn" / f"{key_hash}.json"
+    legacy_path.parent.mkdir(parents=True)
+    legacy_path.write_text(json.dumps({"result": "legacy"}))
+
+    cm = CacheManager(cache_dir=tmp_path)
+    assert cm.get("llm_mocker", _key(1), "fn") == {"result": "legacy"}
+    cm.flush()
+    cm.close()
+    # Migrated files are removed, along with the directories they leave empty.
+    assert not (tmp_path / "llm_mocker").exists()
+
+    reader = CacheManager(cache_dir=tmp_path)
+    assert reader.get("llm_mocker", _key(1), "fn") == {"result": "legacy"}
+    reader.close()
+
+
+def test_misses_skip_legacy_lookup_without_legacy_layout(tmp_path, monkeypatch):
+    """Without legacy directories a miss does not look for a legacy file."""
+
+    def fail(*args: Any) -> Path:
+        raise AssertionError("legacy cache path computed")
+
+    cm = CacheManager(cache_dir=tmp_path)
+    monkeypatch.setattr(cm, "_get_legacy_cache_path", fail)
+
+    assert cm.get("llm_mocker", _key(1), "fn") is None
+    cm.close()
@@ -0,0 +1,371 @@
+"""Tests for running an evaluation set sharded across worker processes."""
+
+import logging
+import os
+import pickle
+import uuid
+from pathlib import Path
+from typing import Any, AsyncGenerator
+
+import coverage
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from uipath._cli._evals._processes import (
+    EvalShard,
+    ProcessShardedEvalRuntime,
+    _coverage_data_file,
+    run_eval_shard,
+    shard_trace_file,
+)
+from uipath._cli.cli_eval import _shard_cli_args
+from uipath._cli.cli_eval import eval as eval_command
+from uipath.core.events import EventBus
+from uipath.core.tracing import UiPathTraceManager
+from uipath.eval.helpers import EvalHelpers
+from uipath.eval.models.models import EvaluationResultDto
+from uipath.eval.runtime import UiPathEvalContext
+from uipath.eval.runtime._sharding import (
+    pack_event,
+    pack_result,
+    split_into_shards,
+    unpack_event,
+    unpack_result,
+)
+from uipath.eval.runtime._types import UiPathEvalRunResult, UiPathEvalRunResultDto
+from uipath.eval.runtime.events import (
+    EvalItemExceptionDetails,
+    EvalRunCreatedEvent,
+    EvalRunUpdatedEvent,
+    EvaluationEvents,
+)
+from uipath.runtime import (
+    UiPathExecuteOptions,
+    UiPathRuntimeEvent,
+    UiPathRuntimeFactorySettings,
+    UiPathRuntimeProtocol,
+    UiPathRuntimeResult,
+    UiPathRuntimeStatus,
+    UiPathRuntimeStorageProtocol,
+    UiPathStreamOptions,
+)
+from uipath.runtime.schema import UiPathRuntimeSchema
+
+EVAL_SET_PATH = str(Path(__file__).parent / "evals" / "eval-sets" / "default.json")
+
+
+class IdentityRuntime:
+    async def execute(
+        self,
+        input: dict[str, Any] | None = None,
+        options: UiPathExecuteOptions | None = None,
+    ) -> UiPathRuntimeResult:
+        return UiPathRuntimeResult(
+            output=input or {}, status=UiPathRuntimeStatus.SUCCESSFUL
+        )
+
+    async def stream(
+        self,
+        input: dict[str, Any] | None = None,
+        options: UiPathStreamOptions | None = None,
+    ) -> AsyncGenerator[UiPathRuntimeEvent, None]:
+        yield await self.execute(input, None)
+
+    async def get_schema(self) -> UiPathRuntimeSchema:
+        return UiPathRuntimeSchema(
+            filePath="test.py",
+            uniqueId="test",
+            type="workflow",
+            input={"type": "object", "properties": {}},
+            output={"type": "object", "properties": {}},
+        )
+
+    async def dispose(self) -> None:
+        pass
+
+
+class IdentityFactory:
+    def discover_entrypoints(self) -> list[str]:
+        return ["test"]
+
+    async def get_storage(self) -> UiPathRuntimeStorageProtocol | None:
+        return None
+
+    async def get_settings(self) -> UiPathRuntimeFactorySettings | None:
+        return None
+
+    async def new_runtime(
+        self, entrypoint: str, runtime_id: str, **kwargs
+    ) -> UiPathRuntimeProtocol:
+        return IdentityRuntime()
+
+    async def dispose(self) -> None:
+        pass
+
+
+class ListChannel:
+    def __init__(self) -> None:
+        self.messages: list[Any] = []
+
+    def put(self, message: Any) -> None:
+        # Messages must survive the trip to the parent process.
+        self.messages.append(pickle.loads(pickle.dumps(message)))
+
+
+async def _eval_context() -> UiPathEvalContext:
+    evaluation_set, _ = EvalHelpers.load_eval_set(EVAL_SET_PATH)
+    context = UiPathEvalContext()
+    context.execution_id = str(uuid.uuid4())
+    context.evaluation_set = evaluation_set
+    context.runtime_schema = await IdentityRuntime().get_schema()
+    context.evaluators = await EvalHelpers.load_evaluators(
+        EVAL_SET_PATH, evaluation_set, agent_model=None
+    )
+    return context
+
+
+class UnpicklableError(Exception):
+    def __init__(self, code: int, reason: str):
+        super().__init__(f"{code}: {reason}")
+
+
+class TestSplitIntoShards:
+    def test_deals_items_round_robin(self) -> None:
+        assert split_into_shards([1, 2, 3, 4, 5], 2) == [[1, 3, 5], [2, 4]]
+
+    def test_never_returns_empty_shards(self) -> None:
+        assert split_into_shards(["a", "b"], 4) == [["a"], ["b"]]
+        assert split_into_shards([], 3) == []
+
+
+class TestMessages:
+    async def test_updated_event_round_trip(self) -> None:
+        evaluation_set, _ = EvalHelpers.load_eval_set(EVAL_SET_PATH)
+        eval_item = evaluation_set.evaluations[0]
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        with provider.get_tracer(__name__).start_as_current_span(
+            "agent", attributes={"tags": ("a", "b")}
+        ):
+            pass
+        span = exporter.get_finished_spans()[0]
+
+        try:
+            raise UnpicklableError(500, "boom")
+        except UnpicklableError as e:
+            error = e
+        record = logging.LogRecord(
+            "agent", logging.INFO, __file__, 1, "took %s ms", (12,), None
+        )
+
+        event = EvalRunUpdatedEvent(
+            execution_id="run",
+            eval_item=eval_item,
+            eval_results=[],
+            success=False,
+            agent_output={"x": 1},
+            agent_execution_time=0.5,
+            spans=[span],
+            logs=[record],
+            exception_details=EvalItemExceptionDetails(exception=error),
+        )
+
+        message = pickle.loads(
+            pickle.dumps(pack_event(EvaluationEvents.UPDATE_EVAL_RUN, event))
+        )
+        event_type, unpacked = unpack_event(message)
+
+        assert event_type == EvaluationEvents.UPDATE_EVAL_RUN
+        assert isinstance(unpacked, EvalRunUpdatedEvent)
+        assert unpacked.eval_item.id == eval_item.id
+        assert unpacked.spans[0].name == "agent"
+        assert unpacked.spans[0].context.span_id == span.context.span_id
+        assert unpacked.logs[0].getMessage() == "took 12 ms"
+        assert unpacked.exception_details is not None
+        assert isinstance(unpacked.exception_details.exception, RuntimeError)
+        assert "UnpicklableError" in str(unpacked.exception_details.exception)
+
+    def test_created_event_round_trip(self) -> None:
+        evaluation_set, _ = EvalHelpers.load_eval_set(EVAL_SET_PATH)
+        event = EvalRunCreatedEvent(
+            execution_id="run", eval_item=evaluation_set.evaluations[0]
+        )
+
+        event_type, unpacked = unpack_event(
+            pickle.loads(
+                pickle.dumps(pack_event(EvaluationEvents.CREATE_EVAL_RUN, event))
+            )
+        )
+
+        assert event_type == EvaluationEvents.CREATE_EVAL_RUN
+        assert unpacked == event
+
+    def test_result_round_trip(self) -> None:
+        result = UiPathEvalRunResult(
+            evaluation_name="dp1",
+            evaluation_run_results=[
+                UiPathEvalRunResultDto(
+                    evaluator_name="exact",
+                    evaluator_id="exact-id",
+                    result=EvaluationResultDto(score=0.5, details={"k": "v"}),
+                )
+            ],
+        )
+
+        eval_item_id, unpacked = unpack_result(
+            pickle.loads(pickle.dumps(pack_result("item-1", result)))
+        )
+
+        assert eval_item_id == "item-1"
+        assert unpacked.score == 0.5
+        assert unpacked.evaluation_run_results[0].result.details == {"k": "v"}
+
+
+async def test_run_eval_shard_forwards_events_and_results() -> None:
+    context = await _eval_context()
+    channel = ListChannel()
+    trace_id, span_id = 0x1234, 0x5678
+
+    exporter = InMemorySpanExporter()
+    trace_manager = UiPathTraceManager()
+    trace_manager.tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    result = await run_eval_shard(
+        IdentityFactory(),
+        trace_manager,
+        context,
+        EvalShard(
+            index=3,
+            channel=channel,
+            parent_span=(trace_id, span_id, 1),
+            live_tracking=False,
+        ),
+    )
+
+    assert result.status == UiPathRuntimeStatus.SUCCESSFUL
+    kinds = [message[0] for message in channel.messages]
+    item_ids = {item.id for item in context.evaluation_set.evaluations}
+    results = [unpack_result(m) for m in channel.messages if m[0] == "result"]
+    assert {eval_item_id for eval_item_id, _ in results} == item_ids
+    events = [unpack_event(m)[0] for m in channel.messages if m[0] == "event"]
+    assert events.count(EvaluationEvents.CREATE_EVAL_RUN) == len(item_ids)
+    assert events.count(EvaluationEvents.UPDATE_EVAL_RUN) == len(item_ids)
+    assert kinds[-1] == "done" and channel.messages[-1][1] == 3
+
+    evaluation_spans = [
+        s for s in exporter.get_finished_spans() if s.name == "Evaluation"
+    ]
+    assert evaluation_spans
+    for span in evaluation_spans:
+        assert span.parent is not None
+        assert (span.parent.trace_id, span.parent.span_id) == (trace_id, span_id)
+
+
+async def test_process_sharded_runtime_rejects_resume() -> None:
+    context = await _eval_context()
+    context.resume = True
+    runtime = ProcessShardedEvalRuntime(
+        context,
+        IdentityFactory(),
+        UiPathTraceManager(),
+        EventBus(),
+        processes=2,
+        shard_args=lambda eval_ids, trace_file: [],
+    )
+
+    with pytest.raises(ValueError, match="Resume mode"):
+        await runtime._run_evaluations([], 1, lambda index, result: None)
+
+
+async def test_coverage_of_workers_is_combined(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    agent = tmp_path / "agent.py"
+    agent.write_text("x = 1\ny = 2\n")
+    context = await _eval_context()
+    context.report_coverage = True
+    runtime = ProcessShardedEvalRuntime(
+        context,
+        IdentityFactory(),
+        UiPathTraceManager(),
+        EventBus(),
+        processes=2,
+        shard_args=lambda eval_ids, trace_file: [],
+    )
+    coverage_dir = runtime._coverage_dir
+    assert coverage_dir is not None
+    # What two workers save: each ran one line of the agent.
+    for arcs in ([(-1, 1), (1, -1)], [(-1, 2), (2, -1)]):
+        data = coverage.CoverageData(
+            basename=_coverage_data_file(coverage_dir), suffix=True
+        )
+        data.add_arcs({str(agent): arcs})
+        data.write()
+
+    runtime._report_coverage()
+
+    report = capsys.readouterr().out
+    assert "agent.py" in report
+    assert "100%" in report
+    assert not os.path.exists(coverage_dir)
+
+
+def test_merge_trace_files(tmp_path: Path) -> None:
+    trace_file = str(tmp_path / "traces.jsonl")
+    Path(trace_file).write_text('{"parent": 1}\n')
+    Path(shard_trace_file(trace_file, 0)).write_text('{"shard": 0}\n')
+    Path(shard_trace_file(trace_file, 1)).write_text('{"shard": 1}\n')
+
+    runtime = ProcessShardedEvalRuntime.__new__(ProcessShardedEvalRuntime)
+    runtime.trace_file = trace_file
+    runtime._merge_trace_files(3)
+
+    assert Path(trace_file).read_text().splitlines() == [
+        '{"parent": 1}',
+        '{"shard": 0}',
+        '{"shard": 1}',
+    ]
+    assert not Path(shard_trace_file(trace_file, 0)).exists()
+    assert shard_trace_file("out/traces.jsonl", 2) == "out/traces.shard2.jsonl"
+
+
+def test_shard_cli_args_parse_as_eval_command() -> None:
+    args = _shard_cli_args(
+        "main.py",
+        EVAL_SET_PATH,
+        ["id-1", "id-2"],
+        eval_set_run_id="run-1",
+        workers=4,
+        eval_timeout=30.0,
+        max_retries=2,
+        enable_mocker_cache=True,
+        model_settings_id="same-as-agent",
+        agent_memory_settings_id="default",
+        trace_file="traces.shard0.jsonl",
+        max_llm_concurrency=8,
+        input_overrides={"a": {"b": 1}},
+        verbose=False,
+        report_coverage=True,
+    )
+
+    ctx = eval_command.make_context("uipath eval", args)
+
+    assert ctx.params["entrypoint"] == "main.py"
+    assert ctx.params["eval_ids"] == ["id-1", "id-2"]
+    assert ctx.params["no_report"] is True
+    assert ctx.params["workers"] == 4
+    assert ctx.params["processes"] == 1
+    assert ctx.params["eval_timeout"] == 30.0
+    assert ctx.params["max_retries"] == 2
+    assert ctx.params["enable_mocker_cache"] is True
+    assert ctx.params["trace_file"] == "traces.shard0.jsonl"
+    assert ctx.params["input_overrides"] == {"a": {"b": 1}}
+    assert ctx.params["eval_set_run_id"] == "run-1"
+    assert ctx.params["report_coverage"] is True
@@ -0,0 +1,293 @@
+"""Tests for eval item ordering, per-item timeouts, retries and scheduler metrics."""
+
+import asyncio
+import json
+import uuid
+from pathlib import Path
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+import httpx
+
+from uipath.core.events import EventBus
+from uipath.core.tracing import UiPathTraceManager
+from uipath.eval.helpers import EvalHelpers
+from uipath.eval.runtime import UiPathEvalContext, evaluate
+from uipath.eval.runtime._parallelization import (
+    SchedulerMetrics,
+    execute_parallel_streaming,
+)
+from uipath.eval.runtime._scheduling import EvalDurationHistory, longest_first
+from uipath.eval.runtime._types import UiPathEvalOutput
+from uipath.runtime import (
+    UiPathExecuteOptions,
+    UiPathRuntimeEvent,
+    UiPathRuntimeFactorySettings,
+    UiPathRuntimeProtocol,
+    UiPathRuntimeResult,
+    UiPathRuntimeStatus,
+    UiPathRuntimeStorageProtocol,
+    UiPathStreamOptions,
+)
+from uipath.runtime.schema import UiPathRuntimeSchema
+
+EVAL_SET_PATH = str(Path(__file__).parent / "evals" / "eval-sets" / "default.json")
+
+Executor = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+class FakeRuntime:
+    def __init__(self, executor: Executor):
+        self.executor = executor
+
+    async def execute(
+        self,
+        input: dict[str, Any] | None = None,
+        options: UiPathExecuteOptions | None = None,
+    ) -> UiPathRuntimeResult:
+        return UiPathRuntimeResult(
+            output=await self.executor(input or {}),
+            status=UiPathRuntimeStatus.SUCCESSFUL,
+        )
+
+    async def stream(
+        self,
+        input: dict[str, Any] | None = None,
+        options: UiPathStreamOptions | None = None,
+    ) -> AsyncGenerator[UiPathRuntimeEvent, None]:
+        yield await self.execute(input, None)
+
+    async def get_schema(self) -> UiPathRuntimeSchema:
+        return UiPathRuntimeSchema(
+            filePath="test.py",
+            uniqueId="test",
+            type="workflow",
+            input={"type": "object", "properties": {}},
+            output={"type": "object", "properties": {}},
+        )
+
+    async def dispose(self) -> None:
+        pass
+
+
+class FakeFactory:
+    def __init__(self, executor: Executor):
+        self.executor = executor
+
+    def discover_entrypoints(self) -> list[str]:
+        return ["test"]
+
+    async def get_storage(self) -> UiPathRuntimeStorageProtocol | None:
+        return None
+
+    async def get_settings(self) -> UiPathRuntimeFactorySettings | None:
+        return None
+
+    async def new_runtime(
+        self, entrypoint: str, runtime_id: str, **kwargs
+    ) -> UiPathRuntimeProtocol:
+        return FakeRuntime(self.executor)
+
+    async def dispose(self) -> None:
+        pass
+
+
+async def _context(item_count: int = 1) -> UiPathEvalContext:
+    evaluation_set, _ = EvalHelpers.load_eval_set(EVAL_SET_PATH)
+    template = evaluation_set.evaluations[0]
+    evaluation_set.evaluations = [
+        template.model_copy(
+            update={
+                "id": f"item-{i}",
+                "name": f"Item {i}",
+                "inputs": {"id": f"item-{i}"},
+            }
+        )
+        for i in range(item_count)
+    ]
+    context = UiPathEvalContext()
+    context.execution_id = str(uuid.uuid4())
+    context.evaluation_set = evaluation_set
+    context.runtime_schema = await FakeRuntime(_identity).get_schema()
+    context.evaluators = await EvalHelpers.load_evaluators(
+        EVAL_SET_PATH, evaluation_set, agent_model=None
+    )
+    return context
+
+
+async def _identity(input: dict[str, Any]) -> dict[str, Any]:
+    return input
+
+
+async def _run(context: UiPathEvalContext, executor: Executor) -> UiPathEvalOutput:
+    result = await evaluate(
+        FakeFactory(executor), UiPathTraceManager(), context, EventBus()
+    )
+    return UiPathEvalOutput.model_validate(result.output)
+
+
+def test_longest_first_puts_unknown_items_first() -> None:
+    durations = {"a": 1.0, "b": 5.0, "d": 3.0}
+
+    assert longest_first(["a", "b", "c", "d", "e"], durations.get) == [
+        2,
+        4,
+        1,
+        3,
+        0,
+    ]
+
+
+def test_duration_history_smooths_and_merges_on_save(tmp_path: Path) -> None:
+    path = tmp_path / ".uipath" / "eval_durations.json"
+    history = EvalDurationHistory(path)
+    assert history.expected("set/a") is None
+
+    history.record("set/a", 10.0)
+    history.record("set/a", 20.0)
+    assert history.expected("set/a") == 15.0
+
+    # Another process saved a different item in the meantime.
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"set/b": 3.0}))
+    history.save()
+
+    assert json.loads(path.read_text()) == {"set/a": 15.0, "set/b": 3.0}
+    assert EvalDurationHistory(path).expected("set/a") == 15.0
+
+
+def test_duration_history_keeps_most_recently_run_items(tmp_path: Path) -> None:
+    path = tmp_path / "eval_durations.json"
+    path.write_text(json.dumps({"set/old": 1.0, "set/a": 2.0, "set/b": 3.0}))
+    history = EvalDurationHistory(path, max_entries=2)
+
+    history.record("set/a", 4.0)
+    history.save()
+
+    assert list(json.loads(path.read_text())) == ["set/b", "set/a"]
+
+
+def test_duration_history_ignores_corrupt_file(tmp_path: Path) -> None:
+    path = tmp_path / "eval_durations.json"
+    path.write_text("{not json")
+
+    assert EvalDurationHistory(path).expected("set/a") is None
+
+
+async def test_scheduler_metrics() -> None:
+    metrics = SchedulerMetrics()
+    seen_depths: list[int] = []
+
+    async def item(delay: float) -> float:
+        seen_depths.append(metrics.queue_depth)
+        await asyncio.sleep(delay)
+        return delay
+
+    count = await execute_parallel_streaming(
+        (item(d) for d in [0.02, 0.02, 0.02, 0.02]),
+        2,
+        lambda index, result: None,
+        metrics,
+    )
+
+    assert count == metrics.completed == 4
+    assert metrics.workers == 2
+    assert metrics.queue_depth == 0
+    assert metrics.busy_workers == 0
+    assert metrics.busy_seconds >= 0.08
+    assert 0.5 < metrics.utilization <= 1.0
+    assert max(seen_depths) <= 2
+
+
+async def test_items_start_longest_first_and_keep_output_order(
+    tmp_path: Path,
+) -> None:
+    context = await _context(item_count=3)
+    history_file = tmp_path / "eval_durations.json"
+    history_file.write_text(
+        json.dumps(
+            {
+                "default-eval-set-id/item-0": 1.0,
+                "default-eval-set-id/item-2": 5.0,
+            }
+        )
+    )
+    context.duration_history_file = str(history_file)
+    started: list[str] = []
+
+    async def record_start(input: dict[str, Any]) -> dict[str, Any]:
+        started.append(input["id"])
+        return input
+
+    output = await _run(context, record_start)
+
+    # item-1 has no history, then the slowest first.
+    assert started == ["item-1", "item-2", "item-0"]
+    assert [result.evaluation_name for result in output.evaluation_set_results] == [
+        "Item 0",
+        "Item 1",
+        "Item 2",
+    ]
+    history = json.loads(history_file.read_text())
+    assert set(history) == {f"default-eval-set-id/item-{i}" for i in range(3)}
+    # Smoothed towards the (fast) durations of this run.
+    assert history["default-eval-set-id/item-2"] < 5.0
+
+
+async def test_item_timeout_marks_run_failed() -> None:
+    context = await _context()
+    context.item_timeout = 0.05
+    cancelled = asyncio.Event()
+
+    async def hang(input: dict[str, Any]) -> dict[str, Any]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return input
+
+    output = await asyncio.wait_for(_run(context, hang), timeout=5)
+
+    assert cancelled.is_set()
+    (result,) = output.evaluation_set_results
+    assert result.evaluation_run_results[0].result.score == 0
+
+
+async def test_transient_failures_are_retried(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "uipath.eval.runtime.runtime.exponential_backoff_with_jitter",
+        lambda attempt, initial: 0.0,
+    )
+    context = await _context()
+    context.max_retries = 2
+    calls = 0
+
+    async def flaky(input: dict[str, Any]) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise httpx.ConnectTimeout("connect timed out")
+        return {"foo": "bar"}
+
+    output = await _run(context, flaky)
+
+    assert calls == 3
+    (result,) = output.evaluation_set_results
+    assert result.evaluation_run_results[0].result.score == 1.0
+
+
+async def test_non_transient_failures_are_not_retried() -> None:
+    context = await _context()
+    context.max_retries = 2
+    calls = 0
+
+    async def broken(input: dict[str, Any]) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        raise ValueError("bad input")
+
+    output = await _run(context, broken)
+
+    assert calls == 1
+    (result,) = output.evaluation_set_results
+    assert result.evaluation_run_results[0].result.score == 0
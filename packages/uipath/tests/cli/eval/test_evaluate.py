@@ -1,3 +1,4 @@
+import json
 import uuid
 from pathlib import Path
 from typing import Any, AsyncGenerator
@@ -360,3 +361,89 @@ async def test_eval_runtime_works_without_exporters():
 
     # Assert that the evaluation completed successfully
     assert result.output is not None
+
+
+async def test_evaluate_streams_results_to_file(tmp_path: Path):
+    """With a results file, results are written as JSON lines, not kept in the output."""
+    event_bus = EventBus()
+    trace_manager = UiPathTraceManager()
+
+    async def identity(input: dict[str, Any]) -> dict[str, Any]:
+        return input
+
+    class TestRuntime:
+        async def execute(
+            self,
+            input: dict[str, Any] | None = None,
+            options: UiPathExecuteOptions | None = None,
+        ) -> UiPathRuntimeResult:
+            return UiPathRuntimeResult(
+                output=await identity(input or {}),
+                status=UiPathRuntimeStatus.SUCCESSFUL,
+            )
+
+        async def stream(
+            self,
+            input: dict[str, Any] | None = None,
+            options: UiPathStreamOptions | None = None,
+        ) -> AsyncGenerator[UiPathRuntimeEvent, None]:
+            yield await self.execute(input, None)
+
+        async def get_schema(self) -> UiPathRuntimeSchema:
+            return UiPathRuntimeSchema(
+                filePath="test.py",
+                uniqueId="test",
+                type="workflow",
+                input={"type": "object", "properties": {}},
+                output={"type": "object", "properties": {}},
+            )
+
+        async def dispose(self) -> None:
+            pass
+
+    class TestFactory:
+        def discover_entrypoints(self) -> list[str]:
+            return ["test"]
+
+        async def get_storage(self) -> UiPathRuntimeStorageProtocol | None:
+            return None
+
+        async def get_settings(self) -> UiPathRuntimeFactorySettings | None:
+            return None
+
+        async def new_runtime(
+            self, entrypoint: str, runtime_id: str, **kwargs
+        ) -> UiPathRuntimeProtocol:
+            return TestRuntime()
+
+        async def dispose(self) -> None:
+            pass
+
+    factory = TestFactory()
+    eval_set_path = str(Path(__file__).parent / "evals" / "eval-sets" / "default.json")
+    evaluation_set, _ = EvalHelpers.load_eval_set(eval_set_path)
+    evaluators = await EvalHelpers.load_evaluators(
+        eval_set_path, evaluation_set, agent_model=None
+    )
+
+    results_file = tmp_path / "results.jsonl"
+    context = UiPathEvalContext()
+    context.execution_id = str(uuid.uuid4())
+    context.evaluation_set = evaluation_set
+    context.runtime_schema = await TestRuntime().get_schema()
+    context.evaluators = evaluators
+    context.results_file = str(results_file)
+
+    result = await evaluate(factory, trace_manager, context, event_bus)
+
+    assert result.status == UiPathRuntimeStatus.SUCCESSFUL
+    eval_output = UiPathEvalOutput.model_validate(result.output)
+    assert eval_output.evaluation_set_results == []
+
+    lines = [json.loads(line) for line in results_file.read_text().splitlines()]
+    assert sorted(line["evaluationName"] for line in lines) == sorted(
+        eval_item.name for eval_item in evaluation_set.evaluations
+    )
+    first_result = lines[0]["evaluationRunResults"][0]
+    assert first_result["evaluatorId"] == "ExactMatchEvaluator"
+    assert first_result["result"]["score"] == 1.0
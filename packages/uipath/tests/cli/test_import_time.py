@@ -0,0 +1,35 @@
+"""Import-time budget for the ``uipath`` CLI.
+
+Every command, including ``uipath --version`` and ``uipath --help``, first
+imports ``uipath._cli``; commands load their own modules when invoked. Each
+check runs in a fresh interpreter; the module checks pin the lazy import
+graph. The time budget catches regressions the module lists do not name; it
+only runs with ``UIPATH_TEST_IMPORT_TIME=1``, on an otherwise idle machine.
+"""
+
+# Cumulative import time in ms; about twice the slowest of repeated runs on a
+# developer machine (roughly 200-420ms), so it only trips on real regressions.
+CLI_BUDGET_MS = 800
+
+
+def test_cli_does_not_import_commands_or_sdk(loaded_after) -> None:
+    loaded = loaded_after(
+        "import uipath._cli",
+        [
+            "uipath._cli.cli_run",
+            "uipath._cli.cli_eval",
+            "uipath._cli.cli_server",
+            "uipath.platform.common",
+            "uipath.core.tracing",
+            "httpx",
+            "opentelemetry",
+        ],
+    )
+    assert loaded == []
+
+
+def test_cli_import_time_budget(import_time_ms) -> None:
+    elapsed = import_time_ms("uipath._cli")
+    assert elapsed < CLI_BUDGET_MS, (
+        f"importing the uipath CLI took {elapsed:.0f}ms (budget {CLI_BUDGET_MS}ms)"
+    )
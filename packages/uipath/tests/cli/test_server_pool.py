@@ -0,0 +1,164 @@
+"""Tests for ``JobWorkerPool`` — the worker processes behind ``uipath server --workers``.
+
+Each test runs real ``uipath run`` jobs of a small function entrypoint in a
+fresh pool, so they exercise the env/cwd isolation, stopping and worker
+restarts across actual process boundaries.
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from uipath._cli._server_pool import JobWorkerPool, _Worker
+
+SCRIPT = """
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+
+@dataclass
+class Input:
+    seconds: float = 0
+    crash: bool = False
+    start_child: bool = False
+
+def main(input: Input) -> str:
+    if input.crash:
+        os._exit(3)
+    if input.start_child:
+        child = multiprocessing.get_context("spawn").Process(
+            target=time.sleep, args=(0,)
+        )
+        child.start()
+        child.join()
+        with open(os.path.join(os.path.dirname(__file__), "child.log"), "w") as f:
+            f.write(str(child.exitcode))
+    time.sleep(input.seconds)
+    return os.environ.get("JOB_MARKER", "")
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> str:
+    (tmp_path / "main.py").write_text(SCRIPT)
+    (tmp_path / "uipath.json").write_text(
+        json.dumps({"functions": {"main": "main.py:main"}})
+    )
+    return str(tmp_path)
+
+
+@pytest.fixture
+async def pool():
+    pool = JobWorkerPool(2, stop_timeout=3)
+    pool.start()
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+def _args(**input: object) -> list[str]:
+    return ["main", json.dumps(input)]
+
+
+async def test_jobs_run_concurrently(pool: JobWorkerPool, project: str) -> None:
+    # Warm both workers up so the timing below only measures the jobs.
+    await asyncio.gather(
+        pool.run("run", _args(), {}, project),
+        pool.run("run", _args(), {}, project),
+    )
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        pool.run("run", _args(seconds=1), {"JOB_MARKER": "a"}, project),
+        pool.run("run", _args(seconds=1), {"JOB_MARKER": "b"}, project),
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [result["ExitCode"] for result in results] == [0, 0]
+    assert elapsed < 1.8
+    snapshot = pool.snapshot()
+    assert snapshot["workers"] == 2
+    assert snapshot["alive"] == 2
+    assert snapshot["completed"] == 4
+    assert snapshot["running"] == snapshot["queued"] == 0
+
+
+async def test_stop_job(pool: JobWorkerPool, project: str) -> None:
+    job = asyncio.create_task(
+        pool.run("run", _args(seconds=30), {}, project, job_key="long")
+    )
+    while "long" not in pool._running:
+        await asyncio.sleep(0.05)
+    # Give the worker time to start the job before interrupting it.
+    await asyncio.sleep(1)
+
+    # The job blocks in time.sleep, so it ends once the stop timeout kills it.
+    assert pool.stop("long")
+    result = await asyncio.wait_for(job, timeout=20)
+
+    assert result["Stopped"] is True
+    assert pool.snapshot()["stopped"] == 1
+    assert not pool.stop("long")
+
+
+async def test_force_stop_replaces_worker(pool: JobWorkerPool, project: str) -> None:
+    job = asyncio.create_task(
+        pool.run("run", _args(seconds=30), {}, project, job_key="long")
+    )
+    while "long" not in pool._running:
+        await asyncio.sleep(0.05)
+
+    assert pool.stop("long", force=True)
+    result = await asyncio.wait_for(job, timeout=20)
+
+    assert result["Stopped"] is True
+    assert pool.snapshot()["worker_restarts"] == 1
+
+
+async def test_crashed_worker_is_replaced(pool: JobWorkerPool, project: str) -> None:
+    result = await pool.run("run", _args(crash=True), {}, project)
+
+    assert result["ExitCode"] == 1
+    assert result["Unexpected"] is True
+    snapshot = pool.snapshot()
+    assert snapshot["failed"] == 1
+    assert snapshot["worker_restarts"] == 1
+
+    results = await asyncio.gather(
+        pool.run("run", _args(), {}, project),
+        pool.run("run", _args(), {}, project),
+    )
+    assert [result["ExitCode"] for result in results] == [0, 0]
+    assert pool.snapshot()["alive"] == 2
+
+
+async def test_jobs_can_start_processes(pool: JobWorkerPool, project: str) -> None:
+    result = await pool.run("run", _args(start_child=True), {}, project)
+
+    assert result["ExitCode"] == 0
+    assert (Path(project) / "child.log").read_text() == "0"
+
+
+async def test_replacing_a_worker_does_not_wait_for_it_to_exit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # A killed worker that takes a while to exit.
+    process = MagicMock()
+    process.is_alive.return_value = False
+    process.join.side_effect = lambda timeout=None: time.sleep(1)
+    worker = _Worker(process=process, conn=MagicMock())
+    replacement = _Worker(process=MagicMock(), conn=MagicMock())
+    pool = JobWorkerPool(1)
+    pool._workers.append(worker)
+    monkeypatch.setattr(pool, "_spawn", lambda: replacement)
+
+    start = time.perf_counter()
+    assert pool._replace(worker) is replacement
+    assert time.perf_counter() - start < 0.5
+    assert pool._workers == [replacement]
@@ -0,0 +1,173 @@
+"""Tests for ``TemplateJobRunner`` — ``uipath server --template``.
+
+The project imports a helper module that logs every import to a file, so the
+tests can tell that jobs run in forks of a template that imported it once.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import struct
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="template mode requires os.fork()"
+)
+
+HELPER = """
+import os
+
+with open(os.path.join(os.path.dirname(__file__), "imports.log"), "a") as f:
+    f.write(f"{os.getpid()}\\n")
+"""
+
+SCRIPT = """
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(__file__))
+import helper
+
+@dataclass
+class Input:
+    seconds: float = 0
+    crash: bool = False
+    start_child: bool = False
+
+def main(input: Input) -> str:
+    if input.crash:
+        os._exit(3)
+    if input.start_child:
+        child = multiprocessing.get_context("spawn").Process(
+            target=time.sleep, args=(0,)
+        )
+        child.start()
+        child.join()
+        with open(os.path.join(os.path.dirname(__file__), "child.log"), "w") as f:
+            f.write(str(child.exitcode))
+    time.sleep(input.seconds)
+    return os.environ.get("JOB_MARKER", "")
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "helper.py").write_text(HELPER)
+    (tmp_path / "main.py").write_text(SCRIPT)
+    (tmp_path / "uipath.json").write_text(
+        json.dumps({"functions": {"main": "main.py:main"}})
+    )
+    return tmp_path
+
+
+@pytest.fixture
+async def runner(project: Path):
+    from uipath._cli._server_template import TemplateJobRunner
+
+    runner = TemplateJobRunner(str(project), max_jobs=2, stop_timeout=3)
+    runner.start()
+    try:
+        yield runner
+    finally:
+        await runner.close()
+
+
+def _args(**input: object) -> list[str]:
+    return ["main", json.dumps(input)]
+
+
+async def test_jobs_run_in_forks_of_the_template(runner, project: Path) -> None:
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        runner.run("run", _args(seconds=1), {"JOB_MARKER": "a"}, str(project)),
+        runner.run("run", _args(seconds=1), {"JOB_MARKER": "b"}, str(project)),
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [result["ExitCode"] for result in results] == [0, 0]
+    # Only the template imported the project.
+    assert len((project / "imports.log").read_text().splitlines()) == 1
+    snapshot = runner.snapshot()
+    assert snapshot["alive"] == 1
+    assert snapshot["completed"] == 2
+    assert snapshot["template_warm_up_seconds"] is not None
+    assert elapsed < snapshot["template_warm_up_seconds"] + 1.8
+
+
+async def test_stop_job(runner, project: Path) -> None:
+    job = asyncio.create_task(
+        runner.run("run", _args(seconds=30), {}, str(project), job_key="long")
+    )
+    while not runner.stop("long"):
+        await asyncio.sleep(0.05)
+
+    result = await asyncio.wait_for(job, timeout=20)
+
+    assert result["Stopped"] is True
+    assert runner.snapshot()["stopped"] == 1
+    assert not runner.stop("long")
+
+
+async def test_crashed_job_does_not_affect_the_template(runner, project: Path) -> None:
+    result = await runner.run("run", _args(crash=True), {}, str(project))
+
+    assert result["ExitCode"] == 1
+    assert result["Unexpected"] is True
+    assert "exited with code 3" in result["Error"]
+
+    result = await runner.run("run", _args(), {}, str(project))
+    assert result["ExitCode"] == 0
+    assert runner.snapshot()["worker_restarts"] == 0
+
+
+async def test_jobs_can_start_processes(runner, project: Path) -> None:
+    result = await runner.run("run", _args(start_child=True), {}, str(project))
+
+    assert result["ExitCode"] == 0
+    assert (project / "child.log").read_text() == "0"
+
+
+def test_job_killed_while_sending_its_result(project: Path, monkeypatch) -> None:
+    from uipath._cli import _server_template
+
+    def run_forked_job(results, command_name, args, *rest) -> None:
+        if args == ["partial"]:
+            # Header of a 1000-byte message, then only one byte of it.
+            os.write(results.fileno(), struct.pack("!i", 1000) + b"x")
+            os.kill(os.getpid(), signal.SIGKILL)
+        results.send({"ExitCode": 0, "Result": args})
+        os._exit(0)
+
+    monkeypatch.setattr(_server_template, "_run_forked_job", run_forked_job)
+    conn, template_conn = multiprocessing.Pipe()
+    template = multiprocessing.get_context("fork").Process(
+        target=_server_template._template_main,
+        args=(template_conn, [], str(project)),
+    )
+    template.start()
+    try:
+        assert conn.poll(60)
+        assert conn.recv()[0] == "ready"
+
+        conn.send(("killed", "run", ["partial"], {}, None))
+        assert conn.recv()[:2] == ("started", "killed")
+        assert conn.recv() == ("exited", "killed", "killed by signal 9")
+
+        conn.send(("next", "run", ["whole"], {}, None))
+        assert conn.recv()[:2] == ("started", "next")
+        assert conn.poll(10)
+        assert conn.recv() == ("result", "next", {"ExitCode": 0, "Result": ["whole"]})
+    finally:
+        conn.send(None)
+        template.join(10)
+        if template.is_alive():
+            template.kill()
@@ -1,8 +1,10 @@
+import json
 import os
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 import pytest
 from click.testing import CliRunner
@@ -51,3 +53,53 @@ def mock_project(temp_dir: str) -> str:
         f.write("def main(input): return input")
 
     return temp_dir
+
+
+_IMPORT_TIME_ENV = "UIPATH_TEST_IMPORT_TIME"
+
+
+def _import_time_ms(module: str) -> float:
+    """Best of three cumulative import times of ``module``, from ``-X importtime``."""
+    timings = []
+    for _ in range(3):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        for line in stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                timings.append(int(fields[1]) / 1000)
+    return min(timings)
+
+
+def _loaded_after(statement: str, modules: list[str]) -> list[str]:
+    """Which of ``modules`` a fresh interpreter has loaded after ``statement``."""
+    code = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    )
+    stdout = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(stdout)
+
+
+@pytest.fixture
+def import_time_ms() -> Callable[[str], float]:
+    """Measure a module's cumulative import time in a fresh interpreter, in ms.
+
+    Wall-clock budgets are too noisy for a loaded CI host, so tests using this
+    are skipped unless ``UIPATH_TEST_IMPORT_TIME`` is set.
+    """
+    if not os.environ.get(_IMPORT_TIME_ENV):
+        pytest.skip(f"set {_IMPORT_TIME_ENV}=1 to check import-time budgets")
+    return _import_time_ms
+
+
+@pytest.fixture
+def loaded_after() -> Callable[[str, list[str]], list[str]]:
+    """List which modules a fresh interpreter has loaded after a statement."""
+    return _loaded_after
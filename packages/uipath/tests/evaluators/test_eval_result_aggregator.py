@@ -0,0 +1,313 @@
+"""Tests for incremental result aggregation and streaming of evaluation runs.
+
+EvalSetResultAggregator must agree with compute_evaluator_scores and
+compute_dataset_evaluator_results when fed the same per-datapoint results one
+at a time, and EvalRunResultWriter must emit one JSON line per result.
+"""
+
+import asyncio
+import json
+import uuid
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from uipath.eval.evaluators._aggregator_specs import (
+    ConfusionMatrixAggregatorSpec,
+    PrecisionAggregatorSpec,
+    RecallAggregatorSpec,
+)
+from uipath.eval.evaluators.base_evaluator import (
+    BaseEvaluatorJustification,
+    BufferedScoreReducer,
+    GenericBaseEvaluator,
+    LabelPairScoreReducer,
+    MeanScoreReducer,
+)
+from uipath.eval.evaluators.binary_classification_evaluator import (
+    BinaryClassificationEvaluator,
+)
+from uipath.eval.evaluators.exact_match_evaluator import ExactMatchEvaluator
+from uipath.eval.models.models import EvaluationResultDto
+from uipath.eval.runtime._parallelization import execute_parallel_streaming
+from uipath.eval.runtime._results import EvalRunResultWriter, EvalSetResultAggregator
+from uipath.eval.runtime._types import (
+    UiPathEvalRunExecutionOutput,
+    UiPathEvalRunResult,
+    UiPathEvalRunResultDto,
+    convert_eval_execution_output_to_serializable,
+)
+from uipath.eval.runtime.runtime import (
+    compute_dataset_evaluator_results,
+    compute_evaluator_scores,
+)
+from uipath.runtime import UiPathRuntimeResult, UiPathRuntimeStatus
+
+
+def _label_result(expected: str, actual: str) -> EvaluationResultDto:
+    return EvaluationResultDto(
+        score=1.0 if expected == actual else 0.0,
+        details=BaseEvaluatorJustification(
+            expected=expected, actual=actual
+        ).model_dump(),
+    )
+
+
+def _run_result(
+    name: str, *dtos: tuple[str, EvaluationResultDto]
+) -> UiPathEvalRunResult:
+    return UiPathEvalRunResult(
+        evaluation_name=name,
+        evaluation_run_results=[
+            UiPathEvalRunResultDto(
+                evaluator_name=evaluator_name,
+                evaluator_id=str(uuid.uuid4()),
+                result=result,
+            )
+            for evaluator_name, result in dtos
+        ],
+    )
+
+
+def _with_status(
+    result: UiPathEvalRunResult, status: UiPathRuntimeStatus
+) -> UiPathEvalRunResult:
+    result.agent_execution_output = convert_eval_execution_output_to_serializable(
+        UiPathEvalRunExecutionOutput(
+            execution_time=0.0,
+            spans=[],
+            logs=[],
+            result=UiPathRuntimeResult(status=status),
+        )
+    )
+    return result
+
+
+@pytest.fixture
+def exact_match() -> ExactMatchEvaluator:
+    return ExactMatchEvaluator.model_validate(
+        {
+            "id": str(uuid.uuid4()),
+            "evaluatorConfig": {
+                "name": "intent_match",
+                "classes": ["yes", "no"],
+                "aggregators": [
+                    PrecisionAggregatorSpec(averaging="macro").model_dump(
+                        by_alias=True
+                    ),
+                    RecallAggregatorSpec(averaging="micro").model_dump(by_alias=True),
+                    ConfusionMatrixAggregatorSpec().model_dump(by_alias=True),
+                ],
+            },
+        }
+    )
+
+
+@pytest.fixture
+def binary() -> BinaryClassificationEvaluator:
+    return BinaryClassificationEvaluator.model_validate(
+        {
+            "id": "binary-test",
+            "evaluatorConfig": {
+                "name": "spam",
+                "target_output_key": "class",
+                "positive_class": "spam",
+                "metric_type": "f-score",
+            },
+        }
+    )
+
+
+class TestEvalSetResultAggregator:
+    def test_matches_batch_computation(
+        self,
+        exact_match: ExactMatchEvaluator,
+        binary: BinaryClassificationEvaluator,
+    ) -> None:
+        pairs = [
+            ("yes", "yes"),
+            ("yes", "no"),
+            ("no", "no"),
+            ("no", "yes"),
+            ("yes", "yes"),
+            ("no", "maybe"),
+        ]
+        spam_pairs = [("spam", "spam"), ("ham", "spam"), ("spam", "ham")]
+        results = [
+            _run_result(
+                f"dp{i}",
+                ("intent_match", _label_result(*pair)),
+                ("spam", _label_result(*spam_pairs[i % len(spam_pairs)])),
+            )
+            for i, pair in enumerate(pairs)
+        ]
+        evaluators: list[GenericBaseEvaluator[Any, Any, Any]] = [exact_match, binary]
+
+        aggregator = EvalSetResultAggregator(evaluators)
+        for result in results:
+            aggregator.add(result)
+
+        _, expected_averages = compute_evaluator_scores(results, evaluators)
+        assert aggregator.evaluator_averages() == pytest.approx(expected_averages)
+        assert aggregator.dataset_evaluator_results() == (
+            compute_dataset_evaluator_results(results, evaluators)
+        )
+        assert aggregator.count == len(pairs)
+
+    def test_duplicates_within_a_datapoint_are_merged(
+        self, exact_match: ExactMatchEvaluator
+    ) -> None:
+        aggregator = EvalSetResultAggregator([exact_match])
+        aggregator.add(
+            _run_result(
+                "dp1",
+                ("intent_match", EvaluationResultDto(score=0.0)),
+                ("intent_match", _label_result("yes", "yes")),
+            )
+        )
+
+        assert aggregator.evaluator_averages() == {"intent_match": 0.5}
+        precision = aggregator.dataset_evaluator_results()["intent_match::precision"]
+        assert isinstance(precision.details, dict)
+        assert precision.details["nTotal"] == 1
+        assert precision.details["nScored"] == 1
+
+    def test_datapoint_fed_again_counts_once(
+        self,
+        exact_match: ExactMatchEvaluator,
+        binary: BinaryClassificationEvaluator,
+    ) -> None:
+        first = _run_result(
+            "dp1",
+            ("intent_match", _label_result("yes", "yes")),
+            ("spam", _label_result("spam", "spam")),
+        )
+        second = _run_result("dp2", ("intent_match", _label_result("yes", "no")))
+        # A retry or resume feeds dp1 again.
+        retried = _run_result(
+            "dp1",
+            ("intent_match", _label_result("yes", "yes")),
+            ("spam", _label_result("spam", "spam")),
+        )
+        evaluators: list[GenericBaseEvaluator[Any, Any, Any]] = [exact_match, binary]
+
+        aggregator = EvalSetResultAggregator(evaluators)
+        for result in (first, second, retried):
+            aggregator.add(result)
+
+        _, expected_averages = compute_evaluator_scores(
+            [first, second, retried], evaluators
+        )
+        assert aggregator.evaluator_averages() == pytest.approx(expected_averages)
+        assert aggregator.evaluator_averages()["intent_match"] == 0.5
+        assert aggregator.dataset_evaluator_results() == (
+            compute_dataset_evaluator_results([first, second], evaluators)
+        )
+        matrix = aggregator.dataset_evaluator_results()["intent_match::precision"]
+        assert isinstance(matrix.details, dict)
+        assert matrix.details["nTotal"] == 2
+
+    @pytest.mark.parametrize("reverse", [False, True], ids=["in_order", "reversed"])
+    def test_same_named_evaluations_are_averaged_in_any_order(
+        self,
+        exact_match: ExactMatchEvaluator,
+        binary: BinaryClassificationEvaluator,
+        reverse: bool,
+    ) -> None:
+        # Evaluation names are not unique; two items may share one.
+        results = [
+            _run_result("same", ("intent_match", _label_result("yes", "yes"))),
+            _run_result("same", ("intent_match", _label_result("yes", "no"))),
+            _run_result("other", ("intent_match", _label_result("no", "no"))),
+        ]
+        if reverse:
+            results.reverse()
+        evaluators: list[GenericBaseEvaluator[Any, Any, Any]] = [exact_match, binary]
+
+        aggregator = EvalSetResultAggregator(evaluators)
+        for result in results:
+            aggregator.add(result)
+
+        _, expected_averages = compute_evaluator_scores(results, evaluators)
+        assert aggregator.evaluator_averages() == pytest.approx(expected_averages)
+        assert aggregator.evaluator_averages()["intent_match"] == pytest.approx(0.75)
+        assert aggregator.dataset_evaluator_results() == (
+            compute_dataset_evaluator_results(results, evaluators)
+        )
+
+    def test_unknown_evaluator_raises(self, exact_match: ExactMatchEvaluator) -> None:
+        aggregator = EvalSetResultAggregator([exact_match])
+        with pytest.raises(ValueError, match="no matching evaluator"):
+            aggregator.add(_run_result("dp1", ("other", EvaluationResultDto(score=1))))
+
+    def test_status_prefers_suspended_over_faulted(
+        self, exact_match: ExactMatchEvaluator
+    ) -> None:
+        aggregator = EvalSetResultAggregator([exact_match])
+        assert aggregator.status == UiPathRuntimeStatus.SUCCESSFUL
+
+        aggregator.add(_with_status(_run_result("dp1"), UiPathRuntimeStatus.FAULTED))
+        assert aggregator.status == UiPathRuntimeStatus.FAULTED
+        aggregator.add(_with_status(_run_result("dp2"), UiPathRuntimeStatus.SUSPENDED))
+        aggregator.add(_with_status(_run_result("dp3"), UiPathRuntimeStatus.FAULTED))
+        assert aggregator.status == UiPathRuntimeStatus.SUSPENDED
+
+    def test_score_reducer_selection(
+        self,
+        exact_match: ExactMatchEvaluator,
+        binary: BinaryClassificationEvaluator,
+    ) -> None:
+        assert isinstance(exact_match.score_reducer(), MeanScoreReducer)
+        assert isinstance(binary.score_reducer(), LabelPairScoreReducer)
+
+        class CustomReducerEvaluator(ExactMatchEvaluator):
+            def reduce_scores(self, results: list[EvaluationResultDto]) -> float:
+                return max((r.score for r in results), default=0.0)
+
+        custom = CustomReducerEvaluator.model_validate(
+            {"id": "custom", "evaluatorConfig": {"name": "custom"}}
+        )
+        reducer = custom.score_reducer()
+        assert isinstance(reducer, BufferedScoreReducer)
+        for score in (0.2, 0.9, 0.4):
+            reducer.add(EvaluationResultDto(score=score))
+        assert reducer.result() == 0.9
+
+
+class TestEvalRunResultWriter:
+    def test_writes_one_line_per_result(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "results.jsonl"
+        results = [
+            _run_result("dp1", ("intent_match", _label_result("yes", "yes"))),
+            _run_result("dp2", ("intent_match", _label_result("no", "yes"))),
+        ]
+
+        with EvalRunResultWriter(str(path)) as writer:
+            writer.write(results[0])
+            # Flushed per line, so readable mid-run.
+            assert len(path.read_text().splitlines()) == 1
+            writer.write(results[1])
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["evaluationName"] for line in lines] == ["dp1", "dp2"]
+        assert [UiPathEvalRunResult.model_validate(line).score for line in lines] == [
+            1.0,
+            0.0,
+        ]
+
+
+async def test_execute_parallel_streaming_hands_off_in_completion_order() -> None:
+    async def item(index: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return index
+
+    seen: list[tuple[int, int]] = []
+    count = await execute_parallel_streaming(
+        (item(i, d) for i, d in enumerate([0.03, 0.0, 0.01])),
+        3,
+        lambda index, result: seen.append((index, result)),
+    )
+
+    assert count == 3
+    assert seen == [(1, 1), (2, 2), (0, 0)]
@@ -1,6 +1,9 @@
 """Tests for line-by-line evaluation utility functions."""
 
+import asyncio
+
 import pytest
+from opentelemetry.sdk.trace import ReadableSpan
 
 from uipath.eval.evaluators.line_by_line_utils import (
     aggregate_line_scores,
@@ -255,6 +258,75 @@ class TestEvaluateLines:
         assert len(line_details) == 2
         assert len(line_results) == 2
 
+    @pytest.mark.asyncio
+    async def test_evaluate_lines_concurrently_keeps_line_order(self):
+        """Lines run concurrently up to the limit and come back in order."""
+        lines = [f"line{i}" for i in range(10)]
+        workload_execution = WorkloadExecution(
+            agent_input={"test": "input"},
+            workload_output="\n".join(lines),
+            workload_trace=[ReadableSpan(name="agent")],
+        )
+        running = 0
+        peak = 0
+
+        async def mock_evaluate(execution, criteria):
+            nonlocal running, peak
+            assert execution.workload_trace is workload_execution.workload_trace
+            running += 1
+            peak = max(peak, running)
+            # Later lines finish first
+            await asyncio.sleep(0.001 * (10 - int(criteria["expected"][4:])))
+            running -= 1
+            score = 1.0 if execution.workload_output == criteria["expected"] else 0.0
+            return NumericEvaluationResult(score=score)
+
+        line_details, line_results = await evaluate_lines(
+            actual_lines=lines,
+            expected_lines=lines,
+            target_output_key="*",
+            workload_execution=workload_execution,
+            evaluate_fn=mock_evaluate,
+            create_line_criteria_fn=lambda expected: {"expected": expected},
+            max_concurrency=3,
+        )
+
+        assert peak == 3
+        assert [detail.actual for detail in line_details] == lines
+        assert [number for number, _ in line_results] == list(range(1, 11))
+        assert all(detail.score == 1.0 for detail in line_details)
+        assert workload_execution.workload_output == "\n".join(lines)
+
+    @pytest.mark.asyncio
+    async def test_evaluate_lines_concurrent_failure_cancels_other_lines(self):
+        """The first failing line is raised and the remaining lines are cancelled."""
+        cancelled = 0
+
+        async def mock_evaluate(execution, criteria):
+            nonlocal cancelled
+            if execution.workload_output == "bad":
+                raise ValueError("judge failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        with pytest.raises(ValueError, match="judge failed"):
+            await evaluate_lines(
+                actual_lines=["a", "bad", "c"],
+                expected_lines=["a", "b", "c"],
+                target_output_key="*",
+                workload_execution=WorkloadExecution(
+                    agent_input=None, workload_output="", workload_trace=[]
+                ),
+                evaluate_fn=mock_evaluate,
+                create_line_criteria_fn=lambda expected: expected,
+                max_concurrency=3,
+            )
+
+        assert cancelled == 2
+
 
 class TestBuildLineByLineResult:
     """Tests for build_line_by_line_result utility function."""
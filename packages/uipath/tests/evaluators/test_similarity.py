@@ -0,0 +1,85 @@
+"""Tests for the shared string similarity helpers."""
+
+import random
+
+import pytest
+
+from uipath.eval._helpers.similarity import levenshtein_distance, string_similarity
+
+
+def reference_distance(source: str, target: str) -> int:
+    previous = list(range(len(target) + 1))
+    for row, source_char in enumerate(source, 1):
+        current = [row] + [0] * len(target)
+        for col, target_char in enumerate(target, 1):
+            current[col] = min(
+                previous[col] + 1,
+                current[col - 1] + 1,
+                previous[col - 1] + (source_char != target_char),
+            )
+        previous = current
+    return previous[-1]
+
+
+@pytest.mark.parametrize(
+    "source, target, expected",
+    [
+        ("", "", 0),
+        ("", "abc", 3),
+        ("kitten", "sitting", 3),
+        ("flaw", "lawn", 2),
+        ("same", "same", 0),
+        ("héllo wörld", "hello world", 2),
+    ],
+)
+def test_levenshtein_distance(source: str, target: str, expected: int) -> None:
+    assert levenshtein_distance(source, target) == expected
+    assert levenshtein_distance(target, source) == expected
+
+
+def test_levenshtein_distance_matches_reference_on_random_strings() -> None:
+    rng = random.Random(0)
+    for _ in range(500):
+        source = "".join(rng.choice("abc") for _ in range(rng.randint(0, 90)))
+        target = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 90)))
+        assert levenshtein_distance(source, target) == reference_distance(
+            source, target
+        )
+
+
+def test_levenshtein_distance_stops_at_max_distance() -> None:
+    assert levenshtein_distance("kitten", "sitting", max_distance=5) == 3
+    assert levenshtein_distance("kitten", "sitting", max_distance=2) == 3
+    assert levenshtein_distance("a" * 10_000, "b" * 10_000, max_distance=10) == 11
+
+
+def test_levenshtein_distance_max_distance_matches_reference() -> None:
+    rng = random.Random(2)
+    for _ in range(300):
+        source = "".join(rng.choice("ab") for _ in range(rng.randint(0, 40)))
+        target = "".join(rng.choice("abc") for _ in range(rng.randint(0, 40)))
+        max_distance = rng.randint(0, 20)
+        expected = min(reference_distance(source, target), max_distance + 1)
+        assert levenshtein_distance(source, target, max_distance) == expected
+
+
+def test_levenshtein_distance_handles_long_strings() -> None:
+    rng = random.Random(1)
+    source = "".join(rng.choice("abcdef ") for _ in range(20_000))
+    target = source[:5_000] + "XYZ" + source[5_003:]
+
+    assert levenshtein_distance(source, target) == 3
+
+
+def test_string_similarity() -> None:
+    assert string_similarity("", "") == 1.0
+    assert string_similarity("abcd", "abcd") == 1.0
+    assert string_similarity("abcd", "abcf") == 0.75
+    assert string_similarity("abc", "") == 0.0
+
+
+def test_string_similarity_min_similarity() -> None:
+    assert string_similarity("abcd", "abcf", min_similarity=0.75) == 0.75
+    assert string_similarity("abcd", "abff", min_similarity=0.75) == 0.0
+    assert string_similarity("a" * 10_000, "b" * 10_000, min_similarity=0.5) == 0.0
+    assert string_similarity("", "", min_similarity=1.0) == 1.0
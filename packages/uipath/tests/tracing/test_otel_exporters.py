@@ -1,5 +1,9 @@
+import gzip
 import json
 import os
+import sqlite3
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -290,6 +294,265 @@ def test_send_with_retries_success():
         )
 
 
+def test_export_groups_spans_by_trace(exporter, mock_span):
+    """Spans of different traces are sent in separate requests."""
+    spans = [
+        {"span": "a", "TraceId": "trace-1"},
+        {"span": "b", "TraceId": "trace-2"},
+        {"span": "c", "TraceId": "trace-1"},
+    ]
+    uipath_spans = [MagicMock(to_dict=MagicMock(return_value=s)) for s in spans]
+
+    with patch(
+        "uipath.tracing._otel_exporters._SpanUtils.otel_span_to_uipath_span",
+        side_effect=uipath_spans,
+    ):
+        exporter.http_client.post.return_value = MagicMock(status_code=200)
+
+        result = exporter.export([mock_span, mock_span, mock_span])
+
+    assert result == SpanExportResult.SUCCESS
+    assert [call.args[0] for call in exporter._build_url.call_args_list] == [
+        [spans[0], spans[2]],
+        [spans[1]],
+    ]
+    assert exporter.http_client.post.call_count == 2
+
+
+def test_send_with_retries_gzip_compresses_body_once(mock_env_vars):
+    with patch("uipath.tracing._otel_exporters.httpx.Client"):
+        exporter = LlmOpsHttpExporter(compression="gzip")
+    exporter.http_client.post.side_effect = [  # type: ignore
+        MagicMock(status_code=503, text="busy"),
+        MagicMock(status_code=200),
+    ]
+
+    with patch("uipath.tracing._otel_exporters.time.sleep"):
+        result = exporter._send_with_retries("http://example.com", [{"span": "é"}])
+
+    assert result == SpanExportResult.SUCCESS
+    first, second = exporter.http_client.post.call_args_list  # type: ignore
+    assert first.kwargs["headers"] == {"Content-Encoding": "gzip"}
+    assert first.kwargs["content"] is second.kwargs["content"]
+    assert json.loads(gzip.decompress(first.kwargs["content"])) == [{"span": "é"}]
+
+
+def test_compression_from_env(mock_env_vars):
+    with (
+        patch.dict(os.environ, {"UIPATH_TRACE_COMPRESSION": "gzip"}),
+        patch("uipath.tracing._otel_exporters.httpx.Client"),
+    ):
+        assert LlmOpsHttpExporter().compression == "gzip"
+        assert LlmOpsHttpExporter(compression="none").compression is None
+
+
+def test_unsupported_compression_raises(mock_env_vars):
+    with pytest.raises(ValueError):
+        LlmOpsHttpExporter(compression="brotli")
+
+
+def test_export_with_in_flight_window_returns_before_upload(mock_env_vars, mock_span):
+    """Uploads run in the background and force_flush waits for them."""
+    with patch("uipath.tracing._otel_exporters.httpx.Client"):
+        exporter = LlmOpsHttpExporter(max_in_flight=2)
+    exporter._build_url = MagicMock(return_value="http://example.com")  # type: ignore
+    release = threading.Event()
+
+    def post(url, **kwargs):
+        assert release.wait(timeout=5)
+        return MagicMock(status_code=200)
+
+    exporter.http_client.post.side_effect = post  # type: ignore
+    mock_uipath_span = MagicMock()
+    mock_uipath_span.to_dict.return_value = {"span": "data", "TraceId": "t"}
+
+    with patch(
+        "uipath.tracing._otel_exporters._SpanUtils.otel_span_to_uipath_span",
+        return_value=mock_uipath_span,
+    ):
+        assert exporter.export([mock_span]) == SpanExportResult.SUCCESS
+
+    assert exporter.force_flush(timeout_millis=50) is False
+    release.set()
+    assert exporter.force_flush() is True
+    exporter.http_client.post.assert_called_once()  # type: ignore
+    exporter.shutdown()
+
+
+def test_in_flight_window_blocks_when_full(mock_env_vars):
+    with patch("uipath.tracing._otel_exporters.httpx.Client"):
+        exporter = LlmOpsHttpExporter(max_in_flight=1)
+    release = threading.Event()
+    exporter._send_with_retries = MagicMock(  # type: ignore
+        side_effect=lambda url, payload: (
+            release.wait(timeout=5) and SpanExportResult.SUCCESS
+        )
+    )
+
+    exporter._submit_upload("http://example.com", [{"span": "a"}])
+    second = threading.Thread(
+        target=exporter._submit_upload, args=("http://example.com", [{"span": "b"}])
+    )
+    second.start()
+    second.join(timeout=0.1)
+    assert second.is_alive()
+
+    release.set()
+    second.join(timeout=5)
+    assert not second.is_alive()
+    assert exporter.force_flush() is True
+    assert exporter._send_with_retries.call_count == 2
+    exporter.shutdown()
+
+
+def _export_one(exporter, mock_span, span_data):
+    mock_uipath_span = MagicMock()
+    mock_uipath_span.to_dict.return_value = span_data
+    with patch(
+        "uipath.tracing._otel_exporters._SpanUtils.otel_span_to_uipath_span",
+        return_value=mock_uipath_span,
+    ):
+        return exporter.export([mock_span])
+
+
+def test_export_with_spool_uploads_in_background(mock_env_vars, mock_span, tmp_path):
+    client = MagicMock()
+    client.post.return_value = MagicMock(status_code=200)
+    with patch("uipath.tracing._otel_exporters.httpx.Client", return_value=client):
+        exporter = LlmOpsHttpExporter(spool_path=str(tmp_path / "spool.db"))
+
+    result = _export_one(exporter, mock_span, {"span": "data", "TraceId": "t"})
+
+    assert result == SpanExportResult.SUCCESS
+    assert exporter.force_flush() is True
+    assert exporter.spool is not None and len(exporter.spool) == 0
+    assert exporter.http_client.post.call_args.kwargs["json"] == [  # type: ignore
+        {"span": "data", "TraceId": "t"}
+    ]
+    exporter.shutdown()
+
+
+def test_spool_keeps_spans_while_offline_and_replays_them(
+    mock_env_vars, mock_span, tmp_path
+):
+    spool_path = str(tmp_path / "spool.db")
+    offline_client = MagicMock()
+    offline_client.post.side_effect = Exception("offline")
+    online_client = MagicMock()
+    online_client.post.return_value = MagicMock(status_code=200)
+
+    with (
+        patch(
+            "uipath.tracing._otel_exporters.httpx.Client",
+            side_effect=[offline_client, online_client],
+        ),
+        patch("uipath.tracing._otel_exporters._SPOOL_SHUTDOWN_GRACE_MILLIS", 50),
+    ):
+        offline = LlmOpsHttpExporter(spool_path=spool_path)
+        assert (
+            _export_one(offline, mock_span, {"span": "data", "TraceId": "t"})
+            == SpanExportResult.SUCCESS
+        )
+        assert offline.force_flush(timeout_millis=100) is False
+        offline.shutdown()
+
+        online = LlmOpsHttpExporter(spool_path=spool_path)
+        assert online.force_flush() is True
+        online.shutdown()
+
+    online_client.post.assert_called_once()
+    assert online_client.post.call_args.kwargs["json"] == [
+        {"span": "data", "TraceId": "t"}
+    ]
+
+
+def test_exporters_sharing_a_spool_upload_each_batch_once(
+    mock_env_vars, mock_span, tmp_path
+):
+    spool_path = str(tmp_path / "spool.db")
+
+    def slow_post(*args, **kwargs):
+        # Still uploading the first batch when the second is exported.
+        time.sleep(0.2)
+        return MagicMock(status_code=200)
+
+    clients = [MagicMock(), MagicMock()]
+    for client in clients:
+        client.post.side_effect = slow_post
+
+    with patch("uipath.tracing._otel_exporters.httpx.Client", side_effect=clients):
+        exporters = [LlmOpsHttpExporter(spool_path=spool_path) for _ in clients]
+
+    for index, exporter in enumerate(exporters):
+        _export_one(exporter, mock_span, {"span": index, "TraceId": "t"})
+
+    assert all(exporter.force_flush(timeout_millis=5000) for exporter in exporters)
+    uploaded = [
+        call.kwargs["json"] for client in clients for call in client.post.call_args_list
+    ]
+    assert sorted(batch[0]["span"] for batch in uploaded) == [0, 1]
+    for exporter in exporters:
+        exporter.shutdown()
+
+
+def test_spool_drops_batches_rejected_by_server(mock_env_vars, mock_span, tmp_path):
+    client = MagicMock()
+    client.post.return_value = MagicMock(status_code=400, text="bad")
+    with patch("uipath.tracing._otel_exporters.httpx.Client", return_value=client):
+        exporter = LlmOpsHttpExporter(spool_path=str(tmp_path / "spool.db"))
+
+    _export_one(exporter, mock_span, {"span": "data", "TraceId": "t"})
+
+    assert exporter.force_flush() is True
+    exporter.http_client.post.assert_called_once()  # type: ignore
+    exporter.shutdown()
+
+
+def test_spool_drainer_survives_spool_errors(mock_env_vars, mock_span, tmp_path):
+    client = MagicMock()
+    client.post.return_value = MagicMock(status_code=200)
+    with (
+        patch("uipath.tracing._otel_exporters.httpx.Client", return_value=client),
+        patch("uipath.tracing._otel_exporters._SPOOL_MAX_BACKOFF", 0.01),
+    ):
+        exporter = LlmOpsHttpExporter(spool_path=str(tmp_path / "spool.db"))
+        assert exporter.spool is not None
+        claim = exporter.spool.claim
+        errors = [sqlite3.OperationalError("database is locked")]
+
+        def flaky_claim():
+            if errors:
+                raise errors.pop()
+            return claim()
+
+        with patch.object(exporter.spool, "claim", side_effect=flaky_claim):
+            _export_one(exporter, mock_span, {"span": "data", "TraceId": "t"})
+            assert exporter.force_flush(timeout_millis=5000) is True
+
+    assert exporter._spool_drainer.is_alive()
+    client.post.assert_called_once()
+    exporter.shutdown()
+
+
+def test_export_sends_directly_once_the_drainer_is_dead(
+    mock_env_vars, mock_span, tmp_path
+):
+    client = MagicMock()
+    client.post.return_value = MagicMock(status_code=200)
+    with patch("uipath.tracing._otel_exporters.httpx.Client", return_value=client):
+        exporter = LlmOpsHttpExporter(spool_path=str(tmp_path / "spool.db"))
+    exporter._spool_stop.set()
+    exporter._spool_wakeup.set()
+    exporter._spool_drainer.join(timeout=5)
+
+    result = _export_one(exporter, mock_span, {"span": "data", "TraceId": "t"})
+
+    assert result == SpanExportResult.SUCCESS
+    assert exporter.spool is not None and len(exporter.spool) == 0
+    client.post.assert_called_once()
+    exporter.shutdown()
+
+
 def test_build_url_uses_v3_endpoint(mock_env_vars):
     """_build_url must point to /api/Traces/v3/spans, not /api/Traces/spans."""
     with patch("uipath.tracing._otel_exporters.httpx.Client"):
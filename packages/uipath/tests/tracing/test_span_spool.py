@@ -0,0 +1,92 @@
+import pytest
+
+from uipath.tracing._span_spool import SpanSpool
+
+
+def test_spool_returns_batches_oldest_first(tmp_path):
+    spool = SpanSpool(str(tmp_path / "spool.db"))
+    spool.append("http://a", [{"Id": "1"}])
+    spool.append("http://b", [{"Id": "2"}, {"Id": "3"}])
+
+    first, second = spool.claim()
+
+    assert (first.url, first.payload) == ("http://a", [{"Id": "1"}])
+    assert (second.url, second.payload) == ("http://b", [{"Id": "2"}, {"Id": "3"}])
+    spool.remove(first.id)
+    spool.release([second.id])
+    assert [batch.url for batch in spool.claim()] == ["http://b"]
+    assert len(spool) == 1
+
+
+def test_spool_survives_reopening(tmp_path):
+    path = str(tmp_path / "nested" / "spool.db")
+    spool = SpanSpool(path)
+    spool.append("http://a", [{"Id": "1"}])
+    spool.close()
+
+    reopened = SpanSpool(path)
+
+    assert len(reopened) == 1
+    assert reopened.size_bytes > 0
+    assert reopened.claim()[0].payload == [{"Id": "1"}]
+
+
+def test_spool_evicts_oldest_batches_beyond_cap(tmp_path):
+    payload = [{"Name": "x" * 100}]
+    spool = SpanSpool(str(tmp_path / "spool.db"), max_bytes=300)
+
+    for url in ["http://1", "http://2", "http://3", "http://4"]:
+        spool.append(url, payload)
+
+    assert [batch.url for batch in spool.claim()] == ["http://3", "http://4"]
+    assert spool.size_bytes <= 300
+
+
+def test_spool_keeps_newest_batch_larger_than_cap(tmp_path):
+    spool = SpanSpool(str(tmp_path / "spool.db"), max_bytes=10)
+
+    spool.append("http://1", [{"Name": "small"}])
+    spool.append("http://2", [{"Name": "x" * 100}])
+
+    assert [batch.url for batch in spool.claim()] == ["http://2"]
+
+
+def test_spool_rejects_non_positive_cap(tmp_path):
+    with pytest.raises(ValueError):
+        SpanSpool(str(tmp_path / "spool.db"), max_bytes=0)
+
+
+def test_spools_sharing_a_file_claim_each_batch_once(tmp_path):
+    path = str(tmp_path / "spool.db")
+    first = SpanSpool(path)
+    second = SpanSpool(path)
+    first.append("http://a", [{"Id": "1"}])
+    second.append("http://b", [{"Id": "2"}])
+
+    claimed = first.claim()
+
+    assert [batch.url for batch in claimed] == ["http://a", "http://b"]
+    assert second.claim() == []
+    first.release([claimed[1].id])
+    assert [batch.url for batch in second.claim()] == ["http://b"]
+
+
+def test_spool_counts_batches_removed_by_another_spool(tmp_path):
+    path = str(tmp_path / "spool.db")
+    first = SpanSpool(path)
+    second = SpanSpool(path)
+    first.append("http://a", [{"Id": "1"}])
+
+    assert (len(second), first.pending(), second.pending()) == (1, 1, 0)
+    second.remove(second.claim()[0].id)
+
+    assert (len(first), first.size_bytes, first.pending()) == (0, 0, 0)
+
+
+def test_expired_claims_can_be_claimed_again(tmp_path):
+    path = str(tmp_path / "spool.db")
+    crashed = SpanSpool(path, claim_seconds=0)
+    crashed.append("http://a", [{"Id": "1"}])
+    crashed.claim()
+
+    assert [batch.url for batch in SpanSpool(path).claim()] == ["http://a"]